@@ -1,4 +1,6 @@
-from typing import Sequence, Type
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Sequence, Type
 
 from eth_typing import BLSPubkey, BLSSignature, Hash32
 from py_ecc.bls.typing import Domain
@@ -6,7 +8,9 @@ from py_ecc.bls.typing import Domain
 from eth2.beacon.exceptions import SignatureError
 
 from .backends import DEFAULT_BACKEND, NoOpBackend
-from .backends.base import BaseBLSBackend
+from .backends.base import BaseBLSBackend, SignatureSet
+from .batch import SignatureBatch
+from .cache import ValidatorPubkeyCache
 from .validation import (
     validate_many_public_keys,
     validate_private_key,
@@ -15,8 +19,17 @@ from .validation import (
 )
 
 
+# While set, ``validate`` adds to this batch instead of verifying. State transitions
+# and gossip validation run concurrently in executor threads, so every thread (and
+# every task) has a batch of its own.
+_current_batch: "ContextVar[Optional[SignatureBatch]]" = ContextVar(
+    "eth2_bls_batch", default=None
+)
+
+
 class Eth2BLS:
     backend: Type[BaseBLSBackend]
+    pubkey_cache = ValidatorPubkeyCache()
 
     def __init__(self) -> None:
         self.use_default_backend()
@@ -51,6 +64,16 @@ class Eth2BLS:
     def aggregate_pubkeys(cls, pubkeys: Sequence[BLSPubkey]) -> BLSPubkey:
         return cls.backend.aggregate_pubkeys(pubkeys)
 
+    @classmethod
+    def aggregate_validator_pubkeys(
+        cls, validators: Sequence[Any], indices: Sequence[int], epoch: int
+    ) -> BLSPubkey:
+        """
+        Return the aggregate public key of the ``validators`` at ``indices``, from
+        ``pubkey_cache``.
+        """
+        return cls.pubkey_cache.aggregate(cls.backend, validators, indices, epoch)
+
     @classmethod
     def verify(
         cls,
@@ -71,6 +94,36 @@ class Eth2BLS:
     ) -> bool:
         return cls.backend.verify_multiple(pubkeys, message_hashes, signature, domain)
 
+    @classmethod
+    def verify_batch(cls, signature_sets: Sequence[SignatureSet]) -> bool:
+        return cls.backend.verify_batch(signature_sets)
+
+    @classmethod
+    @contextmanager
+    def collect_signatures(cls) -> Iterator[SignatureBatch]:
+        """
+        Instead of verifying them right away, add the signatures passed to
+        ``validate`` within the context to the returned batch.
+        """
+        batch = SignatureBatch(cls.backend)
+        token = _current_batch.set(batch)
+        try:
+            yield batch
+        finally:
+            _current_batch.reset(token)
+
+    @classmethod
+    @contextmanager
+    def batch(cls) -> Iterator[SignatureBatch]:
+        """
+        Validate all signatures passed to ``validate`` within the context in one
+        batch when the context exits. Raises ``SignatureError`` describing the
+        invalid signatures if there are any.
+        """
+        with cls.collect_signatures() as batch:
+            yield batch
+        batch.validate()
+
     @classmethod
     def validate(
         cls,
@@ -83,6 +136,11 @@ class Eth2BLS:
             validate_signature(signature)
             validate_public_key(pubkey)
 
+        batch = _current_batch.get()
+        if batch is not None:
+            batch.add(pubkey, message_hash, signature, domain)
+            return
+
         if not cls.verify(message_hash, pubkey, signature, domain):
             raise SignatureError(
                 f"backend {cls.backend.__name__}\n"
@@ -1,10 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Any, NamedTuple, Sequence
 
 from eth_typing import BLSPubkey, BLSSignature, Hash32
 from py_ecc.bls.typing import Domain
 
 
+class SignatureSet(NamedTuple):
+    pubkey: BLSPubkey
+    message_hash: Hash32
+    signature: BLSSignature
+    domain: Domain
+
+
 class BaseBLSBackend(ABC):
     @staticmethod
     @abstractmethod
@@ -42,3 +49,31 @@ class BaseBLSBackend(ABC):
         domain: Domain,
     ) -> bool:
         ...
+
+    @staticmethod
+    def decompress_pubkey(pubkey: BLSPubkey) -> Any:
+        """
+        Return ``pubkey`` in the form ``aggregate_decompressed_pubkeys`` takes.
+        """
+        return pubkey
+
+    @classmethod
+    def aggregate_decompressed_pubkeys(cls, pubkeys: Sequence[Any]) -> BLSPubkey:
+        """
+        Aggregate public keys returned by ``decompress_pubkey``, which saves
+        decompressing the public keys of validators again for every aggregate.
+        """
+        return cls.aggregate_pubkeys(pubkeys)
+
+    @classmethod
+    def verify_batch(cls, signature_sets: Sequence[SignatureSet]) -> bool:
+        """
+        Return whether all of the ``signature_sets`` are valid.
+
+        Backends that can combine the verification of many signatures override
+        this; the fallback verifies the signatures one by one.
+        """
+        return all(
+            cls.verify(message_hash, pubkey, signature, domain)
+            for pubkey, message_hash, signature, domain in signature_sets
+        )
@@ -5,7 +5,7 @@ from py_ecc.bls.typing import Domain
 
 from eth2.beacon.constants import EMPTY_PUBKEY, EMPTY_SIGNATURE
 
-from .base import BaseBLSBackend
+from .base import BaseBLSBackend, SignatureSet
 
 
 class NoOpBackend(BaseBLSBackend):
@@ -39,3 +39,7 @@ class NoOpBackend(BaseBLSBackend):
         domain: Domain,
     ) -> bool:
         return True
+
+    @staticmethod
+    def verify_batch(signature_sets: Sequence[SignatureSet]) -> bool:
+        return True
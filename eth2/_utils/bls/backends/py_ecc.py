@@ -1,6 +1,8 @@
-from typing import Sequence
+import secrets
+from typing import Any, Dict, Sequence, Tuple
 
 from eth_typing import BLSPubkey, BLSSignature, Hash32
+from eth_utils import ValidationError
 from py_ecc.bls import (
     aggregate_pubkeys,
     aggregate_signatures,
@@ -10,10 +12,26 @@ from py_ecc.bls import (
     verify_multiple,
 )
 from py_ecc.bls.typing import Domain
+from py_ecc.bls.utils import G1_to_pubkey, hash_to_G2, pubkey_to_G1, signature_to_G2
+from py_ecc.fields import optimized_bls12_381_FQ12 as FQ12
+from py_ecc.optimized_bls12_381 import (
+    G1,
+    Z1,
+    Z2,
+    add,
+    final_exponentiate,
+    multiply,
+    neg,
+    pairing,
+)
 
-from eth2._utils.bls.backends.base import BaseBLSBackend
+from eth2._utils.bls.backends.base import BaseBLSBackend, SignatureSet
 from eth2.beacon.constants import EMPTY_PUBKEY, EMPTY_SIGNATURE
 
+# Bits of the random factors which make forging signatures that cancel out in a
+# batch as hard as forging a single signature
+RANDOM_FACTOR_BITS = 64
+
 
 class PyECCBackend(BaseBLSBackend):
     @staticmethod
@@ -44,6 +62,19 @@ class PyECCBackend(BaseBLSBackend):
             return EMPTY_PUBKEY
         return aggregate_pubkeys(pubkeys)
 
+    @staticmethod
+    def decompress_pubkey(pubkey: BLSPubkey) -> Any:
+        return pubkey_to_G1(pubkey)
+
+    @staticmethod
+    def aggregate_decompressed_pubkeys(pubkeys: Sequence[Any]) -> BLSPubkey:
+        if len(pubkeys) == 0:
+            return EMPTY_PUBKEY
+        aggregate = Z1
+        for pubkey in pubkeys:
+            aggregate = add(aggregate, pubkey)
+        return G1_to_pubkey(aggregate)
+
     @staticmethod
     def verify_multiple(
         pubkeys: Sequence[BLSPubkey],
@@ -52,3 +83,40 @@ class PyECCBackend(BaseBLSBackend):
         domain: Domain,
     ) -> bool:
         return verify_multiple(pubkeys, message_hashes, signature, domain)
+
+    @staticmethod
+    def verify_batch(signature_sets: Sequence[SignatureSet]) -> bool:
+        """
+        Check ``e(sum(r_i * signature_i), G1) == prod(e(H(message_i), r_i * pubkey_i))``
+        with a random factor ``r_i`` for every set, which needs one pairing per
+        distinct message instead of two pairings per signature. The sets with the
+        same message share their pairing.
+        """
+        if not signature_sets:
+            return True
+
+        try:
+            aggregate_signature = Z2
+            pubkeys_by_message: Dict[Tuple[Hash32, Domain], Any] = {}
+            for pubkey, message_hash, signature, domain in signature_sets:
+                random_factor = secrets.randbits(RANDOM_FACTOR_BITS) | 1
+                aggregate_signature = add(
+                    aggregate_signature,
+                    multiply(signature_to_G2(signature), random_factor),
+                )
+                key = (message_hash, domain)
+                pubkeys_by_message[key] = add(
+                    pubkeys_by_message.get(key, Z1),
+                    multiply(pubkey_to_G1(pubkey), random_factor),
+                )
+
+            o = pairing(aggregate_signature, neg(G1), final_exponentiate=False)
+            for (message_hash, domain), aggregate_pubkey in pubkeys_by_message.items():
+                o *= pairing(
+                    hash_to_G2(message_hash, domain),
+                    aggregate_pubkey,
+                    final_exponentiate=False,
+                )
+            return final_exponentiate(o) == FQ12.one()
+        except (ValidationError, ValueError, AssertionError):
+            return False
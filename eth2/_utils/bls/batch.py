@@ -0,0 +1,151 @@
+from concurrent.futures import Executor
+import multiprocessing
+from typing import Iterable, List, Optional, Sequence, Tuple, Type
+
+from eth_typing import BLSPubkey, BLSSignature, Hash32
+from py_ecc.bls.typing import Domain
+
+from eth2.beacon.exceptions import SignatureError
+
+from .backends.base import BaseBLSBackend, SignatureSet
+
+
+def verify_signature_sets(
+    backend: Type[BaseBLSBackend], signature_sets: Sequence[SignatureSet]
+) -> bool:
+    """
+    Module level entry point, so that a batch can be verified in another process.
+    """
+    return backend.verify_batch(signature_sets)
+
+
+def _split(
+    signature_sets: Sequence[SignatureSet], count: int
+) -> Iterable[Sequence[SignatureSet]]:
+    chunk_size = -(-len(signature_sets) // count)
+    for start in range(0, len(signature_sets), chunk_size):
+        yield signature_sets[start : start + chunk_size]
+
+
+class SignatureBatch:
+    """
+    A collection of signature sets which are verified together.
+
+    If the batch is invalid, bisecting it finds the invalid sets with a number of
+    batch verifications that is logarithmic in the size of the batch for every
+    invalid set.
+    """
+
+    def __init__(self, backend: Type[BaseBLSBackend]) -> None:
+        self.backend = backend
+        self._signature_sets: List[SignatureSet] = []
+
+    def __len__(self) -> int:
+        return len(self._signature_sets)
+
+    @property
+    def signature_sets(self) -> Tuple[SignatureSet, ...]:
+        return tuple(self._signature_sets)
+
+    def add(
+        self,
+        pubkey: BLSPubkey,
+        message_hash: Hash32,
+        signature: BLSSignature,
+        domain: Domain,
+    ) -> None:
+        self._signature_sets.append(
+            SignatureSet(pubkey, message_hash, signature, domain)
+        )
+
+    def extend(self, signature_sets: Iterable[SignatureSet]) -> None:
+        self._signature_sets.extend(signature_sets)
+
+    def verify(self, executor: Optional[Executor] = None) -> bool:
+        """
+        Return whether all signature sets in the batch are valid. With an
+        ``executor``, the batch is split into one part per CPU that are verified
+        in parallel.
+        """
+        return self._verify(self._signature_sets, executor)
+
+    def find_invalid(self, executor: Optional[Executor] = None) -> Tuple[int, ...]:
+        """
+        Return the indices of the invalid signature sets in the batch.
+        """
+        return tuple(
+            self._bisect(0, len(self._signature_sets), executor, is_known_invalid=False)
+        )
+
+    def validate(self, executor: Optional[Executor] = None) -> None:
+        if self.verify(executor):
+            return
+
+        invalid_sets = tuple(
+            self._signature_sets[index]
+            for index in self._bisect(
+                0, len(self._signature_sets), executor, is_known_invalid=True
+            )
+        )
+        raise SignatureError(
+            f"backend {self.backend.__name__}\n"
+            f"{len(invalid_sets)} of {len(self)} signatures in batch are invalid\n"
+            + "\n".join(
+                f"message_hash {signature_set.message_hash.hex()} "
+                f"pubkey {signature_set.pubkey.hex()} "
+                f"signature {signature_set.signature.hex()} "
+                f"domain {signature_set.domain.hex()}"
+                for signature_set in invalid_sets
+            )
+        )
+
+    def _verify(
+        self, signature_sets: Sequence[SignatureSet], executor: Optional[Executor]
+    ) -> bool:
+        if executor is None or len(signature_sets) < 2:
+            return verify_signature_sets(self.backend, signature_sets)
+
+        futures = tuple(
+            executor.submit(verify_signature_sets, self.backend, chunk)
+            for chunk in _split(signature_sets, multiprocessing.cpu_count())
+        )
+        return all(future.result() for future in futures)
+
+    def _bisect(
+        self,
+        start: int,
+        end: int,
+        executor: Optional[Executor],
+        is_known_invalid: bool,
+    ) -> Iterable[int]:
+        if start >= end:
+            return
+        if not is_known_invalid and self._verify(
+            self._signature_sets[start:end], executor
+        ):
+            return
+        if end - start == 1:
+            yield start
+            return
+
+        middle = (start + end) // 2
+        left_invalid = tuple(
+            self._bisect(start, middle, executor, is_known_invalid=False)
+        )
+        yield from left_invalid
+        # if the left half is fine, the invalid signature must be in the right half
+        yield from self._bisect(
+            middle, end, executor, is_known_invalid=not left_invalid
+        )
+
+
+def find_invalid_signature_sets(
+    backend: Type[BaseBLSBackend], signature_sets: Sequence[SignatureSet]
+) -> Tuple[int, ...]:
+    """
+    Return the indices of the invalid ``signature_sets``. Like
+    ``verify_signature_sets``, this can be run in another process.
+    """
+    batch = SignatureBatch(backend)
+    batch.extend(signature_sets)
+    return batch.find_invalid()
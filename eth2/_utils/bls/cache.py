@@ -0,0 +1,148 @@
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from eth_typing import BLSPubkey
+from lru import LRU
+
+from .backends.base import BaseBLSBackend
+
+DEFAULT_AGGREGATE_CACHE_SIZE = 2048
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    # seconds spent on computing the missed entries
+    miss_time: float
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def time_saved(self) -> float:
+        """
+        Estimate of the seconds the hits saved, assuming a hit would have taken as
+        long as the average miss.
+        """
+        return self.hits * self.miss_time / self.misses if self.misses else 0.0
+
+
+class _StatsCounter:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.miss_time = 0.0
+
+    def get_stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.miss_time)
+
+
+class ValidatorPubkeyCache:
+    """
+    Cache the public keys of the validator registry, by validator index, in the
+    form the BLS backend aggregates them from, e.g. as decompressed curve points.
+    The registry only ever grows and the public key of a validator never changes,
+    so the cache is extended with the validators it has not seen yet.
+
+    Public keys are only decompressed the first time they are aggregated, so
+    catching up with a large registry does not decompress all of it at once.
+
+    On top of that, keep the aggregate public keys of recently seen committees.
+    """
+
+    def __init__(
+        self, aggregate_cache_size: int = DEFAULT_AGGREGATE_CACHE_SIZE
+    ) -> None:
+        self._backend: Optional[Type[BaseBLSBackend]] = None
+        self._pubkeys: List[BLSPubkey] = []
+        self._decompressed_pubkeys: Dict[int, Any] = {}
+        self._aggregates = LRU(aggregate_cache_size)
+        self._pubkey_stats = _StatsCounter()
+        self._aggregate_stats = _StatsCounter()
+
+    def __len__(self) -> int:
+        return len(self._pubkeys)
+
+    def _reset(self, backend: Type[BaseBLSBackend]) -> None:
+        self._backend = backend
+        self._pubkeys = []
+        self._decompressed_pubkeys = {}
+        self._aggregates.clear()
+
+    def _is_prefix_shared(self, validators: Sequence[Any]) -> bool:
+        # Comparing every public key would cost as much as copying them again, so
+        # only the ends and the middle of the shared prefix are compared. Registries
+        # of different chains differ from the first validator on.
+        shared_count = min(len(self._pubkeys), len(validators))
+        return all(
+            validators[index].pubkey == self._pubkeys[index]
+            for index in {0, shared_count // 2, shared_count - 1}
+        )
+
+    def update(self, backend: Type[BaseBLSBackend], validators: Sequence[Any]) -> None:
+        """
+        Add the public keys of the ``validators`` (anything with a ``pubkey``)
+        beyond the cached ones.
+        """
+        if backend is not self._backend:
+            self._reset(backend)
+
+        # an older registry of the same chain is a prefix of the cached one,
+        # anything else, e.g. the registry of another chain, starts over
+        if self._pubkeys and validators and not self._is_prefix_shared(validators):
+            self._reset(backend)
+
+        for index in range(len(self._pubkeys), len(validators)):
+            self._pubkeys.append(validators[index].pubkey)
+
+    def _get_decompressed_pubkey(
+        self, backend: Type[BaseBLSBackend], index: int
+    ) -> Any:
+        try:
+            decompressed_pubkey = self._decompressed_pubkeys[index]
+        except KeyError:
+            start = time.perf_counter()
+            decompressed_pubkey = backend.decompress_pubkey(self._pubkeys[index])
+            self._decompressed_pubkeys[index] = decompressed_pubkey
+            self._pubkey_stats.misses += 1
+            self._pubkey_stats.miss_time += time.perf_counter() - start
+        else:
+            self._pubkey_stats.hits += 1
+        return decompressed_pubkey
+
+    def aggregate(
+        self,
+        backend: Type[BaseBLSBackend],
+        validators: Sequence[Any],
+        indices: Sequence[int],
+        epoch: int,
+    ) -> BLSPubkey:
+        """
+        Return the aggregate public key of the ``validators`` at ``indices``,
+        e.g. the attesting members of a committee in ``epoch``.
+        """
+        self.update(backend, validators)
+
+        key: Tuple[int, Tuple[int, ...]] = (epoch, tuple(indices))
+        if key in self._aggregates:
+            self._aggregate_stats.hits += 1
+            return self._aggregates[key]
+
+        decompressed_pubkeys = tuple(
+            self._get_decompressed_pubkey(backend, index) for index in indices
+        )
+        start = time.perf_counter()
+        aggregate = backend.aggregate_decompressed_pubkeys(decompressed_pubkeys)
+        self._aggregate_stats.misses += 1
+        self._aggregate_stats.miss_time += time.perf_counter() - start
+
+        self._aggregates[key] = aggregate
+        return aggregate
+
+    def get_pubkey_stats(self) -> CacheStats:
+        return self._pubkey_stats.get_stats()
+
+    def get_aggregate_stats(self) -> CacheStats:
+        return self._aggregate_stats.get_stats()
@@ -0,0 +1,93 @@
+from typing import Dict
+
+from eth_typing import Hash32
+from pyrsistent import pvector
+from ssz.constants import ZERO_HASHES
+from ssz.hash import hash_eth2
+from ssz.hash_tree import HashTree
+from ssz.hashable_structure import (
+    BaseHashableStructure,
+    HashableStructureEvolver,
+    get_num_padding_elements,
+    get_updated_chunks,
+)
+
+
+def update_hash_tree(
+    hash_tree: HashTree, updated_chunks: Dict[int, Hash32]
+) -> HashTree:
+    """
+    Return ``hash_tree`` with the chunks in ``updated_chunks`` replaced.
+
+    ``HashTree.mset`` rehashes the full branch of every updated chunk on its own,
+    so branches shared by many updated chunks are rehashed over and over. Here
+    every layer is updated once, and each dirty node is hashed exactly once.
+    """
+    if not updated_chunks:
+        return hash_tree
+
+    raw_hash_tree = hash_tree.raw_hash_tree
+
+    chunks = raw_hash_tree[0].evolver()
+    for index, chunk in updated_chunks.items():
+        chunks[index] = chunk
+    layers = [chunks.persistent()]
+
+    dirty_indices = {index // 2 for index in updated_chunks}
+    for layer_index in range(1, len(raw_hash_tree)):
+        child_layer = layers[-1]
+        child_layer_size = len(child_layer)
+        layer = raw_hash_tree[layer_index].evolver()
+        for index in dirty_indices:
+            left_index = index * 2
+            right_index = left_index + 1
+            if right_index < child_layer_size:
+                right_child = child_layer[right_index]
+            else:
+                right_child = ZERO_HASHES[layer_index - 1]
+            layer[index] = hash_eth2(child_layer[left_index] + right_child)
+        layers.append(layer.persistent())
+        dirty_indices = {index // 2 for index in dirty_indices}
+
+    return HashTree(pvector(layers), hash_tree.chunk_count)
+
+
+def persist_hashable_structure(
+    evolver: HashableStructureEvolver,
+) -> BaseHashableStructure:
+    """
+    Equivalent to ``evolver.persistent()``, but rehashes all updated items of the
+    structure in a single pass over its hash tree.
+    """
+    original = evolver._original_structure
+    updated_elements = evolver._updated_elements
+    if evolver._appended_elements or not updated_elements:
+        # appends are rare and change the shape of the tree, leave them to ssz
+        return evolver.persistent()
+
+    sedes = original.sedes
+    updated_chunks = get_updated_chunks(
+        updated_elements={
+            index: sedes.serialize_element_for_tree(index, element)
+            for index, element in updated_elements.items()
+        },
+        appended_elements=(),
+        original_chunks=original.chunks,
+        num_original_elements=len(original),
+        num_padding_elements=get_num_padding_elements(
+            num_original_elements=len(original),
+            num_original_chunks=len(original.chunks),
+            element_size=sedes.element_size_in_tree,
+        ),
+        element_size=sedes.element_size_in_tree,
+    )
+
+    elements = original.elements.evolver()
+    for index, element in updated_elements.items():
+        elements[index] = element
+
+    return original.__class__(
+        elements.persistent(),
+        update_hash_tree(original.hash_tree, updated_chunks),
+        sedes,
+    )
@@ -13,8 +13,8 @@ def validate_indexed_attestation_aggregate_signature(
     state: BeaconState, indexed_attestation: IndexedAttestation, slots_per_epoch: int
 ) -> None:
     attesting_indices = indexed_attestation.attesting_indices
-    pubkey = bls.aggregate_pubkeys(
-        tuple(state.validators[i].pubkey for i in attesting_indices)
+    pubkey = bls.aggregate_validator_pubkeys(
+        state.validators, attesting_indices, indexed_attestation.data.target.epoch
     )
 
     message_hash = indexed_attestation.data.hash_tree_root
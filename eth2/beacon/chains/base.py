@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 import logging
-from typing import TYPE_CHECKING, Tuple, Type
+from typing import TYPE_CHECKING, Dict, Tuple, Type
 
 from eth._utils.datatypes import Configurable
 from eth.abc import AtomicDatabaseAPI
@@ -14,6 +14,7 @@ from eth2.beacon.exceptions import BlockClassError, StateMachineNotFound
 from eth2.beacon.fork_choice.constant import ConstantScoring
 from eth2.beacon.fork_choice.scoring import BaseScore
 from eth2.beacon.helpers import get_state_root_at_slot
+from eth2.beacon.state_machines.state_cache import AdvancedStateCache
 from eth2.beacon.types.attestations import Attestation
 from eth2.beacon.types.blocks import BaseBeaconBlock, BaseSignedBeaconBlock
 from eth2.beacon.types.nonspec.epoch_info import EpochInfo
@@ -36,6 +37,7 @@ class BaseBeaconChain(Configurable, ABC):
         None
     )  # type: Tuple[Tuple[Slot, Type[BaseBeaconStateMachine]], ...]
     chain_id = None  # type: int
+    state_cache = None  # type: AdvancedStateCache
 
     @abstractmethod
     def __init__(self, base_db: AtomicDatabaseAPI, genesis_config: Eth2Config) -> None:
@@ -196,6 +198,12 @@ class BeaconChain(BaseBeaconChain):
             pass
 
         self.chaindb = self.get_chaindb_class()(base_db, genesis_config)
+        # shared by the state machines of the chain
+        self.state_cache = AdvancedStateCache()
+        # the state machines keep the fork choice stores, so they live as long as the chain
+        self._state_machines: Dict[
+            Type["BaseBeaconStateMachine"], "BaseBeaconStateMachine"
+        ] = {}
 
     #
     # Helpers
@@ -286,7 +294,12 @@ class BeaconChain(BaseBeaconChain):
             slot = at_slot
         sm_class = self.get_state_machine_class_for_block_slot(slot)
 
-        return sm_class(chaindb=self.chaindb)
+        try:
+            return self._state_machines[sm_class]
+        except KeyError:
+            state_machine = sm_class(chaindb=self.chaindb, state_cache=self.state_cache)
+            self._state_machines[sm_class] = state_machine
+            return state_machine
 
     @classmethod
     def get_genesis_state_machine_class(cls) -> Type["BaseBeaconStateMachine"]:
@@ -2,7 +2,8 @@ import logging
 from typing import Iterable, Sequence, Tuple
 
 from eth_typing import Hash32
-from eth_utils import ValidationError, to_tuple
+from eth_utils import ValidationError
+from lru import LRU
 
 from eth2._utils.hash import hash_eth2
 from eth2.beacon.constants import MAX_INDEX_COUNT, MAX_RANDOM_BYTE
@@ -21,6 +22,14 @@ from eth2.configs import Eth2Config
 
 logger = logging.getLogger("eth2.beacon.committee_helpers")
 
+# Active validator indices keyed by ``(validators_root, epoch)``, with the root of
+# the indices themselves.
+active_indices_cache = LRU(32)
+# Shuffled active validator indices keyed by
+# ``(seed, active_index_root, epoch, shuffle_round_count)``.
+# Every committee of an epoch is a slice of the same shuffling.
+committee_cache = LRU(16)
+
 
 def get_committee_count_at_slot(
     state: BeaconState,
@@ -42,7 +51,7 @@ def get_committee_count_per_slot_at_epoch(
     slots_per_epoch: int,
     target_committee_size: int,
 ) -> int:
-    active_validator_indices = get_active_validator_indices(state.validators, epoch)
+    active_validator_indices, _ = _get_active_validator_indices_and_root(state, epoch)
     return max(
         1,
         min(
@@ -157,21 +166,94 @@ def compute_shuffled_index(
     return new_index
 
 
-@to_tuple
-def _compute_committee(
-    indices: Sequence[ValidatorIndex],
-    seed: Hash32,
-    index: int,
-    count: int,
-    shuffle_round_count: int,
-) -> Iterable[ValidatorIndex]:
-    start = (len(indices) * index) // count
-    end = (len(indices) * (index + 1)) // count
-    for i in range(start, end):
-        shuffled_index = compute_shuffled_index(
-            i, len(indices), seed, shuffle_round_count
+def compute_shuffled_indices(
+    indices: Sequence[ValidatorIndex], seed: Hash32, shuffle_round_count: int
+) -> Tuple[ValidatorIndex, ...]:
+    """
+    Return ``indices`` permuted such that the ``i``-th item is
+    ``indices[compute_shuffled_index(i, len(indices), seed, shuffle_round_count)]``.
+
+    Every round of the 'swap or not' shuffle pairs up the positions of the list,
+    so the rounds are applied (in reverse) to the whole list at once. This hashes
+    each 256-position block once per round, instead of once per index per round.
+    """
+    index_count = len(indices)
+    if index_count > MAX_INDEX_COUNT:
+        raise ValidationError(
+            f"The given `index_count` ({index_count}) should be equal to or less than "
+            f"`MAX_INDEX_COUNT` ({MAX_INDEX_COUNT}"
         )
-        yield indices[shuffled_index]
+
+    shuffled = list(indices)
+    if index_count < 2:
+        return tuple(shuffled)
+
+    block_count = (index_count + 255) // 256
+    for current_round in reversed(range(shuffle_round_count)):
+        round_seed = seed + current_round.to_bytes(1, "little")
+        pivot = int.from_bytes(hash_eth2(round_seed)[0:8], "little") % index_count
+        source = b"".join(
+            hash_eth2(round_seed + block.to_bytes(4, "little"))
+            for block in range(block_count)
+        )
+
+        # ``i`` is paired with ``flip = (pivot - i) % index_count``; the pairs below
+        # and above the pivot are walked separately, and the bit at the larger
+        # position of each pair decides whether the pair is swapped.
+        for index, flip in zip(range((pivot + 1) // 2), range(pivot, -1, -1)):
+            if (source[flip >> 3] >> (flip & 7)) & 1:
+                shuffled[index], shuffled[flip] = shuffled[flip], shuffled[index]
+        for index, flip in zip(
+            range(pivot + 1, (pivot + index_count + 1) // 2),
+            range(index_count - 1, pivot, -1),
+        ):
+            if (source[flip >> 3] >> (flip & 7)) & 1:
+                shuffled[index], shuffled[flip] = shuffled[flip], shuffled[index]
+
+    return tuple(shuffled)
+
+
+def _get_active_validator_indices_and_root(
+    state: BeaconState, epoch: Epoch
+) -> Tuple[Tuple[ValidatorIndex, ...], Hash32]:
+    key = (state.validators.hash_tree_root, epoch)
+    if key not in active_indices_cache:
+        indices = get_active_validator_indices(state.validators, epoch)
+        root = hash_eth2(b"".join(index.to_bytes(8, "little") for index in indices))
+        active_indices_cache[key] = (indices, root)
+    return active_indices_cache[key]
+
+
+def get_shuffled_active_validator_indices(
+    state: BeaconState, epoch: Epoch, config: Eth2Config
+) -> Tuple[ValidatorIndex, ...]:
+    """
+    Return the active validator indices of ``epoch`` in the order in which they
+    are assigned to the committees of that epoch.
+    """
+    (
+        active_validator_indices,
+        active_index_root,
+    ) = _get_active_validator_indices_and_root(state, epoch)
+    domain_type = signature_domain_to_domain_type(
+        SignatureDomain.DOMAIN_BEACON_ATTESTER
+    )
+    seed = get_seed(state, epoch, domain_type, config)
+
+    key = (seed, active_index_root, epoch, config.SHUFFLE_ROUND_COUNT)
+    if key not in committee_cache:
+        committee_cache[key] = compute_shuffled_indices(
+            active_validator_indices, seed, config.SHUFFLE_ROUND_COUNT
+        )
+    return committee_cache[key]
+
+
+def _compute_committee(
+    shuffled_indices: Sequence[ValidatorIndex], index: int, count: int
+) -> Tuple[ValidatorIndex, ...]:
+    start = (len(shuffled_indices) * index) // count
+    end = (len(shuffled_indices) * (index + 1)) // count
+    return tuple(shuffled_indices[start:end])
 
 
 def get_beacon_committee(
@@ -186,18 +268,10 @@ def get_beacon_committee(
         config.TARGET_COMMITTEE_SIZE,
     )
 
-    active_validator_indices = get_active_validator_indices(state.validators, epoch)
-
-    domain_type = signature_domain_to_domain_type(
-        SignatureDomain.DOMAIN_BEACON_ATTESTER
-    )
-
     return _compute_committee(
-        indices=active_validator_indices,
-        seed=get_seed(state, epoch, domain_type, config),
+        shuffled_indices=get_shuffled_active_validator_indices(state, epoch, config),
         index=(slot % config.SLOTS_PER_EPOCH) * committees_per_slot + index,
         count=committees_per_slot * config.SLOTS_PER_EPOCH,
-        shuffle_round_count=config.SHUFFLE_ROUND_COUNT,
     )
 
 
@@ -227,8 +301,13 @@ def iterate_committees_at_slot(
     """
     Iterate ``committee``, ``committee_index``, ``slot`` of the given ``slot``.
     """
+    epoch = compute_epoch_at_slot(slot, config.SLOTS_PER_EPOCH)
+    shuffled_indices = get_shuffled_active_validator_indices(state, epoch, config)
     for committee_index in range(committees_per_slot):
-        committee = get_beacon_committee(
-            state, slot, CommitteeIndex(committee_index), config
+        committee = _compute_committee(
+            shuffled_indices=shuffled_indices,
+            index=(slot % config.SLOTS_PER_EPOCH) * committees_per_slot
+            + committee_index,
+            count=committees_per_slot * config.SLOTS_PER_EPOCH,
         )
         yield committee, CommitteeIndex(committee_index), slot
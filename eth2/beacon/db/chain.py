@@ -22,8 +22,14 @@ from eth2.beacon.db.exceptions import (
     StateNotFound,
 )
 from eth2.beacon.db.schema import SchemaV1
+from eth2.beacon.db.state_diff import (
+    apply_state_diff,
+    compute_state_diff,
+    decode_state_diff,
+    encode_state_diff,
+)
 from eth2.beacon.fork_choice.scoring import BaseForkChoiceScoring, BaseScore
-from eth2.beacon.helpers import compute_epoch_at_slot
+from eth2.beacon.helpers import compute_epoch_at_slot, compute_start_slot_at_epoch
 from eth2.beacon.types.blocks import BaseBeaconBlock, BaseSignedBeaconBlock
 from eth2.beacon.types.nonspec.epoch_info import EpochInfo
 from eth2.beacon.types.states import BeaconState  # noqa: F401
@@ -34,7 +40,8 @@ from eth2.configs import Eth2Config
 # up recent blocks to validate the chain, and decoding their SSZ representation is
 # relatively expensive so we cache that here, but use a small cache because we *should* only
 # be looking up recent blocks. We cache by root instead of ssz representation as ssz
-# representation is not unique if different length configs are considered
+# representation is not unique if different length configs are considered.
+# States stored as a diff to a snapshot are cached after they were rebuilt.
 state_cache = LRU(128)
 block_cache = LRU(128)
 
@@ -148,6 +155,18 @@ class BaseBeaconChainDB(ABC):
     def persist_state(self, state: BeaconState) -> None:
         ...
 
+    @abstractmethod
+    def get_state_snapshot_interval(self) -> int:
+        ...
+
+    @abstractmethod
+    def set_state_snapshot_interval(self, interval: int) -> None:
+        ...
+
+    @abstractmethod
+    def prune_states(self) -> int:
+        ...
+
     #
     # Attestation API
     #
@@ -193,6 +212,7 @@ class BeaconChainDB(BaseBeaconChainDB):
 
         self._finalized_root = self._get_finalized_root_if_present(db)
         self._highest_justified_epoch = self._get_highest_justified_epoch(db)
+        self._state_snapshot_interval = self._get_state_snapshot_interval(db)
 
     def _get_finalized_root_if_present(self, db: DatabaseAPI) -> Root:
         try:
@@ -703,9 +723,9 @@ class BeaconChainDB(BaseBeaconChainDB):
     ) -> BeaconState:
         return self._get_state_by_root(self.db, state_root, state_class)
 
-    @staticmethod
+    @classmethod
     def _get_state_by_root(
-        db: DatabaseAPI, state_root: Hash32, state_class: Type[BeaconState]
+        cls, db: DatabaseAPI, state_root: Hash32, state_class: Type[BeaconState]
     ) -> BeaconState:
         """
         Return the requested beacon state as specified by state hash.
@@ -713,16 +733,54 @@ class BeaconChainDB(BaseBeaconChainDB):
         Raises StateNotFound if it is not present in the db.
         """
         # TODO: validate_state_root
-        if state_root in state_cache and state_root in db:
+        if state_root in state_cache and cls._state_exists(db, state_root):
             return state_cache[state_root]
 
         try:
             state_ssz = db[state_root]
+        except KeyError:
+            state = cls._rebuild_state(db, state_root, state_class)
+        else:
+            state = ssz.decode(state_ssz, state_class)
+
+        state_cache[state_root] = state
+        return state
+
+    @staticmethod
+    def _state_exists(db: DatabaseAPI, state_root: Hash32) -> bool:
+        """
+        Check for the snapshot or the diff of the state, with a single request if
+        ``db`` supports it, e.g. a :class:`~trinity.db.manager.DBClient`.
+        """
+        keys = (state_root, SchemaV1.make_state_diff_lookup_key(Root(state_root)))
+        try:
+            db_multi_exists = getattr(db, "multi_exists")
+        except AttributeError:
+            return any(key in db for key in keys)
+        else:
+            return any(db_multi_exists(keys))
+
+    @classmethod
+    def _rebuild_state(
+        cls, db: DatabaseAPI, state_root: Hash32, state_class: Type[BeaconState]
+    ) -> BeaconState:
+        """
+        Rebuild a state that is stored as a diff to the snapshot it was persisted
+        against.
+        """
+        try:
+            encoded_diff = db[SchemaV1.make_state_diff_lookup_key(Root(state_root))]
         except KeyError:
             raise StateNotFound(f"No state with root {encode_hex(state_root)} found")
 
-        state = ssz.decode(state_ssz, state_class)
-        state_cache[state] = state
+        diff = decode_state_diff(encoded_diff, state_class)
+        base = cls._get_state_by_root(db, diff.base_root, state_class)
+        state = apply_state_diff(base, diff)
+        if state.hash_tree_root != state_root:
+            raise ValidationError(
+                f"State rebuilt from diff has root {encode_hex(state.hash_tree_root)}, "
+                f"expected {encode_hex(state_root)}"
+            )
         return state
 
     def persist_state(self, state: BeaconState) -> None:
@@ -734,7 +792,18 @@ class BeaconChainDB(BaseBeaconChainDB):
         return self._persist_state(state)
 
     def _persist_state(self, state: BeaconState) -> None:
-        self.db.set(state.hash_tree_root, ssz.encode(state))
+        state_root = state.hash_tree_root
+        base = self._find_state_snapshot(state)
+        if base is None:
+            self.db.set(state_root, ssz.encode(state))
+        else:
+            diff = compute_state_diff(base, state)
+            self.db.set(
+                SchemaV1.make_state_diff_lookup_key(state_root),
+                encode_state_diff(diff, type(state)),
+            )
+        self._add_state_slot_to_root_lookup(state.slot, state_root)
+        state_cache[state_root] = state
 
         self._persist_finalized_head(state)
         self._persist_justified_head(state)
@@ -750,6 +819,121 @@ class BeaconChainDB(BaseBeaconChainDB):
         # TODO: only persist per epoch transition
         self._persist_canonical_epoch_info(self.db, state)
 
+    def _find_state_snapshot(self, state: BeaconState) -> Optional[BeaconState]:
+        """
+        Return the full snapshot ``state`` should be stored as a diff against, or
+        ``None`` if ``state`` should be stored in full.
+
+        Snapshots are taken every ``state_snapshot_interval`` epochs: the first
+        state persisted at or after such an epoch boundary is stored in full and
+        every later state up to the next boundary is stored as a diff against it,
+        so that any state can be rebuilt from one snapshot and one diff.
+        """
+        interval = self._state_snapshot_interval
+        if not interval:
+            return None
+
+        slots_per_epoch = self.genesis_config.SLOTS_PER_EPOCH
+        epoch = compute_epoch_at_slot(state.slot, slots_per_epoch)
+        boundary_slot = compute_start_slot_at_epoch(
+            Epoch(epoch - epoch % interval), slots_per_epoch
+        )
+        history_length = len(state.state_roots)
+        for slot in range(max(boundary_slot, state.slot - history_length), state.slot):
+            root = state.state_roots[slot % history_length]
+            # full snapshots are the states stored under their root
+            if root in self.db:
+                return self._get_state_by_root(self.db, root, type(state))
+        return None
+
+    def _add_state_slot_to_root_lookup(self, slot: Slot, state_root: Hash32) -> None:
+        key = SchemaV1.make_state_slot_to_roots_lookup_key(slot)
+        state_roots = self._get_state_roots_at_slot(self.db, slot)
+        if state_root not in state_roots:
+            self.db.set(key, b"".join(state_roots + (state_root,)))
+
+    @staticmethod
+    def _get_state_roots_at_slot(db: DatabaseAPI, slot: Slot) -> Tuple[Hash32, ...]:
+        try:
+            encoded_roots = db[SchemaV1.make_state_slot_to_roots_lookup_key(slot)]
+        except KeyError:
+            return ()
+        return tuple(
+            Hash32(encoded_roots[index : index + 32])
+            for index in range(0, len(encoded_roots), 32)
+        )
+
+    def get_state_snapshot_interval(self) -> int:
+        return self._state_snapshot_interval
+
+    def set_state_snapshot_interval(self, interval: int) -> None:
+        """
+        Store states in full only every ``interval`` epochs and all other states
+        as a diff against the latest snapshot. An ``interval`` of 0 stores every
+        state in full. States that were already persisted are kept as they are.
+        """
+        self.db.set(
+            SchemaV1.make_state_snapshot_interval_lookup_key(),
+            ssz.encode(interval, sedes=ssz.sedes.uint64),
+        )
+        self._state_snapshot_interval = interval
+
+    @staticmethod
+    def _get_state_snapshot_interval(db: DatabaseAPI) -> int:
+        try:
+            encoded_interval = db[SchemaV1.make_state_snapshot_interval_lookup_key()]
+        except KeyError:
+            return 0
+        return ssz.decode(encoded_interval, sedes=ssz.sedes.uint64)
+
+    def prune_states(self) -> int:
+        """
+        Delete the states from before the finalized block which are not needed
+        to rebuild any later state. The genesis state is always kept.
+
+        Return the number of deleted states.
+        """
+        if self._finalized_root == ZERO_ROOT:
+            return 0
+
+        slots_per_epoch = self.genesis_config.SLOTS_PER_EPOCH
+        finalized_slot = self.get_slot_by_root(self._finalized_root)
+        finalized_epoch = compute_epoch_at_slot(finalized_slot, slots_per_epoch)
+        interval = self._state_snapshot_interval
+        if interval:
+            # the diffs of later states may refer to the snapshot at the boundary
+            prune_slot = compute_start_slot_at_epoch(
+                Epoch(finalized_epoch - finalized_epoch % interval), slots_per_epoch
+            )
+        else:
+            prune_slot = finalized_slot
+
+        pruned_slot_key = SchemaV1.make_pruned_state_slot_lookup_key()
+        try:
+            start_slot = ssz.decode(self.db[pruned_slot_key], sedes=ssz.sedes.uint64)
+        except KeyError:
+            start_slot = self.genesis_config.GENESIS_SLOT + 1
+
+        pruned_count = 0
+        with self.db.atomic_batch() as db:
+            for slot in range(start_slot, prune_slot):
+                for state_root in self._get_state_roots_at_slot(db, Slot(slot)):
+                    for key in (
+                        state_root,
+                        SchemaV1.make_state_diff_lookup_key(Root(state_root)),
+                    ):
+                        if key in db:
+                            del db[key]
+                    state_cache.pop(state_root, None)
+                    pruned_count += 1
+                slot_key = SchemaV1.make_state_slot_to_roots_lookup_key(slot)
+                if slot_key in db:
+                    del db[slot_key]
+            if prune_slot > start_slot:
+                db.set(pruned_slot_key, ssz.encode(prune_slot, sedes=ssz.sedes.uint64))
+
+        return pruned_count
+
     def _update_finalized_head(self, finalized_root: Root) -> None:
         """
         Unconditionally write the ``finalized_root`` as the root of the currently
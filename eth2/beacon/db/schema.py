@@ -17,6 +17,26 @@ class BaseSchema(ABC):
     def make_head_state_root_lookup_key() -> bytes:
         ...
 
+    @staticmethod
+    @abstractmethod
+    def make_state_diff_lookup_key(state_root: Root) -> bytes:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    def make_state_slot_to_roots_lookup_key(slot: int) -> bytes:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    def make_state_snapshot_interval_lookup_key() -> bytes:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    def make_pruned_state_slot_lookup_key() -> bytes:
+        ...
+
     #
     # Block
     #
@@ -83,6 +103,22 @@ class SchemaV1(BaseSchema):
     def make_canonical_epoch_info_lookup_key() -> bytes:
         return b"v1:beacon:canonical-epoch-info"
 
+    @staticmethod
+    def make_state_diff_lookup_key(state_root: Root) -> bytes:
+        return b"v1:beacon:state-diff:%s" % state_root
+
+    @staticmethod
+    def make_state_slot_to_roots_lookup_key(slot: int) -> bytes:
+        return b"v1:beacon:state-slot-to-roots:%d" % slot
+
+    @staticmethod
+    def make_state_snapshot_interval_lookup_key() -> bytes:
+        return b"v1:beacon:state-snapshot-interval"
+
+    @staticmethod
+    def make_pruned_state_slot_lookup_key() -> bytes:
+        return b"v1:beacon:pruned-state-slot"
+
     #
     # Block
     #
@@ -0,0 +1,225 @@
+"""
+Compact encoding of a ``BeaconState`` as the difference to an earlier ``BeaconState``.
+
+Between two states a few slots apart most of the state is unchanged: only a few
+entries of ``block_roots``, ``state_roots`` and ``randao_mixes`` are replaced and
+only the balances touched by the blocks in between differ. A diff records, for
+every field that changed, either the changed elements of the list or vector, or
+the whole new value of the field if that is smaller.
+
+The changed elements of a list or vector are found by walking the hash trees of
+both versions from their roots and only descending into the subtrees whose roots
+differ, so computing the diff does not compare every element of the state.
+"""
+from dataclasses import dataclass, field
+import struct
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, Tuple, Type
+
+from eth_typing import Hash32
+from eth_utils import ValidationError, encode_hex
+import ssz
+from ssz.hash_tree import HashTree
+from ssz.hashable_list import HashableList
+from ssz.hashable_vector import HashableVector
+from ssz.sedes import List
+
+from eth2.beacon.types.states import BeaconState
+from eth2.beacon.typing import Slot
+
+_HEADER = struct.Struct("<32sQB")
+_FIELD_HEADER = struct.Struct("<BB")
+_ELEMENTS_HEADER = struct.Struct("<QI")
+_LENGTH = struct.Struct("<I")
+
+_REPLACED = 0
+_UPDATED = 1
+
+
+@dataclass(frozen=True)
+class FieldDiff:
+    field_index: int
+    # the whole new value of the field, if the field was replaced
+    value: Any = None
+    # the length of the new list and its changed elements, otherwise
+    length: int = 0
+    elements: Dict[int, Any] = field(default_factory=dict)
+
+
+class StateDiff(NamedTuple):
+    base_root: Hash32
+    base_slot: Slot
+    field_diffs: Tuple[FieldDiff, ...]
+
+
+def _is_sequence(value: Any) -> bool:
+    return isinstance(value, (HashableList, HashableVector))
+
+
+def _get_updated_chunk_indices(
+    base_hash_tree: HashTree, hash_tree: HashTree
+) -> Iterable[int]:
+    base_layers = base_hash_tree.raw_hash_tree
+    layers = hash_tree.raw_hash_tree
+
+    dirty_indices: Sequence[int] = (0,)
+    for layer_index in range(len(layers) - 1, -1, -1):
+        base_layer = base_layers[layer_index]
+        layer = layers[layer_index]
+        dirty_indices = tuple(
+            index
+            for index in dirty_indices
+            if index < len(layer)
+            and (index >= len(base_layer) or layer[index] != base_layer[index])
+        )
+        if layer_index:
+            dirty_indices = tuple(
+                child for index in dirty_indices for child in (index * 2, index * 2 + 1)
+            )
+    return dirty_indices
+
+
+def _get_updated_elements(
+    base_value: HashableList, value: HashableList
+) -> Optional[Dict[int, Any]]:
+    """
+    Return the elements of ``value`` that differ from ``base_value`` by index, or
+    ``None`` if ``value`` is better stored whole.
+    """
+    base_length = len(base_value)
+    length = len(value)
+    if length < base_length or base_length == 0:
+        return None
+
+    elements_per_chunk = max(1, 32 // value.sedes.element_size_in_tree)
+    updated_elements = {}
+    for chunk_index in _get_updated_chunk_indices(
+        base_value.hash_tree, value.hash_tree
+    ):
+        start = chunk_index * elements_per_chunk
+        for index in range(start, min(start + elements_per_chunk, base_length)):
+            element = value[index]
+            if element != base_value[index]:
+                updated_elements[index] = element
+    # appending zero-valued basic elements does not necessarily change any chunk
+    for index in range(base_length, length):
+        updated_elements[index] = value[index]
+
+    # every updated element costs its index on top of its encoding
+    if len(updated_elements) * 2 > length:
+        return None
+    return updated_elements
+
+
+def compute_state_diff(base: BeaconState, state: BeaconState) -> StateDiff:
+    field_diffs = []
+    for field_index, (field_name, _) in enumerate(type(state)._meta.fields):
+        base_value = base[field_name]
+        value = state[field_name]
+        if _is_sequence(value):
+            if value.hash_tree_root == base_value.hash_tree_root:
+                continue
+            elements = _get_updated_elements(base_value, value)
+            if elements is not None:
+                field_diffs.append(
+                    FieldDiff(field_index, length=len(value), elements=elements)
+                )
+                continue
+        elif value == base_value:
+            continue
+
+        field_diffs.append(FieldDiff(field_index, value=value))
+
+    return StateDiff(base.hash_tree_root, base.slot, tuple(field_diffs))
+
+
+def apply_state_diff(base: BeaconState, diff: StateDiff) -> BeaconState:
+    """
+    Rebuild the state ``diff`` was computed for from its ``base``.
+    """
+    if base.hash_tree_root != diff.base_root:
+        raise ValidationError(
+            f"State diff is relative to state {encode_hex(diff.base_root)}, "
+            f"got state {encode_hex(base.hash_tree_root)}"
+        )
+
+    fields = type(base)._meta.fields
+    evolver = base.transient()
+    replaced_fields: Tuple[Any, ...] = ()
+    for field_diff in diff.field_diffs:
+        field_name, _ = fields[field_diff.field_index]
+        if field_diff.elements:
+            field_evolver = evolver[field_name]
+            base_length = len(base[field_name])
+            for index in range(base_length, field_diff.length):
+                field_evolver.append(field_diff.elements[index])
+            for index, element in field_diff.elements.items():
+                if index < base_length:
+                    field_evolver[index] = element
+        else:
+            replaced_fields += (field_name, field_diff.value)
+
+    state = evolver.persistent()
+    if replaced_fields:
+        state = state.mset(*replaced_fields)
+    return state
+
+
+def encode_state_diff(diff: StateDiff, state_class: Type[BeaconState]) -> bytes:
+    fields = state_class._meta.fields
+    encoded = [_HEADER.pack(diff.base_root, diff.base_slot, len(diff.field_diffs))]
+    for field_diff in diff.field_diffs:
+        _, field_sedes = fields[field_diff.field_index]
+        if field_diff.elements:
+            indices = tuple(field_diff.elements.keys())
+            elements_sedes = List(field_sedes.element_sedes, max(1, len(indices)))
+            payload = ssz.encode(tuple(field_diff.elements.values()), elements_sedes)
+            encoded.extend(
+                (
+                    _FIELD_HEADER.pack(field_diff.field_index, _UPDATED),
+                    _ELEMENTS_HEADER.pack(field_diff.length, len(indices)),
+                    struct.pack(f"<{len(indices)}Q", *indices),
+                )
+            )
+        else:
+            payload = ssz.encode(field_diff.value, field_sedes)
+            encoded.append(_FIELD_HEADER.pack(field_diff.field_index, _REPLACED))
+        encoded.extend((_LENGTH.pack(len(payload)), payload))
+    return b"".join(encoded)
+
+
+def decode_state_diff(encoded: bytes, state_class: Type[BeaconState]) -> StateDiff:
+    fields = state_class._meta.fields
+    base_root, base_slot, field_count = _HEADER.unpack_from(encoded)
+    offset = _HEADER.size
+    field_diffs = []
+    for _ in range(field_count):
+        field_index, kind = _FIELD_HEADER.unpack_from(encoded, offset)
+        offset += _FIELD_HEADER.size
+        _, field_sedes = fields[field_index]
+        if kind == _UPDATED:
+            length, index_count = _ELEMENTS_HEADER.unpack_from(encoded, offset)
+            offset += _ELEMENTS_HEADER.size
+            indices = struct.unpack_from(f"<{index_count}Q", encoded, offset)
+            offset += 8 * index_count
+
+        (payload_length,) = _LENGTH.unpack_from(encoded, offset)
+        offset += _LENGTH.size
+        payload = encoded[offset : offset + payload_length]
+        offset += payload_length
+
+        if kind == _UPDATED:
+            elements_sedes = List(field_sedes.element_sedes, max(1, index_count))
+            elements = ssz.decode(payload, elements_sedes)
+            field_diffs.append(
+                FieldDiff(
+                    field_index, length=length, elements=dict(zip(indices, elements))
+                )
+            )
+        elif kind == _REPLACED:
+            field_diffs.append(
+                FieldDiff(field_index, value=ssz.decode(payload, field_sedes))
+            )
+        else:
+            raise ValidationError(f"Unknown kind {kind} of state diff field")
+
+    return StateDiff(Hash32(base_root), Slot(base_slot), tuple(field_diffs))
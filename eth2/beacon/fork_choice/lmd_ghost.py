@@ -1,14 +1,16 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Tuple, Type, cast
+from typing import Any, Dict, Iterable, Optional, Tuple, Type, cast
 
 from eth_typing import Hash32
 from eth_utils import ValidationError
+from eth_utils.toolz import first
 import ssz
 
 from eth2.beacon.attestation_helpers import validate_indexed_attestation
 from eth2.beacon.constants import ZERO_ROOT
 from eth2.beacon.db.chain import BaseBeaconChainDB
 from eth2.beacon.epoch_processing_helpers import get_indexed_attestation
+from eth2.beacon.fork_choice.proto_array import DEFAULT_PRUNE_THRESHOLD, ProtoArray
 from eth2.beacon.fork_choice.scoring import BaseForkChoiceScoring, BaseScore
 from eth2.beacon.helpers import (
     compute_epoch_at_slot,
@@ -421,10 +423,18 @@ class Store:
                 i not in self._context.latest_messages
                 or target.epoch > self._context.latest_messages[i].epoch
             ):
-                self._context.latest_messages[i] = LatestMessage(
-                    epoch=target.epoch, root=attestation.data.beacon_block_root
+                self._update_latest_message(
+                    i,
+                    LatestMessage(
+                        epoch=target.epoch, root=attestation.data.beacon_block_root
+                    ),
                 )
 
+    def _update_latest_message(
+        self, index: ValidatorIndex, latest_message: LatestMessage
+    ) -> None:
+        self._context.latest_messages[index] = latest_message
+
     def scoring(self, block: BaseBeaconBlock) -> LMDGHOSTScore:
         """
         Return the score of the target ``block`` according to the LMD GHOST algorithm,
@@ -438,6 +448,152 @@ class Store:
         return LMDGHOSTScore((attestation_score, block_root_score))
 
 
+class ProtoArrayStore(Store):
+    """
+    A ``Store`` that keeps the latest attesting balance of every block it has seen
+    in a ``ProtoArray``, instead of summing the balances of all active validators
+    each time a block is scored.
+
+    New latest messages are recorded as pending votes; the next time a block is
+    scored they are turned into weight deltas against the balances of the
+    justified checkpoint state and applied to the array in a single pass.
+
+    The array is only built once, so the store has to outlive the state machine
+    that creates it, as it does in a ``BeaconChain``.
+    """
+
+    def __init__(
+        self,
+        chain_db: BaseBeaconChainDB,
+        block_class: Type[BaseSignedBeaconBlock],
+        config: Eth2Config,
+        context: Context,
+        prune_threshold: int = DEFAULT_PRUNE_THRESHOLD,
+    ):
+        super().__init__(chain_db, block_class, config, context)
+        self._proto_array = ProtoArray(prune_threshold)
+        for root, block in sorted(
+            context.blocks.items(), key=lambda item: item[1].slot
+        ):
+            self._add_to_proto_array(root, block)
+
+        # The root each validator's vote is currently counted for in the array,
+        # and the balances it was counted with.
+        self._current_votes: Dict[ValidatorIndex, Root] = {}
+        self._balances: Tuple[Gwei, ...] = ()
+        self._balances_checkpoint: Optional[Checkpoint] = None
+        self._dirty_votes = set(context.latest_messages.keys())
+
+    def _add_to_proto_array(self, root: Root, block: BaseBeaconBlock) -> None:
+        try:
+            post_state = self._context.block_states[root]
+        except KeyError:
+            # without a post-state, the block is assumed to agree with the context
+            justified_epoch = self._context.justified_checkpoint.epoch
+            finalized_epoch = self._context.finalized_checkpoint.epoch
+        else:
+            justified_epoch = post_state.current_justified_checkpoint.epoch
+            finalized_epoch = post_state.finalized_checkpoint.epoch
+        self._proto_array.on_block(
+            root, block.parent_root, justified_epoch, finalized_epoch
+        )
+
+    def _get_justified_balances(self) -> Tuple[Gwei, ...]:
+        state = self._get_checkpoint_state_for(self._context.justified_checkpoint)
+        current_epoch = state.current_epoch(self.slots_per_epoch)
+        return tuple(
+            validator.effective_balance
+            if validator.is_active(current_epoch)
+            else Gwei(0)
+            for validator in state.validators
+        )
+
+    def _apply_pending_votes(self) -> None:
+        justified_checkpoint = self._context.justified_checkpoint
+        if justified_checkpoint != self._balances_checkpoint:
+            new_balances = self._get_justified_balances()
+            changed_indices: Iterable[ValidatorIndex] = set(
+                self._current_votes.keys()
+            ) | self._dirty_votes
+        else:
+            new_balances = self._balances
+            changed_indices = self._dirty_votes
+
+        deltas = [0] * len(self._proto_array)
+        old_balances = self._balances
+        for index in changed_indices:
+            old_root = self._current_votes.get(index)
+            if old_root is not None and index < len(old_balances):
+                old_index = self._proto_array.get_index(old_root)
+                if old_index is not None:
+                    deltas[old_index] -= old_balances[index]
+
+            new_root = self._context.latest_messages[index].root
+            new_index = self._proto_array.get_index(new_root)
+            if new_index is None:
+                # a vote for a pruned block can never count again
+                self._current_votes.pop(index, None)
+                continue
+
+            if index < len(new_balances):
+                deltas[new_index] += new_balances[index]
+            self._current_votes[index] = new_root
+
+        self._proto_array.apply_score_changes(
+            deltas,
+            justified_checkpoint.epoch,
+            self._context.finalized_checkpoint.epoch,
+        )
+        self._balances = new_balances
+        self._balances_checkpoint = justified_checkpoint
+        self._dirty_votes = set()
+
+    def get_latest_attesting_balance(self, root: Root) -> Gwei:
+        if root not in self._proto_array:
+            # blocks that were never passed to ``on_block`` are scored the slow way
+            return super().get_latest_attesting_balance(root)
+
+        if self._dirty_votes or (
+            self._context.justified_checkpoint != self._balances_checkpoint
+        ):
+            self._apply_pending_votes()
+        return self._proto_array.get_weight(root)
+
+    def get_head(self) -> Root:
+        """
+        Return the root of the head of the chain according to the votes seen so far,
+        among the blocks that agree with the justified and finalized checkpoints.
+        """
+        self._apply_pending_votes()
+        justified_root = self._context.justified_checkpoint.root
+        if justified_root == ZERO_ROOT:
+            # the justified checkpoint of the genesis state refers to the genesis
+            # block by the zero root; that block is the first one in the array
+            justified_root = first(self._proto_array.iter_roots())
+        return self._proto_array.find_head(justified_root)
+
+    def on_block(
+        self,
+        signed_block: BaseSignedBeaconBlock,
+        post_state: BeaconState = None,
+        state_machine: BaseBeaconStateMachine = None,
+    ) -> None:
+        super().on_block(signed_block, post_state, state_machine)
+
+        block = signed_block.message
+        self._add_to_proto_array(block.hash_tree_root, block)
+
+        finalized_root = self._context.finalized_checkpoint.root
+        if finalized_root in self._proto_array:
+            self._proto_array.maybe_prune(finalized_root)
+
+    def _update_latest_message(
+        self, index: ValidatorIndex, latest_message: LatestMessage
+    ) -> None:
+        super()._update_latest_message(index, latest_message)
+        self._dirty_votes.add(index)
+
+
 class LMDGHOSTScoring(BaseForkChoiceScoring):
     def __init__(self, store: Store) -> None:
         self._store = store
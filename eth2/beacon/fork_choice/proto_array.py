@@ -0,0 +1,243 @@
+"""
+A "proto-array" keeps the block tree of the fork choice as a flat list of nodes,
+ordered such that every parent comes before its children.
+
+Every node caches the weight of the latest messages that support it, i.e. the
+balance of the validators whose latest message is for the node or one of its
+descendants. Rather than summing the balances of all validators whenever a block
+is scored, changes to the latest messages are turned into per-node weight deltas
+which are then propagated from the end of the list towards its start in a single
+backwards pass.
+
+Only the blocks whose post-states agree with the justified and finalized epochs
+of the fork choice are viable heads, and the best descendant of a block is always
+the best viable one.
+"""
+from dataclasses import dataclass
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from eth_utils import ValidationError
+
+from eth2.beacon.typing import Epoch, Gwei, Root
+
+DEFAULT_PRUNE_THRESHOLD = 256
+
+
+@dataclass
+class ProtoNode:
+    root: Root
+    parent: Optional[int]
+    justified_epoch: Epoch = Epoch(0)
+    finalized_epoch: Epoch = Epoch(0)
+    weight: Gwei = Gwei(0)
+    best_child: Optional[int] = None
+    best_descendant: Optional[int] = None
+
+
+class ProtoArray:
+    logger = logging.getLogger("eth2.beacon.fork_choice.proto_array.ProtoArray")
+
+    def __init__(self, prune_threshold: int = DEFAULT_PRUNE_THRESHOLD) -> None:
+        self._prune_threshold = prune_threshold
+        self._nodes: List[ProtoNode] = []
+        self._indices: Dict[Root, int] = {}
+        # the epochs of the fork choice the viable heads agree with, zero for any
+        self._justified_epoch = Epoch(0)
+        self._finalized_epoch = Epoch(0)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, root: Root) -> bool:
+        return root in self._indices
+
+    def get_index(self, root: Root) -> Optional[int]:
+        return self._indices.get(root)
+
+    def get_weight(self, root: Root) -> Gwei:
+        return self._nodes[self._indices[root]].weight
+
+    def on_block(
+        self,
+        root: Root,
+        parent_root: Optional[Root],
+        justified_epoch: Epoch = Epoch(0),
+        finalized_epoch: Epoch = Epoch(0),
+    ) -> None:
+        """
+        Append the block with ``root`` to the tree, with the justified and finalized
+        epochs of its post-state. A block whose parent is not in the tree becomes a
+        new root of the tree. Adding a known block is a no-op.
+        """
+        if root in self._indices:
+            return
+
+        parent = self._indices.get(parent_root) if parent_root is not None else None
+        index = len(self._nodes)
+        self._indices[root] = index
+        self._nodes.append(
+            ProtoNode(
+                root=root,
+                parent=parent,
+                justified_epoch=justified_epoch,
+                finalized_epoch=finalized_epoch,
+            )
+        )
+
+        if parent is not None:
+            self._maybe_update_best_child_and_descendant(parent, index)
+
+    def apply_score_changes(
+        self,
+        deltas: Sequence[int],
+        justified_epoch: Epoch = Epoch(0),
+        finalized_epoch: Epoch = Epoch(0),
+    ) -> None:
+        """
+        Add ``deltas[i]`` to the weight of the ``i``-th node and of all its
+        ancestors, then refresh the best child and best descendant of every node,
+        for the current ``justified_epoch`` and ``finalized_epoch`` of the fork choice.
+        """
+        if len(deltas) != len(self._nodes):
+            raise ValidationError(
+                f"Expected {len(self._nodes)} weight deltas, got {len(deltas)}"
+            )
+
+        self._justified_epoch = justified_epoch
+        self._finalized_epoch = finalized_epoch
+
+        deltas = list(deltas)
+        for index in range(len(self._nodes) - 1, -1, -1):
+            node = self._nodes[index]
+            delta = deltas[index]
+            if delta:
+                if node.weight + delta < 0:
+                    raise ValidationError(
+                        f"Weight delta {delta} would make the weight of block "
+                        f"{node.root.hex()} negative"
+                    )
+                node.weight = Gwei(node.weight + delta)
+                if node.parent is not None:
+                    deltas[node.parent] += delta
+
+        # Children come after their parents, so walking backwards settles the best
+        # descendant of every child before it is considered by its parent.
+        for index in range(len(self._nodes) - 1, -1, -1):
+            parent = self._nodes[index].parent
+            if parent is not None:
+                self._maybe_update_best_child_and_descendant(parent, index)
+
+    def find_head(self, justified_root: Root) -> Root:
+        """
+        Return the root of the heaviest viable leaf descending from ``justified_root``.
+        Ties are broken in favour of the higher block root.
+        """
+        try:
+            justified_index = self._indices[justified_root]
+        except KeyError:
+            raise ValidationError(
+                f"Justified block {justified_root.hex()} is not in the fork choice"
+            )
+
+        best_node = self._nodes[self._get_leaf(justified_index)]
+        if not self._is_viable_for_head(best_node):
+            raise ValidationError(
+                f"No block descending from justified block {justified_root.hex()} "
+                f"agrees with justified epoch {self._justified_epoch} and finalized "
+                f"epoch {self._finalized_epoch}"
+            )
+        return best_node.root
+
+    def maybe_prune(self, finalized_root: Root) -> None:
+        """
+        Drop the blocks that were added before the block with ``finalized_root``,
+        which are either its ancestors or can never become canonical. Pruning only
+        happens once there are at least ``prune_threshold`` such blocks, to avoid
+        re-indexing the array on every finalization.
+        """
+        try:
+            finalized_index = self._indices[finalized_root]
+        except KeyError:
+            raise ValidationError(
+                f"Finalized block {finalized_root.hex()} is not in the fork choice"
+            )
+
+        if finalized_index < self._prune_threshold:
+            return
+
+        for node in self._nodes[:finalized_index]:
+            del self._indices[node.root]
+
+        self._nodes = self._nodes[finalized_index:]
+        for root, index in self._indices.items():
+            self._indices[root] = index - finalized_index
+
+        for node in self._nodes:
+            node.parent = _shift_index(node.parent, finalized_index)
+            node.best_child = _shift_index(node.best_child, finalized_index)
+            node.best_descendant = _shift_index(node.best_descendant, finalized_index)
+
+        self.logger.debug(
+            "Pruned %d blocks below finalized block %s",
+            finalized_index,
+            finalized_root.hex(),
+        )
+
+    def iter_roots(self) -> Iterable[Root]:
+        for node in self._nodes:
+            yield node.root
+
+    def _get_leaf(self, index: int) -> int:
+        best_descendant = self._nodes[index].best_descendant
+        return index if best_descendant is None else best_descendant
+
+    def _is_viable_for_head(self, node: ProtoNode) -> bool:
+        return (
+            node.justified_epoch == self._justified_epoch or self._justified_epoch == 0
+        ) and (
+            node.finalized_epoch == self._finalized_epoch or self._finalized_epoch == 0
+        )
+
+    def _leads_to_viable_head(self, index: int) -> bool:
+        return self._is_viable_for_head(self._nodes[self._get_leaf(index)])
+
+    def _is_better_child(self, child: int, other_child: int) -> bool:
+        child_node = self._nodes[child]
+        other_node = self._nodes[other_child]
+        return (
+            self._leads_to_viable_head(child),
+            child_node.weight,
+            child_node.root,
+        ) > (
+            self._leads_to_viable_head(other_child),
+            other_node.weight,
+            other_node.root,
+        )
+
+    def _maybe_update_best_child_and_descendant(self, parent: int, child: int) -> None:
+        parent_node = self._nodes[parent]
+        best_child = parent_node.best_child
+
+        if best_child is None:
+            is_best = self._leads_to_viable_head(child)
+        elif best_child == child:
+            is_best = True
+        else:
+            is_best = self._is_better_child(child, best_child)
+
+        if not is_best:
+            return
+        elif best_child == child and not self._leads_to_viable_head(child):
+            parent_node.best_child = None
+            parent_node.best_descendant = None
+        else:
+            parent_node.best_child = child
+            parent_node.best_descendant = self._get_leaf(child)
+
+
+def _shift_index(index: Optional[int], offset: int) -> Optional[int]:
+    if index is None or index < offset:
+        return None
+    else:
+        return index - offset
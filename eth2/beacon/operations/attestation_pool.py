@@ -1,54 +1,207 @@
-from typing import Tuple
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple
 
-from eth_utils import ValidationError
-
-from eth2.beacon.state_machines.forks.serenity.block_validation import (
-    validate_attestation_slot,
+from eth2.beacon.tools.builder.aggregator import (
+    get_aggregate_from_valid_committee_attestations,
 )
 from eth2.beacon.types.attestations import Attestation
-from eth2.beacon.typing import CommitteeIndex, Root, Slot
+from eth2.beacon.typing import Bitfield, CommitteeIndex, Epoch, Root, Slot
 from eth2.configs import Eth2Config
 
 from .pool import OperationPool
 
 
-def is_valid_slot(
-    attestation: Attestation, current_slot: Slot, config: Eth2Config
-) -> bool:
-    try:
-        validate_attestation_slot(
-            attestation.data.slot,
-            current_slot,
-            config.SLOTS_PER_EPOCH,
-            config.MIN_ATTESTATION_INCLUSION_DELAY,
-        )
-    except ValidationError:
-        return False
-    else:
-        return True
+def _to_mask(aggregation_bits: Bitfield) -> int:
+    return sum(1 << index for index, bit in enumerate(aggregation_bits) if bit)
+
+
+class _AggregateGroup:
+    """
+    Attestations with the same data and pairwise disjoint aggregation bits, which
+    can be aggregated into one attestation.
+    """
+
+    def __init__(self) -> None:
+        self.roots: List[Root] = []
+        self.mask = 0
+        self._aggregate: Optional[Attestation] = None
+
+    def add(self, root: Root, mask: int) -> None:
+        self.roots.append(root)
+        self.mask |= mask
+        self._aggregate = None
+
+    def get_aggregate(self, pool: Dict[Root, Attestation]) -> Attestation:
+        if self._aggregate is None:
+            attestations = tuple(pool[root] for root in self.roots)
+            if len(attestations) == 1:
+                self._aggregate = attestations[0]
+            else:
+                self._aggregate = get_aggregate_from_valid_committee_attestations(
+                    attestations
+                )
+        return self._aggregate
 
 
 class AttestationPool(OperationPool[Attestation]):
+    """
+    Attestations indexed by slot, by ``(slot, committee index, beacon block root)``
+    and by target epoch.
+
+    On insert, an attestation joins the first group of attestations with the same
+    data that it does not overlap with, so that each group can be included in a
+    block as one aggregate.
+    """
+
+    _by_slot: DefaultDict[Slot, Set[Root]]
+    _by_committee: DefaultDict[Tuple[Slot, CommitteeIndex, Root], Set[Root]]
+    _by_target_epoch: DefaultDict[Epoch, Set[Root]]
+    # the aggregate groups of every ``AttestationData``, by its root
+    _groups: DefaultDict[Root, List[_AggregateGroup]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._by_slot = defaultdict(set)
+        self._by_committee = defaultdict(set)
+        self._by_target_epoch = defaultdict(set)
+        self._groups = defaultdict(list)
+
+    def add(self, operation: Attestation) -> None:
+        root = operation.hash_tree_root
+        if root in self._pool_storage:
+            return
+        super().add(operation)
+
+        data = operation.data
+        self._by_slot[data.slot].add(root)
+        self._by_committee[(data.slot, data.index, data.beacon_block_root)].add(root)
+        self._by_target_epoch[data.target.epoch].add(root)
+        self._add_to_group(operation, root)
+
+    def remove(self, operation: Attestation) -> None:
+        root = operation.hash_tree_root
+        if root not in self._pool_storage:
+            return
+        super().remove(operation)
+
+        data = operation.data
+        _discard(self._by_slot, data.slot, root)
+        _discard(
+            self._by_committee, (data.slot, data.index, data.beacon_block_root), root
+        )
+        _discard(self._by_target_epoch, data.target.epoch, root)
+        self._remove_from_group(operation, root)
+
+    def prune(self, current_slot: Slot, config: Eth2Config) -> None:
+        """
+        Remove the attestations that are too old to be included in a block at
+        ``current_slot`` or later.
+        """
+        expired_slots = tuple(
+            slot
+            for slot in self._by_slot
+            if slot + config.SLOTS_PER_EPOCH < current_slot
+        )
+        self.batch_remove(
+            tuple(
+                self._pool_storage[root]
+                for slot in expired_slots
+                for root in tuple(self._by_slot[slot])
+            )
+        )
+
     def get_valid_attestation_by_current_slot(
         self, slot: Slot, config: Eth2Config
     ) -> Tuple[Attestation, ...]:
+        """
+        Return the attestations which can be included in a block at ``slot``.
+        """
         return tuple(
-            filter(
-                lambda attestation: is_valid_slot(attestation, slot, config),
-                self._pool_storage.values(),
-            )
+            self._pool_storage[root]
+            for attestation_slot in self._get_includable_slots(slot, config)
+            for root in self._by_slot.get(attestation_slot, ())
         )
 
+    def get_aggregated_attestations_by_current_slot(
+        self, slot: Slot, config: Eth2Config
+    ) -> Tuple[Attestation, ...]:
+        """
+        Like ``get_valid_attestation_by_current_slot``, but with the attestations
+        of every group aggregated, the ones covering the most validators first.
+        """
+        data_roots = {
+            self._pool_storage[root].data.hash_tree_root
+            for attestation_slot in self._get_includable_slots(slot, config)
+            for root in self._by_slot.get(attestation_slot, ())
+        }
+        groups = sorted(
+            (group for data_root in data_roots for group in self._groups[data_root]),
+            key=lambda group: bin(group.mask).count("1"),
+            reverse=True,
+        )
+        return tuple(group.get_aggregate(self._pool_storage) for group in groups)
+
     def get_acceptable_attestations(
         self, slot: Slot, committee_index: CommitteeIndex, beacon_block_root: Root
     ) -> Tuple[Attestation, ...]:
         return tuple(
-            filter(
-                lambda attestation: (
-                    beacon_block_root == attestation.data.beacon_block_root
-                    and slot == attestation.data.slot
-                    and committee_index == attestation.data.index
-                ),
-                self._pool_storage.values(),
+            self._pool_storage[root]
+            for root in self._by_committee.get(
+                (slot, committee_index, beacon_block_root), ()
+            )
+        )
+
+    def get_attestations_by_target_epoch(self, epoch: Epoch) -> Tuple[Attestation, ...]:
+        return tuple(
+            self._pool_storage[root] for root in self._by_target_epoch.get(epoch, ())
+        )
+
+    @staticmethod
+    def _get_includable_slots(slot: Slot, config: Eth2Config) -> Iterable[Slot]:
+        return (
+            Slot(attestation_slot)
+            for attestation_slot in range(
+                max(0, slot - config.SLOTS_PER_EPOCH),
+                slot - config.MIN_ATTESTATION_INCLUSION_DELAY + 1,
             )
         )
+
+    def _add_to_group(self, attestation: Attestation, root: Root) -> None:
+        mask = _to_mask(attestation.aggregation_bits)
+        groups = self._groups[attestation.data.hash_tree_root]
+        for group in groups:
+            if not group.mask & mask:
+                group.add(root, mask)
+                return
+        groups.append(_AggregateGroup())
+        groups[-1].add(root, mask)
+
+    def _remove_from_group(self, attestation: Attestation, root: Root) -> None:
+        data_root = attestation.data.hash_tree_root
+        groups = self._groups[data_root]
+        for group in groups:
+            if root in group.roots:
+                remaining_roots = tuple(
+                    remaining_root
+                    for remaining_root in group.roots
+                    if remaining_root != root
+                )
+                groups.remove(group)
+                break
+        else:
+            return
+
+        if not groups:
+            del self._groups[data_root]
+        # the rest of the group may fit into other groups now
+        for remaining_root in remaining_roots:
+            self._add_to_group(self._pool_storage[remaining_root], remaining_root)
+
+
+def _discard(index: DefaultDict[Any, Set[Root]], key: Any, root: Root) -> None:
+    roots = index.get(key)
+    if roots is None:
+        return
+    roots.discard(root)
+    if not roots:
+        del index[key]
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 import logging
-from typing import Tuple, Type
+from typing import Optional, Tuple, Type
 
 from eth._utils.datatypes import Configurable
 
@@ -12,6 +12,7 @@ from eth2.beacon.types.states import BeaconState
 from eth2.beacon.typing import Timestamp
 from eth2.configs import Eth2Config
 
+from .state_cache import AdvancedStateCache
 from .state_transitions import BaseStateTransition
 
 logger = logging.getLogger("trinity.beacon.state_machines")
@@ -30,9 +31,14 @@ class BaseBeaconStateMachine(Configurable, ABC):
     state_transition_class: Type[BaseStateTransition] = None
     fork_choice_scoring_class: Type[BaseForkChoiceScoring] = None
     fork_choice_scoring: BaseForkChoiceScoring = None
+    state_cache: Optional[AdvancedStateCache] = None
 
     @abstractmethod
-    def __init__(self, chaindb: BaseBeaconChainDB) -> None:
+    def __init__(
+        self,
+        chaindb: BaseBeaconChainDB,
+        state_cache: Optional[AdvancedStateCache] = None,
+    ) -> None:
         ...
 
     @classmethod
@@ -90,8 +96,13 @@ class BaseBeaconStateMachine(Configurable, ABC):
 
 
 class BeaconStateMachine(BaseBeaconStateMachine):
-    def __init__(self, chaindb: BaseBeaconChainDB) -> None:
+    def __init__(
+        self,
+        chaindb: BaseBeaconChainDB,
+        state_cache: Optional[AdvancedStateCache] = None,
+    ) -> None:
         self.chaindb = chaindb
+        self.state_cache = state_cache
 
     @classmethod
     def get_block_class(cls) -> Type[BaseBeaconBlock]:
@@ -130,7 +141,7 @@ class BeaconStateMachine(BaseBeaconStateMachine):
 
     @property
     def state_transition(self) -> BaseStateTransition:
-        return self.get_state_transiton_class()(self.config)
+        return self.get_state_transiton_class()(self.config, self.state_cache)
 
     @classmethod
     def get_fork_choice_scoring_class(cls) -> Type[BaseForkChoiceScoring]:
@@ -1,4 +1,4 @@
-from typing import Type  # noqa: F401
+from typing import Optional, Type  # noqa: F401
 
 from eth2.beacon.db.chain import BaseBeaconChainDB
 from eth2.beacon.db.exceptions import MissingForkChoiceContext
@@ -6,6 +6,7 @@ from eth2.beacon.fork_choice.lmd_ghost import Context as LMDGHOSTContext
 from eth2.beacon.fork_choice.lmd_ghost import LMDGHOSTScoring, Store
 from eth2.beacon.fork_choice.scoring import BaseForkChoiceScoring
 from eth2.beacon.state_machines.base import BeaconStateMachine
+from eth2.beacon.state_machines.state_cache import AdvancedStateCache
 from eth2.beacon.state_machines.state_transitions import (  # noqa: F401
     BaseStateTransition,
 )
@@ -31,12 +32,17 @@ class SerenityStateMachine(BeaconStateMachine):
     state_class = SerenityBeaconState  # type: Type[BeaconState]
     state_transition_class = SerenityStateTransition  # type: Type[BaseStateTransition]
     fork_choice_scoring_class = LMDGHOSTScoring  # type: Type[BaseForkChoiceScoring]
+    # configure with ``ProtoArrayStore`` to keep the weights of the blocks in a proto-array
+    fork_choice_store_class = Store  # type: Type[Store]
 
     def __init__(
-        self, chaindb: BaseBeaconChainDB, fork_choice_context: LMDGHOSTContext = None
+        self,
+        chaindb: BaseBeaconChainDB,
+        fork_choice_context: LMDGHOSTContext = None,
+        state_cache: Optional[AdvancedStateCache] = None,
     ) -> None:
-        super().__init__(chaindb)
-        self._fork_choice_store = Store(
+        super().__init__(chaindb, state_cache)
+        self._fork_choice_store = self.fork_choice_store_class(
             chaindb,
             self.block_class,
             self.config,
@@ -79,7 +85,7 @@ class SerenityStateMachine(BeaconStateMachine):
         self._fork_choice_store.on_tick(time)
 
     def on_block(self, block: BaseBeaconBlock) -> None:
-        self._fork_choice_store.on_block(block)
+        self._fork_choice_store.on_block(block, state_machine=self)
 
     def on_attestation(self, attestation: Attestation) -> None:
         self._fork_choice_store.on_attestation(attestation)
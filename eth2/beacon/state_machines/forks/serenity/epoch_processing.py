@@ -1,14 +1,16 @@
-from typing import Sequence, Set, Tuple
+from array import array
+from typing import Dict, List, Sequence, Set, Tuple
 
 from eth_typing import Hash32
 from eth_utils.toolz import curry
 from ssz.hashable_list import HashableList
 
+from eth2._utils.hash_tree import persist_hashable_structure
+from eth2._utils.numeric import integer_squareroot
 from eth2._utils.tuple import update_tuple_item, update_tuple_item_with_fn
-from eth2.beacon.constants import BASE_REWARDS_PER_EPOCH
+from eth2.beacon.constants import BASE_REWARDS_PER_EPOCH, FAR_FUTURE_EPOCH
 from eth2.beacon.epoch_processing_helpers import (
     compute_activation_exit_epoch,
-    decrease_balance,
     get_attesting_balance,
     get_attesting_indices,
     get_base_reward,
@@ -19,17 +21,19 @@ from eth2.beacon.epoch_processing_helpers import (
     get_total_balance,
     get_unslashed_attesting_indices,
     get_validator_churn_limit,
-    increase_balance,
 )
-from eth2.beacon.helpers import get_block_root, get_randao_mix
+from eth2.beacon.helpers import get_block_root, get_block_root_at_slot, get_randao_mix
 from eth2.beacon.types.checkpoints import Checkpoint
 from eth2.beacon.types.eth1_data import Eth1Data
 from eth2.beacon.types.historical_batch import HistoricalBatch
 from eth2.beacon.types.pending_attestations import PendingAttestation
-from eth2.beacon.types.states import BeaconState
+from eth2.beacon.types.states import BeaconState, BeaconStateEvolver
 from eth2.beacon.types.validators import Validator
 from eth2.beacon.typing import Bitfield, Epoch, Gwei, ValidatorIndex
-from eth2.beacon.validator_status_helpers import initiate_exit_for_validator
+from eth2.beacon.validator_status_helpers import (
+    compute_exit_queue_epochs,
+    set_validator_exit_epoch,
+)
 from eth2.configs import Eth2Config
 
 
@@ -259,6 +263,132 @@ def _is_threshold_met_against_committee(
 def get_attestation_deltas(
     state: BeaconState, config: Eth2Config
 ) -> Tuple[Sequence[Gwei], Sequence[Gwei]]:
+    """
+    Compute the rewards and penalties for the attestations of the previous epoch.
+
+    Equivalent to ``_get_attestation_deltas_reference`` but linear in the
+    number of validators: the attesting indices and the earliest inclusion of
+    every validator are collected in a single pass over the attestations, and
+    the deltas are accumulated in place.
+    """
+    validators = state.validators
+    validator_count = len(validators)
+    rewards = array("Q", bytes(8 * validator_count))
+    penalties = array("Q", bytes(8 * validator_count))
+
+    previous_epoch = state.previous_epoch(config.SLOTS_PER_EPOCH, config.GENESIS_EPOCH)
+    total_balance = get_total_active_balance(state, config)
+    balance_sqrt = integer_squareroot(total_balance)
+
+    effective_balances = tuple(v.effective_balance for v in validators)
+    is_slashed = tuple(v.slashed for v in validators)
+    base_rewards = tuple(
+        effective_balance
+        * config.BASE_REWARD_FACTOR
+        // balance_sqrt
+        // BASE_REWARDS_PER_EPOCH
+        for effective_balance in effective_balances
+    )
+    eligible_validator_indices = tuple(
+        ValidatorIndex(index)
+        for index, v in enumerate(validators)
+        if v.is_active(previous_epoch)
+        or (v.slashed and previous_epoch + 1 < v.withdrawable_epoch)
+    )
+
+    target_root = get_block_root(
+        state, previous_epoch, config.SLOTS_PER_EPOCH, config.SLOTS_PER_HISTORICAL_ROOT
+    )
+    source_indices: Set[ValidatorIndex] = set()
+    target_indices: Set[ValidatorIndex] = set()
+    head_indices: Set[ValidatorIndex] = set()
+    # validator index -> (inclusion delay, proposer index) of its earliest inclusion
+    earliest_inclusions: Dict[ValidatorIndex, Tuple[int, ValidatorIndex]] = {}
+
+    for attestation in get_matching_source_attestations(state, previous_epoch, config):
+        data = attestation.data
+        attesting_indices = get_attesting_indices(
+            state, data, attestation.aggregation_bits, config
+        )
+
+        source_indices.update(attesting_indices)
+        if data.target.root == target_root:
+            target_indices.update(attesting_indices)
+        if data.beacon_block_root == get_block_root_at_slot(
+            state, data.slot, config.SLOTS_PER_HISTORICAL_ROOT
+        ):
+            head_indices.update(attesting_indices)
+
+        inclusion = (attestation.inclusion_delay, attestation.proposer_index)
+        for index in attesting_indices:
+            # strict comparison so that, like ``min``, the first of several
+            # attestations with the same delay wins
+            if (
+                index not in earliest_inclusions
+                or inclusion[0] < earliest_inclusions[index][0]
+            ):
+                earliest_inclusions[index] = inclusion
+
+    unslashed_source_indices = set(
+        index for index in source_indices if not is_slashed[index]
+    )
+    unslashed_target_indices = set(
+        index for index in target_indices if not is_slashed[index]
+    )
+    unslashed_head_indices = set(
+        index for index in head_indices if not is_slashed[index]
+    )
+
+    for unslashed_attesting_indices in (
+        unslashed_source_indices,
+        unslashed_target_indices,
+        unslashed_head_indices,
+    ):
+        attesting_balance = max(
+            sum(effective_balances[index] for index in unslashed_attesting_indices), 1
+        )
+        for index in eligible_validator_indices:
+            if index in unslashed_attesting_indices:
+                rewards[index] += (
+                    base_rewards[index] * attesting_balance // total_balance
+                )
+            else:
+                penalties[index] += base_rewards[index]
+
+    for index in unslashed_source_indices:
+        inclusion_delay, proposer_index = earliest_inclusions[index]
+        base_reward = base_rewards[index]
+        proposer_reward = base_reward // config.PROPOSER_REWARD_QUOTIENT
+        rewards[proposer_index] += proposer_reward
+        max_attester_reward = base_reward - proposer_reward
+        rewards[index] += max_attester_reward // inclusion_delay
+
+    finality_delay = previous_epoch - state.finalized_checkpoint.epoch
+    if finality_delay > config.MIN_EPOCHS_TO_INACTIVITY_PENALTY:
+        for index in eligible_validator_indices:
+            penalties[index] += BASE_REWARDS_PER_EPOCH * base_rewards[index]
+            if index not in unslashed_target_indices:
+                penalties[index] += (
+                    effective_balances[index]
+                    * finality_delay
+                    // config.INACTIVITY_PENALTY_QUOTIENT
+                )
+
+    return (
+        tuple(Gwei(reward) for reward in rewards),
+        tuple(Gwei(penalty) for penalty in penalties),
+    )
+
+
+def _get_attestation_deltas_reference(
+    state: BeaconState, config: Eth2Config
+) -> Tuple[Sequence[Gwei], Sequence[Gwei]]:
+    """
+    A literal transcription of ``get_attestation_deltas`` from the spec.
+
+    It is quadratic in the number of validators, so it is only kept to check
+    ``get_attestation_deltas`` against.
+    """
     rewards = tuple(0 for _ in range(len(state.validators)))
     penalties = tuple(0 for _ in range(len(state.validators)))
     previous_epoch = state.previous_epoch(config.SLOTS_PER_EPOCH, config.GENESIS_EPOCH)
@@ -374,31 +504,33 @@ def process_rewards_and_penalties(
         state, config
     )
 
+    evolver = state.transient()
     for index in range(len(state.validators)):
-        index = ValidatorIndex(index)
-        state = increase_balance(state, index, Gwei(rewards_for_attestations[index]))
-        state = decrease_balance(state, index, Gwei(penalties_for_attestations[index]))
+        evolver.increase_balance(index, Gwei(rewards_for_attestations[index]))
+        evolver.decrease_balance(index, Gwei(penalties_for_attestations[index]))
 
-    return state
+    return evolver.persistent()
 
 
-@curry
-def _process_activation_eligibility_or_ejections(
-    state: BeaconState, index: ValidatorIndex, config: Eth2Config
-) -> BeaconState:
-    current_epoch = state.current_epoch(config.SLOTS_PER_EPOCH)
-    validator = state.validators[index]
+def _process_activation_eligibility(
+    evolver: BeaconStateEvolver, index: ValidatorIndex, config: Eth2Config
+) -> bool:
+    """
+    Make the validator at ``index`` eligible for the activation queue if it can be,
+    and return whether it is to be ejected.
+    """
+    current_epoch = evolver.state.current_epoch(config.SLOTS_PER_EPOCH)
+    validator = evolver.validators[index]
 
     if validator.is_eligible_for_activation_queue(config):
         validator = validator.set("activation_eligibility_epoch", current_epoch + 1)
+        evolver.validators[index] = validator
 
-    if (
+    return (
         validator.is_active(current_epoch)
         and validator.effective_balance <= config.EJECTION_BALANCE
-    ):
-        validator = initiate_exit_for_validator(validator, state, config)
-
-    return state.transform(("validators", index), validator)
+        and validator.exit_epoch == FAR_FUTURE_EPOCH
+    )
 
 
 @curry
@@ -414,33 +546,38 @@ def _update_validator_activation_epoch(
 
 
 def process_registry_updates(state: BeaconState, config: Eth2Config) -> BeaconState:
-    new_state = state
+    evolver = state.transient()
+    ejected_indices: List[ValidatorIndex] = []
     for index in range(len(state.validators)):
-        new_state = _process_activation_eligibility_or_ejections(
-            new_state, index, config
+        if _process_activation_eligibility(evolver, ValidatorIndex(index), config):
+            ejected_indices.append(ValidatorIndex(index))
+
+    # The exit queue only depends on the exits initiated before, so the exits of the
+    # ejected validators are computed together instead of one state at a time.
+    validators = evolver.validators
+    exit_epochs = compute_exit_queue_epochs(state, len(ejected_indices), config)
+    for index, exit_epoch in zip(ejected_indices, exit_epochs):
+        validators[index] = set_validator_exit_epoch(
+            validators[index], exit_epoch, config
         )
 
     # Queue validators eligible for activation and not yet dequeued for activation
     activation_queue = sorted(
         (
             index
-            for index, validator in enumerate(new_state.validators)
-            if validator.is_eligible_for_activation(state)
+            for index in range(len(validators))
+            if validators[index].is_eligible_for_activation(state)
         ),
         # Order by the sequence of activation_eligibility_epoch setting and then index
-        key=lambda index: (
-            new_state.validators[index].activation_eligibility_epoch,
-            index,
-        ),
+        key=lambda index: (validators[index].activation_eligibility_epoch, index),
     )
 
     # Dequeued validators for activation up to churn limit
+    update_activation_epoch = _update_validator_activation_epoch(state, config)
     for index in activation_queue[: get_validator_churn_limit(state, config)]:
-        new_state = new_state.transform(
-            ("validators", index), _update_validator_activation_epoch(state, config)
-        )
+        validators[index] = update_activation_epoch(validators[index])
 
-    return new_state
+    return evolver.persistent()
 
 
 def _determine_slashing_penalty(
@@ -456,8 +593,8 @@ def process_slashings(state: BeaconState, config: Eth2Config) -> BeaconState:
     total_balance = get_total_active_balance(state, config)
 
     slashing_period = config.EPOCHS_PER_SLASHINGS_VECTOR // 2
+    evolver = state.transient()
     for index, validator in enumerate(state.validators):
-        index = ValidatorIndex(index)
         if (
             validator.slashed
             and current_epoch + slashing_period == validator.withdrawable_epoch
@@ -468,8 +605,8 @@ def process_slashings(state: BeaconState, config: Eth2Config) -> BeaconState:
                 validator.effective_balance,
                 config.EFFECTIVE_BALANCE_INCREMENT,
             )
-            state = decrease_balance(state, index, penalty)
-    return state
+            evolver.decrease_balance(index, penalty)
+    return evolver.persistent()
 
 
 def _determine_next_eth1_votes(
@@ -483,9 +620,9 @@ def _determine_next_eth1_votes(
 
 def _update_effective_balances(
     state: BeaconState, config: Eth2Config
-) -> Tuple[Validator, ...]:
+) -> HashableList[Validator]:
     half_increment = config.EFFECTIVE_BALANCE_INCREMENT // 2
-    new_validators = state.validators
+    new_validators = state.validators.evolver()
     for index, validator in enumerate(state.validators):
         balance = state.balances[index]
         if balance < validator.effective_balance or (
@@ -495,10 +632,10 @@ def _update_effective_balances(
                 balance - balance % config.EFFECTIVE_BALANCE_INCREMENT,
                 config.MAX_EFFECTIVE_BALANCE,
             )
-            new_validators = new_validators.transform(
-                (index, "effective_balance"), new_effective_balance
+            new_validators[index] = validator.set(
+                "effective_balance", new_effective_balance
             )
-    return new_validators
+    return persist_hashable_structure(new_validators)
 
 
 def _compute_next_slashings(state: BeaconState, config: Eth2Config) -> Tuple[Gwei, ...]:
@@ -1,8 +1,8 @@
+from eth2._utils.bls import bls
 from eth2.beacon.state_machines.state_transitions import BaseStateTransition
 from eth2.beacon.types.blocks import BaseSignedBeaconBlock
 from eth2.beacon.types.states import BeaconState
 from eth2.beacon.typing import Slot
-from eth2.configs import Eth2Config
 
 from .block_processing import process_block
 from .block_validation import validate_proposer_signature
@@ -12,9 +12,6 @@ from .slot_processing import process_slots
 class SerenityStateTransition(BaseStateTransition):
     config = None
 
-    def __init__(self, config: Eth2Config):
-        self.config = config
-
     def apply_state_transition(
         self,
         state: BeaconState,
@@ -28,11 +25,19 @@ class SerenityStateTransition(BaseStateTransition):
         target_slot = signed_block.message.slot if signed_block else future_slot
         assert target_slot is not None
 
-        state = process_slots(state, target_slot, self.config)
+        if self.state_cache is None:
+            state = process_slots(state, target_slot, self.config)
+        else:
+            state = self.state_cache.process_slots(
+                state, target_slot, self.config, process_slots
+            )
 
         if signed_block:
-            if check_proposer_signature:
-                validate_proposer_signature(state, signed_block, self.config)
-            state = process_block(state, signed_block.message, self.config)
+            # The proposer, RANDAO and operation signatures of the block are
+            # verified together once the block has been processed.
+            with bls.batch():
+                if check_proposer_signature:
+                    validate_proposer_signature(state, signed_block, self.config)
+                state = process_block(state, signed_block.message, self.config)
 
         return state
@@ -0,0 +1,95 @@
+from typing import Any, Callable, Dict, Optional
+
+from lru import LRU
+
+from eth2.beacon.types.states import BeaconState
+from eth2.beacon.typing import Root, Slot
+from eth2.configs import Eth2Config
+
+DEFAULT_ADVANCED_STATE_CACHE_SIZE = 32
+
+ProcessSlotsFn = Callable[[BeaconState, Slot, Eth2Config], BeaconState]
+
+
+class AdvancedStateCache:
+    """
+    Cache the states ``process_slots`` produced, by the root of the state they were
+    advanced from and the slot they were advanced to.
+
+    A chain imports the block of a slot on top of the same parent state its gossip
+    validators have already advanced to that slot, so the empty slots, and
+    particularly the epoch transition among them, only have to be processed once.
+    A transition that crosses an epoch boundary is split at the boundary and the
+    state at the start of the epoch is cached as well, so that one precomputed
+    epoch transition serves the blocks of every slot of the next epoch.
+
+    Advancing a state slot by slot or all at once gives the same state, so the
+    cached states are keyed by the state they were first advanced from: advancing
+    a state of the empty slots after a block, e.g. the head state after a skipped
+    slot, looks up the states advanced from the post-state of the block.
+    """
+
+    def __init__(self, size: int = DEFAULT_ADVANCED_STATE_CACHE_SIZE) -> None:
+        self._states = LRU(size)
+        # the root of the state every cached state was first advanced from
+        self._origins = LRU(size)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "AdvancedStateCache":
+        # ``LRU`` can not be copied; a copy starts empty, like the cached states
+        # can always be computed again
+        return type(self)(self._states.get_size())
+
+    def get(self, pre_state_root: Root, slot: Slot) -> Optional[BeaconState]:
+        return self._states.get((pre_state_root, slot))
+
+    def put(self, pre_state_root: Root, state: BeaconState) -> None:
+        self._states[(pre_state_root, state.slot)] = state
+        self._origins[state.hash_tree_root] = pre_state_root
+
+    def clear(self) -> None:
+        self._states.clear()
+        self._origins.clear()
+
+    def process_slots(
+        self,
+        state: BeaconState,
+        slot: Slot,
+        config: Eth2Config,
+        process_slots: ProcessSlotsFn,
+    ) -> BeaconState:
+        """
+        Return ``process_slots(state, slot, config)``, reusing the cached states.
+        """
+        if state.slot >= slot:
+            # nothing to advance; let ``process_slots`` validate the request
+            return process_slots(state, slot, config)
+
+        pre_state_root = self._origins.get(state.hash_tree_root, state.hash_tree_root)
+        post_state = self.get(pre_state_root, slot)
+        if post_state is not None:
+            self.hits += 1
+            return post_state
+
+        next_epoch_start_slot = Slot(
+            (state.slot // config.SLOTS_PER_EPOCH + 1) * config.SLOTS_PER_EPOCH
+        )
+        if next_epoch_start_slot < slot:
+            epoch_start_state = self.get(pre_state_root, next_epoch_start_slot)
+            if epoch_start_state is None:
+                self.misses += 1
+                epoch_start_state = process_slots(state, next_epoch_start_slot, config)
+                self.put(pre_state_root, epoch_start_state)
+            else:
+                self.hits += 1
+            post_state = process_slots(epoch_start_state, slot, config)
+        else:
+            self.misses += 1
+            post_state = process_slots(state, slot, config)
+
+        self.put(pre_state_root, post_state)
+        return post_state
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from eth._utils.datatypes import Configurable
 
@@ -7,12 +8,17 @@ from eth2.beacon.types.states import BeaconState
 from eth2.beacon.typing import Slot
 from eth2.configs import Eth2Config
 
+from .state_cache import AdvancedStateCache
+
 
 class BaseStateTransition(Configurable, ABC):
     config = None
 
-    def __init__(self, config: Eth2Config):
+    def __init__(
+        self, config: Eth2Config, state_cache: Optional[AdvancedStateCache] = None
+    ):
         self.config = config
+        self.state_cache = state_cache
 
     @abstractmethod
     def apply_state_transition(
@@ -2,8 +2,9 @@ from typing import Any, Dict, Optional, Tuple, Type
 
 from eth_utils import decode_hex
 
-from eth2.beacon.committee_helpers import compute_shuffled_index
+from eth2.beacon.committee_helpers import compute_shuffled_indices
 from eth2.beacon.tools.fixtures.test_handler import TestHandler
+from eth2.beacon.typing import ValidatorIndex
 from eth2.configs import Eth2Config
 
 from . import TestType
@@ -27,9 +28,10 @@ class CoreHandler(TestHandler[Tuple[int, bytes], Tuple[int, ...]]):
     @classmethod
     def run_with(_cls, inputs: Any, config: Optional[Eth2Config]) -> Tuple[int, ...]:
         count, seed = inputs
-        return tuple(
-            compute_shuffled_index(index, count, seed, config.SHUFFLE_ROUND_COUNT)
-            for index in range(count)
+        return compute_shuffled_indices(
+            tuple(ValidatorIndex(index) for index in range(count)),
+            seed,
+            config.SHUFFLE_ROUND_COUNT,
         )
 
     @staticmethod
@@ -1,11 +1,13 @@
-from typing import Sequence, Type, TypeVar
+from typing import Any, Dict, Sequence, Type, TypeVar
 
 from eth.constants import ZERO_HASH32
 from eth_typing import Hash32
 from eth_utils import humanize_hash
+from ssz.abc import HashableStructureEvolverAPI
 from ssz.hashable_container import HashableContainer
 from ssz.sedes import Bitvector, List, Vector, bytes32, uint64
 
+from eth2._utils.hash_tree import persist_hashable_structure
 from eth2.beacon.constants import JUSTIFICATION_BITS_LENGTH, ZERO_ROOT
 from eth2.beacon.helpers import compute_epoch_at_slot
 from eth2.beacon.typing import Bitfield, Epoch, Gwei, Root, Slot, Timestamp
@@ -181,3 +183,63 @@ class BeaconState(HashableContainer):
 
     def next_epoch(self, slots_per_epoch: int) -> Epoch:
         return Epoch(self.current_epoch(slots_per_epoch) + 1)
+
+    def transient(self) -> "BeaconStateEvolver":
+        return BeaconStateEvolver(self)
+
+
+class BeaconStateEvolver:
+    """
+    A transient view of a ``BeaconState`` whose list and vector fields, like
+    ``balances`` and ``validators``, can be updated item by item in place.
+
+    ``persistent`` freezes all updates into one new ``BeaconState``, rehashing the
+    paths to the updated items once, instead of creating a new version of the
+    state (and of its hash tree) for every single update.
+    """
+
+    def __init__(self, state: BeaconState) -> None:
+        self._state = state
+        self._field_evolvers: Dict[str, HashableStructureEvolverAPI[Any, Any]] = {}
+
+    @property
+    def state(self) -> BeaconState:
+        """
+        The state this evolver was created from, without any of its updates.
+        """
+        return self._state
+
+    def __getitem__(self, field_name: str) -> HashableStructureEvolverAPI[Any, Any]:
+        if field_name not in self._field_evolvers:
+            self._field_evolvers[field_name] = self._state[field_name].evolver()
+        return self._field_evolvers[field_name]
+
+    @property
+    def balances(self) -> HashableStructureEvolverAPI[Any, Gwei]:
+        return self["balances"]
+
+    @property
+    def validators(self) -> HashableStructureEvolverAPI[Any, Validator]:
+        return self["validators"]
+
+    def increase_balance(self, index: int, delta: Gwei) -> None:
+        if delta:
+            self.balances[index] = Gwei(self.balances[index] + delta)
+
+    def decrease_balance(self, index: int, delta: Gwei) -> None:
+        if delta:
+            balance = self.balances[index]
+            self.balances[index] = Gwei(0) if delta > balance else Gwei(balance - delta)
+
+    def persistent(self) -> BeaconState:
+        updates = tuple(
+            update
+            for field_name, field_evolver in self._field_evolvers.items()
+            if field_evolver.is_dirty()
+            for update in (field_name, persist_hashable_structure(field_evolver))
+        )
+
+        if updates:
+            return self._state.mset(*updates)
+        else:
+            return self._state
@@ -1,4 +1,5 @@
 from functools import partial
+from typing import Tuple
 
 from eth_utils.toolz import curry
 
@@ -25,9 +26,10 @@ def activate_validator(validator: Validator, activation_epoch: Epoch) -> Validat
     )
 
 
-def _compute_exit_queue_epoch(
-    state: BeaconState, churn_limit: int, config: Eth2Config
-) -> Epoch:
+def _get_exit_queue(state: BeaconState, config: Eth2Config) -> Tuple[Epoch, int]:
+    """
+    Return the last epoch of the exit queue and the number of validators exiting in it.
+    """
     slots_per_epoch = config.SLOTS_PER_EPOCH
 
     exit_epochs = tuple(
@@ -44,9 +46,53 @@ def _compute_exit_queue_epoch(
     exit_queue_churn = len(
         tuple(v for v in state.validators if v.exit_epoch == exit_queue_epoch)
     )
+    return Epoch(exit_queue_epoch), exit_queue_churn
+
+
+def _compute_exit_queue_epoch(
+    state: BeaconState, churn_limit: int, config: Eth2Config
+) -> Epoch:
+    exit_queue_epoch, exit_queue_churn = _get_exit_queue(state, config)
     if exit_queue_churn >= churn_limit:
-        exit_queue_epoch += 1
-    return Epoch(exit_queue_epoch)
+        return Epoch(exit_queue_epoch + 1)
+    else:
+        return exit_queue_epoch
+
+
+def compute_exit_queue_epochs(
+    state: BeaconState, exit_count: int, config: Eth2Config
+) -> Tuple[Epoch, ...]:
+    """
+    Return the exit epochs ``initiate_exit_for_validator`` gives to ``exit_count``
+    validators that exit one after the other, starting from ``state``.
+
+    The exits only depend on the ones before them, so the state doesn't have to be
+    updated between them.
+    """
+    if not exit_count:
+        return ()
+
+    churn_limit = get_validator_churn_limit(state, config)
+    exit_queue_epoch, exit_queue_churn = _get_exit_queue(state, config)
+    exit_queue_epochs = []
+    for _ in range(exit_count):
+        if exit_queue_churn >= churn_limit:
+            exit_queue_epoch = Epoch(exit_queue_epoch + 1)
+            exit_queue_churn = 0
+        exit_queue_epochs.append(exit_queue_epoch)
+        exit_queue_churn += 1
+    return tuple(exit_queue_epochs)
+
+
+def set_validator_exit_epoch(
+    validator: Validator, exit_epoch: Epoch, config: Eth2Config
+) -> Validator:
+    return validator.mset(
+        "exit_epoch",
+        exit_epoch,
+        "withdrawable_epoch",
+        Epoch(exit_epoch + config.MIN_VALIDATOR_WITHDRAWABILITY_DELAY),
+    )
 
 
 # NOTE: adding ``curry`` here gets mypy to allow use of this elsewhere.
@@ -64,12 +110,7 @@ def initiate_exit_for_validator(
     churn_limit = get_validator_churn_limit(state, config)
     exit_queue_epoch = _compute_exit_queue_epoch(state, churn_limit, config)
 
-    return validator.mset(
-        "exit_epoch",
-        exit_queue_epoch,
-        "withdrawable_epoch",
-        Epoch(exit_queue_epoch + config.MIN_VALIDATOR_WITHDRAWABILITY_DELAY),
-    )
+    return set_validator_exit_epoch(validator, exit_queue_epoch, config)
 
 
 def initiate_validator_exit(
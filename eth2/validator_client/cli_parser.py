@@ -1,5 +1,7 @@
 import argparse
+import contextlib
 import logging
+from typing import ContextManager, Optional
 
 import argcomplete
 from async_service.trio import background_trio_service
@@ -8,8 +10,13 @@ from eth2.clock import Clock
 from eth2.validator_client.beacon_node import MockBeaconNode as BeaconNode
 from eth2.validator_client.client import Client
 from eth2.validator_client.config import Config
+from eth2.validator_client.key_pair_cache import KeyPairCache
 from eth2.validator_client.key_store import KeyStore
-from eth2.validator_client.tools.password_providers import terminal_password_provider
+from eth2.validator_client.signatory_db import SignatoryDB
+from eth2.validator_client.tools.password_providers import (
+    terminal_master_password_provider,
+    terminal_password_provider,
+)
 from trinity._utils.trio_utils import wait_for_interrupts
 from trinity.cli_parser import parser, subparser
 
@@ -17,12 +24,21 @@ IMPORT_PARSER_HELP_MSG = (
     "import a validator private key to the keystore discovered from the configuration"
 )
 IMPORT_PARSER_KEY_ARGUMENT_HELP_MSG = "private key, encoded as big-endian hex"
+KEY_PAIR_CACHE_HELP_MSG = (
+    "load the key files of the keystore and keep their key pairs in a cache"
+    " unlocked with a single master password, prompted for at startup"
+)
 
 
 async def _main(
     logger: logging.Logger, config: Config, arguments: argparse.Namespace
 ) -> None:
-    key_store = KeyStore.from_config(config)
+    key_pair_cache: Optional[KeyPairCache] = None
+    if arguments.key_pair_cache:
+        key_pair_cache = KeyPairCache(
+            config.key_pair_cache_path, terminal_master_password_provider()
+        )
+    key_store = KeyStore.from_config(config, key_pair_cache)
     clock = Clock(
         config.seconds_per_slot,
         config.genesis_time,
@@ -30,13 +46,18 @@ async def _main(
         config.seconds_per_epoch,
     )
     beacon_node = BeaconNode.from_config(config)
+    signatory_db = SignatoryDB.from_config(config)
 
-    # with key_store.persistence():
-    async with beacon_node:
-        client = Client(key_store, clock, beacon_node)
-        async with background_trio_service(client):
-            await wait_for_interrupts()
-            logger.info("received interrupt; shutting down...")
+    # the key files are only loaded when they can be unlocked through the cache
+    persistence: ContextManager[object] = (
+        key_store.persistence() if key_pair_cache else contextlib.nullcontext()
+    )
+    with persistence:
+        async with beacon_node:
+            client = Client(key_store, clock, beacon_node, signatory_db)
+            async with background_trio_service(client):
+                await wait_for_interrupts()
+                logger.info("received interrupt; shutting down...")
 
 
 async def _import_key(
@@ -56,6 +77,9 @@ async def _import_key(
 
 def parse_cli_args() -> argparse.ArgumentParser:
     parser.set_defaults(func=_main)
+    parser.add_argument(
+        "--key-pair-cache", action="store_true", help=KEY_PAIR_CACHE_HELP_MSG
+    )
 
     import_key_parser = subparser.add_parser("import-key", help=IMPORT_PARSER_HELP_MSG)
     import_key_parser.add_argument(
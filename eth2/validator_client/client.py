@@ -1,5 +1,5 @@
 import logging
-from typing import AsyncIterable, Collection
+from typing import AsyncIterable, Collection, Optional
 
 from async_service.base import Service
 from eth_typing import BLSPubkey
@@ -47,13 +47,14 @@ class Client(Service):
         key_store: KeyStoreAPI,
         clock: AsyncIterable[Tick],
         beacon_node: BeaconNodeAPI,
+        signature_db: Optional[SignatoryDatabaseAPI] = None,
     ) -> None:
         self._key_store = key_store
         self._clock = clock
         self._beacon_node = beacon_node
 
         self._duty_store = DutyStore()
-        self._signature_db = InMemorySignatoryDB()
+        self._signature_db = signature_db if signature_db else InMemorySignatoryDB()
 
     async def _run_client(self) -> None:
         # NOTE: all duties dispatched from the scheduler are expected to be
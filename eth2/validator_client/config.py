@@ -11,6 +11,7 @@ DEFAULT_BEACON_NODE_ENDPOINT = "http://127.0.0.1:30303"
 DEFAULT_VALIDATOR_DATA_DIR = Path("validator_client")
 DEFAULT_KEY_STORE_DIR_SUFFIX = Path("key_store")
 DEFAULT_SIGNATORY_DB_DIR_SUFFIX = Path("db") / "signatory"
+DEFAULT_KEY_PAIR_CACHE_SUFFIX = Path("key_pair_cache.json")
 
 
 class Config:
@@ -26,6 +27,7 @@ class Config:
         beacon_node_endpoint: str = DEFAULT_BEACON_NODE_ENDPOINT,
         key_store_dir_suffix: Path = DEFAULT_KEY_STORE_DIR_SUFFIX,
         signatory_db_handle: Path = DEFAULT_SIGNATORY_DB_DIR_SUFFIX,
+        key_pair_cache_suffix: Path = DEFAULT_KEY_PAIR_CACHE_SUFFIX,
         slots_per_epoch: Slot = None,
         seconds_per_slot: int = None,
         genesis_time: int = None,
@@ -35,6 +37,7 @@ class Config:
         self.beacon_node_endpoint = beacon_node_endpoint
         self.key_store_dir_suffix = key_store_dir_suffix
         self.signatory_db_handle = signatory_db_handle
+        self.key_pair_cache_suffix = key_pair_cache_suffix
         self.slots_per_epoch = slots_per_epoch
         self.seconds_per_slot = seconds_per_slot
         self.genesis_time = genesis_time
@@ -46,3 +49,12 @@ class Config:
     @cached_property
     def key_store_dir(self) -> Path:
         return self._root_data_dir / self.key_store_dir_suffix
+
+    @cached_property
+    def signatory_db_dir(self) -> Path:
+        return self._root_data_dir / self.signatory_db_handle
+
+    @cached_property
+    def key_pair_cache_path(self) -> Path:
+        # NOTE: not inside the key store dir, where every file is read as a key file
+        return self._root_data_dir / self.key_pair_cache_suffix
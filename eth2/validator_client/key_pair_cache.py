@@ -0,0 +1,126 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, Tuple
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+from eth_typing import BLSPubkey
+from eth_utils import decode_hex, encode_hex
+
+from eth2.validator_client.typing import BLSPrivateKey
+
+CACHE_VERSION = 1
+KEY_LENGTH = 32
+NONCE_LENGTH = 12
+SALT_LENGTH = 32
+# scrypt parameters of the key derivation, run once per load or store
+DEFAULT_SCRYPT_N = 2 ** 18
+DEFAULT_SCRYPT_R = 8
+DEFAULT_SCRYPT_P = 1
+
+# The key pairs of a key store by key file ID
+CachedKeyPairs = Dict[str, Tuple[BLSPubkey, BLSPrivateKey]]
+
+
+def _derive_key(password: bytes, salt: bytes, n: int, r: int, p: int) -> bytes:
+    kdf = Scrypt(salt=salt, length=KEY_LENGTH, n=n, r=r, p=p, backend=default_backend())
+    return kdf.derive(password)
+
+
+class KeyPairCache:
+    """
+    All key pairs of a ``KeyStore`` in one file, encrypted with a single master
+    password. Unlocking the cache costs one key derivation, instead of one for
+    every key file in the key store.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        password: bytes,
+        scrypt_n: int = DEFAULT_SCRYPT_N,
+        scrypt_r: int = DEFAULT_SCRYPT_R,
+        scrypt_p: int = DEFAULT_SCRYPT_P,
+    ) -> None:
+        self._path = path
+        self._password = password
+        self._scrypt_n = scrypt_n
+        self._scrypt_r = scrypt_r
+        self._scrypt_p = scrypt_p
+
+    def load(self) -> CachedKeyPairs:
+        """
+        Return the cached key pairs, or nothing if there is no cache yet.
+        Raises ``ValueError`` if the password is incorrect or the cache corrupted.
+        """
+        if not self._path.exists():
+            return {}
+
+        with open(self._path) as cache_handle:
+            cache_json = json.load(cache_handle)
+        if cache_json["version"] != CACHE_VERSION:
+            raise ValueError(
+                f"unsupported key pair cache version {cache_json['version']}"
+            )
+
+        kdf_params = cache_json["kdfparams"]
+        key = _derive_key(
+            self._password,
+            decode_hex(kdf_params["salt"]),
+            kdf_params["n"],
+            kdf_params["r"],
+            kdf_params["p"],
+        )
+        try:
+            plaintext = AESGCM(key).decrypt(
+                decode_hex(cache_json["nonce"]),
+                decode_hex(cache_json["ciphertext"]),
+                None,
+            )
+        except InvalidTag:
+            raise ValueError("password was incorrect for the key pair cache")
+
+        return {
+            key_file_id: (
+                BLSPubkey(decode_hex(public_key)),
+                BLSPrivateKey(int.from_bytes(decode_hex(private_key), "little")),
+            )
+            for key_file_id, (public_key, private_key) in json.loads(plaintext).items()
+        }
+
+    def store(self, key_pairs: CachedKeyPairs) -> None:
+        plaintext = json.dumps(
+            {
+                key_file_id: (
+                    encode_hex(public_key),
+                    encode_hex(private_key.to_bytes(32, "little")),
+                )
+                for key_file_id, (public_key, private_key) in key_pairs.items()
+            }
+        ).encode()
+        salt = os.urandom(SALT_LENGTH)
+        nonce = os.urandom(NONCE_LENGTH)
+        key = _derive_key(
+            self._password, salt, self._scrypt_n, self._scrypt_r, self._scrypt_p
+        )
+        cache_json = {
+            "version": CACHE_VERSION,
+            "kdfparams": {
+                "salt": encode_hex(salt),
+                "n": self._scrypt_n,
+                "r": self._scrypt_r,
+                "p": self._scrypt_p,
+            },
+            "nonce": encode_hex(nonce),
+            "ciphertext": encode_hex(AESGCM(key).encrypt(nonce, plaintext, None)),
+        }
+
+        # write the new cache next to the old one first, so a crash leaves either
+        tmp_path = self._path.with_suffix(".tmp")
+        with open(tmp_path, "w") as cache_handle:
+            json.dump(cache_json, cache_handle)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, self._path)
@@ -1,5 +1,7 @@
+from concurrent.futures import ProcessPoolExecutor
 import json
 import logging
+import os
 from pathlib import Path
 from types import TracebackType
 from typing import (
@@ -8,9 +10,12 @@ from typing import (
     Collection,
     ContextManager,
     Dict,
+    List,
     Optional,
+    Sequence,
     Tuple,
     Type,
+    cast,
 )
 
 import eth_keyfile
@@ -21,6 +26,7 @@ from eth2._utils.bls import bls
 from eth2._utils.humanize import humanize_bytes
 from eth2.validator_client.abc import KeyStoreAPI
 from eth2.validator_client.config import Config
+from eth2.validator_client.key_pair_cache import CachedKeyPairs, KeyPairCache
 from eth2.validator_client.tools.directory import create_dir_if_missing
 from eth2.validator_client.tools.password_providers import insecure_password_provider
 from eth2.validator_client.typing import BLSPrivateKey
@@ -35,12 +41,51 @@ def _deserialize_private_key(private_key: bytes) -> BLSPrivateKey:
 
 
 def _compute_key_pair_from_private_key_bytes(
-    private_key_bytes: bytes
+    private_key_bytes: bytes,
 ) -> Tuple[BLSPubkey, BLSPrivateKey]:
     private_key = _deserialize_private_key(private_key_bytes)
     return (bls.privtopub(private_key), private_key)
 
 
+def _decrypt_key_file(
+    keyfile_json: Dict[str, Any], password: bytes
+) -> Tuple[BLSPubkey, BLSPrivateKey]:
+    """
+    Module level entry point, so that key files can be decrypted in other processes.
+    """
+    return _compute_key_pair_from_private_key_bytes(
+        eth_keyfile.decode_keyfile_json(keyfile_json, password)
+    )
+
+
+def _try_decrypt_key_file(
+    keyfile_json: Dict[str, Any], password: bytes
+) -> Optional[Tuple[BLSPubkey, BLSPrivateKey]]:
+    """
+    Return ``None`` if the password is incorrect, so the caller learns about every
+    incorrect password at once.
+    """
+    try:
+        return _decrypt_key_file(keyfile_json, password)
+    except ValueError:
+        return None
+
+
+def _decrypt_key_files(
+    jobs: Sequence[Tuple[Dict[str, Any], bytes]]
+) -> Tuple[Optional[Tuple[BLSPubkey, BLSPrivateKey]], ...]:
+    """
+    Decrypt the key files with their passwords, spread over one process per CPU.
+    The key derivation functions of the key files dominate the cost.
+    """
+    if len(jobs) <= 1:
+        return tuple(_try_decrypt_key_file(*job) for job in jobs)
+
+    with ProcessPoolExecutor(min(len(jobs), os.cpu_count() or 1)) as executor:
+        futures = tuple(executor.submit(_try_decrypt_key_file, *job) for job in jobs)
+        return tuple(future.result() for future in futures)
+
+
 class KeyStore(KeyStoreAPI):
     """
     A ``KeyStore`` instance is a repository for the private and public keys
@@ -54,10 +99,14 @@ class KeyStore(KeyStoreAPI):
         key_pairs: Optional[Dict[BLSPubkey, BLSPrivateKey]] = None,
         key_store_dir: Optional[Path] = None,
         password_provider: Callable[[BLSPubkey], bytes] = insecure_password_provider,
+        key_pair_cache: Optional[KeyPairCache] = None,
     ) -> None:
         self._key_pairs = key_pairs if key_pairs else {}
         self._key_store_dir = key_store_dir
         self._password_provider = password_provider
+        # If given, the key pairs loaded from the key files are kept in this cache,
+        # so they are not decrypted one by one again next time.
+        self._key_pair_cache = key_pair_cache
 
         self._key_files: Dict[str, Dict[str, Any]] = {}
         # Mapping of public key to key file ID
@@ -65,8 +114,15 @@ class KeyStore(KeyStoreAPI):
         self._should_load_existing_key_pairs = False
 
     @classmethod
-    def from_config(cls, config: Config) -> "KeyStore":
-        return cls(config.key_pairs, config.key_store_dir, insecure_password_provider)
+    def from_config(
+        cls, config: Config, key_pair_cache: Optional[KeyPairCache] = None
+    ) -> "KeyStore":
+        return cls(
+            config.key_pairs,
+            config.key_store_dir,
+            insecure_password_provider,
+            key_pair_cache,
+        )
 
     def _ensure_dirs(self) -> None:
         did_create = create_dir_if_missing(self._key_store_dir)
@@ -122,8 +178,27 @@ class KeyStore(KeyStoreAPI):
         """
         Load all key pairs found in the key store directory.
         """
-        for key_file in self._key_store_dir.iterdir():
-            public_key, private_key, key_file_id = self._load_key_file(key_file)
+        key_files = tuple(
+            self._read_key_file(key_file) for key_file in self._key_store_dir.iterdir()
+        )
+        cached_key_pairs = self._key_pair_cache.load() if self._key_pair_cache else {}
+
+        loaded_key_pairs: CachedKeyPairs = {}
+        missing_key_files: List[Tuple[BLSPubkey, Dict[str, Any]]] = []
+        for public_key, keyfile_json in key_files:
+            key_file_id = keyfile_json["id"]
+            cached_key_pair = cached_key_pairs.get(key_file_id)
+            if cached_key_pair is not None and cached_key_pair[0] == public_key:
+                loaded_key_pairs[key_file_id] = cached_key_pair
+            else:
+                missing_key_files.append((public_key, keyfile_json))
+
+        for (public_key, keyfile_json), key_pair in zip(
+            missing_key_files, self._decrypt_key_files(missing_key_files)
+        ):
+            loaded_key_pairs[keyfile_json["id"]] = key_pair
+
+        for key_file_id, (public_key, private_key) in loaded_key_pairs.items():
             if public_key in self._key_pairs:
                 if private_key != self._key_pairs[public_key]:
                     self.logger.warn(
@@ -136,19 +211,48 @@ class KeyStore(KeyStoreAPI):
             self._key_pairs[public_key] = private_key
             self._key_file_index[public_key] = key_file_id
 
-    def _load_key_file(self, key_file: Path) -> Tuple[BLSPubkey, BLSPrivateKey, str]:
+        if self._key_pair_cache and loaded_key_pairs != cached_key_pairs:
+            self._key_pair_cache.store(loaded_key_pairs)
+
+    def _read_key_file(self, key_file: Path) -> Tuple[BLSPubkey, Dict[str, Any]]:
         with open(key_file) as key_file_handle:
             keyfile_json = json.load(key_file_handle)
-            public_key = BLSPubkey(decode_hex(keyfile_json["public_key"]))
-            password = self._password_provider(public_key)
-            try:
-                private_key = eth_keyfile.decode_keyfile_json(keyfile_json, password)
-            except ValueError:
-                self.logger.error(
-                    "password was incorrect for public key %s", encode_hex(public_key)
+        return BLSPubkey(decode_hex(keyfile_json["public_key"])), keyfile_json
+
+    def _decrypt_key_files(
+        self, key_files: Sequence[Tuple[BLSPubkey, Dict[str, Any]]]
+    ) -> Tuple[Tuple[BLSPubkey, BLSPrivateKey], ...]:
+        # Passwords may be entered by the user, so they are collected up front
+        jobs = tuple(
+            (keyfile_json, self._password_provider(public_key))
+            for public_key, keyfile_json in key_files
+        )
+        decrypted_key_pairs = _decrypt_key_files(jobs)
+
+        incorrect_public_keys = tuple(
+            public_key
+            for (public_key, _), key_pair in zip(key_files, decrypted_key_pairs)
+            if key_pair is None
+        )
+        for public_key in incorrect_public_keys:
+            self.logger.error(
+                "password was incorrect for public key %s", encode_hex(public_key)
+            )
+        if incorrect_public_keys:
+            raise ValueError(
+                f"password was incorrect for {len(incorrect_public_keys)} key file(s)"
+            )
+
+        key_pairs = cast(
+            Tuple[Tuple[BLSPubkey, BLSPrivateKey], ...], decrypted_key_pairs
+        )
+        for (public_key, _), (derived_public_key, _) in zip(key_files, key_pairs):
+            if derived_public_key != public_key:
+                raise ValueError(
+                    f"key file for public key {encode_hex(public_key)} holds"
+                    f" the private key of public key {encode_hex(derived_public_key)}"
                 )
-                raise
-            return (public_key, private_key, keyfile_json["id"])
+        return key_pairs
 
     def _is_persisted(self, public_key: BLSPubkey) -> bool:
         return public_key in self._key_file_index
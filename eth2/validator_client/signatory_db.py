@@ -1,40 +1,54 @@
+from array import array
 from enum import Enum, unique
 import logging
-from typing import Dict
+import sys
+from typing import Dict, NamedTuple, Optional, Tuple, cast
 
+from eth.abc import AtomicDatabaseAPI
+from eth.db.atomic import AtomicDB
+from eth.db.backends.level import LevelDB
+from eth_typing import BLSPubkey
+from lru import LRU
 import ssz
 
-from eth2.beacon.typing import Operation
+from eth2.beacon.types.attestations import Attestation
+from eth2.beacon.typing import Epoch, Operation
 from eth2.validator_client.abc import SignatoryDatabaseAPI
+from eth2.validator_client.config import Config
 from eth2.validator_client.duty import Duty, DutyType
+from eth2.validator_client.tools.directory import create_dir_if_missing
+
+# Number of epochs in one stored chunk of a span array
+CHUNK_SIZE = 256
+# Number of recent epochs the span arrays cover, a multiple of ``CHUNK_SIZE``
+DEFAULT_HISTORY_LENGTH = 4096
+DEFAULT_CHUNK_CACHE_SIZE = 4096
+
+# Span array entries without any attestation to compare against
+NO_MIN_TARGET = 2 ** 64 - 1
+NO_MAX_TARGET = 0
 
 
 @unique
 class OperationTag(Enum):
     Attestation = b"\x00"
     BlockProposal = b"\x01"
+    MinTargetChunk = b"\x02"
+    MaxTargetChunk = b"\x03"
+    AttestationBounds = b"\x04"
 
 
-def _key_for_attestation(duty: Duty) -> bytes:
-    return (
-        OperationTag.Attestation.value
-        + duty.validator_public_key
-        + ssz.encode(duty.tick_for_execution.slot, ssz.sedes.uint64)
-    )
+def _encode_uint64(value: int) -> bytes:
+    # same as ``ssz.encode(value, ssz.sedes.uint64)``, which is slow on hot paths
+    return value.to_bytes(8, "little")
 
 
-async def _record_attestation(
-    duty: Duty, operation: Operation, db: SignatoryDatabaseAPI
-) -> None:
-    # TODO temporary; will need more sophisticated logic to avoid slashing
-    db.insert(_key_for_attestation(duty), operation.hash_tree_root)
+def _key_for_attestation(public_key: BLSPubkey, target_epoch: Epoch) -> bytes:
+    return OperationTag.Attestation.value + public_key + _encode_uint64(target_epoch)
 
 
-async def _is_attestation_slashable(
-    duty: Duty, operation: Operation, db: SignatoryDatabaseAPI
-) -> bool:
-    # TODO temporary; will need more sophisticated logic to avoid slashing
-    return _key_for_attestation(duty) in db
+def _key_for_attestation_bounds(public_key: BLSPubkey) -> bytes:
+    return OperationTag.AttestationBounds.value + public_key
 
 
 def _key_for_block_proposal(duty: Duty) -> bytes:
@@ -45,61 +59,265 @@ def _key_for_block_proposal(duty: Duty) -> bytes:
     )
 
 
-async def _record_block_proposal(
-    duty: Duty, operation: Operation, db: SignatoryDatabaseAPI
-) -> None:
-    db.insert(_key_for_block_proposal(duty), operation.hash_tree_root)
+def _deserialize_chunk(encoded_chunk: bytes) -> Tuple[int, "array[int]"]:
+    chunk = array("Q")
+    chunk.frombytes(encoded_chunk)
+    if sys.byteorder != "little":
+        chunk.byteswap()
+    return chunk[0], chunk[1:]
 
 
-async def _is_block_proposal_slashable(
-    duty: Duty, operation: Operation, db: SignatoryDatabaseAPI
-) -> bool:
+def _serialize_chunk(chunk_index: int, chunk: "array[int]") -> bytes:
+    encoded_chunk = array("Q", (chunk_index,)) + chunk
+    if sys.byteorder != "little":
+        encoded_chunk.byteswap()
+    return encoded_chunk.tobytes()
+
+
+class _AttestationBounds(NamedTuple):
+    """
+    The lowest source epoch, the lowest target epoch and the highest target
+    epoch over all attestations of a validator.
     """
-    A block proposal is invalid if we already have produced a signature for the proposal's slot.
+
+    lowest_source: Epoch
+    lowest_target: Epoch
+    highest_target: Epoch
+
+    @classmethod
+    def deserialize(cls, encoded_bounds: bytes) -> "_AttestationBounds":
+        return cls(
+            *(
+                Epoch(ssz.decode(encoded_bounds[offset : offset + 8], ssz.sedes.uint64))
+                for offset in range(0, 24, 8)
+            )
+        )
+
+    def serialize(self) -> bytes:
+        return b"".join(_encode_uint64(epoch) for epoch in self)
+
+
+class SignatoryDB(SignatoryDatabaseAPI):
     """
-    return _key_for_block_proposal(duty) in db
+    Slashing protection on top of a (persistent) database.
+
+    Next to the signing root of every attestation by target epoch, to detect
+    double votes, every validator has two span arrays indexed by epoch ``e``:
 
+    - ``min_target[e]``: the lowest target of the attestations with a source
+      after ``e``. A new attestation ``(source, target)`` surrounds one of them
+      if ``min_target[source] < target``.
+    - ``max_target[e]``: the highest target of the attestations with a source
+      before ``e``. A new attestation is surrounded by one of them if
+      ``max_target[source] > target``.
 
-SLASHING_VALIDATIONS = {
-    DutyType.Attestation: _is_attestation_slashable,
-    DutyType.BlockProposal: _is_block_proposal_slashable,
-}
+    so checking an attestation takes a constant number of lookups.
 
-SLASHING_RECORDERS = {
-    DutyType.Attestation: _record_attestation,
-    DutyType.BlockProposal: _record_block_proposal,
-}
+    The span arrays only cover the last ``history_length`` epochs up to the
+    highest target of a validator, in ring buffers of chunks of ``CHUNK_SIZE``
+    epochs. Attestations with a source before that are refused. The recently
+    used chunks are kept in memory. ``min_target`` before the lowest source
+    epoch of a validator is the lowest target of all its attestations and is
+    not stored.
 
+    Block proposals are slashable if a proposal was signed for the same slot.
+    """
 
-class InMemorySignatoryDB(SignatoryDatabaseAPI):
     logger = logging.getLogger("eth2.validator_client.signatory_db")
 
-    def __init__(self) -> None:
-        self._store: Dict[bytes, bytes] = {}
+    def __init__(
+        self,
+        db: AtomicDatabaseAPI,
+        history_length: int = DEFAULT_HISTORY_LENGTH,
+        chunk_cache_size: int = DEFAULT_CHUNK_CACHE_SIZE,
+    ) -> None:
+        if history_length % CHUNK_SIZE:
+            raise ValueError(
+                f"history length {history_length} is not a multiple of {CHUNK_SIZE}"
+            )
+        self._db = db
+        self._chunk_count = history_length // CHUNK_SIZE
+        self._chunks = LRU(chunk_cache_size)
+        self._bounds: Dict[BLSPubkey, _AttestationBounds] = {}
+
+    @classmethod
+    def from_config(cls, config: Config) -> "SignatoryDB":
+        create_dir_if_missing(config.signatory_db_dir)
+        return cls(LevelDB(config.signatory_db_dir))
 
     async def record_signature_for(self, duty: Duty, operation: Operation) -> None:
         self.logger.debug("recording signature for duty %s", duty)
-        recorder = SLASHING_RECORDERS.get(duty.duty_type, None)
-        if not recorder:
+        if duty.duty_type == DutyType.Attestation:
+            self._record_attestation(duty, cast(Attestation, operation))
+        elif duty.duty_type == DutyType.BlockProposal:
+            self.insert(_key_for_block_proposal(duty), operation.hash_tree_root)
+        else:
             raise NotImplementedError(
                 f"missing a signature recorder handler for the duty type {duty.duty_type}"
             )
 
-        await recorder(duty, operation, self)
-
     async def is_slashable(self, duty: Duty, operation: Operation) -> bool:
-        validation = SLASHING_VALIDATIONS.get(duty.duty_type, None)
-        if not validation:
+        if duty.duty_type == DutyType.Attestation:
+            return self._is_attestation_slashable(duty, cast(Attestation, operation))
+        elif duty.duty_type == DutyType.BlockProposal:
+            return _key_for_block_proposal(duty) in self
+        else:
             raise NotImplementedError(
                 f"missing a slashing validation handler for the duty type {duty.duty_type}"
             )
 
-        return await validation(duty, operation, self)
-
     def insert(self, key: bytes, value: bytes) -> None:
-        self._store[key] = value
+        self._db[key] = value
 
     def __contains__(self, key: object) -> bool:
         if not isinstance(key, bytes):
             raise Exception("element type is ``bytes``")
-        return key in self._store
+        return key in self._db
+
+    def _is_attestation_slashable(self, duty: Duty, attestation: Attestation) -> bool:
+        public_key = duty.validator_public_key
+        source = attestation.data.source.epoch
+        target = attestation.data.target.epoch
+        if source > target:
+            return True
+
+        signing_root = self._db.get(_key_for_attestation(public_key, target))
+        if signing_root is not None:
+            # signing the very same attestation again is harmless
+            return signing_root != attestation.hash_tree_root
+
+        bounds = self._get_bounds(public_key)
+        if bounds is None:
+            return False
+        elif source < self._get_lowest_covered_epoch(
+            max(bounds.highest_target, target)
+        ):
+            # the history needed to check it is gone
+            return True
+        return (
+            self._get_min_target(public_key, bounds, source) < target
+            or self._get_max_target(public_key, source) > target
+        )
+
+    def _record_attestation(self, duty: Duty, attestation: Attestation) -> None:
+        public_key = duty.validator_public_key
+        source = attestation.data.source.epoch
+        target = attestation.data.target.epoch
+        bounds = self._get_bounds(public_key)
+        if bounds is None:
+            bounds = _AttestationBounds(source, target, target)
+        lowest_covered_epoch = self._get_lowest_covered_epoch(
+            max(bounds.highest_target, target)
+        )
+
+        # chunks are updated on copies and committed together
+        updated_chunks: Dict[Tuple[OperationTag, int], "array[int]"] = {}
+
+        def _update(tag: OperationTag, epoch: int, value: int) -> None:
+            chunk_index = epoch // CHUNK_SIZE
+            key = (tag, chunk_index)
+            if key not in updated_chunks:
+                chunk = self._get_chunk(tag, public_key, chunk_index)
+                updated_chunks[key] = array("Q", chunk)
+            updated_chunks[key][epoch % CHUNK_SIZE] = value
+
+        # ``min_target`` below the old lowest source is the old lowest target
+        for epoch in range(source, bounds.lowest_source):
+            _update(OperationTag.MinTargetChunk, epoch, bounds.lowest_target)
+        # ``min_target`` is non-decreasing, stop once it is low enough already
+        for epoch in range(
+            source - 1, max(bounds.lowest_source, lowest_covered_epoch) - 1, -1
+        ):
+            current = self._get_min_target(public_key, bounds, epoch)
+            if current <= target:
+                break
+            _update(OperationTag.MinTargetChunk, epoch, target)
+        # ``max_target`` is non-decreasing, stop once it is high enough already.
+        # Entries from ``target`` on can not reveal a surrounded attestation.
+        for epoch in range(source + 1, target):
+            current = self._get_max_target(public_key, epoch)
+            if current >= target:
+                break
+            _update(OperationTag.MaxTargetChunk, epoch, target)
+
+        updated_bounds = _AttestationBounds(
+            Epoch(min(bounds.lowest_source, source)),
+            Epoch(min(bounds.lowest_target, target)),
+            Epoch(max(bounds.highest_target, target)),
+        )
+
+        with self._db.atomic_batch() as batch:
+            batch[_key_for_attestation(public_key, target)] = attestation.hash_tree_root
+            batch[_key_for_attestation_bounds(public_key)] = updated_bounds.serialize()
+            for (tag, chunk_index), chunk in updated_chunks.items():
+                batch[
+                    self._key_for_chunk(tag, public_key, chunk_index)
+                ] = _serialize_chunk(chunk_index, chunk)
+
+        self._bounds[public_key] = updated_bounds
+        for (tag, chunk_index), chunk in updated_chunks.items():
+            self._chunks[(tag, public_key, chunk_index)] = chunk
+
+    def _get_lowest_covered_epoch(self, highest_target: Epoch) -> int:
+        """
+        Return the first epoch of the oldest chunk in the ring buffer of span
+        arrays that reach up to ``highest_target``.
+        """
+        highest_chunk_index = max(highest_target - 1, 0) // CHUNK_SIZE
+        return max(highest_chunk_index - self._chunk_count + 1, 0) * CHUNK_SIZE
+
+    def _key_for_chunk(
+        self, tag: OperationTag, public_key: BLSPubkey, chunk_index: int
+    ) -> bytes:
+        return tag.value + public_key + _encode_uint64(chunk_index % self._chunk_count)
+
+    def _get_bounds(self, public_key: BLSPubkey) -> Optional[_AttestationBounds]:
+        if public_key in self._bounds:
+            return self._bounds[public_key]
+
+        encoded_bounds = self._db.get(_key_for_attestation_bounds(public_key))
+        if encoded_bounds is None:
+            return None
+        bounds = _AttestationBounds.deserialize(encoded_bounds)
+        self._bounds[public_key] = bounds
+        return bounds
+
+    def _get_chunk(
+        self, tag: OperationTag, public_key: BLSPubkey, chunk_index: int
+    ) -> "array[int]":
+        cache_key = (tag, public_key, chunk_index)
+        if cache_key in self._chunks:
+            return self._chunks[cache_key]
+
+        encoded_chunk = self._db.get(self._key_for_chunk(tag, public_key, chunk_index))
+        if encoded_chunk is not None:
+            stored_chunk_index, chunk = _deserialize_chunk(encoded_chunk)
+        # the slot in the ring buffer may still hold an older chunk
+        if encoded_chunk is None or stored_chunk_index != chunk_index:
+            if tag is OperationTag.MinTargetChunk:
+                chunk = array("Q", (NO_MIN_TARGET,)) * CHUNK_SIZE
+            else:
+                chunk = array("Q", (NO_MAX_TARGET,)) * CHUNK_SIZE
+        self._chunks[cache_key] = chunk
+        return chunk
+
+    def _get_min_target(
+        self, public_key: BLSPubkey, bounds: _AttestationBounds, epoch: int
+    ) -> int:
+        if epoch < bounds.lowest_source:
+            return bounds.lowest_target
+        chunk = self._get_chunk(
+            OperationTag.MinTargetChunk, public_key, epoch // CHUNK_SIZE
+        )
+        return chunk[epoch % CHUNK_SIZE]
+
+    def _get_max_target(self, public_key: BLSPubkey, epoch: int) -> int:
+        chunk = self._get_chunk(
+            OperationTag.MaxTargetChunk, public_key, epoch // CHUNK_SIZE
+        )
+        return chunk[epoch % CHUNK_SIZE]
+
+
+class InMemorySignatoryDB(SignatoryDB):
+    def __init__(self) -> None:
+        super().__init__(AtomicDB())
@@ -10,5 +10,11 @@ def terminal_password_provider(public_key: BLSPubkey) -> bytes:
     ).encode()
 
 
+def terminal_master_password_provider() -> bytes:
+    return getpass.getpass(
+        "Please enter the master password of the key pair cache:"
+    ).encode()
+
+
 def insecure_password_provider(public_key: BLSPubkey) -> bytes:
     return public_key
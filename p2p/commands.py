@@ -2,6 +2,7 @@ from typing import (
     Any,
     Callable,
     ClassVar,
+    Iterable,
     Type,
 )
 
@@ -36,6 +37,20 @@ class NoneSerializationCodec(SerializationCodecAPI[None]):
             raise MalformedMessage(f"Should be empty. Got {len(data)} bytes: {data.hex()}")
 
 
+class EncodedRLP(bytes):
+    """
+    A payload that is RLP encoded already, e.g. because it was read as it is from the
+    database, which :class:`RLPCodec` sends without serializing it again.
+    """
+    @classmethod
+    def from_encoded_items(cls, encoded_items: Iterable[bytes]) -> 'EncodedRLP':
+        """
+        Return the encoding of the list of the already encoded ``encoded_items``.
+        """
+        encoded_list = b''.join(encoded_items)
+        return cls(rlp.codec.length_prefix(len(encoded_list), 0xc0) + encoded_list)
+
+
 class RLPCodec(SerializationCodecAPI[TCommandPayload]):
     decode_strict: bool
 
@@ -56,6 +71,8 @@ class RLPCodec(SerializationCodecAPI[TCommandPayload]):
         self._process_inbound_payload_fn = process_inbound_payload_fn or identity
 
     def encode(self, payload: TCommandPayload) -> bytes:
+        if isinstance(payload, EncodedRLP):
+            return payload
         return rlp.encode(self._process_outbound_payload_fn(payload), sedes=self.sedes)
 
     def decode(self, data: bytes) -> TCommandPayload:
@@ -206,6 +206,13 @@ DISCOVERY_MAX_PACKET_SIZE = 1280
 DISCOVERY_DATAGRAM_BUFFER_SIZE = DISCOVERY_MAX_PACKET_SIZE * 2
 
 NEIGHBOURS_RESPONSE_ITEMS = 16
+
+# Number of decoded ENRs that the node DB keeps in memory
+NODE_DB_ENR_CACHE_SIZE = 4096
+
+# Number of public keys recovered from the signatures of discovery packets that are kept, so
+# that the duplicates of a packet aren't verified again
+DISCOVERY_PUBKEY_CACHE_SIZE = 512
 AES128_KEY_SIZE = 16  # size of an AES218 key
 HKDF_INFO = b"discovery v5 key agreement"
 ID_NONCE_SIGNATURE_PREFIX = b"discovery-id-nonce"
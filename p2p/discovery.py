@@ -6,6 +6,7 @@ listening nodes.
 More information at https://github.com/ethereum/devp2p/blob/master/rlpx.md#node-discovery
 """
 import collections
+import functools
 import ipaddress
 import netifaces
 import random
@@ -1301,14 +1302,20 @@ def _unpack_v4(message: bytes) -> Tuple[datatypes.PublicKey, int, Tuple[Any, ...
     message_hash = Hash32(message[:MAC_SIZE])
     if message_hash != keccak(message[MAC_SIZE:]):
         raise WrongMAC("Wrong msg mac")
-    signature = eth_keys.keys.Signature(message[MAC_SIZE:HEAD_SIZE])
-    signed_data = message[HEAD_SIZE:]
-    remote_pubkey = signature.recover_public_key_from_msg(signed_data)
+    remote_pubkey = _recover_public_key(message[MAC_SIZE:HEAD_SIZE], message[HEAD_SIZE:])
     cmd_id = message[HEAD_SIZE]
     payload = tuple(rlp.decode(message[HEAD_SIZE + 1:], strict=False))
     return remote_pubkey, cmd_id, payload, message_hash
 
 
+@functools.lru_cache(constants.DISCOVERY_PUBKEY_CACHE_SIZE)
+def _recover_public_key(signature_bytes: bytes, signed_data: bytes) -> datatypes.PublicKey:
+    # Nodes resend their packets when they get no reply in time, and the same packets may arrive
+    # more than once, so the public keys of recent packets are cached.
+    signature = eth_keys.keys.Signature(signature_bytes)
+    return signature.recover_public_key_from_msg(signed_data)
+
+
 def _get_msg_expiration() -> bytes:
     return rlp.sedes.big_endian_int.serialize(int(time.time() + EXPIRATION))
 
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import (
     Any,
-    AsyncIterator,
+    AsyncGenerator,
     AsyncContextManager,
     Callable,
     Dict,
@@ -116,7 +116,7 @@ class ResponseCandidateStreamAPI(ServiceAPI, Generic[TRequestCommand, TResponseC
             request: TRequestCommand,
             tracker: PerformanceTrackerAPI[TRequestCommand, Any],
             *,
-            timeout: float = None) -> AsyncIterator[TResponseCommand]:
+            timeout: float = None) -> AsyncGenerator[TResponseCommand, None]:
         """
         Make a request and iterate through candidates for a valid response.
 
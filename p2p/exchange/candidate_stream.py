@@ -3,14 +3,17 @@ import logging
 import time
 from typing import (
     Any,
-    AsyncIterator,
+    AsyncGenerator,
+    Dict,
     Tuple,
     Type,
 )
 
 from async_service import Service
+from eth_utils import ValidationError
 
 from p2p.abc import (
+    CommandAPI,
     ConnectionAPI,
     ProtocolAPI,
 )
@@ -23,6 +26,7 @@ from .abc import (
     ResponseCandidateStreamAPI,
 )
 from .constants import (
+    MAX_CONCURRENT_REQUESTS,
     ROUND_TRIP_TIMEOUT,
     NUM_QUEUED_REQUESTS,
 )
@@ -30,6 +34,7 @@ from .typing import (
     TRequestCommand,
     TResponseCommand,
 )
+from .window import RequestWindow
 
 
 class ResponseCandidateStream(
@@ -64,7 +69,7 @@ class ResponseCandidateStream(
             request: TRequestCommand,
             tracker: PerformanceTrackerAPI[TRequestCommand, Any],
             *,
-            timeout: float = None) -> AsyncIterator[TResponseCommand]:
+            timeout: float = None) -> AsyncGenerator[TResponseCommand, None]:
         """
         Make a request and iterate through candidates for a valid response.
 
@@ -149,3 +154,119 @@ class ResponseCandidateStream(
     @property
     def is_pending(self) -> bool:
         return self._pending_request is not None
+
+
+def get_request_id(command: CommandAPI[Any]) -> int:
+    return command.payload.request_id
+
+
+class RequestIDCandidateStream(ResponseCandidateStream[TRequestCommand, TResponseCommand]):
+    """
+    A :class:`ResponseCandidateStream` for commands that carry a request ID in their payload,
+    like the LES commands, which may have several requests in flight to the peer at once.
+    Every response is routed to the request with the same ID.
+
+    The number of requests in flight is bounded by a :class:`~p2p.exchange.window.RequestWindow`
+    that adapts to the peer's performance.
+    """
+    logger = logging.getLogger('p2p.exchange.RequestIDCandidateStream')
+
+    def __init__(
+            self,
+            connection: ConnectionAPI,
+            request_protocol: ProtocolAPI,
+            response_cmd_type: Type[TResponseCommand],
+            max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS) -> None:
+        super().__init__(connection, request_protocol, response_cmd_type)
+        self.window = RequestWindow(max_concurrent_requests)
+        self._pending_requests: Dict[int, Tuple[float, 'asyncio.Queue[Tuple[float, TResponseCommand]]']] = {}  # noqa: E501
+        self._slot_freed = asyncio.Condition()
+
+    def __repr__(self) -> str:
+        return f'<RequestIDCandidateStream({self._connection!s}, {self.response_cmd_type!r})>'
+
+    async def payload_candidates(
+            self,
+            request: TRequestCommand,
+            tracker: PerformanceTrackerAPI[TRequestCommand, Any],
+            *,
+            timeout: float = None) -> AsyncGenerator[TResponseCommand, None]:
+        """
+        Make a request and iterate through the responses with the same request ID.
+
+        The request is over when the iteration stops, so `complete_request` is not needed.
+        """
+        total_timeout = self.response_timeout if timeout is None else timeout
+        request_id = get_request_id(request)
+
+        queue = await self._reserve_slot(request_id, total_timeout * NUM_QUEUED_REQUESTS)
+        start_at = time.perf_counter()
+
+        try:
+            self.request_protocol.send(request)
+            while True:
+                timeout_remaining = max(0, total_timeout - (time.perf_counter() - start_at))
+
+                try:
+                    response_time, candidate = await asyncio.wait_for(
+                        queue.get(),
+                        timeout=timeout_remaining,
+                    )
+                except asyncio.TimeoutError:
+                    tracker.record_timeout(total_timeout)
+                    raise
+                # read by the consumer right away, before any other response can arrive
+                self.last_response_time = response_time
+                yield candidate
+        finally:
+            self._pending_requests.pop(request_id)
+            self.window.update(tracker)
+            async with self._slot_freed:
+                self._slot_freed.notify_all()
+
+    async def _reserve_slot(
+            self,
+            request_id: int,
+            timeout: float) -> 'asyncio.Queue[Tuple[float, TResponseCommand]]':
+        if request_id in self._pending_requests:
+            raise ValidationError(
+                f"A {self.response_cmd_name} request with id {request_id} is in flight already"
+            )
+
+        deadline = time.perf_counter() + timeout
+        async with self._slot_freed:
+            while len(self._pending_requests) >= self.window.size:
+                timeout_remaining = deadline - time.perf_counter()
+                try:
+                    await asyncio.wait_for(self._slot_freed.wait(), timeout=timeout_remaining)
+                except asyncio.TimeoutError:
+                    raise ConnectionBusy(
+                        f"Timed out waiting for a free {self.response_cmd_name} request slot "
+                        f"({self.window!r}) or connection: {self._connection}"
+                    )
+
+            queue: 'asyncio.Queue[Tuple[float, TResponseCommand]]' = asyncio.Queue()
+            self._pending_requests[request_id] = (time.perf_counter(), queue)
+            return queue
+
+    def complete_request(self) -> None:
+        # A request is complete as soon as its candidates are no longer iterated
+        pass
+
+    async def _handle_msg(self, connection: ConnectionAPI, cmd: TResponseCommand) -> None:
+        request_id = get_request_id(cmd)
+        try:
+            send_time, queue = self._pending_requests[request_id]
+        except KeyError:
+            self.logger.debug(
+                "Got %s payload with unexpected request id %d from %s",
+                self.response_cmd_name,
+                request_id,
+                self._connection,
+            )
+        else:
+            queue.put_nowait((time.perf_counter() - send_time, cmd))
+
+    @property
+    def is_pending(self) -> bool:
+        return bool(self._pending_requests)
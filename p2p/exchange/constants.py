@@ -11,3 +11,18 @@ ROUND_TRIP_TIMEOUT = 20.0
 # estimate the queue length is to determine how long a timeout to use when
 # waiting for the lock to send the next queued peer request.
 NUM_QUEUED_REQUESTS = 3
+
+
+# The most requests for a single command pair that we keep in flight to a peer at once, when
+# the commands carry request IDs that tell their responses apart.
+MAX_CONCURRENT_REQUESTS = 8
+
+# The bounds of the estimated number of our requests that wait at the peer, rather than
+# travel the network, between which the request window keeps its size. See `RequestWindow`.
+WINDOW_GROW_THRESHOLD = 1.0
+WINDOW_SHRINK_THRESHOLD = 3.0
+
+# How much the best throughput seen from a peer decays with every response, so that the request
+# window recovers over a few thousand responses when the items requested change, e.g. from
+# full blocks to empty ones.
+BEST_THROUGHPUT_DECAY = 0.999
@@ -1,5 +1,6 @@
 from functools import partial
 from typing import (
+    Any,
     AsyncIterator,
     Callable,
     Type,
@@ -20,6 +21,10 @@ class BaseExchange(ExchangeAPI[TRequestCommand, TResponseCommand, TResult]):
     _request_command_type: Type[TRequestCommand]
     _response_command_type: Type[TResponseCommand]
 
+    # Exchanges of commands that carry request IDs can use a RequestIDCandidateStream, to
+    # have several requests in flight at once.
+    response_stream_class: Type[ResponseCandidateStream[Any, Any]] = ResponseCandidateStream
+
     _manager: ExchangeManager[TRequestCommand, TResponseCommand, TResult]
 
     def __init__(self) -> None:
@@ -29,7 +34,7 @@ class BaseExchange(ExchangeAPI[TRequestCommand, TResponseCommand, TResult]):
     async def run_exchange(self, connection: ConnectionAPI) -> AsyncIterator[None]:
         protocol = connection.get_protocol_for_command_type(self.get_request_cmd_type())
 
-        response_stream: ResponseCandidateStream[TRequestCommand, TResponseCommand] = ResponseCandidateStream(  # noqa: E501
+        response_stream: ResponseCandidateStream[TRequestCommand, TResponseCommand] = self.response_stream_class(  # noqa: E501
             connection,
             protocol,
             self.get_response_cmd_type(),
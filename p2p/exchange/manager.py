@@ -2,6 +2,7 @@ import asyncio
 from concurrent import futures
 import logging
 from typing import (
+    AsyncGenerator,
     Callable,
     TypeVar,
 )
@@ -55,8 +56,16 @@ class ExchangeManager(ExchangeManagerAPI[TRequestCommand, TResponseCommand, TRes
 
         loop = asyncio.get_event_loop()
 
+        candidates: AsyncGenerator[TResponseCommand, None] = stream.payload_candidates(
+            request,
+            tracker,
+            timeout=timeout,
+        )
         with futures.ThreadPoolExecutor() as executor:
-            async for payload in stream.payload_candidates(request, tracker, timeout=timeout):
+            async for payload in candidates:
+                # the stream may have more requests in flight, so read the response time
+                # before any of their responses arrive
+                response_time = stream.last_response_time
                 try:
                     payload_validator(payload)
 
@@ -83,11 +92,13 @@ class ExchangeManager(ExchangeManagerAPI[TRequestCommand, TResponseCommand, TRes
                     continue
                 else:
                     tracker.record_response(
-                        stream.last_response_time,
+                        response_time,
                         request,
                         result,
                     )
                     stream.complete_request()
+                    # end the request right away rather than when the candidates are collected
+                    await candidates.aclose()
                     return result
 
         raise PeerConnectionLost(f"Response stream of {self._connection} was apparently closed")
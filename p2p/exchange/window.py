@@ -0,0 +1,57 @@
+from .abc import PerformanceAPI
+from .constants import (
+    BEST_THROUGHPUT_DECAY,
+    MAX_CONCURRENT_REQUESTS,
+    WINDOW_GROW_THRESHOLD,
+    WINDOW_SHRINK_THRESHOLD,
+)
+
+
+class RequestWindow:
+    """
+    The number of requests for a single command pair that may be in flight to a peer at once,
+    adapted to the performance of the peer like the congestion window of TCP Vegas.
+
+    A request's throughput, the items it returned over its round trip time, is at its best
+    when the request doesn't wait at the peer behind our other requests. If the throughput
+    of a request is a fraction ``r`` of the best one, about ``size * (1 - r)`` of the requests
+    in flight are waiting at the peer. The window grows while fewer than
+    ``WINDOW_GROW_THRESHOLD`` of them wait, to use the round trip time for more requests, and
+    shrinks when more than ``WINDOW_SHRINK_THRESHOLD`` of them do. A timeout halves it.
+
+    The throughput and timeouts are read from the peer's performance tracker for the command.
+    """
+
+    def __init__(self, max_size: int = MAX_CONCURRENT_REQUESTS) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be a positive integer: got {max_size}")
+        self.size = 1
+        self.max_size = max_size
+        self._best_throughput = 0.0
+        self._seen_msgs = 0
+        self._seen_timeouts = 0
+
+    def __repr__(self) -> str:
+        return f'<RequestWindow {self.size}/{self.max_size}>'
+
+    def update(self, tracker: PerformanceAPI) -> None:
+        """
+        Resize the window according to what ``tracker`` recorded since the last update.
+        """
+        if tracker.total_timeouts > self._seen_timeouts:
+            self.size = max(1, self.size // 2)
+        elif tracker.total_msgs > self._seen_msgs:
+            throughput = tracker.items_per_second_ema.value
+            self._best_throughput = max(
+                throughput,
+                self._best_throughput * BEST_THROUGHPUT_DECAY,
+            )
+            if self._best_throughput > 0:
+                waiting = self.size * (1 - throughput / self._best_throughput)
+                if waiting < WINDOW_GROW_THRESHOLD:
+                    self.size = min(self.max_size, self.size + 1)
+                elif waiting > WINDOW_SHRINK_THRESHOLD:
+                    self.size = max(1, self.size - 1)
+
+        self._seen_msgs = tracker.total_msgs
+        self._seen_timeouts = tracker.total_timeouts
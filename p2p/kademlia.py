@@ -448,12 +448,33 @@ class KademliaRoutingTable:
             return bucket_index + 1
 
     def iter_nodes_around(self, reference_node_id: NodeID) -> Iterator[NodeID]:
-        """Iterate over all nodes in the routing table ordered by distance to a given reference."""
-        all_node_ids = itertools.chain(*self.buckets)
+        """Iterate over all nodes in the routing table ordered by distance to a given reference.
+
+        The distances of the nodes of a bucket to the reference lie in a range of their own, so
+        the buckets are visited from the closest range to the farthest one, and only the nodes
+        of the buckets that are actually reached are sorted.
+        """
         distance_to_reference = functools.partial(compute_distance, reference_node_id)
-        sorted_node_ids = sorted(all_node_ids, key=distance_to_reference)
-        for node_id in sorted_node_ids:
-            yield node_id
+        for bucket_index in self._iter_bucket_indices_around(reference_node_id):
+            bucket = self.buckets[bucket_index]
+            if bucket:
+                yield from sorted(bucket, key=distance_to_reference)
+
+    def _iter_bucket_indices_around(self, reference_node_id: NodeID) -> Iterator[int]:
+        # A node in the bucket at index i first differs from the center at bit i, so its
+        # distance to the reference has the same bits as the distance of the center to the
+        # reference above bit i, and the opposite one at bit i. If the reference differs from
+        # the center at bit i, the nodes of the bucket are closer to it than the ones of all the
+        # buckets below, otherwise they are farther. The buckets start from the one at the log
+        # distance of the reference, which is the closest one unless it is the center itself.
+        center_distance = compute_distance(self.center_node_id, reference_node_id)
+        bucket_indices = range(len(self.buckets))
+        for bucket_index in reversed(bucket_indices):
+            if center_distance >> bucket_index & 1:
+                yield bucket_index
+        for bucket_index in bucket_indices:
+            if not center_distance >> bucket_index & 1:
+                yield bucket_index
 
     def iter_all_random(self) -> Iterator[NodeID]:
         """
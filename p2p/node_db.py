@@ -1,3 +1,5 @@
+import collections
+
 from eth_utils.encoding import (
     big_endian_to_int,
     int_to_big_endian,
@@ -8,6 +10,7 @@ from eth.abc import DatabaseAPI
 import rlp
 
 from p2p.abc import NodeDBAPI
+from p2p.constants import NODE_DB_ENR_CACHE_SIZE
 from p2p.enr import ENR
 from p2p.identity_schemes import IdentitySchemeRegistry
 from p2p.typing import NodeID
@@ -15,11 +18,23 @@ from p2p._utils import get_logger
 
 
 class NodeDB(NodeDBAPI):
-
-    def __init__(self, identity_scheme_registry: IdentitySchemeRegistry, db: DatabaseAPI) -> None:
+    """
+    Store ENRs and pong times in ``db``.
+
+    The most recently used ENRs are kept decoded in memory as well, as discovery looks them up
+    for every packet it receives. All writes go through to ``db`` and replace the cached ENR,
+    whose sequence number is then never lower than the stored one.
+    """
+
+    def __init__(self,
+                 identity_scheme_registry: IdentitySchemeRegistry,
+                 db: DatabaseAPI,
+                 enr_cache_size: int = NODE_DB_ENR_CACHE_SIZE) -> None:
         self.db = db
         self.logger = get_logger(".".join((self.__module__, self.__class__.__name__,)))
         self._identity_scheme_registry = identity_scheme_registry
+        self._enr_cache: 'collections.OrderedDict[NodeID, ENR]' = collections.OrderedDict()
+        self._enr_cache_size = enr_cache_size
 
     @property
     def identity_scheme_registry(self) -> IdentitySchemeRegistry:
@@ -49,12 +64,27 @@ class NodeDB(NodeDBAPI):
                 f"Cannot overwrite existing ENR ({existing_enr.sequence_number}) with old one "
                 f"({enr.sequence_number})")
         self.db.set(self._get_enr_key(enr.node_id), rlp.encode(enr))
+        self._cache_enr(enr)
 
     def get_enr(self, node_id: NodeID) -> ENR:
-        return rlp.decode(self.db[self._get_enr_key(node_id)], sedes=ENR)
+        try:
+            enr = self._enr_cache[node_id]
+        except KeyError:
+            enr = rlp.decode(self.db[self._get_enr_key(node_id)], sedes=ENR)
+            self._cache_enr(enr)
+        else:
+            self._enr_cache.move_to_end(node_id)
+        return enr
 
     def delete_enr(self, node_id: NodeID) -> None:
         del self.db[self._get_enr_key(node_id)]
+        self._enr_cache.pop(node_id, None)
+
+    def _cache_enr(self, enr: ENR) -> None:
+        self._enr_cache[enr.node_id] = enr
+        self._enr_cache.move_to_end(enr.node_id)
+        if len(self._enr_cache) > self._enr_cache_size:
+            self._enr_cache.popitem(last=False)
 
     def set_last_pong_time(self, node_id: NodeID, last_pong: int) -> None:
         self.db.set(self._get_last_pong_time_key(node_id), int_to_big_endian(last_pong))
@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 import logging
 import multiprocessing
 import os
@@ -12,10 +13,13 @@ import time
 from eth.db.backends.level import LevelDB
 
 from trinity.db.manager import (
+    AsyncDBClient,
     DBManager,
     DBClient,
 )
 
+MODES = ('single', 'batched', 'pipelined')
+
 logger = logging.getLogger('trinity.scripts.benchmark')
 logger.setLevel(logging.INFO)
 
@@ -43,28 +47,61 @@ def run_server(ipc_path):
         ipc_path.unlink()
 
 
-def run_client(ipc_path, client_id, num_operations):
+def run_client(ipc_path, client_id, num_operations, mode, batch_size):
     key_values = {
         random_bytes(32): random_bytes(256)
         for i in range(num_operations)
     }
 
     db_client = DBClient.connect(ipc_path)
+    with db_client.atomic_batch() as batch:
+        for key, value in key_values.items():
+            batch[key] = value
+
+    keys = tuple(key_values.keys())
 
     start = time.perf_counter()
-    for key, value in key_values.items():
-        db_client.set(key, value)
-        db_client.get(key)
+    if mode == 'single':
+        for key in keys:
+            db_client.get(key)
+            db_client.exists(key)
+    elif mode == 'batched':
+        for offset in range(0, num_operations, batch_size):
+            key_batch = keys[offset:offset + batch_size]
+            db_client.multi_get(key_batch)
+            db_client.multi_exists(key_batch)
+    elif mode == 'pipelined':
+        asyncio.get_event_loop().run_until_complete(
+            run_pipelined_client(ipc_path, keys, batch_size)
+        )
+    else:
+        raise Exception(f"Unknown mode: {mode}")
     end = time.perf_counter()
     duration = end - start
 
+    db_client.close()
+
     logger.info(
-        "Client %d: %d get-set per second",
+        "Client %d (%s): %d get+exists ops per second",
         client_id,
-        num_operations / duration,
+        mode,
+        2 * num_operations / duration,
     )
 
 
+async def run_pipelined_client(ipc_path, keys, window_size):
+    client = await AsyncDBClient.connect(ipc_path)
+    try:
+        for offset in range(0, len(keys), window_size):
+            key_window = keys[offset:offset + window_size]
+            await asyncio.gather(
+                *(client.coro_get(key) for key in key_window),
+                *(client.coro_exists(key) for key in key_window),
+            )
+    finally:
+        client.close()
+
+
 parser = argparse.ArgumentParser(description='Database Manager Benchmark')
 parser.add_argument(
     '--num-clients',
@@ -81,18 +118,31 @@ parser.add_argument(
     required=False,
     default=10000,
     help=(
-        "Number of set+get operations that should be performed for each client"
+        "Number of keys that each client should read (with both a get and an exists)"
+    ),
+)
+parser.add_argument(
+    '--mode',
+    choices=MODES + ('all',),
+    required=False,
+    default='all',
+    help=(
+        "Read one key per round trip (single), many keys per request (batched) "
+        "or many tagged requests in flight at once (pipelined)"
+    ),
+)
+parser.add_argument(
+    '--batch-size',
+    type=int,
+    required=False,
+    default=100,
+    help=(
+        "Keys per multi-key request in batched mode, and requests in flight in pipelined mode"
     ),
 )
 
 
-if __name__ == '__main__':
-    args = parser.parse_args()
-    logger.info(
-        "Running database manager benchmark:\n - %d client(s)\n - %d get-set operations\n*****************************\n",  # noqa: E501
-        args.num_clients,
-        args.num_operations,
-    )
+def run_benchmark(mode, num_clients, num_operations, batch_size):
     with tempfile.TemporaryDirectory() as ipc_base_dir:
         ipc_path = pathlib.Path(ipc_base_dir) / 'db.ipc'
 
@@ -101,8 +151,8 @@ if __name__ == '__main__':
         clients = [
             multiprocessing.Process(
                 target=run_client,
-                args=(ipc_path, client_id, args.num_operations),
-            ) for client_id in range(args.num_clients)
+                args=(ipc_path, client_id, num_operations, mode, batch_size),
+            ) for client_id in range(num_clients)
         ]
         server.start()
         for client in clients:
@@ -113,3 +163,16 @@ if __name__ == '__main__':
         os.kill(server.pid, signal.SIGINT)
         server.join(1)
     logger.info('\n')
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running database manager benchmark:\n - %d client(s)\n - %d keys\n - batch size %d\n*****************************\n",  # noqa: E501
+        args.num_clients,
+        args.num_operations,
+        args.batch_size,
+    )
+    modes = MODES if args.mode == 'all' else (args.mode,)
+    for mode in modes:
+        run_benchmark(mode, args.num_clients, args.num_operations, args.batch_size)
@@ -0,0 +1,146 @@
+"""
+Discovery packets handled per second, up to their dispatch to the handler of
+their command, and FIND_NODE requests answered per second, when every ENR is
+decoded from the node DB and the sender of every packet is recovered from its
+signature, against keeping the recent ENRs decoded and the senders of recent
+packets in memory.
+
+Every remote node sends a new PING in every round, and some of them send it
+twice, as nodes resend the packets that got no reply in time.
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+
+from eth.db.backends.memory import MemoryDB
+from eth_keys import keys
+import trio
+
+from p2p import discovery
+from p2p.constants import NODE_DB_ENR_CACHE_SIZE
+from p2p.discovery import (
+    CMD_PING,
+    DiscoveryService,
+    _get_msg_expiration,
+    _pack_v4,
+    _unpack_v4,
+)
+from p2p.identity_schemes import default_identity_scheme_registry
+from p2p.kademlia import (
+    Address,
+    Node,
+    create_stub_enr,
+)
+from p2p.node_db import NodeDB
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def make_service(enr_cache_size):
+    socket = trio.socket.socket(family=trio.socket.AF_INET, type=trio.socket.SOCK_DGRAM)
+    return DiscoveryService(
+        keys.PrivateKey(b'\x01' * 32),
+        30303,
+        30303,
+        bootstrap_nodes=[],
+        event_bus=None,
+        socket=socket,
+        node_db=NodeDB(default_identity_scheme_registry, MemoryDB(), enr_cache_size),
+    )
+
+
+def make_remotes(node_count):
+    return tuple(
+        (
+            keys.PrivateKey((index + 2).to_bytes(32, 'big')),
+            Address('10.%d.%d.1' % (index // 256, index % 256), 30303, 30303),
+        )
+        for index in range(node_count)
+    )
+
+
+def add_remotes(service, remotes):
+    for private_key, address in remotes:
+        node = Node(create_stub_enr(private_key.public_key, address))
+        service.node_db.set_enr(node.enr)
+        service.routing.update(node.id)
+
+
+def make_packets(remotes, rounds, resend_ratio):
+    rng = random.Random(0)
+    packets = []
+    for _ in range(rounds):
+        for private_key, address in remotes:
+            packet = _pack_v4(CMD_PING.id, [b'\x04', _get_msg_expiration()], private_key)
+            packets.append((address, packet))
+            if rng.random() < resend_ratio:
+                packets.append((address, packet))
+    return packets
+
+
+def receive_packets(service, packets, cache_senders):
+    # DiscoveryService.receive() up to the dispatch to the command handler
+    for address, packet in packets:
+        if not cache_senders:
+            discovery._recover_public_key.cache_clear()
+        remote_pubkey, cmd_id, payload, message_hash = _unpack_v4(packet)
+        Node(service.lookup_and_maybe_update_enr(remote_pubkey, address))
+
+
+def answer_find_nodes(service, request_count):
+    rng = random.Random(1)
+    for _ in range(request_count):
+        service.get_neighbours(rng.getrandbits(256).to_bytes(32, 'big'))
+
+
+def measure(name, function, item_count, *args):
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    logger.info('%s: %.2fs, %.0f/s', name, elapsed, item_count / elapsed)
+
+
+async def run(node_count, rounds, resend_ratio, find_node_count):
+    remotes = make_remotes(node_count)
+    packets = make_packets(remotes, rounds, resend_ratio)
+    logger.info('%d packets from %d nodes', len(packets), node_count)
+
+    configurations = (
+        ('no caches', 0, False),
+        ('caches', NODE_DB_ENR_CACHE_SIZE, True),
+    )
+    for name, enr_cache_size, cache_senders in configurations:
+        # the socket is only created, for the service not to complain
+        service = make_service(enr_cache_size)
+        add_remotes(service, remotes)
+        discovery._recover_public_key.cache_clear()
+
+        measure(
+            f'packets, {name}', receive_packets, len(packets), service, packets, cache_senders,
+        )
+        measure(
+            f'FIND_NODE responses, {name}',
+            answer_find_nodes,
+            find_node_count,
+            service,
+            find_node_count,
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--nodes', type=int, default=500)
+    parser.add_argument('--rounds', type=int, default=4)
+    parser.add_argument('--resend-ratio', type=float, default=0.2)
+    parser.add_argument('--find-nodes', type=int, default=500)
+    args = parser.parse_args()
+
+    trio.run(run, args.nodes, args.rounds, args.resend_ratio, args.find_nodes)
@@ -0,0 +1,107 @@
+"""
+Time to find the nodes of a full routing table closest to a random target, like
+we do to answer every FIND_NODE request and at every step of a lookup, when
+sorting all the nodes of the table by their distance to the target, against
+visiting the buckets from the closest one to the target and only sorting the
+nodes of the buckets that are reached.
+
+Every one of the 256 buckets of the table holds 16 nodes.
+"""
+import argparse
+import functools
+import itertools
+import logging
+import random
+import sys
+import time
+
+from p2p.constants import (
+    KADEMLIA_BUCKET_SIZE,
+    NEIGHBOURS_RESPONSE_ITEMS,
+    NUM_ROUTING_TABLE_BUCKETS,
+)
+from p2p.kademlia import (
+    KademliaRoutingTable,
+    compute_distance,
+)
+from p2p.tools.factories.discovery import NodeIDFactory
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def make_full_routing_table():
+    center_node_id = NodeIDFactory()
+    routing_table = KademliaRoutingTable(center_node_id, KADEMLIA_BUCKET_SIZE)
+    for log_distance in range(1, NUM_ROUTING_TABLE_BUCKETS + 1):
+        # there are fewer than 16 node IDs at the smallest log distances
+        for _ in range(min(KADEMLIA_BUCKET_SIZE, 2 ** (log_distance - 1))):
+            while True:
+                node_id = NodeIDFactory.at_log_distance(center_node_id, log_distance)
+                if node_id not in routing_table.buckets[log_distance - 1]:
+                    break
+            routing_table.update(node_id)
+    return routing_table
+
+
+def sort_all_nodes_around(routing_table, target):
+    all_node_ids = itertools.chain(*routing_table.buckets)
+    distance_to_target = functools.partial(compute_distance, target)
+    return iter(sorted(all_node_ids, key=distance_to_target))
+
+
+def get_neighbours(iter_nodes_around, routing_table, target):
+    return tuple(itertools.islice(
+        iter_nodes_around(routing_table, target),
+        NEIGHBOURS_RESPONSE_ITEMS,
+    ))
+
+
+def measure(name, iter_nodes_around, routing_table, targets):
+    start = time.perf_counter()
+    neighbours = tuple(
+        get_neighbours(iter_nodes_around, routing_table, target)
+        for target in targets
+    )
+    elapsed = time.perf_counter() - start
+    logger.info(
+        '%s: %.1fus per FIND_NODE response',
+        name,
+        elapsed / len(targets) * 1000000,
+    )
+    return neighbours
+
+
+def run(request_count):
+    routing_table = make_full_routing_table()
+    logger.info(
+        '%d nodes in %d buckets',
+        sum(len(bucket) for bucket in routing_table.buckets),
+        len(routing_table.buckets),
+    )
+
+    rng = random.Random(0)
+    targets = tuple(rng.getrandbits(256).to_bytes(32, 'big') for _ in range(request_count))
+
+    sorted_neighbours = measure('sorting all nodes', sort_all_nodes_around, routing_table, targets)
+    bucket_neighbours = measure(
+        'visiting the closest buckets',
+        KademliaRoutingTable.iter_nodes_around,
+        routing_table,
+        targets,
+    )
+    if bucket_neighbours != sorted_neighbours:
+        raise Exception('Invariant: the neighbours differ from the ones of sorting all nodes')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    run(args.requests)
@@ -0,0 +1,75 @@
+import argparse
+import logging
+import sys
+import time
+
+from eth2.beacon.state_machines.forks.serenity.configs import SERENITY_CONFIG
+from eth2.beacon.state_machines.forks.serenity.epoch_processing import (
+    _get_attestation_deltas_reference,
+    get_attestation_deltas,
+)
+
+from mock_state import (
+    BENCHMARK_VALIDATOR_COUNTS,
+    mk_previous_epoch_attestations,
+    mk_validator_state,
+)
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def run_benchmark(validator_count, max_reference_validator_count):
+    config = SERENITY_CONFIG
+    state = mk_validator_state(validator_count, epoch=10, config=config)
+    state = state.set("previous_epoch_attestations", mk_previous_epoch_attestations(state))
+
+    start = time.perf_counter()
+    deltas = get_attestation_deltas(state, config)
+    duration = time.perf_counter() - start
+    logger.info("%d validators: get_attestation_deltas took %.3f s", validator_count, duration)
+
+    if validator_count <= max_reference_validator_count:
+        start = time.perf_counter()
+        reference_deltas = _get_attestation_deltas_reference(state, config)
+        reference_duration = time.perf_counter() - start
+        logger.info(
+            "%d validators: reference implementation took %.3f s (%.1fx)",
+            validator_count,
+            reference_duration,
+            reference_duration / duration,
+        )
+        if deltas != reference_deltas:
+            raise Exception("get_attestation_deltas disagrees with the reference implementation")
+
+
+parser = argparse.ArgumentParser(description='Attestation deltas benchmark')
+parser.add_argument(
+    '--validator-counts',
+    type=int,
+    nargs='+',
+    required=False,
+    default=BENCHMARK_VALIDATOR_COUNTS,
+    help="Sizes of the validator registry to benchmark",
+)
+parser.add_argument(
+    '--max-reference-validator-count',
+    type=int,
+    required=False,
+    default=2 ** 8,
+    help=(
+        "Largest registry to also run the reference implementation on. It recomputes "
+        "committees for every validator, so only small registries are practical"
+    ),
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    for validator_count in args.validator_counts:
+        run_benchmark(validator_count, args.max_reference_validator_count)
@@ -0,0 +1,97 @@
+"""
+Compare verifying signatures one by one with verifying them as one randomized
+batch, on every available BLS backend, optionally spreading the batch over a
+process pool.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import sys
+import time
+
+from eth2._utils.bls import SignatureBatch, bls
+from eth2._utils.bls.backends import AVAILABLE_BACKENDS, NoOpBackend
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+DOMAIN = (1).to_bytes(8, 'big')
+
+
+def mk_batch(backend, signature_count, message_count):
+    batch = SignatureBatch(backend)
+    for privkey in range(1, signature_count + 1):
+        message_hash = (privkey % message_count).to_bytes(32, 'big')
+        batch.add(
+            backend.privtopub(privkey),
+            message_hash,
+            backend.sign(message_hash, privkey, DOMAIN),
+            DOMAIN,
+        )
+    return batch
+
+
+def run_benchmark(backend, signature_count, message_count, process_count):
+    bls.use(backend)
+    batch = mk_batch(backend, signature_count, message_count)
+
+    start = time.perf_counter()
+    assert all(
+        backend.verify(message_hash, pubkey, signature, domain)
+        for pubkey, message_hash, signature, domain in batch.signature_sets
+    )
+    one_by_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert batch.verify()
+    batched = time.perf_counter() - start
+
+    logger.info(
+        "%s: %d signatures over %d messages: one by one %.3f s, batched %.3f s (%.1fx)",
+        backend.__name__,
+        signature_count,
+        message_count,
+        one_by_one,
+        batched,
+        one_by_one / batched,
+    )
+
+    if process_count:
+        with ProcessPoolExecutor(process_count) as executor:
+            start = time.perf_counter()
+            assert batch.verify(executor)
+            pooled = time.perf_counter() - start
+        logger.info(
+            "%s: batched in a pool of %d processes %.3f s",
+            backend.__name__,
+            process_count,
+            pooled,
+        )
+
+
+parser = argparse.ArgumentParser(description='BLS batch verification benchmark')
+parser.add_argument('--signature-count', type=int, default=16)
+parser.add_argument(
+    '--message-count',
+    type=int,
+    default=4,
+    help="Number of distinct messages, e.g. attestation data, among the signatures",
+)
+parser.add_argument(
+    '--process-count',
+    type=int,
+    default=0,
+    help="Also verify the batch in a process pool of this size",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    for backend in AVAILABLE_BACKENDS:
+        if backend is not NoOpBackend:
+            run_benchmark(backend, args.signature_count, args.message_count, args.process_count)
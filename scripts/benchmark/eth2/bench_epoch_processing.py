@@ -0,0 +1,122 @@
+import argparse
+import logging
+import sys
+import time
+
+from eth2.beacon.epoch_processing_helpers import decrease_balance, increase_balance
+from eth2.beacon.state_machines.forks.serenity.configs import SERENITY_CONFIG
+from eth2.beacon.state_machines.forks.serenity.epoch_processing import (
+    get_attestation_deltas,
+    process_epoch,
+    process_final_updates,
+    process_justification_and_finalization,
+    process_registry_updates,
+    process_rewards_and_penalties,
+    process_slashings,
+)
+
+from mock_state import (
+    BENCHMARK_VALIDATOR_COUNTS,
+    mk_previous_epoch_attestations,
+    mk_validator_state,
+)
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+EPOCH_PROCESSING_STEPS = (
+    process_justification_and_finalization,
+    process_rewards_and_penalties,
+    process_registry_updates,
+    process_slashings,
+    process_final_updates,
+)
+
+
+def mk_epoch_end_state(validator_count, config):
+    state = mk_validator_state(validator_count, epoch=10, config=config)
+    state = state.set("previous_epoch_attestations", mk_previous_epoch_attestations(state))
+    # process the epoch at its last slot, and give some validators a balance that
+    # moves their effective balance
+    balances = state.balances.mset(*(
+        item
+        for index in range(0, validator_count, 7)
+        for item in (index, config.MAX_EFFECTIVE_BALANCE - 2 * 10 ** 9)
+    ))
+    return state.mset(
+        "slot", state.slot + config.SLOTS_PER_EPOCH - 1,
+        "balances", balances,
+    )
+
+
+def apply_deltas_per_validator(state, config):
+    """
+    The way ``process_rewards_and_penalties`` used to apply deltas: one new
+    version of the state per update.
+    """
+    rewards, penalties = get_attestation_deltas(state, config)
+    for index in range(len(state.validators)):
+        state = increase_balance(state, index, rewards[index])
+        state = decrease_balance(state, index, penalties[index])
+    return state
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(validator_count, max_reference_validator_count):
+    config = SERENITY_CONFIG
+    state = mk_epoch_end_state(validator_count, config)
+    # warm the cached hash tree, as it would be after the previous slots
+    state.hash_tree_root
+
+    step_state = state
+    for step in EPOCH_PROCESSING_STEPS:
+        step_state, duration = timed(step, step_state, config)
+        logger.info("%d validators: %s took %.3f s", validator_count, step.__name__, duration)
+
+    _, duration = timed(process_epoch, state, config)
+    logger.info("%d validators: process_epoch took %.3f s", validator_count, duration)
+
+    if validator_count <= max_reference_validator_count:
+        rewarded_state, _ = timed(process_rewards_and_penalties, state, config)
+        reference_state, reference_duration = timed(apply_deltas_per_validator, state, config)
+        logger.info(
+            "%d validators: applying deltas one state version at a time took %.3f s",
+            validator_count,
+            reference_duration,
+        )
+        if reference_state.hash_tree_root != rewarded_state.hash_tree_root:
+            raise Exception("process_rewards_and_penalties disagrees with the reference")
+
+
+parser = argparse.ArgumentParser(description='Epoch processing benchmark')
+parser.add_argument(
+    '--validator-counts',
+    type=int,
+    nargs='+',
+    required=False,
+    default=BENCHMARK_VALIDATOR_COUNTS,
+    help="Sizes of the validator registry to benchmark",
+)
+parser.add_argument(
+    '--max-reference-validator-count',
+    type=int,
+    required=False,
+    default=2 ** 16,
+    help="Largest registry to also apply balance deltas one state version at a time",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    for validator_count in args.validator_counts:
+        run_benchmark(validator_count, args.max_reference_validator_count)
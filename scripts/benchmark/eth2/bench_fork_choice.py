@@ -0,0 +1,140 @@
+"""
+Replay a stream of blocks and latest messages through the proto-array fork choice
+and through the per-root balance summation of ``Store.get_latest_attesting_balance``,
+scoring every new block after each slot.
+
+A stream is a file with one JSON event per line, either
+``["block", root, parent_root, slot]`` or ``["vote", validator_index, root]``.
+Without ``--stream`` a random stream is generated; ``--record`` saves it for reuse.
+"""
+import argparse
+import json
+import logging
+import random
+import sys
+import time
+
+from eth2.beacon.fork_choice.proto_array import ProtoArray
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+BALANCE = 32 * 10 ** 9
+
+
+def mk_stream(validator_count, slot_count, fork_probability):
+    genesis_root = '00' * 32
+    yield ['block', genesis_root, None, 0]
+    tips = [genesis_root]
+    for slot in range(1, slot_count + 1):
+        parent = random.choice(tips) if random.random() < fork_probability else tips[-1]
+        root = random.getrandbits(256).to_bytes(32, 'big').hex()
+        tips.append(root)
+        tips = tips[-4:]
+        yield ['block', root, parent, slot]
+        # every validator attests once per epoch of 32 slots
+        for index in range(slot % 32, validator_count, 32):
+            yield ['vote', index, random.choice(tips)]
+
+
+def load_stream(path):
+    with open(path) as stream_file:
+        return [json.loads(line) for line in stream_file]
+
+
+def replay_proto_array(events):
+    proto_array = ProtoArray()
+    votes = {}
+    pending = {}
+    scored = 0
+    start = time.perf_counter()
+    for event in events:
+        if event[0] == 'block':
+            _, root, parent_root, _ = event
+            if pending:
+                deltas = [0] * len(proto_array)
+                for index, new_root in pending.items():
+                    old_root = votes.get(index)
+                    if old_root is not None:
+                        deltas[proto_array.get_index(old_root)] -= BALANCE
+                    deltas[proto_array.get_index(new_root)] += BALANCE
+                    votes[index] = new_root
+                proto_array.apply_score_changes(deltas)
+                pending = {}
+            proto_array.on_block(root, parent_root)
+            proto_array.get_weight(root)
+            scored += 1
+        else:
+            _, index, root = event
+            pending[index] = root
+    return time.perf_counter() - start, scored
+
+
+def replay_summation(events, max_blocks):
+    parents = {}
+    slots = {}
+    votes = {}
+    scored = 0
+
+    def get_ancestor_root(root, slot):
+        while slots[root] > slot:
+            root = parents[root]
+        return root if slots[root] == slot else None
+
+    start = time.perf_counter()
+    for event in events:
+        if event[0] == 'block':
+            _, root, parent_root, slot = event
+            parents[root] = parent_root
+            slots[root] = slot
+            sum(
+                BALANCE
+                for vote in votes.values()
+                if get_ancestor_root(vote, slot) == root
+            )
+            scored += 1
+            if scored >= max_blocks:
+                break
+        else:
+            _, index, root = event
+            votes[index] = root
+    return time.perf_counter() - start, scored
+
+
+parser = argparse.ArgumentParser(description='Fork choice replay benchmark')
+parser.add_argument('--stream', type=str, required=False, help="Recorded stream to replay")
+parser.add_argument('--record', type=str, required=False, help="Save the generated stream")
+parser.add_argument('--validator-count', type=int, default=2 ** 14)
+parser.add_argument('--slot-count', type=int, default=256)
+parser.add_argument('--fork-probability', type=float, default=0.2)
+parser.add_argument(
+    '--max-summation-blocks',
+    type=int,
+    default=64,
+    help="Number of blocks to score with the per-root summation",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    if args.stream:
+        events = load_stream(args.stream)
+    else:
+        events = list(mk_stream(args.validator_count, args.slot_count, args.fork_probability))
+        if args.record:
+            with open(args.record, 'w') as stream_file:
+                for event in events:
+                    stream_file.write(json.dumps(event) + '\n')
+
+    duration, scored = replay_proto_array(events)
+    logger.info("proto-array: scored %d blocks in %.3f s (%.5f s/block)",
+                scored, duration, duration / scored)
+
+    duration, scored = replay_summation(events, args.max_summation_blocks)
+    logger.info("summation: scored %d blocks in %.3f s (%.5f s/block)",
+                scored, duration, duration / scored)
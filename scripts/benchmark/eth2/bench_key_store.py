@@ -0,0 +1,97 @@
+"""
+Startup time of a ``KeyStore`` with many key files: decrypting every key file
+one by one, in parallel, and unlocking the key pair cache instead.
+"""
+import argparse
+import json
+import logging
+import pathlib
+import sys
+import tempfile
+import time
+
+import eth_keyfile
+from eth_utils import encode_hex
+
+from eth2._utils.bls import bls
+from eth2.validator_client import key_store as key_store_module
+from eth2.validator_client.key_pair_cache import KeyPairCache
+from eth2.validator_client.key_store import KeyStore
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+PASSWORD = b'password'
+
+
+def write_key_files(key_store_dir, key_count, iterations):
+    for private_key in range(1, key_count + 1):
+        key_file_json = eth_keyfile.create_keyfile_json(
+            private_key.to_bytes(32, 'little'), PASSWORD, iterations=iterations,
+        )
+        key_file_json['public_key'] = encode_hex(bls.privtopub(private_key))
+        with open(key_store_dir / f"{key_file_json['id']}.json", 'w') as key_file_handle:
+            json.dump(key_file_json, key_file_handle)
+
+
+def time_startup(key_store_dir, key_pair_cache=None):
+    key_store = KeyStore(
+        key_store_dir=key_store_dir,
+        password_provider=lambda _public_key: PASSWORD,
+        key_pair_cache=key_pair_cache,
+    )
+    start = time.perf_counter()
+    with key_store.persistence():
+        elapsed = time.perf_counter() - start
+    return elapsed, len(key_store.public_keys)
+
+
+def run_benchmark(key_count, iterations):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        key_store_dir = pathlib.Path(tmp_dir) / 'keys'
+        key_store_dir.mkdir()
+        logger.info("writing %d key files with %d PBKDF2 iterations", key_count, iterations)
+        write_key_files(key_store_dir, key_count, iterations)
+
+        # decrypt in this process only, like before key files were decrypted in parallel
+        parallel_decrypt = key_store_module._decrypt_key_files
+        key_store_module._decrypt_key_files = lambda jobs: tuple(
+            key_store_module._decrypt_key_file(*job) for job in jobs
+        )
+        try:
+            serial, count = time_startup(key_store_dir)
+        finally:
+            key_store_module._decrypt_key_files = parallel_decrypt
+        logger.info("one by one: %d key pairs in %.3f s", count, serial)
+
+        parallel, count = time_startup(key_store_dir)
+        logger.info(
+            "in parallel: %d key pairs in %.3f s (%.1fx)", count, parallel, serial / parallel,
+        )
+
+        key_pair_cache = KeyPairCache(pathlib.Path(tmp_dir) / 'key_pairs', b'master')
+        cold, count = time_startup(key_store_dir, key_pair_cache)
+        logger.info("cold cache: %d key pairs in %.3f s", count, cold)
+        cached, count = time_startup(key_store_dir, key_pair_cache)
+        logger.info(
+            "warm cache: %d key pairs in %.3f s (%.1fx)", count, cached, serial / cached,
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--keys', type=int, default=1000, help="Number of key files")
+    parser.add_argument(
+        '--iterations',
+        type=int,
+        default=2 ** 18,
+        help="PBKDF2 iterations of every key file, by default the ones of eth_keyfile",
+    )
+    args = parser.parse_args()
+
+    run_benchmark(args.keys, args.iterations)
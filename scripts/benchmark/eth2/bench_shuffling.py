@@ -0,0 +1,70 @@
+import argparse
+import logging
+import sys
+import time
+
+from eth2._utils.hash import hash_eth2
+from eth2.beacon.committee_helpers import compute_shuffled_index, compute_shuffled_indices
+from eth2.beacon.state_machines.forks.serenity.configs import SERENITY_CONFIG
+
+from mock_state import BENCHMARK_VALIDATOR_COUNTS
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+SEED = hash_eth2(b'shuffling benchmark')
+
+
+def run_benchmark(validator_count, max_reference_validator_count):
+    rounds = SERENITY_CONFIG.SHUFFLE_ROUND_COUNT
+    indices = tuple(range(validator_count))
+
+    start = time.perf_counter()
+    shuffled = compute_shuffled_indices(indices, SEED, rounds)
+    duration = time.perf_counter() - start
+    logger.info("%d validators: compute_shuffled_indices took %.3f s", validator_count, duration)
+
+    if validator_count <= max_reference_validator_count:
+        start = time.perf_counter()
+        reference = tuple(
+            indices[compute_shuffled_index(index, validator_count, SEED, rounds)]
+            for index in indices
+        )
+        reference_duration = time.perf_counter() - start
+        logger.info(
+            "%d validators: compute_shuffled_index per validator took %.3f s (%.1fx)",
+            validator_count,
+            reference_duration,
+            reference_duration / duration,
+        )
+        if shuffled != reference:
+            raise Exception("compute_shuffled_indices disagrees with compute_shuffled_index")
+
+
+parser = argparse.ArgumentParser(description='Whole-list shuffling benchmark')
+parser.add_argument(
+    '--validator-counts',
+    type=int,
+    nargs='+',
+    required=False,
+    default=BENCHMARK_VALIDATOR_COUNTS,
+    help="Sizes of the validator registry to benchmark",
+)
+parser.add_argument(
+    '--max-reference-validator-count',
+    type=int,
+    required=False,
+    default=2 ** 14,
+    help="Largest registry to also shuffle one index at a time",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    for validator_count in args.validator_counts:
+        run_benchmark(validator_count, args.max_reference_validator_count)
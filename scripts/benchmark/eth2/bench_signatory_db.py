@@ -0,0 +1,122 @@
+"""
+Slashing protection checks per second of the ``SignatoryDB`` for many validators
+with a long attestation history.
+"""
+import argparse
+import logging
+import pathlib
+import random
+import sys
+import tempfile
+import time
+
+from eth.db.backends.level import LevelDB
+import trio
+
+from eth2.beacon.types.attestations import Attestation, AttestationData
+from eth2.beacon.types.checkpoints import Checkpoint
+from eth2.clock import Tick
+from eth2.validator_client.duty import AttestationDuty
+from eth2.validator_client.signatory_db import SignatoryDB
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def mk_duty(public_key):
+    return AttestationDuty(public_key, Tick(0, 0, 0, 1), Tick(0, 0, 0, 1), committee_index=0)
+
+
+def mk_attestation(source_epoch, target_epoch):
+    # only the checkpoints of the attestation matter for slashing protection
+    return Attestation.create(
+        data=AttestationData.create(
+            source=Checkpoint.create(epoch=source_epoch),
+            target=Checkpoint.create(epoch=target_epoch),
+        )
+    )
+
+
+async def run_benchmark(db, validator_count, epoch_count, recorded_epoch_count, tick_count):
+    public_keys = tuple(index.to_bytes(48, 'big') for index in range(validator_count))
+    recorded_epochs = range(epoch_count - recorded_epoch_count, epoch_count)
+
+    start = time.perf_counter()
+    for epoch in recorded_epochs:
+        # every validator votes for the same checkpoints
+        attestation = mk_attestation(epoch, epoch + 1)
+        for public_key in public_keys:
+            await db.record_signature_for(mk_duty(public_key), attestation)
+    elapsed = time.perf_counter() - start
+    record_count = validator_count * recorded_epoch_count
+    logger.info(
+        "recorded %d attestations of %d validators up to epoch %d in %.3f s (%.0f/s)",
+        record_count,
+        validator_count,
+        epoch_count,
+        elapsed,
+        record_count / elapsed,
+    )
+
+    # the duties of all validators at the head, once per tick
+    head_attestation = mk_attestation(epoch_count, epoch_count + 1)
+    head_duties = tuple((mk_duty(public_key), head_attestation) for public_key in public_keys)
+    start = time.perf_counter()
+    for _ in range(tick_count):
+        for duty, operation in head_duties:
+            assert not await db.is_slashable(duty, operation)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "checked %d ticks of %d duties at the head: %.0f checks/s",
+        tick_count,
+        validator_count,
+        tick_count * validator_count / elapsed,
+    )
+
+    # votes surrounding a recorded one anywhere in the history
+    rng = random.Random(0)
+    scattered_duties = tuple(
+        (mk_duty(rng.choice(public_keys)), mk_attestation(source_epoch - 1, source_epoch + 2))
+        for source_epoch in (
+            rng.choice(recorded_epochs[1:-1]) for _ in range(validator_count)
+        )
+    )
+    start = time.perf_counter()
+    for duty, operation in scattered_duties:
+        assert await db.is_slashable(duty, operation)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "checked %d surrounding votes scattered over the history: %.0f checks/s",
+        validator_count,
+        validator_count / elapsed,
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--validators', type=int, default=10000)
+    parser.add_argument('--epochs', type=int, default=50000)
+    parser.add_argument(
+        '--recorded-epochs',
+        type=int,
+        default=32,
+        help="Number of epochs before the head in which every validator attested",
+    )
+    parser.add_argument('--ticks', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        signatory_db = SignatoryDB(LevelDB(pathlib.Path(db_dir)))
+        trio.run(
+            run_benchmark,
+            signatory_db,
+            args.validators,
+            args.epochs,
+            args.recorded_epochs,
+            args.ticks,
+        )
@@ -0,0 +1,58 @@
+"""
+Helpers to build large beacon states for the eth2 benchmarks without paying
+for key generation or deposit processing.
+"""
+from eth2.beacon.committee_helpers import iterate_committees_at_epoch
+from eth2.beacon.helpers import compute_start_slot_at_epoch, get_block_root
+from eth2.beacon.state_machines.forks.serenity.configs import SERENITY_CONFIG
+from eth2.beacon.tools.builder.initializer import create_mock_validator
+from eth2.beacon.tools.builder.state import create_mock_genesis_state_from_validators
+from eth2.beacon.tools.builder.validator import mk_pending_attestation_from_committee
+from eth2.beacon.tools.misc.ssz_vector import override_lengths
+from eth2.beacon.types.eth1_data import Eth1Data
+
+BENCHMARK_VALIDATOR_COUNTS = (2 ** 14, 2 ** 16, 300000)
+
+
+def mk_validator_state(validator_count, epoch, config=SERENITY_CONFIG):
+    """
+    Return a state with ``validator_count`` active validators at the first slot
+    of ``epoch``.
+    """
+    override_lengths(config)
+    validators = tuple(
+        create_mock_validator(index.to_bytes(48, "big"), config)
+        for index in range(validator_count)
+    )
+    balances = (config.MAX_EFFECTIVE_BALANCE,) * validator_count
+    state = create_mock_genesis_state_from_validators(
+        genesis_time=0,
+        genesis_eth1_data=Eth1Data.create(deposit_count=validator_count),
+        genesis_validators=validators,
+        genesis_balances=balances,
+        config=config,
+    )
+    return state.set("slot", compute_start_slot_at_epoch(epoch, config.SLOTS_PER_EPOCH))
+
+
+def mk_previous_epoch_attestations(state, config=SERENITY_CONFIG):
+    """
+    Return pending attestations with full participation from every committee
+    of the previous epoch of ``state``.
+    """
+    previous_epoch = state.previous_epoch(config.SLOTS_PER_EPOCH, config.GENESIS_EPOCH)
+    target_root = get_block_root(
+        state, previous_epoch, config.SLOTS_PER_EPOCH, config.SLOTS_PER_HISTORICAL_ROOT
+    )
+    return tuple(
+        mk_pending_attestation_from_committee(
+            len(committee),
+            target_epoch=previous_epoch,
+            target_root=target_root,
+            slot=slot,
+            committee_index=committee_index,
+        ).mset("inclusion_delay", 1 + slot % config.SLOTS_PER_EPOCH % 4)
+        for committee, committee_index, slot in iterate_committees_at_epoch(
+            state, previous_epoch, config
+        )
+    )
@@ -0,0 +1,139 @@
+"""
+Blocks/s and Mgas/s of importing a generated chain file of value transfers: the
+file read at once and decoded block by block, like ``trinity import`` used to,
+against the streaming import, which maps the file into memory and decodes blocks
+and recovers transaction senders in worker processes while importing.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+from eth.chains.base import Chain, MiningChain
+from eth.tools.builder.chain import build, disable_pow_check, frontier_at, genesis
+from eth.vm.forks.frontier.blocks import FrontierBlock
+from eth_keys import keys
+from eth_utils import to_wei
+import rlp
+
+from trinity.components.builtin.import_export.rlp_decode import decode_all
+from trinity.components.builtin.import_export.streaming import (
+    BATCHES_IN_FLIGHT_PER_WORKER,
+    decode_blocks_in_parallel,
+    open_export_file,
+    open_rlp_items,
+)
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+SENDER_KEYS = tuple(keys.PrivateKey(index.to_bytes(32, 'big')) for index in range(1, 9))
+RECIPIENT = b'\x10' * 20
+GENESIS_PARAMS = {'gas_limit': 3141592, 'difficulty': 1, 'timestamp': 1514764800}
+GENESIS_STATE = {
+    key.public_key.to_canonical_address(): {'balance': to_wei(1000, 'ether')}
+    for key in SENDER_KEYS
+}
+
+
+def build_chain(chain_class):
+    return build(
+        chain_class,
+        frontier_at(0),
+        disable_pow_check(),
+        genesis(params=GENESIS_PARAMS, state=GENESIS_STATE),
+    )
+
+
+def generate_chain_file(path, block_count, transactions_per_block):
+    chain = build_chain(MiningChain)
+    nonces = [0] * len(SENDER_KEYS)
+    with open_export_file(path, append=False) as chain_file:
+        for _ in range(block_count):
+            for index in range(transactions_per_block):
+                sender_index = index % len(SENDER_KEYS)
+                transaction = chain.create_unsigned_transaction(
+                    nonce=nonces[sender_index],
+                    gas_price=1,
+                    gas=21000,
+                    to=RECIPIENT,
+                    value=1,
+                    data=b'',
+                ).as_signed_transaction(SENDER_KEYS[sender_index])
+                chain.apply_transaction(transaction)
+                nonces[sender_index] += 1
+            block = chain.mine_block()
+            chain_file.write(rlp.encode(block))
+
+
+def import_sequentially(path):
+    chain = build_chain(Chain)
+    with open(path, 'rb') as chain_file:
+        blocks = decode_all(chain_file.read(), sedes=FrontierBlock)
+    for block in blocks:
+        chain.import_block(block)
+    return blocks
+
+
+def import_streaming(path, worker_count):
+    chain = build_chain(Chain)
+    imported_blocks = []
+    with open_rlp_items(path) as encoded_blocks, ProcessPoolExecutor(worker_count) as executor:
+        blocks = decode_blocks_in_parallel(
+            encoded_blocks,
+            FrontierBlock,
+            executor,
+            max_batches_in_flight=worker_count * BATCHES_IN_FLIGHT_PER_WORKER,
+        )
+        for block in blocks:
+            chain.import_block(block)
+            imported_blocks.append(block)
+    return imported_blocks
+
+
+def report(name, blocks, elapsed):
+    gas_used = sum(block.header.gas_used for block in blocks)
+    logger.info(
+        '%s: %d blocks in %.2fs, %.1f blocks/s, %.2f Mgas/s',
+        name,
+        len(blocks),
+        elapsed,
+        len(blocks) / elapsed,
+        gas_used / 1e6 / elapsed,
+    )
+
+
+def run(block_count, transactions_per_block, worker_count):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = pathlib.Path(temp_dir) / 'chain.rlp'
+        logger.info(
+            'Generating %d blocks of %d transactions...', block_count, transactions_per_block
+        )
+        generate_chain_file(path, block_count, transactions_per_block)
+
+        start = time.perf_counter()
+        blocks = import_sequentially(path)
+        report('sequential import', blocks, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        blocks = import_streaming(path, worker_count)
+        report(f'streaming import, {worker_count} workers', blocks, time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blocks', type=int, default=50)
+    parser.add_argument('--transactions', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    run(args.blocks, args.transactions, args.workers)
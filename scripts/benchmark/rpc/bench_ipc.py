@@ -0,0 +1,190 @@
+"""
+Load test of the JSON-RPC IPC server: requests per second and latency of
+``web3_sha3`` requests sent one at a time, pipelined on one connection or in
+JSON-RPC batches.
+
+Without ``--ipc-path`` an IPC server with only the ``web3`` module is started in
+another process, otherwise the server of a running node is tested.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import pathlib
+import sys
+import tempfile
+import time
+
+from async_service import background_asyncio_service
+
+from trinity.rpc.ipc import IPCServer
+from trinity.rpc.main import RPCServer
+from trinity.rpc.modules.web3 import Web3
+
+MODES = ('sequential', 'pipelined', 'batched')
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def run_server(ipc_path):
+    async def serve():
+        rpc = RPCServer((Web3(),), chain=None)
+        async with background_asyncio_service(IPCServer(rpc, ipc_path)) as manager:
+            await manager.wait_finished()
+
+    asyncio.get_event_loop().run_until_complete(serve())
+
+
+def mk_request(request_id):
+    return {
+        'jsonrpc': '2.0',
+        'id': request_id,
+        'method': 'web3_sha3',
+        'params': [hex(request_id)],
+    }
+
+
+async def wait_for_server(ipc_path):
+    for _ in range(500):
+        if ipc_path.exists():
+            return await asyncio.open_unix_connection(str(ipc_path))
+        await asyncio.sleep(0.01)
+    raise Exception(f"IPC server did not start at {ipc_path}")
+
+
+async def run_sequential(reader, writer, num_requests, window_size):
+    latencies = []
+    for request_id in range(num_requests):
+        start = time.perf_counter()
+        writer.write(json.dumps(mk_request(request_id)).encode())
+        json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def run_pipelined(reader, writer, num_requests, window_size):
+    sent_at = {}
+    latencies = []
+    next_id = 0
+    while next_id < min(window_size, num_requests):
+        sent_at[next_id] = time.perf_counter()
+        writer.write(json.dumps(mk_request(next_id)).encode())
+        next_id += 1
+
+    while sent_at:
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - sent_at.pop(response['id']))
+        if next_id < num_requests:
+            sent_at[next_id] = time.perf_counter()
+            writer.write(json.dumps(mk_request(next_id)).encode())
+            next_id += 1
+    return latencies
+
+
+async def run_batched(reader, writer, num_requests, window_size):
+    latencies = []
+    for offset in range(0, num_requests, window_size):
+        batch = [
+            mk_request(request_id)
+            for request_id in range(offset, min(offset + window_size, num_requests))
+        ]
+        start = time.perf_counter()
+        writer.write(json.dumps(batch).encode())
+        responses = json.loads(await reader.readline())
+        assert len(responses) == len(batch)
+        # every request of the batch waits for the whole batch
+        latencies.extend([time.perf_counter() - start] * len(batch))
+    return latencies
+
+
+RUNNERS = {
+    'sequential': run_sequential,
+    'pipelined': run_pipelined,
+    'batched': run_batched,
+}
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+async def run_client(ipc_path, mode, num_requests, window_size):
+    reader, writer = await wait_for_server(ipc_path)
+    try:
+        start = time.perf_counter()
+        latencies = await RUNNERS[mode](reader, writer, num_requests, window_size)
+        duration = time.perf_counter() - start
+    finally:
+        writer.close()
+
+    latencies.sort()
+    logger.info(
+        "%s: %d requests per second, latency p50 %.2f ms, p99 %.2f ms",
+        mode,
+        num_requests / duration,
+        1000 * percentile(latencies, 0.5),
+        1000 * percentile(latencies, 0.99),
+    )
+
+
+parser = argparse.ArgumentParser(description='JSON-RPC IPC server load test')
+parser.add_argument(
+    '--ipc-path',
+    type=pathlib.Path,
+    required=False,
+    help="IPC socket of a running node, instead of starting a server",
+)
+parser.add_argument(
+    '--num-requests',
+    type=int,
+    required=False,
+    default=10000,
+    help="Number of requests to send in every mode",
+)
+parser.add_argument(
+    '--mode',
+    choices=MODES + ('all',),
+    required=False,
+    default='all',
+    help=(
+        "Wait for every response before the next request (sequential), keep many "
+        "requests in flight (pipelined) or send JSON-RPC batches (batched)"
+    ),
+)
+parser.add_argument(
+    '--window-size',
+    type=int,
+    required=False,
+    default=50,
+    help="Requests in flight in pipelined mode, and requests per batch in batched mode",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    modes = MODES if args.mode == 'all' else (args.mode,)
+
+    with tempfile.TemporaryDirectory() as ipc_base_dir:
+        server = None
+        ipc_path = args.ipc_path
+        if ipc_path is None:
+            ipc_path = pathlib.Path(ipc_base_dir) / 'jsonrpc.ipc'
+            server = multiprocessing.Process(target=run_server, args=[ipc_path])
+            server.start()
+
+        try:
+            for mode in modes:
+                asyncio.get_event_loop().run_until_complete(
+                    run_client(ipc_path, mode, args.num_requests, args.window_size)
+                )
+        finally:
+            if server is not None:
+                server.terminate()
+                server.join()
@@ -0,0 +1,172 @@
+"""
+Time to find the logs of a rare address over a long range of blocks, like an
+indexer's ``eth_getLogs`` does, when checking the bloom of every header against
+the rotated bloom bit-vectors of the log index, with and without the exact
+postings of every address and topic.
+
+Every block has the same few common logs, and one block in ``--rare-every``
+has a log of the rare address as well.
+"""
+import argparse
+import logging
+import sys
+import tempfile
+import time
+
+from eth.constants import EMPTY_UNCLE_HASH
+from eth.db.atomic import AtomicDB
+from eth.db.backends.level import LevelDB
+from eth.db.chain import ChainDB
+from eth.db.schema import SchemaV1
+from eth.db.trie import make_trie_root_and_nodes
+from eth.rlp.headers import BlockHeader
+from eth.rlp.logs import Log
+from eth.rlp.receipts import Receipt
+from eth.rlp.transactions import BaseTransactionFields
+from eth_utils import keccak
+import rlp
+
+from trinity.db.eth1.log_index import (
+    LogCriteria,
+    LogIndex,
+)
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+COMMON_ADDRESSES = tuple(bytes([index]) * 20 for index in range(1, 9))
+RARE_ADDRESS = b'\xee' * 20
+TRANSFER_TOPIC = keccak(b'Transfer(address,address,uint256)')
+
+
+def make_block_data(chaindb, addresses):
+    transactions = tuple(
+        BaseTransactionFields(
+            nonce=index,
+            gas_price=1,
+            gas=50000,
+            to=address,
+            value=0,
+            data=b'',
+            v=27,
+            r=1,
+            s=2,
+        )
+        for index, address in enumerate(addresses)
+    )
+    receipts = tuple(
+        Receipt(
+            state_root=b'\x01',
+            gas_used=50000 * (index + 1),
+            logs=[Log(address, [int.from_bytes(TRANSFER_TOPIC, 'big'), index], b'\x00' * 32)],
+        )
+        for index, address in enumerate(addresses)
+    )
+    transaction_root, transaction_nodes = make_trie_root_and_nodes(transactions)
+    receipt_root, receipt_nodes = make_trie_root_and_nodes(receipts)
+    chaindb.persist_trie_data_dict(transaction_nodes)
+    chaindb.persist_trie_data_dict(receipt_nodes)
+
+    bloom = 0
+    for receipt in receipts:
+        bloom |= receipt.bloom
+    return transaction_root, receipt_root, bloom
+
+
+def persist_chain(chaindb, block_count, rare_every):
+    # the blocks share their transactions and receipts, to generate them quickly
+    common_data = make_block_data(chaindb, COMMON_ADDRESSES)
+    rare_data = make_block_data(chaindb, COMMON_ADDRESSES + (RARE_ADDRESS,))
+
+    parent_hash = b'\x00' * 32
+    with chaindb.db.atomic_batch() as batch:
+        for block_number in range(block_count):
+            if block_number % rare_every == rare_every - 1:
+                transaction_root, receipt_root, bloom = rare_data
+            else:
+                transaction_root, receipt_root, bloom = common_data
+            header = BlockHeader(
+                difficulty=1,
+                block_number=block_number,
+                gas_limit=8000000,
+                # the same blocks in every database
+                timestamp=block_number,
+                parent_hash=parent_hash,
+                transaction_root=transaction_root,
+                receipt_root=receipt_root,
+                uncles_hash=EMPTY_UNCLE_HASH,
+                bloom=bloom,
+            )
+            batch[header.hash] = rlp.encode(header)
+            batch[SchemaV1.make_block_number_to_hash_lookup_key(block_number)] = rlp.encode(
+                header.hash,
+                sedes=rlp.sedes.binary,
+            )
+            parent_hash = header.hash
+        batch[SchemaV1.make_canonical_head_hash_lookup_key()] = parent_hash
+
+
+def measure_indexing(log_index):
+    start = time.perf_counter()
+    while log_index.index_next_section():
+        pass
+    elapsed = time.perf_counter() - start
+    logger.info(
+        'indexing %d sections (postings: %s): %.2fs',
+        log_index.get_section_count(),
+        log_index.index_postings,
+        elapsed,
+    )
+
+
+def measure_query(name, log_index, block_count, criteria, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        logs = tuple(log_index.find_logs(0, block_count - 1, criteria))
+    elapsed = (time.perf_counter() - start) / rounds
+    logger.info('%s: %.1fms for %d logs', name, elapsed * 1000, len(logs))
+    return logs
+
+
+def run(block_count, rare_every, rounds):
+    with tempfile.TemporaryDirectory() as db_path:
+        chaindb = ChainDB(AtomicDB(LevelDB(db_path=db_path)))
+        logger.info('Storing %d blocks...', block_count)
+        persist_chain(chaindb, block_count, rare_every)
+
+        criteria = LogCriteria(addresses=(RARE_ADDRESS,), topics=((TRANSFER_TOPIC,),))
+
+        scanned = measure_query(
+            'header blooms', LogIndex(chaindb, confirmations=0), block_count, criteria, 1,
+        )
+
+        log_index = LogIndex(chaindb, confirmations=0)
+        measure_indexing(log_index)
+        indexed = measure_query('bloom bit-vectors', log_index, block_count, criteria, rounds)
+        if indexed != scanned:
+            raise Exception('Invariant: the indexed logs differ from the scanned ones')
+
+    with tempfile.TemporaryDirectory() as db_path:
+        chaindb = ChainDB(AtomicDB(LevelDB(db_path=db_path)))
+        persist_chain(chaindb, block_count, rare_every)
+
+        log_index = LogIndex(chaindb, confirmations=0, index_postings=True)
+        measure_indexing(log_index)
+        posted = measure_query('postings', log_index, block_count, criteria, rounds)
+        if posted != scanned:
+            raise Exception('Invariant: the logs of the postings differ from the scanned ones')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blocks', type=int, default=65536)
+    parser.add_argument('--rare-every', type=int, default=5000)
+    parser.add_argument('--rounds', type=int, default=10)
+    args = parser.parse_args()
+
+    run(args.blocks, args.rare_every, args.rounds)
@@ -0,0 +1,102 @@
+"""
+Blocks per second of ``BeaconChainSyncer`` syncing from simulated peers with
+network latency: one request at a time from a single peer, like the sync loop
+before ranges were pipelined, against ranges in flight to several peers.
+
+Blocks are written to the database without state transitions, so the numbers
+show how well the sync hides network latency, not the cost of importing blocks.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from eth2.beacon.tools.factories import BeaconChainFactory
+from trinity.protocol.bcc_libp2p.node import PeerPool
+from trinity.tools.bcc_factories import (
+    BeaconChainSyncerFactory,
+    SignedBeaconBlockFactory,
+)
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+class SimulatedPeer:
+    def __init__(self, peer_id, branch, latency):
+        self._id = peer_id
+        self.head_slot = branch[-1].slot
+        self.branch = branch
+        self.latency = latency
+
+    async def request_beacon_blocks_by_range(self, start_slot, count, step=1):
+        await asyncio.sleep(self.latency)
+        return self.branch[start_slot:start_slot + count]
+
+
+async def run_sync(genesis_state, branch, peer_count, max_ranges_in_flight, latency):
+    chain = BeaconChainFactory(genesis_state=genesis_state)
+    peer_pool = PeerPool()
+    for peer_id in range(peer_count):
+        peer_pool.add(SimulatedPeer(peer_id, branch, latency))
+
+    syncer = BeaconChainSyncerFactory(
+        chain_db__db=chain.chaindb.db,
+        peer_pool=peer_pool,
+        max_ranges_in_flight=max_ranges_in_flight,
+    )
+    syncer.sync_peer = peer_pool.get_best_head_slot_peer()
+
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    await syncer.sync()
+    elapsed = loop.time() - start
+
+    assert chain.get_canonical_head() == branch[-1]
+    return (len(branch) - 1) / elapsed
+
+
+def run_benchmark(block_count, peer_count, max_ranges_in_flight, latency):
+    genesis_state = BeaconChainFactory().get_head_state()
+    genesis_block = SignedBeaconBlockFactory(message__state_root=genesis_state.hash_tree_root)
+    # one block in every slot, so blocks can be looked up by slot
+    branch = (genesis_block,) + SignedBeaconBlockFactory.create_branch(
+        length=block_count, root=genesis_block,
+    )
+
+    loop = asyncio.get_event_loop()
+    single_peer = loop.run_until_complete(
+        run_sync(genesis_state, branch, 1, 1, latency)
+    )
+    logger.info("single peer, one range at a time: %.1f blocks/s", single_peer)
+    pipelined = loop.run_until_complete(
+        run_sync(genesis_state, branch, peer_count, max_ranges_in_flight, latency)
+    )
+    logger.info(
+        "%d peers, %d ranges in flight: %.1f blocks/s (%.1fx)",
+        peer_count,
+        max_ranges_in_flight,
+        pipelined,
+        pipelined / single_peer,
+    )
+
+
+if __name__ == '__main__':
+    # Silence the per block logs of the syncer
+    logging.getLogger('trinity.sync.beacon.chain.BeaconChainSyncer').setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blocks', type=int, default=2048, help="Number of blocks to sync")
+    parser.add_argument('--peers', type=int, default=4)
+    parser.add_argument('--ranges-in-flight', type=int, default=8)
+    parser.add_argument(
+        '--latency', type=float, default=0.2, help="Seconds until a peer responds",
+    )
+    args = parser.parse_args()
+
+    run_benchmark(args.blocks, args.peers, args.ranges_in_flight, args.latency)
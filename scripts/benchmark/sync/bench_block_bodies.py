@@ -0,0 +1,212 @@
+"""
+Block bodies and receipts served per second to a syncing peer, from a database
+served by a separate process like trinity's own, when decoding the stored
+transactions, uncles and receipts and encoding them again for the reply, against
+reading their stored encoding in batches and sending it as it is.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import pathlib
+import signal
+import sys
+import tempfile
+import time
+
+from eth.constants import EMPTY_UNCLE_HASH
+from eth.db.backends.level import LevelDB
+from eth.db.trie import make_trie_root_and_nodes
+from eth.rlp.headers import BlockHeader
+from eth.rlp.logs import Log
+from eth.rlp.receipts import Receipt
+from eth.rlp.transactions import BaseTransactionFields
+import rlp
+
+from p2p.commands import EncodedRLP
+
+from trinity.db.eth1.chain import AsyncChainDB
+from trinity.db.manager import (
+    DBClient,
+    DBManager,
+)
+from trinity.protocol.eth.commands import (
+    BlockBodiesV65,
+    ReceiptsV65,
+)
+from trinity.protocol.eth.constants import (
+    MAX_BODIES_FETCH,
+    MAX_RECEIPTS_FETCH,
+)
+from trinity.rlp.block_body import BlockBody
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+# The command id doesn't matter for the encoding cost
+COMMAND_ID = 0x10
+
+
+def run_server(ipc_path):
+    with tempfile.TemporaryDirectory() as db_path:
+        db = LevelDB(db_path=db_path)
+        manager = DBManager(db)
+
+        with manager.run(ipc_path):
+            try:
+                manager.wait_stopped()
+            except KeyboardInterrupt:
+                pass
+
+
+def wait_for_ipc(ipc_path):
+    while not ipc_path.exists():
+        time.sleep(0.01)
+
+
+def persist_blocks(chaindb, block_count, transactions_per_block):
+    block_hashes = []
+    for block_number in range(1, block_count + 1):
+        transactions = tuple(
+            BaseTransactionFields(
+                nonce=block_number * transactions_per_block + index,
+                gas_price=10 ** 9,
+                gas=21000,
+                to=b'\x02' * 20,
+                value=10 ** 18,
+                data=b'',
+                v=27,
+                r=2 ** 255 + index,
+                s=2 ** 254 + index,
+            )
+            for index in range(transactions_per_block)
+        )
+        receipts = tuple(
+            Receipt(
+                state_root=b'\x01',
+                gas_used=21000 * (index + 1),
+                bloom=0,
+                logs=[Log(b'\x03' * 20, [index], b'')],
+            )
+            for index in range(transactions_per_block)
+        )
+        transaction_root, transaction_nodes = make_trie_root_and_nodes(transactions)
+        receipt_root, receipt_nodes = make_trie_root_and_nodes(receipts)
+        chaindb.persist_trie_data_dict(transaction_nodes)
+        chaindb.persist_trie_data_dict(receipt_nodes)
+
+        header = BlockHeader(
+            difficulty=1,
+            block_number=block_number,
+            gas_limit=8000000,
+            transaction_root=transaction_root,
+            receipt_root=receipt_root,
+            uncles_hash=EMPTY_UNCLE_HASH,
+        )
+        chaindb.db[header.hash] = rlp.encode(header)
+        block_hashes.append(header.hash)
+    return tuple(block_hashes)
+
+
+def serve_decoded_bodies(chaindb, block_hashes):
+    bodies = []
+    for block_hash in block_hashes:
+        header = chaindb.get_block_header_by_hash(block_hash)
+        transactions = chaindb.get_block_transactions(header, BaseTransactionFields)
+        uncles = chaindb.get_block_uncles(header.uncles_hash)
+        bodies.append(BlockBody(transactions, uncles))
+    return BlockBodiesV65(tuple(bodies)).encode(COMMAND_ID, False)
+
+
+def serve_encoded_bodies(chaindb, block_hashes):
+    encoded_bodies = chaindb.get_encoded_block_bodies(block_hashes)
+    payload = EncodedRLP.from_encoded_items(encoded_bodies)
+    return BlockBodiesV65(payload).encode(COMMAND_ID, False)
+
+
+def serve_decoded_receipts(chaindb, block_hashes):
+    receipts = []
+    for block_hash in block_hashes:
+        header = chaindb.get_block_header_by_hash(block_hash)
+        receipts.append(tuple(chaindb.get_receipts(header, Receipt)))
+    return ReceiptsV65(tuple(receipts)).encode(COMMAND_ID, False)
+
+
+def serve_encoded_receipts(chaindb, block_hashes):
+    encoded_receipts = chaindb.get_encoded_receipts(block_hashes)
+    payload = EncodedRLP.from_encoded_items(encoded_receipts)
+    return ReceiptsV65(payload).encode(COMMAND_ID, False)
+
+
+def measure(name, serve, chaindb, block_hashes, batch_size):
+    start = time.perf_counter()
+    messages = [
+        serve(chaindb, block_hashes[offset:offset + batch_size])
+        for offset in range(0, len(block_hashes), batch_size)
+    ]
+    elapsed = time.perf_counter() - start
+    logger.info('%s: %.2fs, %.1f blocks/s', name, elapsed, len(block_hashes) / elapsed)
+    return messages
+
+
+def run(block_count, transactions_per_block):
+    with tempfile.TemporaryDirectory() as ipc_base_dir:
+        ipc_path = pathlib.Path(ipc_base_dir) / 'db.ipc'
+        server = multiprocessing.Process(target=run_server, args=[ipc_path])
+        server.start()
+        try:
+            wait_for_ipc(ipc_path)
+            db_client = DBClient.connect(ipc_path)
+            chaindb = AsyncChainDB(db_client)
+
+            logger.info(
+                'Storing %d blocks of %d transactions...',
+                block_count,
+                transactions_per_block,
+            )
+            block_hashes = persist_blocks(chaindb, block_count, transactions_per_block)
+
+            decoded = measure(
+                'decoded bodies', serve_decoded_bodies, chaindb, block_hashes, MAX_BODIES_FETCH,
+            )
+            encoded = measure(
+                'encoded bodies', serve_encoded_bodies, chaindb, block_hashes, MAX_BODIES_FETCH,
+            )
+            if [message.body for message in decoded] != [message.body for message in encoded]:
+                raise Exception('Invariant: the encoded bodies differ from the decoded ones')
+
+            decoded = measure(
+                'decoded receipts',
+                serve_decoded_receipts,
+                chaindb,
+                block_hashes,
+                MAX_RECEIPTS_FETCH,
+            )
+            encoded = measure(
+                'encoded receipts',
+                serve_encoded_receipts,
+                chaindb,
+                block_hashes,
+                MAX_RECEIPTS_FETCH,
+            )
+            if [message.body for message in decoded] != [message.body for message in encoded]:
+                raise Exception('Invariant: the encoded receipts differ from the decoded ones')
+
+            db_client.close()
+        finally:
+            os.kill(server.pid, signal.SIGINT)
+            server.join(1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blocks', type=int, default=512)
+    parser.add_argument('--transactions', type=int, default=100)
+    args = parser.parse_args()
+
+    run(args.blocks, args.transactions)
@@ -0,0 +1,121 @@
+"""
+Block import time of generated blocks of value transfers, with the transaction
+senders recovered during the import, against blocks whose senders were filled
+from a warm sender cache beforehand, as they are for transactions the pool saw.
+The time to fill the senders is included in the latter.
+"""
+import argparse
+import logging
+import pathlib
+import sys
+import tempfile
+import time
+
+from eth.chains.base import Chain, MiningChain
+from eth.tools.builder.chain import build, disable_pow_check, frontier_at, genesis
+from eth.vm.forks.frontier.blocks import FrontierBlock
+from eth_keys import keys
+from eth_utils import to_wei
+import rlp
+
+from trinity.db.sender_cache import prepare_sender_cache
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+SENDER_KEYS = tuple(keys.PrivateKey(index.to_bytes(32, 'big')) for index in range(1, 9))
+RECIPIENT = b'\x10' * 20
+GENESIS_PARAMS = {'gas_limit': 3141592, 'difficulty': 1, 'timestamp': 1514764800}
+GENESIS_STATE = {
+    key.public_key.to_canonical_address(): {'balance': to_wei(1000, 'ether')}
+    for key in SENDER_KEYS
+}
+
+
+def build_chain(chain_class):
+    return build(
+        chain_class,
+        frontier_at(0),
+        disable_pow_check(),
+        genesis(params=GENESIS_PARAMS, state=GENESIS_STATE),
+    )
+
+
+def generate_blocks(block_count, transactions_per_block):
+    chain = build_chain(MiningChain)
+    nonces = [0] * len(SENDER_KEYS)
+    encoded_blocks = []
+    for _ in range(block_count):
+        for index in range(transactions_per_block):
+            sender_index = index % len(SENDER_KEYS)
+            transaction = chain.create_unsigned_transaction(
+                nonce=nonces[sender_index],
+                gas_price=1,
+                gas=21000,
+                to=RECIPIENT,
+                value=1,
+                data=b'',
+            ).as_signed_transaction(SENDER_KEYS[sender_index])
+            chain.apply_transaction(transaction)
+            nonces[sender_index] += 1
+        encoded_blocks.append(rlp.encode(chain.mine_block()))
+    return encoded_blocks
+
+
+def decode_blocks(encoded_blocks):
+    return [rlp.decode(encoded_block, sedes=FrontierBlock) for encoded_block in encoded_blocks]
+
+
+def import_blocks(encoded_blocks, sender_cache=None):
+    chain = build_chain(Chain)
+    blocks = decode_blocks(encoded_blocks)
+    start = time.perf_counter()
+    for block in blocks:
+        if sender_cache is not None:
+            sender_cache.recover(block.transactions)
+        chain.import_block(block)
+    return time.perf_counter() - start
+
+
+def run(block_count, transactions_per_block):
+    logger.info('Generating %d blocks of %d transactions...', block_count, transactions_per_block)
+    encoded_blocks = generate_blocks(block_count, transactions_per_block)
+
+    elapsed = import_blocks(encoded_blocks)
+    logger.info('without sender cache: %.2fs, %.1f blocks/s', elapsed, block_count / elapsed)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sender_cache = prepare_sender_cache(pathlib.Path(temp_dir) / 'db.ipc', 16 * 1024 * 1024)
+        try:
+            # the transaction pool recovered the senders as the transactions arrived
+            for block in decode_blocks(encoded_blocks):
+                sender_cache.recover(block.transactions)
+
+            warm_stats = sender_cache.get_stats()
+            elapsed = import_blocks(encoded_blocks, sender_cache)
+            stats = sender_cache.get_stats()
+        finally:
+            sender_cache.close()
+
+    hits = stats.hits - warm_stats.hits
+    misses = stats.misses - warm_stats.misses
+    logger.info(
+        'with warm sender cache: %.2fs, %.1f blocks/s, hit ratio %.2f',
+        elapsed,
+        block_count / elapsed,
+        hits / (hits + misses),
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blocks', type=int, default=20)
+    parser.add_argument('--transactions', type=int, default=100)
+    args = parser.parse_args()
+
+    run(args.blocks, args.transactions)
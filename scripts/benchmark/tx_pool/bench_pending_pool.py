@@ -0,0 +1,100 @@
+"""
+Insert, replace and evict throughput of the ``PendingTransactions`` pool when it holds a large
+number of pending transactions.
+
+The transactions carry made up signatures and their senders are set up front, so that only the
+pool is measured and not the signature recovery.
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+
+from eth.vm.forks.istanbul.transactions import IstanbulTransaction
+
+from trinity.components.builtin.tx_pool.pending import PendingTransactions
+from trinity.db.sender_cache import set_cached_sender
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+TRANSACTIONS_PER_SENDER = 100
+
+
+def make_transaction(sender_index, nonce, gas_price):
+    transaction = IstanbulTransaction(
+        nonce=nonce,
+        gas_price=gas_price,
+        gas=21000,
+        to=b'\x10' * 20,
+        value=1,
+        data=b'',
+        v=27,
+        r=random.getrandbits(256),
+        s=random.getrandbits(255),
+    )
+    set_cached_sender(transaction, sender_index.to_bytes(20, 'big'))
+    return transaction, transaction.hash
+
+
+def run_phase(name, pool, transactions):
+    dropped_count = 0
+    start = time.perf_counter()
+    for transaction, transaction_hash in transactions:
+        dropped_count += len(pool.add(transaction, transaction_hash))
+    elapsed = time.perf_counter() - start
+    logger.info(
+        '%s: %d transactions in %.2fs, %.0f tx/s, %d dropped, %d pooled',
+        name,
+        len(transactions),
+        elapsed,
+        len(transactions) / elapsed,
+        dropped_count,
+        len(pool),
+    )
+
+
+def run(pending_count, operation_count):
+    logger.info('Generating %d transactions...', pending_count + 2 * operation_count)
+    initial = [
+        make_transaction(index // TRANSACTIONS_PER_SENDER, index % TRANSACTIONS_PER_SENDER, price)
+        for index, price in enumerate(random.randint(1, 1000) for _ in range(pending_count))
+    ]
+    replacements = [
+        make_transaction(
+            index // TRANSACTIONS_PER_SENDER,
+            index % TRANSACTIONS_PER_SENDER,
+            initial[index][0].gas_price * 2,
+        )
+        for index in random.sample(range(pending_count), operation_count)
+    ]
+    # new senders paying more than any of the initial transactions
+    first_new_sender = pending_count // TRANSACTIONS_PER_SENDER + 1
+    newcomers = [
+        make_transaction(
+            first_new_sender + index // TRANSACTIONS_PER_SENDER,
+            index % TRANSACTIONS_PER_SENDER,
+            random.randint(2001, 3000),
+        )
+        for index in range(operation_count)
+    ]
+
+    pool = PendingTransactions(max_size=pending_count)
+    run_phase('insert', pool, initial)
+    run_phase('replace', pool, replacements)
+    run_phase('evict', pool, newcomers)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pending', type=int, default=100000)
+    parser.add_argument('--operations', type=int, default=10000)
+    args = parser.parse_args()
+
+    run(args.pending, args.operations)
@@ -0,0 +1,155 @@
+"""
+Transactions per second the transaction pool can relay to its peers, and the bytes it sends to
+them, with the former relay, which validated every transaction for every peer and kept a salted
+entry per peer and transaction in a rolling bloom filter, against the ``TransactionRelay``, which
+validates every transaction once and announces most transactions by hash.
+
+Only the relay logic is measured, not the sending of the messages. The former relay validates
+every transaction once per peer, so it runs on fewer transactions to finish in reasonable time.
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+import uuid
+
+from eth.vm.forks.istanbul.transactions import IstanbulTransaction
+from eth_keys import keys
+from eth_utils import ValidationError
+from eth_utils.toolz import partition_all
+import rlp
+
+from trinity._utils.bloom import RollingBloom
+from trinity.components.builtin.tx_pool.pool import BATCH_HIGH_WATER
+from trinity.components.builtin.tx_pool.relay import TransactionRelay
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+PRIVATE_KEY = keys.PrivateKey(b'\x01' * 32)
+# the number of transactions per incoming Transactions message
+TRANSACTIONS_PER_MESSAGE = 10
+HASH_SIZE = 32
+
+
+def make_transactions(count):
+    return tuple(
+        IstanbulTransaction.create_unsigned_transaction(
+            nonce=nonce,
+            gas_price=1,
+            gas=21000,
+            to=b'\x10' * 20,
+            value=1,
+            data=b'',
+        ).as_signed_transaction(PRIVATE_KEY)
+        for nonce in range(count)
+    )
+
+
+def validate(transaction):
+    # like the DefaultTransactionValidator
+    try:
+        IstanbulTransaction(**transaction.as_dict()).validate()
+    except ValidationError:
+        return False
+    else:
+        return True
+
+
+def make_incoming_messages(transactions, sessions):
+    return tuple(
+        (random.choice(sessions), batch)
+        for batch in partition_all(TRANSACTIONS_PER_MESSAGE, transactions)
+    )
+
+
+def relay_with_bloom(messages, sessions):
+    bloom = RollingBloom(generation_size=100000, max_generations=144)
+    salt = uuid.uuid4()
+    bytes_sent = 0
+
+    def bloom_entry(session, transaction):
+        return b':'.join((session.bytes, transaction.hash, salt.bytes))
+
+    buffer = []
+    for sender, transactions in messages:
+        for transaction in transactions:
+            bloom.add(bloom_entry(sender, transaction))
+        buffer.extend(transactions)
+
+    for batch in partition_all(BATCH_HIGH_WATER, buffer):
+        for session in sessions:
+            filtered = tuple(
+                transaction for transaction in batch
+                if bloom_entry(session, transaction) not in bloom
+                if validate(transaction)
+            )
+            for transaction in filtered:
+                bloom.add(bloom_entry(session, transaction))
+                bytes_sent += len(rlp.encode(transaction))
+    return bytes_sent
+
+
+def relay_with_known_transactions(messages, sessions):
+    relay = TransactionRelay()
+    for session in sessions:
+        relay.mark_announcing(session)
+    bytes_sent = 0
+
+    buffer = []
+    for sender, transactions in messages:
+        hashes = tuple(transaction.hash for transaction in transactions)
+        relay.mark_known(sender, hashes)
+        buffer.extend(transaction for transaction in transactions if validate(transaction))
+
+    for batch in partition_all(BATCH_HIGH_WATER, buffer):
+        for instruction in relay.plan(sessions, batch):
+            bytes_sent += sum(len(rlp.encode(tx)) for tx in instruction.transactions)
+            bytes_sent += HASH_SIZE * len(instruction.announced_hashes)
+    return bytes_sent
+
+
+def run_relay(name, relay_fn, transactions, sessions):
+    messages = make_incoming_messages(transactions, sessions)
+    start = time.perf_counter()
+    bytes_sent = relay_fn(messages, sessions)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        '%s: %d transactions to %d peers in %.2fs, %.0f tx/s, %.1f KB sent per transaction',
+        name,
+        len(transactions),
+        len(sessions),
+        elapsed,
+        len(transactions) / elapsed,
+        bytes_sent / 1e3 / len(transactions),
+    )
+
+
+def run(peer_count, transaction_count, bloom_transaction_count):
+    sessions = tuple(uuid.uuid4() for _ in range(peer_count))
+    logger.info('Signing %d transactions...', transaction_count)
+    transactions = make_transactions(transaction_count)
+
+    run_relay(
+        'per peer bloom filter',
+        relay_with_bloom,
+        transactions[:bloom_transaction_count],
+        sessions,
+    )
+    run_relay('per peer known transactions', relay_with_known_transactions, transactions, sessions)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--peers', type=int, default=50)
+    parser.add_argument('--transactions', type=int, default=10000)
+    parser.add_argument('--bloom-transactions', type=int, default=1000)
+    args = parser.parse_args()
+
+    run(args.peers, args.transactions, args.bloom_transactions)
@@ -1,8 +1,14 @@
 import pytest
 
+from eth2.beacon.tools.builder.validator import (
+    make_deposit_proof,
+    make_deposit_tree_and_root,
+)
 from trinity.components.eth2.eth1_monitor.db import (
     BaseDepositDataDB,
+    DepositDataDB,
     ListCachedDepositDataDB,
+    SchemaV1,
 )
 from trinity.components.eth2.eth1_monitor.exceptions import DepositDataDBValidationError
 from trinity.components.eth2.eth1_monitor.factories import (
@@ -94,3 +100,49 @@ def test_list_cached_deposit_db_cache():
         == cached_db.highest_processed_block_number  # noqa: W503
     )
     assert cached_db._cache_deposit_data == another_cached_db._cache_deposit_data
+
+
+@pytest.mark.parametrize(
+    "db_factory", (DepositDataDBFactory, ListCachedDepositDataDBFactory)
+)
+def test_deposit_tree(db_factory):
+    atomic_db = AtomicDBFactory()
+    db: BaseDepositDataDB = db_factory(db=atomic_db)
+    sequence_deposit_data = tuple(DepositDataFactory() for _ in range(7))
+    db.add_deposit_data_batch(sequence_deposit_data[:3], 1)
+    db.add_deposit_data_batch(sequence_deposit_data[3:], 2)
+
+    def assert_deposit_tree(db):
+        for deposit_count in range(1, len(sequence_deposit_data) + 1):
+            list_deposit_data = sequence_deposit_data[:deposit_count]
+            tree, root = make_deposit_tree_and_root(list_deposit_data)
+            assert db.get_deposit_root(deposit_count) == root
+            for index in range(deposit_count):
+                assert db.get_deposit_proof(deposit_count, index) == make_deposit_proof(
+                    list_deposit_data, tree, root, index
+                )
+
+    assert_deposit_tree(db)
+
+    # Test: The deposit tree is persisted
+    assert_deposit_tree(db_factory(db=atomic_db))
+
+    # Test: Proofs are only available for the deposits in the tree
+    with pytest.raises(DepositDataDBValidationError):
+        db.get_deposit_root(len(sequence_deposit_data) + 1)
+    with pytest.raises(DepositDataDBValidationError):
+        db.get_deposit_proof(3, 3)
+
+
+def test_deposit_tree_is_rebuilt():
+    atomic_db = AtomicDBFactory()
+    db = DepositDataDBFactory(db=atomic_db)
+    sequence_deposit_data = tuple(DepositDataFactory() for _ in range(3))
+    db.add_deposit_data_batch(sequence_deposit_data, 1)
+
+    # Test: A database with deposit data but without the deposit tree gets the tree
+    #   built from the deposit data.
+    del atomic_db[SchemaV1.make_deposit_root_lookup_key(3)]
+    _, root = make_deposit_tree_and_root(sequence_deposit_data)
+    assert DepositDataDB(atomic_db).get_deposit_root(3) == root
+    assert DepositDataDB(atomic_db).get_deposit_root(3) == root
@@ -7,12 +7,12 @@ from trio.testing import wait_all_tasks_blocked
 
 from eth2._utils.merkle.common import verify_merkle_branch
 from eth2.beacon.constants import DEPOSIT_CONTRACT_TREE_DEPTH
+from eth2.beacon.tools.builder.validator import make_deposit_tree_and_root
 from trinity.components.eth2.eth1_monitor.eth1_monitor import (
     Eth1Monitor,
     GetDepositRequest,
     GetDistanceRequest,
     GetEth1DataRequest,
-    make_deposit_tree_and_root,
 )
 from trinity.components.eth2.eth1_monitor.exceptions import (
     DepositDataCorrupted,
@@ -1,53 +1,140 @@
+import random
+
+from eth.constants import ZERO_HASH32
+from eth.db.atomic import AtomicDB
 import pytest
 
+from eth2.beacon.attestation_helpers import is_slashable_attestation_data
 from eth2.beacon.types.attestations import Attestation, AttestationData
 from eth2.beacon.types.blocks import BeaconBlock
+from eth2.beacon.types.checkpoints import Checkpoint
 from eth2.clock import Tick
 from eth2.validator_client.duty import AttestationDuty, BlockProposalDuty
-from eth2.validator_client.signatory_db import InMemorySignatoryDB
+from eth2.validator_client.signatory_db import (
+    CHUNK_SIZE,
+    InMemorySignatoryDB,
+    SignatoryDB,
+)
+
+SLOTS_PER_EPOCH = 32
 
 
-def _mk_resolved_attestation_duty(slot, public_key):
+def _mk_resolved_attestation_duty(
+    public_key, source_epoch, target_epoch, slot=None, beacon_block_root=ZERO_HASH32
+):
+    if slot is None:
+        slot = target_epoch * SLOTS_PER_EPOCH
     return (
         AttestationDuty(
             public_key, Tick(0, slot, 0, 1), Tick(0, 0, 0, 1), committee_index=22
         ),
-        Attestation.create(data=AttestationData.create(slot=slot)),
+        Attestation.create(
+            data=AttestationData.create(
+                slot=slot,
+                beacon_block_root=beacon_block_root,
+                source=Checkpoint.create(epoch=source_epoch),
+                target=Checkpoint.create(epoch=target_epoch),
+            )
+        ),
     )
 
 
 @pytest.mark.trio
 @pytest.mark.parametrize(
-    ("slots_to_make_duties_at," "is_slashable,"), [((1, 2), False), ((2, 2), True)]
+    ("first_vote," "second_vote," "is_slashable,"),
+    [
+        ((0, 1), (1, 2), False),
+        ((1, 2), (0, 1), False),
+        ((1, 2), (1, 3), False),
+        # double vote
+        ((1, 2), (0, 2), True),
+        # surround vote
+        ((1, 2), (0, 3), True),
+        # surrounded vote
+        ((0, 3), (1, 2), True),
+        ((0, 300), (299, 299), True),
+        ((299, 300), (0, 600), True),
+        ((0, 3), (0, 2), False),
+        ((0, 3), (3, 4), False),
+        # source after target
+        ((0, 1), (3, 2), True),
+    ],
 )
 async def test_signatory_db_attestation_slashing_conditions(
-    slots_to_make_duties_at, is_slashable, sample_bls_public_key
+    first_vote, second_vote, is_slashable, sample_bls_public_key
 ):
-    """
-    NOTE: these are not the actual attestation slashing conditions
-    DO _NOT_ USE IN PRODUCTION.
-
-    This test will be updated w/ the appropratie test cases once the attestation slashing conditions
-    are installed in the validator client.
-    """
-
-    first_resolved_duty, second_resolved_duty = tuple(
-        _mk_resolved_attestation_duty(slot, sample_bls_public_key)
-        for slot in slots_to_make_duties_at
+    first_resolved_duty, second_resolved_duty = (
+        _mk_resolved_attestation_duty(sample_bls_public_key, *first_vote),
+        _mk_resolved_attestation_duty(
+            sample_bls_public_key, *second_vote, beacon_block_root=b"\x01" * 32
+        ),
     )
     db = InMemorySignatoryDB()
 
     first_duty, first_operation = first_resolved_duty
     assert not await db.is_slashable(first_duty, first_operation)
     await db.record_signature_for(first_duty, first_operation)
-    # NOTE: once we have recorded the first duty, it is slashable wrt the db
-    assert await db.is_slashable(first_duty, first_operation)
+    # NOTE: signing the recorded attestation again is not slashable
+    assert not await db.is_slashable(first_duty, first_operation)
 
     second_duty, second_operation = second_resolved_duty
     is_slashable_in_db = await db.is_slashable(second_duty, second_operation)
     assert is_slashable_in_db == is_slashable
 
 
+@pytest.mark.trio
+async def test_signatory_db_matches_slashing_conditions(sample_bls_public_key):
+    """
+    Check random votes against the span arrays, and against every recorded vote
+    with the slashing conditions of the spec.
+    """
+    rng = random.Random(7)
+    db = InMemorySignatoryDB()
+    recorded = []
+    for vote in range(300):
+        source_epoch = rng.randrange(0, 600)
+        target_epoch = source_epoch + rng.randrange(0, 20)
+        duty, attestation = _mk_resolved_attestation_duty(
+            sample_bls_public_key,
+            source_epoch,
+            target_epoch,
+            beacon_block_root=vote.to_bytes(32, "little"),
+        )
+        expected = any(
+            is_slashable_attestation_data(attestation.data, other.data)
+            or is_slashable_attestation_data(other.data, attestation.data)
+            for other in recorded
+        )
+        assert await db.is_slashable(duty, attestation) == expected
+        if not expected:
+            await db.record_signature_for(duty, attestation)
+            recorded.append(attestation)
+
+    assert len(recorded) > 20
+
+
+@pytest.mark.trio
+async def test_signatory_db_is_persistent(sample_bls_public_key):
+    base_db = AtomicDB()
+    db = SignatoryDB(base_db)
+    resolved_duties = tuple(
+        _mk_resolved_attestation_duty(sample_bls_public_key, source_epoch, target_epoch)
+        for source_epoch, target_epoch in ((400, 501), (0, 1))
+    )
+    for duty, operation in resolved_duties:
+        await db.record_signature_for(duty, operation)
+
+    restarted_db = SignatoryDB(base_db)
+    surrounding_duty = _mk_resolved_attestation_duty(sample_bls_public_key, 1, 600)
+    surrounded_duty = _mk_resolved_attestation_duty(sample_bls_public_key, 450, 460)
+    unrelated_duty = _mk_resolved_attestation_duty(sample_bls_public_key, 501, 700)
+    assert [
+        await restarted_db.is_slashable(duty, operation)
+        for duty, operation in resolved_duties
+        + (surrounding_duty, surrounded_duty, unrelated_duty)
+    ] == [False, False, True, True, False]
+
+
 def _mk_resolved_block_proposal_duty(slot, public_key):
     return (
         BlockProposalDuty(public_key, Tick(0, slot, 0, 0), Tick(0, 0, 0, 0)),
@@ -77,3 +164,26 @@ async def test_signatory_db_block_proposal_slashing_conditions(
     second_duty, second_operation = second_resolved_duty
     is_slashable_in_db = await db.is_slashable(second_duty, second_operation)
     assert is_slashable_in_db == is_slashable
+
+
+@pytest.mark.trio
+async def test_signatory_db_refuses_attestations_before_history(sample_bls_public_key):
+    db = SignatoryDB(AtomicDB(), history_length=CHUNK_SIZE)
+    for source_epoch, target_epoch in ((0, 1), (CHUNK_SIZE, 2 * CHUNK_SIZE + 1)):
+        await db.record_signature_for(
+            *_mk_resolved_attestation_duty(
+                sample_bls_public_key, source_epoch, target_epoch
+            )
+        )
+
+    # the ring buffer of span arrays reused the chunk of the first attestation
+    old_duty = _mk_resolved_attestation_duty(sample_bls_public_key, 1, 2)
+    assert await db.is_slashable(*old_duty)
+    surrounded_duty = _mk_resolved_attestation_duty(
+        sample_bls_public_key, 2 * CHUNK_SIZE, 2 * CHUNK_SIZE
+    )
+    assert await db.is_slashable(*surrounded_duty)
+    next_duty = _mk_resolved_attestation_duty(
+        sample_bls_public_key, 2 * CHUNK_SIZE + 1, 2 * CHUNK_SIZE + 2
+    )
+    assert not await db.is_slashable(*next_duty)
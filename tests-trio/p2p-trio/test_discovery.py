@@ -33,6 +33,7 @@ from p2p.discovery import (
     _get_msg_expiration,
     _extract_nodes_from_payload,
     _pack_v4,
+    _recover_public_key,
     _unpack_v4,
 )
 from p2p.kademlia import Node
@@ -637,6 +638,20 @@ def test_discover_v4_message_pack():
     assert cmd_id == CMD_PING.id
 
 
+def test_unpack_duplicate_message_reuses_recovered_pubkey():
+    privkey = PrivateKeyFactory()
+    message = _pack_v4(CMD_PING.id, (_get_msg_expiration(),), privkey)
+    _recover_public_key.cache_clear()
+
+    first_pubkey, _, _, _ = _unpack_v4(message)
+    assert _recover_public_key.cache_info().hits == 0
+    # a copy of the message, as it'd come in another datagram
+    second_pubkey, _, _, _ = _unpack_v4(bytes(bytearray(message)))
+
+    assert _recover_public_key.cache_info().hits == 1
+    assert first_pubkey == second_pubkey == privkey.public_key
+
+
 def test_unpack_eip8_packets():
     # Test our _unpack() function against the sample packets specified in
     # https://github.com/ethereum/EIPs/blob/master/EIPS/eip-8.md
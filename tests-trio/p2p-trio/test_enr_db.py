@@ -64,6 +64,37 @@ def test_delete_enr(node_db):
         db.get_enr(enr.node_id)
 
 
+def test_enr_cache_is_bounded_and_written_through():
+    db = NodeDB(default_identity_scheme_registry, MemoryDB(), enr_cache_size=2)
+    private_key = PrivateKeyFactory().to_bytes()
+    enr = ENRFactory(private_key=private_key)
+    other_enrs = ENRFactory.create_batch(2)
+
+    db.set_enr(enr)
+    for other_enr in other_enrs:
+        db.set_enr(other_enr)
+    assert len(db._enr_cache) == 2
+    # the least recently used ENR is decoded again from the DB
+    assert enr.node_id not in db._enr_cache
+    assert db.get_enr(enr.node_id) == enr
+    assert enr.node_id in db._enr_cache
+    assert other_enrs[0].node_id not in db._enr_cache
+
+    updated_enr = ENRFactory(private_key=private_key, sequence_number=enr.sequence_number + 1)
+    db.set_enr(updated_enr)
+    assert db.get_enr(enr.node_id) == updated_enr
+    assert NodeDB(default_identity_scheme_registry, db.db).get_enr(enr.node_id) == updated_enr
+
+    # an ENR with a lower sequence number is rejected and doesn't replace the cached one
+    with pytest.raises(ValueError):
+        db.set_enr(enr)
+    assert db.get_enr(enr.node_id) == updated_enr
+
+    db.delete_enr(enr.node_id)
+    with pytest.raises(KeyError):
+        db.get_enr(enr.node_id)
+
+
 def test_get_and_set_last_pong_time(node_db):
     db = node_db
     enr = ENRFactory()
@@ -0,0 +1,117 @@
+from concurrent.futures import ProcessPoolExecutor
+import gzip
+import io
+
+from eth.rlp.headers import BlockHeader
+from eth.vm.forks.frontier.blocks import FrontierBlock
+from eth.vm.forks.frontier.transactions import FrontierTransaction
+from eth_keys import keys
+import pytest
+import rlp
+from rlp.exceptions import DecodingError
+
+from trinity.components.builtin.import_export.streaming import (
+    decode_blocks_in_parallel,
+    open_export_file,
+    open_rlp_items,
+    read_rlp_items,
+    split_rlp_items,
+)
+
+
+def _make_block(block_number, private_key):
+    transactions = tuple(
+        FrontierTransaction.create_unsigned_transaction(
+            nonce=nonce,
+            gas_price=1,
+            gas=21000,
+            to=b'\x02' * 20,
+            value=block_number,
+            data=b'',
+        ).as_signed_transaction(private_key)
+        for nonce in range(block_number % 3)
+    )
+    header = BlockHeader(difficulty=1, block_number=block_number, gas_limit=3141592)
+    return FrontierBlock(header=header, transactions=transactions)
+
+
+@pytest.fixture
+def private_key():
+    return keys.PrivateKey(b'\x01' * 32)
+
+
+@pytest.fixture
+def blocks(private_key):
+    return tuple(_make_block(block_number, private_key) for block_number in range(1, 11))
+
+
+@pytest.fixture
+def encoded_blocks(blocks):
+    return tuple(rlp.encode(block) for block in blocks)
+
+
+def test_split_rlp_items(encoded_blocks):
+    assert tuple(split_rlp_items(b''.join(encoded_blocks))) == encoded_blocks
+    assert tuple(split_rlp_items(b'')) == ()
+
+    with pytest.raises(DecodingError):
+        tuple(split_rlp_items(b''.join(encoded_blocks)[:-1]))
+
+
+@pytest.mark.parametrize('chunk_size', (1, 7, 1024 * 1024))
+def test_read_rlp_items(encoded_blocks, chunk_size):
+    stream = io.BytesIO(b''.join(encoded_blocks))
+    assert tuple(read_rlp_items(stream, chunk_size)) == encoded_blocks
+
+    truncated_stream = io.BytesIO(b''.join(encoded_blocks)[:-1])
+    with pytest.raises(DecodingError):
+        tuple(read_rlp_items(truncated_stream, chunk_size))
+
+
+@pytest.mark.parametrize('file_name', ('blocks.rlp', 'blocks.rlp.gz'))
+def test_export_file_round_trip(tmp_path, encoded_blocks, file_name):
+    path = tmp_path / file_name
+    with open_export_file(path, append=False) as export_file:
+        for encoded_block in encoded_blocks[:4]:
+            export_file.write(encoded_block)
+    with open_export_file(path, append=True) as export_file:
+        for encoded_block in encoded_blocks[4:]:
+            export_file.write(encoded_block)
+
+    if path.suffix == '.gz':
+        assert gzip.decompress(path.read_bytes()) == b''.join(encoded_blocks)
+
+    with open_rlp_items(path) as items:
+        assert tuple(items) == encoded_blocks
+
+
+def test_open_empty_file(tmp_path):
+    path = tmp_path / 'empty.rlp'
+    path.touch()
+    with open_rlp_items(path) as items:
+        assert tuple(items) == ()
+
+
+@pytest.mark.parametrize('batch_size', (1, 3, 64))
+def test_decode_blocks_in_parallel(blocks, encoded_blocks, private_key, batch_size):
+    with ProcessPoolExecutor(2) as executor:
+        decoded_blocks = tuple(decode_blocks_in_parallel(
+            encoded_blocks,
+            FrontierBlock,
+            executor,
+            max_batches_in_flight=2,
+            batch_size=batch_size,
+        ))
+    assert decoded_blocks == blocks
+
+    sender = private_key.public_key.to_canonical_address()
+    transactions = tuple(
+        transaction for block in decoded_blocks for transaction in block.transactions
+    )
+    assert transactions
+    # the senders were recovered by the workers
+    assert all(transaction.__dict__['sender'] == sender for transaction in transactions)
+
+
+def test_decode_blocks_without_executor(blocks, encoded_blocks):
+    assert tuple(decode_blocks_in_parallel(encoded_blocks, FrontierBlock, batch_size=4)) == blocks
@@ -0,0 +1,121 @@
+import asyncio
+import pathlib
+import tempfile
+
+from eth.db.atomic import AtomicDB
+from eth.db.diff import DBDiffTracker
+import pytest
+
+from trinity.db.manager import (
+    AsyncDBClient,
+    DBManager,
+)
+
+
+@pytest.fixture
+def ipc_path():
+    with tempfile.TemporaryDirectory() as dir:
+        ipc_path = pathlib.Path(dir) / "db_manager.ipc"
+        yield ipc_path
+
+
+@pytest.fixture
+def base_db():
+    return AtomicDB()
+
+
+@pytest.fixture
+def db_manager(base_db, ipc_path):
+    with DBManager(base_db).run(ipc_path) as manager:
+        yield manager
+
+
+@pytest.fixture
+async def async_db_client(ipc_path, db_manager):
+    client = await AsyncDBClient.connect(ipc_path)
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_db_client_get_set_delete(async_db_client, base_db):
+    await async_db_client.coro_set(b'key', b'value')
+    assert base_db[b'key'] == b'value'
+    assert await async_db_client.coro_get(b'key') == b'value'
+    assert await async_db_client.coro_exists(b'key')
+
+    await async_db_client.coro_delete(b'key')
+    assert not await async_db_client.coro_exists(b'key')
+
+    with pytest.raises(KeyError):
+        await async_db_client.coro_get(b'key')
+    with pytest.raises(KeyError):
+        await async_db_client.coro_delete(b'key')
+
+
+@pytest.mark.asyncio
+async def test_async_db_client_many_requests_in_flight(async_db_client, base_db):
+    keys = tuple(i.to_bytes(4, 'big') for i in range(500))
+
+    await asyncio.gather(*(
+        async_db_client.coro_set(key, key * 2) for key in keys
+    ))
+    values = await asyncio.gather(*(
+        async_db_client.coro_get(key) for key in keys
+    ))
+
+    assert values == [key * 2 for key in keys]
+
+
+@pytest.mark.asyncio
+async def test_async_db_client_multi_key_operations(async_db_client, base_db):
+    base_db[b'key-a'] = b'value-a'
+    base_db[b'key-b'] = b''
+
+    values = await async_db_client.coro_multi_get((b'key-a', b'missing', b'key-b'))
+    assert values == (b'value-a', None, b'')
+
+    exists = await async_db_client.coro_multi_exists((b'missing', b'key-a'))
+    assert exists == (False, True)
+
+
+@pytest.mark.asyncio
+async def test_async_db_client_apply_diff(async_db_client, base_db):
+    base_db[b'to-delete'] = b'old'
+
+    tracker = DBDiffTracker()
+    tracker[b'to-set'] = b'new'
+    del tracker[b'to-delete']
+    await async_db_client.coro_apply_diff(tracker.diff())
+
+    assert base_db[b'to-set'] == b'new'
+    assert b'to-delete' not in base_db
+
+
+@pytest.mark.asyncio
+async def test_async_db_client_closes_on_response_to_unknown_request(ipc_path):
+    connection_closed = asyncio.Event()
+
+    async def respond_to_unknown_request(reader, writer):
+        await reader.read(1)
+        writer.write(b'\xff\xff\xff\xff')
+        while await reader.read(1024):
+            pass
+        connection_closed.set()
+
+    server = await asyncio.start_unix_server(respond_to_unknown_request, str(ipc_path))
+    client = await AsyncDBClient.connect(ipc_path)
+    try:
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(client.coro_get(b'key'), timeout=1)
+        await asyncio.wait_for(connection_closed.wait(), timeout=1)
+
+        # later requests fail right away
+        with pytest.raises(ConnectionError):
+            await client.coro_get(b'key')
+    finally:
+        client.close()
+        server.close()
+        await server.wait_closed()
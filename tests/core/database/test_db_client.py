@@ -56,3 +56,18 @@ class TestDBClientDatabaseAPI(DatabaseAPITestSuite):
 
 class TestDBClientAtomicBatchAPI(AtomicDatabaseBatchAPITestSuite):
     pass
+
+
+def test_db_client_multi_get(db_client):
+    db_client[b'key-a'] = b'value-a'
+    db_client[b'key-b'] = b''
+
+    assert db_client.multi_get((b'key-a', b'missing', b'key-b')) == (b'value-a', None, b'')
+    assert db_client.multi_get(()) == ()
+
+
+def test_db_client_multi_exists(db_client):
+    db_client[b'key-a'] = b'value-a'
+
+    assert db_client.multi_exists((b'missing', b'key-a')) == (False, True)
+    assert db_client.multi_exists(()) == ()
@@ -0,0 +1,158 @@
+import pathlib
+import tempfile
+
+from eth.db.atomic import AtomicDB
+import pytest
+
+from trinity.db.manager import (
+    DBClient,
+    DBManager,
+)
+from trinity.db.read_cache import (
+    SharedReadCache,
+    attach_read_cache,
+    get_read_cache_path,
+    prepare_read_cache,
+    remove_read_cache,
+)
+
+
+@pytest.fixture
+def ipc_path():
+    with tempfile.TemporaryDirectory() as dir:
+        ipc_path = pathlib.Path(dir) / "db_manager.ipc"
+        yield ipc_path
+
+
+@pytest.fixture
+def read_cache(ipc_path):
+    cache = prepare_read_cache(ipc_path, 1024 * 1024)
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+
+def test_read_cache_insert_and_get(read_cache):
+    version = read_cache.get_version(b'key')
+    assert read_cache.get(b'key') is None
+
+    read_cache.insert(b'key', b'value', version)
+    assert read_cache.get(b'key') == b'value'
+
+    stats = read_cache.get_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+
+def test_read_cache_is_shared_between_attachments(ipc_path, read_cache):
+    other = attach_read_cache(ipc_path)
+    try:
+        other.insert(b'key', b'value', other.get_version(b'key'))
+        assert read_cache.get(b'key') == b'value'
+    finally:
+        other.close()
+
+
+def test_read_cache_invalidate(read_cache):
+    read_cache.insert(b'key', b'value', read_cache.get_version(b'key'))
+    read_cache.invalidate((b'key',))
+
+    assert read_cache.get(b'key') is None
+    assert read_cache.get_stats().invalidations == 1
+
+
+def test_read_cache_drops_insert_that_raced_an_invalidation(read_cache):
+    version = read_cache.get_version(b'key')
+    read_cache.invalidate((b'key',))
+    read_cache.insert(b'key', b'stale-value', version)
+
+    assert read_cache.get(b'key') is None
+
+
+def test_read_cache_get_cannot_revive_entry_invalidated_while_reading(read_cache, monkeypatch):
+    read_cache.insert(b'key', b'value', read_cache.get_version(b'key'))
+    mark_referenced = read_cache._mark_referenced
+
+    def invalidate_then_mark_referenced(bucket_offset, key):
+        # the invalidation lands after the read was validated, but before the
+        # entry is marked as referenced
+        read_cache.invalidate((key,))
+        mark_referenced(bucket_offset, key)
+
+    monkeypatch.setattr(read_cache, '_mark_referenced', invalidate_then_mark_referenced)
+    assert read_cache.get(b'key') == b'value'
+
+    monkeypatch.undo()
+    assert read_cache.get(b'key') is None
+
+
+def test_read_cache_get_does_not_wait_for_writers(read_cache):
+    read_cache.insert(b'key', b'value', read_cache.get_version(b'key'))
+    with read_cache._write_lock():
+        assert read_cache.get(b'key') == b'value'
+
+
+def test_read_cache_skips_oversized_values(read_cache):
+    read_cache.insert(b'key', b'\x00' * 4096, read_cache.get_version(b'key'))
+    assert read_cache.get(b'key') is None
+
+
+def test_read_cache_evicts_when_full(ipc_path):
+    # a single bucket with two entries
+    cache = SharedReadCache.create(
+        get_read_cache_path(ipc_path),
+        128,
+        ways=2,
+        max_key_size=8,
+        max_value_size=8,
+    )
+    try:
+        for key in (b'a', b'b', b'c'):
+            cache.insert(key, key, cache.get_version(key))
+
+        assert cache.get(b'c') == b'c'
+        assert sum(cache.get(key) is not None for key in (b'a', b'b')) == 1
+        assert cache.get_stats().evictions == 1
+    finally:
+        cache.close()
+
+
+def test_prepare_read_cache_discards_previous_cache(ipc_path, read_cache):
+    read_cache.insert(b'key', b'value', read_cache.get_version(b'key'))
+
+    assert prepare_read_cache(ipc_path, 0) is None
+    assert attach_read_cache(ipc_path) is None
+
+
+def test_remove_read_cache(ipc_path, read_cache):
+    remove_read_cache(ipc_path)
+    assert attach_read_cache(ipc_path) is None
+    # removing it again is fine
+    remove_read_cache(ipc_path)
+
+
+def test_db_client_reads_through_shared_cache(ipc_path, read_cache):
+    base_db = AtomicDB()
+    with DBManager(base_db, read_cache).run(ipc_path):
+        writer = DBClient.connect(ipc_path)
+        reader = DBClient.connect(ipc_path)
+        try:
+            writer[b'key'] = b'value'
+            assert reader[b'key'] == b'value'
+
+            # served from the cache, even though the underlying db changed
+            base_db[b'key'] = b'changed-behind-the-managers-back'
+            assert reader[b'key'] == b'value'
+
+            # writes through the manager invalidate the cached value
+            writer[b'key'] = b'new-value'
+            assert reader[b'key'] == b'new-value'
+            assert reader.multi_get((b'key', b'missing')) == (b'new-value', None)
+
+            with writer.atomic_batch() as batch:
+                del batch[b'key']
+            assert b'key' not in reader
+        finally:
+            writer.close()
+            reader.close()
@@ -0,0 +1,184 @@
+from eth.constants import (
+    BLANK_ROOT_HASH,
+    EMPTY_UNCLE_HASH,
+)
+from eth.db.atomic import AtomicDB
+from eth.db.trie import make_trie_root_and_nodes
+from eth.rlp.headers import BlockHeader
+from eth.rlp.logs import Log
+from eth.rlp.receipts import Receipt
+from eth.rlp.transactions import BaseTransactionFields
+from eth_utils import keccak
+import pytest
+import rlp
+from rlp.sedes import CountableList
+
+from p2p.commands import (
+    EncodedRLP,
+    RLPCodec,
+)
+
+from trinity.db.eth1.chain import AsyncChainDB
+from trinity.protocol.eth.commands import (
+    BlockBodiesV65,
+    ReceiptsV65,
+)
+from trinity.rlp.block_body import BlockBody
+
+
+class MultiGetDB(AtomicDB):
+    """
+    Records the lookups of the batched reads, like a ``DBClient`` would make them.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self.multi_get_calls = []
+
+    def multi_get(self, keys):
+        self.multi_get_calls.append(tuple(keys))
+        return tuple(self.get(key) for key in keys)
+
+
+def _make_transactions(count):
+    return tuple(
+        BaseTransactionFields(
+            nonce=nonce,
+            gas_price=1,
+            gas=21000,
+            to=b'\x02' * 20,
+            value=nonce,
+            data=b'',
+            v=27,
+            r=nonce + 1,
+            s=nonce + 2,
+        )
+        for nonce in range(count)
+    )
+
+
+def _make_receipts(count):
+    return tuple(
+        Receipt(
+            state_root=b'\x01',
+            gas_used=21000 * (index + 1),
+            bloom=0,
+            logs=[Log(b'\x03' * 20, [index], b'log data' * index)],
+        )
+        for index in range(count)
+    )
+
+
+def _persist_block(chaindb, block_number, transaction_count, uncles=()):
+    transactions = _make_transactions(transaction_count)
+    receipts = _make_receipts(transaction_count)
+    transaction_root, transaction_nodes = make_trie_root_and_nodes(transactions)
+    receipt_root, receipt_nodes = make_trie_root_and_nodes(receipts)
+    chaindb.persist_trie_data_dict(transaction_nodes)
+    chaindb.persist_trie_data_dict(receipt_nodes)
+    uncles_hash = chaindb.persist_uncles(uncles) if uncles else EMPTY_UNCLE_HASH
+
+    header = BlockHeader(
+        difficulty=1,
+        block_number=block_number,
+        gas_limit=8000000,
+        transaction_root=transaction_root,
+        receipt_root=receipt_root,
+        uncles_hash=uncles_hash,
+    )
+    chaindb.db[header.hash] = rlp.encode(header)
+    return header
+
+
+def _decoded_body(chaindb, header):
+    return BlockBody(
+        chaindb.get_block_transactions(header, BaseTransactionFields),
+        chaindb.get_block_uncles(header.uncles_hash),
+    )
+
+
+@pytest.fixture(params=(AtomicDB, MultiGetDB))
+def chaindb(request):
+    return AsyncChainDB(request.param())
+
+
+@pytest.fixture
+def headers(chaindb):
+    uncle = BlockHeader(difficulty=1, block_number=1, gas_limit=8000000)
+    return (
+        _persist_block(chaindb, 1, 0),
+        _persist_block(chaindb, 2, 1),
+        _persist_block(chaindb, 3, 17, uncles=(uncle,)),
+        # enough transactions for indices with encodings of different lengths
+        _persist_block(chaindb, 4, 300),
+    )
+
+
+def test_encoded_block_bodies_match_decoded_bodies(chaindb, headers):
+    encoded_bodies = chaindb.get_encoded_block_bodies(tuple(header.hash for header in headers))
+
+    assert headers[0].transaction_root == BLANK_ROOT_HASH
+    assert len(encoded_bodies) == len(headers)
+    for header, encoded_body in zip(headers, encoded_bodies):
+        assert encoded_body == rlp.encode(_decoded_body(chaindb, header))
+
+
+def test_encoded_receipts_match_decoded_receipts(chaindb, headers):
+    encoded_receipts = chaindb.get_encoded_receipts(tuple(header.hash for header in headers))
+
+    assert len(encoded_receipts) == len(headers)
+    for header, block_receipts in zip(headers, encoded_receipts):
+        decoded_receipts = chaindb.get_receipts(header, Receipt)
+        assert block_receipts == rlp.encode(decoded_receipts, sedes=CountableList(Receipt))
+
+
+def test_encoded_block_data_of_missing_blocks(chaindb, headers):
+    missing_hash = keccak(b'missing')
+    # a block with a missing transaction node, but whose receipts are all there
+    incomplete_header = _persist_block(chaindb, 5, 40)
+    del chaindb.db[incomplete_header.transaction_root]
+
+    block_hashes = (missing_hash, headers[3].hash, incomplete_header.hash)
+    encoded_bodies = chaindb.get_encoded_block_bodies(block_hashes)
+    encoded_receipts = chaindb.get_encoded_receipts(block_hashes)
+
+    assert encoded_bodies[0] is None
+    assert encoded_bodies[1] == rlp.encode(_decoded_body(chaindb, headers[3]))
+    assert encoded_bodies[2] is None
+    assert encoded_receipts[0] is None
+    assert encoded_receipts[1] is not None
+    assert encoded_receipts[2] == rlp.encode(
+        chaindb.get_receipts(incomplete_header, Receipt),
+        sedes=CountableList(Receipt),
+    )
+
+
+def test_encoded_block_bodies_are_read_in_batches():
+    chaindb = AsyncChainDB(MultiGetDB())
+    headers = tuple(_persist_block(chaindb, number, 100) for number in range(1, 11))
+    chaindb.db.multi_get_calls.clear()
+
+    chaindb.get_encoded_block_bodies(tuple(header.hash for header in headers))
+
+    # the headers, the uncles, then one lookup per level of the transaction tries
+    trie_depth = 3
+    assert len(chaindb.db.multi_get_calls) <= 2 + trie_depth
+
+
+def test_encoded_payloads_are_sent_as_they_are(chaindb, headers):
+    block_hashes = tuple(header.hash for header in headers)
+    encoded_bodies = chaindb.get_encoded_block_bodies(block_hashes)
+    encoded_receipts = chaindb.get_encoded_receipts(block_hashes)
+
+    bodies_payload = EncodedRLP.from_encoded_items(encoded_bodies)
+    receipts_payload = EncodedRLP.from_encoded_items(encoded_receipts)
+
+    bodies_codec: RLPCodec = BlockBodiesV65.serialization_codec
+    receipts_codec: RLPCodec = ReceiptsV65.serialization_codec
+    assert bodies_codec.encode(bodies_payload) == bodies_codec.encode(tuple(
+        _decoded_body(chaindb, header) for header in headers
+    ))
+    assert receipts_codec.encode(receipts_payload) == receipts_codec.encode(tuple(
+        tuple(chaindb.get_receipts(header, Receipt)) for header in headers
+    ))
+    # and the peer decodes them like any other message
+    assert len(bodies_codec.decode(bodies_codec.encode(bodies_payload))) == len(headers)
@@ -0,0 +1,213 @@
+import random
+
+from eth.constants import (
+    EMPTY_UNCLE_HASH,
+    GENESIS_PARENT_HASH,
+)
+from eth.db.atomic import AtomicDB
+from eth.db.chain import ChainDB
+from eth.db.trie import make_trie_root_and_nodes
+from eth.rlp.headers import BlockHeader
+from eth.rlp.logs import Log
+from eth.rlp.receipts import Receipt
+from eth.rlp.transactions import BaseTransactionFields
+from eth_utils import (
+    big_endian_to_int,
+    int_to_big_endian,
+    keccak,
+)
+import pytest
+
+from trinity.db.eth1.log_index import (
+    IndexedLog,
+    LogCriteria,
+    LogIndex,
+)
+
+
+SECTION_SIZE = 8
+
+ADDRESSES = tuple(bytes([index]) * 20 for index in range(1, 5))
+
+TOPICS = tuple(keccak(bytes([index])) for index in range(6))
+
+
+class MultiGetDB(AtomicDB):
+    def multi_get(self, keys):
+        return tuple(self.get(key) for key in keys)
+
+
+def _make_receipts(rng, transaction_count):
+    receipts = []
+    for index in range(transaction_count):
+        logs = [
+            Log(
+                rng.choice(ADDRESSES),
+                # topics are stored as integers
+                [big_endian_to_int(topic) for topic in rng.sample(TOPICS, rng.randint(0, 3))],
+                b'data %d' % index,
+            )
+            for _ in range(rng.randint(0, 2))
+        ]
+        receipts.append(Receipt(state_root=b'\x01', gas_used=21000 * (index + 1), logs=logs))
+    return tuple(receipts)
+
+
+def _persist_chain(chaindb, rng, block_count, parent=None, difficulty=1):
+    headers = []
+    for _ in range(block_count):
+        transaction_count = rng.randint(0, 3)
+        transactions = tuple(
+            BaseTransactionFields(
+                nonce=rng.randint(0, 2 ** 32),
+                gas_price=1,
+                gas=21000,
+                to=b'\x02' * 20,
+                value=0,
+                data=b'',
+                v=27,
+                r=1,
+                s=2,
+            )
+            for _ in range(transaction_count)
+        )
+        receipts = _make_receipts(rng, transaction_count)
+        transaction_root, transaction_nodes = make_trie_root_and_nodes(transactions)
+        receipt_root, receipt_nodes = make_trie_root_and_nodes(receipts)
+        chaindb.persist_trie_data_dict(transaction_nodes)
+        chaindb.persist_trie_data_dict(receipt_nodes)
+
+        bloom = 0
+        for receipt in receipts:
+            bloom |= receipt.bloom
+        header = BlockHeader(
+            difficulty=difficulty,
+            block_number=0 if parent is None else parent.block_number + 1,
+            gas_limit=8000000,
+            parent_hash=GENESIS_PARENT_HASH if parent is None else parent.hash,
+            transaction_root=transaction_root,
+            receipt_root=receipt_root,
+            uncles_hash=EMPTY_UNCLE_HASH,
+            bloom=bloom,
+        )
+        chaindb.persist_header(header)
+        headers.append(header)
+        parent = header
+    return headers
+
+
+def _find_logs_by_scanning(chaindb, from_block, to_block, criteria):
+    for block_number in range(from_block, to_block + 1):
+        header = chaindb.get_canonical_block_header_by_number(block_number)
+        transaction_hashes = chaindb.get_block_transaction_hashes(header)
+        log_index = 0
+        for transaction_index, receipt in enumerate(chaindb.get_receipts(header, Receipt)):
+            for log in receipt.logs:
+                topics = tuple(int_to_big_endian(topic).rjust(32, b'\0') for topic in log.topics)
+                if criteria.matches(log.address, topics):
+                    yield IndexedLog(
+                        log.address,
+                        topics,
+                        log.data,
+                        block_number,
+                        header.hash,
+                        transaction_hashes[transaction_index],
+                        transaction_index,
+                        log_index,
+                    )
+                log_index += 1
+
+
+CRITERIA = (
+    LogCriteria(),
+    LogCriteria(addresses=ADDRESSES[:1]),
+    LogCriteria(addresses=ADDRESSES[1:3]),
+    LogCriteria(topics=((TOPICS[0],),)),
+    LogCriteria(topics=((), (TOPICS[1], TOPICS[2]))),
+    LogCriteria(addresses=ADDRESSES[2:3], topics=((TOPICS[3],), (), (TOPICS[4],))),
+    LogCriteria(addresses=(b'\xff' * 20,)),
+)
+
+
+@pytest.fixture(params=(AtomicDB, MultiGetDB))
+def chaindb(request):
+    return ChainDB(request.param())
+
+
+@pytest.fixture
+def headers(chaindb):
+    return _persist_chain(chaindb, random.Random(7), 6 * SECTION_SIZE + 3)
+
+
+def _index_all(log_index):
+    while log_index.index_next_section():
+        pass
+
+
+@pytest.mark.parametrize('index_postings', (False, True))
+@pytest.mark.parametrize('criteria', CRITERIA)
+def test_find_logs_matches_scanning_receipts(chaindb, headers, criteria, index_postings):
+    log_index = LogIndex(chaindb, SECTION_SIZE, confirmations=0, index_postings=index_postings)
+    _index_all(log_index)
+    assert log_index.get_section_count() == 6
+
+    # ranges within a section, across sections and into the blocks that aren't indexed
+    for from_block, to_block in ((0, len(headers) - 1), (3, 5), (5, 30), (20, len(headers) - 2)):
+        expected = tuple(_find_logs_by_scanning(chaindb, from_block, to_block, criteria))
+        assert tuple(log_index.find_logs(from_block, to_block, criteria)) == expected
+
+
+def test_postings_find_the_exact_blocks(chaindb, headers):
+    log_index = LogIndex(chaindb, SECTION_SIZE, confirmations=0, index_postings=True)
+    _index_all(log_index)
+    indexed_end = log_index.get_section_count() * SECTION_SIZE
+
+    # a block may have logs of all the values of several groups, but not in the same log
+    for criteria in (criteria for criteria in CRITERIA if len(criteria.get_groups()) == 1):
+        candidates = tuple(log_index.find_candidate_blocks(0, indexed_end - 1, criteria))
+        blocks_with_logs = tuple(sorted({
+            log.block_number
+            for log in _find_logs_by_scanning(chaindb, 0, indexed_end - 1, criteria)
+        }))
+        assert candidates == blocks_with_logs
+
+
+def test_only_confirmed_sections_are_indexed(chaindb, headers):
+    log_index = LogIndex(chaindb, SECTION_SIZE, confirmations=SECTION_SIZE)
+    _index_all(log_index)
+
+    # the last section with all its blocks confirmed ends SECTION_SIZE blocks before the head
+    assert log_index.get_section_count() == 5
+    assert not log_index.index_next_section()
+
+
+def test_reorganized_sections_are_indexed_again(chaindb, headers):
+    log_index = LogIndex(chaindb, SECTION_SIZE, confirmations=0)
+    _index_all(log_index)
+    criteria = LogCriteria(addresses=ADDRESSES[:2])
+
+    # a heavier fork from the middle of the third section
+    fork_parent = headers[2 * SECTION_SIZE + 3]
+    _persist_chain(chaindb, random.Random(8), 3 * SECTION_SIZE, fork_parent, difficulty=2)
+    head_number = chaindb.get_canonical_head().block_number
+
+    assert log_index.index_next_section()
+    # the first two sections are still there, and the third was indexed again
+    assert log_index.get_section_count() == 3
+    _index_all(log_index)
+    assert tuple(log_index.find_logs(0, head_number, criteria)) == tuple(
+        _find_logs_by_scanning(chaindb, 0, head_number, criteria)
+    )
+
+
+def test_section_size_must_fit_offsets():
+    chaindb = ChainDB(AtomicDB())
+    with pytest.raises(ValueError):
+        LogIndex(chaindb, section_size=12)
+    with pytest.raises(ValueError):
+        LogIndex(chaindb, section_size=2 ** 17)
+
+
+def test_empty_range(chaindb, headers):
+    log_index = LogIndex(chaindb, SECTION_SIZE, confirmations=0)
+    assert tuple(log_index.find_logs(5, 4, LogCriteria())) == ()
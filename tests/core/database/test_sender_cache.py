@@ -0,0 +1,118 @@
+import asyncio
+import pathlib
+import tempfile
+
+from eth.vm.forks.frontier.transactions import FrontierTransaction
+from eth_keys import keys
+import pytest
+import rlp
+
+from trinity.db.sender_cache import (
+    attach_sender_cache,
+    get_cached_sender,
+    prepare_sender_cache,
+)
+from trinity.sync.common.senders import SenderRecovery
+
+
+@pytest.fixture
+def ipc_path():
+    with tempfile.TemporaryDirectory() as dir:
+        ipc_path = pathlib.Path(dir) / "db_manager.ipc"
+        yield ipc_path
+
+
+@pytest.fixture
+def sender_cache(ipc_path):
+    cache = prepare_sender_cache(ipc_path, 1024 * 1024)
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+
+@pytest.fixture
+def private_key():
+    return keys.PrivateKey(b'\x01' * 32)
+
+
+@pytest.fixture
+def sender(private_key):
+    return private_key.public_key.to_canonical_address()
+
+
+def _make_transactions(private_key, count):
+    return tuple(
+        FrontierTransaction.create_unsigned_transaction(
+            nonce=nonce,
+            gas_price=1,
+            gas=21000,
+            to=b'\x02' * 20,
+            value=1,
+            data=b'',
+        ).as_signed_transaction(private_key)
+        for nonce in range(count)
+    )
+
+
+def _fresh_copies(transactions):
+    # decoded again, without the senders that were recovered on the originals
+    return tuple(
+        rlp.decode(rlp.encode(transaction), sedes=FrontierTransaction)
+        for transaction in transactions
+    )
+
+
+def test_sender_cache_recover_and_fill(sender_cache, private_key, sender):
+    transactions = _make_transactions(private_key, 3)
+    sender_cache.recover(_fresh_copies(transactions))
+
+    stats = sender_cache.get_stats()
+    assert stats.misses == 3
+    assert stats.hits == 0
+
+    copies = _fresh_copies(transactions)
+    assert all(get_cached_sender(transaction) is None for transaction in copies)
+    assert sender_cache.fill(copies) == ()
+    assert all(get_cached_sender(transaction) == sender for transaction in copies)
+    assert sender_cache.get_stats().hits == 3
+
+
+def test_sender_cache_skips_invalid_signatures(sender_cache, private_key):
+    transaction, = _make_transactions(private_key, 1)
+    invalid = transaction.copy(s=0)
+    sender_cache.recover((invalid,))
+
+    assert get_cached_sender(invalid) is None
+    assert sender_cache.get(invalid.hash) is None
+
+
+def test_sender_cache_is_shared_between_attachments(ipc_path, sender_cache, private_key, sender):
+    transactions = _make_transactions(private_key, 2)
+    other = attach_sender_cache(ipc_path)
+    try:
+        other.recover(_fresh_copies(transactions))
+    finally:
+        other.close()
+
+    assert sender_cache.fill(_fresh_copies(transactions)) == ()
+    assert sender_cache.get(transactions[0].hash) == sender
+
+
+def test_sender_cache_disabled(ipc_path):
+    assert prepare_sender_cache(ipc_path, 0) is None
+    assert attach_sender_cache(ipc_path) is None
+
+
+@pytest.mark.parametrize('max_workers', (1, 2))
+def test_sender_recovery(sender_cache, private_key, sender, max_workers):
+    # enough transactions to be recovered by the workers, if there are any
+    transactions = _fresh_copies(_make_transactions(private_key, 20))
+    sender_recovery = SenderRecovery(sender_cache, max_workers=max_workers)
+    try:
+        asyncio.get_event_loop().run_until_complete(sender_recovery.recover(transactions))
+    finally:
+        sender_recovery.shutdown()
+
+    assert all(get_cached_sender(transaction) == sender for transaction in transactions)
+    assert all(sender_cache.get(transaction.hash) == sender for transaction in transactions)
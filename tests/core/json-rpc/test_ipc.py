@@ -13,6 +13,7 @@ from eth_utils.toolz import (
 )
 from eth_utils import (
     decode_hex,
+    encode_hex,
     function_signature_to_4byte_selector,
     to_bytes,
     to_hex,
@@ -28,6 +29,7 @@ from trinity.protocol.common.events import (
     PeerCountRequest,
     PeerCountResponse,
 )
+from trinity.rpc.modules.eth import FILTER_TIMEOUT
 from trinity.sync.common.events import (
     SyncingRequest,
     SyncingResponse,
@@ -132,7 +134,12 @@ def simple_contract_address():
 
 
 @pytest.fixture
-def genesis_state(base_genesis_state, simple_contract_address):
+def log_contract_address():
+    return b'\x99' * 20
+
+
+@pytest.fixture
+def genesis_state(base_genesis_state, simple_contract_address, log_contract_address):
     """
     Includes runtime bytecode of compiled Solidity:
 
@@ -161,7 +168,7 @@ def genesis_state(base_genesis_state, simple_contract_address):
             }
         }
     """
-    return assoc(
+    genesis_state_with_simple_contract = assoc(
         base_genesis_state,
         simple_contract_address,
         {
@@ -171,6 +178,17 @@ def genesis_state(base_genesis_state, simple_contract_address):
             'storage': {},
         },
     )
+    # LOG1 with the topic 0x2a and no data
+    return assoc(
+        genesis_state_with_simple_contract,
+        log_contract_address,
+        {
+            'balance': 0,
+            'nonce': 0,
+            'code': decode_hex('602a60006000a100'),
+            'storage': {},
+        },
+    )
 
 
 def uint256_to_bytes(uint):
@@ -739,3 +757,173 @@ async def test_get_balance_works_for_block_number(
     ))['result']
 
     assert to_int(hexstr=balance_after) < to_int(hexstr=balance_before)
+
+
+def call_in_new_block(chain, sender_private_key, nonce, to):
+    tx = chain.create_unsigned_transaction(
+        nonce=nonce,
+        gas_price=1,
+        gas=100000,
+        data=b'',
+        to=to,
+        value=0,
+    ).as_signed_transaction(sender_private_key)
+    chain.apply_transaction(tx)
+    chain.mine_block()
+
+
+@pytest.mark.asyncio
+async def test_get_logs_and_filter_changes(
+        chain_without_block_validation,
+        ipc_request,
+        funded_address_private_key,
+        log_contract_address):
+    log_filter = {'fromBlock': 'earliest', 'address': encode_hex(log_contract_address)}
+    filter_id = (await ipc_request('eth_newFilter', [log_filter]))['result']
+
+    call_in_new_block(
+        chain_without_block_validation, funded_address_private_key, 0, log_contract_address,
+    )
+    first_block = chain_without_block_validation.get_canonical_head()
+
+    logs = (await ipc_request('eth_getLogs', [log_filter]))['result']
+    assert len(logs) == 1
+    assert logs[0]['address'] == encode_hex(log_contract_address)
+    assert logs[0]['topics'] == [encode_hex(uint256_to_bytes(42))]
+    assert logs[0]['blockHash'] == encode_hex(first_block.hash)
+    assert logs[0]['blockNumber'] == hex(first_block.block_number)
+    assert logs[0]['logIndex'] == '0x0'
+    assert logs[0]['removed'] is False
+
+    assert (await ipc_request('eth_getFilterChanges', [filter_id]))['result'] == logs
+    assert (await ipc_request('eth_getFilterChanges', [filter_id]))['result'] == []
+
+    call_in_new_block(
+        chain_without_block_validation, funded_address_private_key, 1, log_contract_address,
+    )
+    new_logs = (await ipc_request('eth_getFilterChanges', [filter_id]))['result']
+    assert len(new_logs) == 1
+    assert new_logs[0]['blockNumber'] == hex(first_block.block_number + 1)
+    assert (await ipc_request('eth_getFilterLogs', [filter_id]))['result'] == logs + new_logs
+
+    by_hash = {'blockHash': encode_hex(first_block.hash)}
+    assert (await ipc_request('eth_getLogs', [by_hash]))['result'] == logs
+    unknown_topic = {'fromBlock': 'earliest', 'topics': [encode_hex(uint256_to_bytes(43))]}
+    assert (await ipc_request('eth_getLogs', [unknown_topic]))['result'] == []
+
+    assert (await ipc_request('eth_uninstallFilter', [filter_id]))['result'] is True
+    assert 'error' in await ipc_request('eth_getFilterChanges', [filter_id])
+
+
+@pytest.mark.asyncio
+async def test_filter_changes_of_blocks_imported_between_polls(
+        chain_without_block_validation,
+        ipc_request,
+        funded_address_private_key,
+        log_contract_address):
+    # 'latest' is the head at the time the filter is installed
+    log_filter = {'address': encode_hex(log_contract_address)}
+    filter_id = (await ipc_request('eth_newFilter', [log_filter]))['result']
+    assert (await ipc_request('eth_getFilterChanges', [filter_id]))['result'] == []
+
+    for nonce in range(2):
+        call_in_new_block(
+            chain_without_block_validation, funded_address_private_key, nonce, log_contract_address,
+        )
+    head = chain_without_block_validation.get_canonical_head()
+
+    changes = (await ipc_request('eth_getFilterChanges', [filter_id]))['result']
+    assert [log['blockNumber'] for log in changes] == [
+        hex(head.block_number - 1),
+        hex(head.block_number),
+    ]
+    assert (await ipc_request('eth_getFilterLogs', [filter_id]))['result'] == changes
+    assert (await ipc_request('eth_getFilterChanges', [filter_id]))['result'] == []
+
+
+@pytest.mark.asyncio
+async def test_logs_from_block_after_head(
+        chain_without_block_validation,
+        ipc_request,
+        funded_address_private_key,
+        log_contract_address):
+    call_in_new_block(
+        chain_without_block_validation, funded_address_private_key, 0, log_contract_address,
+    )
+    head_number = chain_without_block_validation.get_canonical_head().block_number
+    log_filter = {
+        'address': encode_hex(log_contract_address),
+        'fromBlock': hex(head_number + 2),
+    }
+    assert (await ipc_request('eth_getLogs', [log_filter]))['result'] == []
+
+    filter_id = (await ipc_request('eth_newFilter', [log_filter]))['result']
+    assert (await ipc_request('eth_getFilterLogs', [filter_id]))['result'] == []
+
+    for nonce in (1, 2):
+        call_in_new_block(
+            chain_without_block_validation, funded_address_private_key, nonce, log_contract_address,
+        )
+    # the logs of the block before fromBlock don't match
+    changes = (await ipc_request('eth_getFilterChanges', [filter_id]))['result']
+    assert [log['blockNumber'] for log in changes] == [hex(head_number + 2)]
+
+
+@pytest.mark.asyncio
+async def test_filters_expire_when_not_polled(ipc_request, monkeypatch):
+    filter_id = (await ipc_request('eth_newFilter', [{}]))['result']
+    assert (await ipc_request('eth_getFilterChanges', [filter_id]))['result'] == []
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: now + FILTER_TIMEOUT + 1)
+    assert 'error' in await ipc_request('eth_getFilterChanges', [filter_id])
+
+
+async def open_ipc_connection(jsonrpc_ipc_pipe_path, event_loop):
+    await asyncio.sleep(0.01)
+    assert wait_for(jsonrpc_ipc_pipe_path), "IPC server did not successfully start with IPC file"
+    return await asyncio.open_unix_connection(str(jsonrpc_ipc_pipe_path), loop=event_loop)
+
+
+@pytest.mark.asyncio
+async def test_ipc_batch_request(jsonrpc_ipc_pipe_path, event_loop, event_bus, ipc_server):
+    reader, writer = await open_ipc_connection(jsonrpc_ipc_pipe_path, event_loop)
+    writer.write(b'[%s, %s, 1]' % (
+        build_request('net_listening'),
+        build_request('notamethod'),
+    ))
+    await writer.drain()
+    # the responses of a batch are written as one line
+    result = json.loads(await asyncio.wait_for(reader.readline(), 0.25, loop=event_loop))
+    writer.close()
+
+    assert result == [
+        {'result': True, 'id': 3, 'jsonrpc': '2.0'},
+        {'error': "Invalid RPC method: 'notamethod'", 'id': 3, 'jsonrpc': '2.0'},
+        {'error': 'Invalid Request: 1'},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ipc_pipelined_requests(jsonrpc_ipc_pipe_path, event_loop, event_bus, ipc_server):
+    reader, writer = await open_ipc_connection(jsonrpc_ipc_pipe_path, event_loop)
+
+    request_ids = tuple(range(20))
+    request_bytes = b''.join(
+        json.dumps({'jsonrpc': '2.0', 'id': request_id, 'method': 'net_listening'}).encode()
+        for request_id in request_ids
+    )
+    # split requests across writes
+    writer.write(request_bytes[:15])
+    await writer.drain()
+    writer.write(request_bytes[15:])
+    await writer.drain()
+
+    responses = []
+    for _ in request_ids:
+        line = await asyncio.wait_for(reader.readline(), 0.25, loop=event_loop)
+        responses.append(json.loads(line.decode()))
+    writer.close()
+
+    assert sorted(response['id'] for response in responses) == list(request_ids)
+    assert all(response['result'] is True for response in responses)
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from trinity.rpc.ipc import (
+    FramingError,
+    JSONFramer,
+)
+
+
+MESSAGES = (
+    b'{"jsonrpc": "2.0", "id": 1, "method": "eth_accounts", "params": []}',
+    b'[{"id": 1}, {"id": 2, "params": [[], {}]}]',
+    b'{"params": ["}", "{", "]", "[", "\\"}", "\\\\"]}',
+    b'{"params": ["\xe2\x82\xac"]}',
+    b'{}',
+)
+
+
+def feed_all(framer, chunks):
+    frames = []
+    for chunk in chunks:
+        frames.extend(framer.feed(chunk))
+    return frames
+
+
+@pytest.mark.parametrize('chunk_size', (1, 2, 7, 1000))
+def test_messages_split_into_chunks(chunk_size):
+    stream = b'\n'.join(MESSAGES)
+    chunks = [stream[i:i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+    frames = feed_all(JSONFramer(), chunks)
+
+    assert frames == list(MESSAGES)
+    for frame in frames:
+        json.loads(frame)
+
+
+def test_non_json_prefix():
+    frames = feed_all(JSONFramer(), (b'  garb', b'age {"id"', b': 1}'))
+
+    assert len(frames) == 2
+    assert isinstance(frames[0], FramingError)
+    assert str(frames[0]) == 'Cannot parse json: garbage'
+    assert frames[1] == b'{"id": 1}'
+
+
+def test_message_too_large():
+    framer = JSONFramer(max_message_size=10)
+    frames = feed_all(framer, (b'{"params": [', b'"{"]', b'}{"id": 1}'))
+
+    assert len(frames) == 2
+    assert isinstance(frames[0], FramingError)
+    assert str(frames[0]).startswith('reached limit: 10 bytes')
+    assert frames[1] == b'{"id": 1}'
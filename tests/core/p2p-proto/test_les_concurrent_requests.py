@@ -0,0 +1,99 @@
+import asyncio
+
+from eth.rlp.headers import BlockHeader
+from p2p.peer import (
+    PeerSubscriber,
+)
+import pytest
+
+from trinity.protocol.les.commands import GetBlockHeaders
+
+from trinity.tools.factories import LESV2PeerPairFactory
+
+
+class RequestIDMonitor(PeerSubscriber):
+    subscription_msg_types = {GetBlockHeaders}
+    msg_queue_maxsize = 100
+
+    async def next_request_id(self):
+        msg = await self.msg_queue.get()
+        return msg.command.payload.request_id
+
+
+def mk_header(block_number):
+    return BlockHeader(difficulty=100, block_number=block_number, gas_limit=3000000)
+
+
+def get_response_stream(peer):
+    return peer.les_api.get_block_headers._manager.service
+
+
+@pytest.mark.asyncio
+async def test_les_requests_in_flight_at_once_are_routed_by_request_id():
+    async with LESV2PeerPairFactory() as (peer, remote):
+        response_stream = get_response_stream(peer)
+        response_stream.window.size = 3
+        request_id_monitor = RequestIDMonitor()
+
+        with request_id_monitor.subscribe_peer(remote):
+            get_headers_tasks = [
+                asyncio.ensure_future(peer.les_api.get_block_headers(block_number, 1, 0, False))
+                for block_number in range(3)
+            ]
+            request_ids = [await request_id_monitor.next_request_id() for _ in range(3)]
+            assert len(set(request_ids)) == 3
+
+            # the requests and their ids arrived in the order they were made, but they are
+            # answered in the opposite order
+            for block_number, request_id in reversed(tuple(enumerate(request_ids))):
+                remote.les_api.send_block_headers((mk_header(block_number),), 0, request_id)
+
+            results = await asyncio.wait_for(asyncio.gather(*get_headers_tasks), timeout=2)
+
+        assert [headers[0].block_number for headers in results] == [0, 1, 2]
+        assert not response_stream.is_pending
+
+
+@pytest.mark.asyncio
+async def test_les_requests_wait_for_a_window_slot():
+    async with LESV2PeerPairFactory() as (peer, remote):
+        response_stream = get_response_stream(peer)
+        response_stream.window.size = 1
+        response_stream.window.max_size = 1
+        request_id_monitor = RequestIDMonitor()
+
+        with request_id_monitor.subscribe_peer(remote):
+            first_task = asyncio.ensure_future(peer.les_api.get_block_headers(0, 1, 0, False))
+            first_request_id = await request_id_monitor.next_request_id()
+            second_task = asyncio.ensure_future(peer.les_api.get_block_headers(1, 1, 0, False))
+
+            # the second request is only sent when the first one is answered
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(request_id_monitor.next_request_id(), timeout=0.1)
+
+            remote.les_api.send_block_headers((mk_header(0),), 0, first_request_id)
+            assert (await first_task)[0].block_number == 0
+
+            second_request_id = await request_id_monitor.next_request_id()
+            remote.les_api.send_block_headers((mk_header(1),), 0, second_request_id)
+            assert (await second_task)[0].block_number == 1
+
+
+@pytest.mark.asyncio
+async def test_les_responses_with_unknown_request_ids_are_ignored():
+    async with LESV2PeerPairFactory() as (peer, remote):
+        request_id_monitor = RequestIDMonitor()
+
+        with request_id_monitor.subscribe_peer(remote):
+            get_headers_task = asyncio.ensure_future(
+                peer.les_api.get_block_headers(0, 1, 0, False)
+            )
+            request_id = await request_id_monitor.next_request_id()
+
+            remote.les_api.send_block_headers((mk_header(0),), 0, request_id + 1)
+            remote.les_api.send_block_headers((mk_header(0),), 0, request_id)
+
+            headers = await asyncio.wait_for(get_headers_task, timeout=2)
+
+        assert headers[0].block_number == 0
+        assert peer.les_api.get_block_headers.tracker.total_msgs == 1
@@ -0,0 +1,118 @@
+from eth._utils.address import force_bytes_to_address
+from eth.vm.forks.frontier.transactions import FrontierTransaction
+from eth_keys import keys
+from eth_utils import ValidationError
+import pytest
+
+from trinity.components.builtin.tx_pool.pending import PendingTransactions
+
+
+ALICE_KEY = keys.PrivateKey(b'\x01' * 32)
+BOB_KEY = keys.PrivateKey(b'\x02' * 32)
+ALICE = ALICE_KEY.public_key.to_canonical_address()
+BOB = BOB_KEY.public_key.to_canonical_address()
+
+
+def make_tx(private_key, nonce, gas_price=1, value=1):
+    return FrontierTransaction.create_unsigned_transaction(
+        nonce=nonce,
+        gas_price=gas_price,
+        gas=21000,
+        to=force_bytes_to_address(b'\x10\x10'),
+        value=value,
+        data=b'',
+    ).as_signed_transaction(private_key)
+
+
+def test_add_and_get():
+    pool = PendingTransactions()
+    txs = tuple(make_tx(ALICE_KEY, nonce) for nonce in (2, 0, 1))
+    for tx in txs:
+        assert pool.add(tx) == ()
+
+    assert len(pool) == 3
+    assert txs[0].hash in pool
+    assert pool.get(txs[0].hash) == txs[0]
+    assert pool.get(make_tx(BOB_KEY, 0).hash) is None
+    assert pool.get_sender_transactions(ALICE) == (txs[1], txs[2], txs[0])
+
+    with pytest.raises(ValidationError):
+        pool.add(txs[0])
+
+
+def test_replace_needs_price_bump():
+    pool = PendingTransactions(price_bump_percent=10)
+    original = make_tx(ALICE_KEY, 0, gas_price=100)
+    pool.add(original)
+
+    with pytest.raises(ValidationError):
+        pool.add(make_tx(ALICE_KEY, 0, gas_price=109))
+
+    replacement = make_tx(ALICE_KEY, 0, gas_price=110)
+    assert pool.add(replacement) == (original,)
+    assert pool.get_sender_transactions(ALICE) == (replacement,)
+    assert original.hash not in pool
+
+
+def test_evicts_cheapest_when_full():
+    pool = PendingTransactions(max_size=3)
+    cheap = make_tx(BOB_KEY, 0, gas_price=1)
+    pool.add(cheap)
+    pool.add(make_tx(ALICE_KEY, 0, gas_price=5))
+    pool.add(make_tx(ALICE_KEY, 1, gas_price=5))
+
+    # not better than the cheapest pooled transaction
+    with pytest.raises(ValidationError):
+        pool.add(make_tx(ALICE_KEY, 2, gas_price=1))
+
+    assert pool.add(make_tx(ALICE_KEY, 2, gas_price=2)) == (cheap,)
+    assert len(pool) == 3
+    assert BOB not in pool.senders
+
+
+def test_evicts_through_removed_entries():
+    pool = PendingTransactions(max_size=2)
+    txs = tuple(make_tx(ALICE_KEY, nonce, gas_price=nonce + 1) for nonce in range(2))
+    for tx in txs:
+        pool.add(tx)
+    assert pool.remove(txs[0].hash) == txs[0]
+    assert pool.remove(txs[0].hash) is None
+
+    pool.add(make_tx(BOB_KEY, 0, gas_price=10))
+    # the stale heap entry of the removed transaction is skipped
+    assert pool.add(make_tx(BOB_KEY, 1, gas_price=10)) == (txs[1],)
+
+
+def test_revalidate_drops_mined_and_unaffordable():
+    pool = PendingTransactions()
+    mined = make_tx(ALICE_KEY, 0)
+    pending = make_tx(ALICE_KEY, 1)
+    queued = make_tx(ALICE_KEY, 3)
+    expensive = make_tx(BOB_KEY, 0, value=10 ** 18)
+    for tx in (mined, pending, queued, expensive):
+        pool.add(tx)
+
+    result = pool.revalidate(
+        account_nonces={ALICE: 1, BOB: 0},
+        account_balances={ALICE: 10 ** 18, BOB: 10 ** 6},
+    )
+
+    assert set(result.dropped) == {mined, expensive}
+    assert result.pending_count == 1
+    assert result.queued_count == 1
+    assert pool.get_pending(ALICE, 1) == (pending,)
+    assert pool.senders == (ALICE,)
+
+
+def test_revalidate_leaves_senders_without_account():
+    pool = PendingTransactions()
+    alice_tx = make_tx(ALICE_KEY, 0)
+    # pooled after the accounts were read
+    bob_tx = make_tx(BOB_KEY, 5)
+    pool.add(alice_tx)
+    pool.add(bob_tx)
+
+    result = pool.revalidate(account_nonces={ALICE: 1}, account_balances={ALICE: 10 ** 18})
+
+    assert result.dropped == (alice_tx,)
+    assert pool.get_sender_transactions(BOB) == (bob_tx,)
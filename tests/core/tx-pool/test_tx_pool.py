@@ -1,5 +1,6 @@
 import asyncio
 import pytest
+import rlp
 import uuid
 
 from async_exit_stack import AsyncExitStack
@@ -7,6 +8,8 @@ from async_service import background_asyncio_service
 from eth._utils.address import (
     force_bytes_to_address
 )
+from eth.rlp.transactions import BaseTransactionFields
+from eth_keys import keys
 
 from trinity.components.builtin.tx_pool.pool import (
     TxPool,
@@ -15,6 +18,7 @@ from trinity.components.builtin.tx_pool.validators import (
     DefaultTransactionValidator
 )
 from trinity.constants import TO_NETWORKING_BROADCAST_CONFIG
+from trinity.db.sender_cache import prepare_sender_cache
 from trinity.protocol.eth.events import (
     TransactionsEvent,
 )
@@ -152,7 +156,8 @@ async def test_tx_propagation(two_connected_tx_pools,
     assert len(alice_incoming_tx) == 0
 
     txs_broadcasted_by_bob = [
-        create_random_tx(chain_with_block_validation, funded_address_private_key),
+        # The pool only keeps one transaction per sender and nonce
+        create_random_tx(chain_with_block_validation, funded_address_private_key, nonce=1),
         txs_broadcasted_by_alice[0]
     ]
 
@@ -194,9 +199,72 @@ async def test_does_not_propagate_invalid_tx(two_connected_tx_pools,
     assert bob_incoming_tx[0].as_dict() == txs_broadcasted_by_alice[1].as_dict()
 
 
-def create_random_tx(chain, private_key, is_valid=True):
+@pytest.mark.asyncio
+async def test_pools_received_transactions(two_connected_tx_pools,
+                                           funded_address_private_key,
+                                           chain_with_block_validation):
+    (
+        (alice, alice_event_bus, alice_tx_pool),
+        (bob, bob_event_bus, bob_tx_pool)
+    ) = two_connected_tx_pools
+
+    bob_incoming_tx, bob_got_tx = observe_incoming_transactions(bob_event_bus)
+
+    tx = create_random_tx(chain_with_block_validation, funded_address_private_key)
+    # transactions arrive from the network as bare fields
+    await alice_tx_pool._handle_tx(bob.session, [BaseTransactionFields(**tx.as_dict())])
+
+    assert alice_tx_pool._get_pooled_transactions([tx.hash]) == [tx]
+
+    # The same sender and nonce at the same price can't replace the pooled transaction
+    underpriced_tx = create_random_tx(chain_with_block_validation, funded_address_private_key)
+    await alice_tx_pool._handle_tx(bob.session, [underpriced_tx])
+
+    await asyncio.wait_for(bob_got_tx.wait(), timeout=0.2)
+    assert len(bob_incoming_tx) == 1
+    assert bob_incoming_tx[0].hash == tx.hash
+    assert alice_tx_pool._get_pooled_transactions([underpriced_tx.hash]) == []
+
+
+@pytest.mark.asyncio
+async def test_caches_senders_of_received_transactions(event_bus,
+                                                       tmp_path,
+                                                       tx_validator,
+                                                       funded_address_private_key,
+                                                       chain_with_block_validation):
+    sender_cache = prepare_sender_cache(tmp_path / 'db_manager.ipc', 1024 * 1024)
+    try:
+        tx_pool = TxPool(event_bus, None, tx_validator, sender_cache)
+        tx = create_random_tx(chain_with_block_validation, funded_address_private_key)
+        # transactions are decoded from the wire as bare fields, without a sender
+        received_tx = rlp.decode(rlp.encode(tx), sedes=BaseTransactionFields)
+        await tx_pool._handle_tx(object(), [received_tx])
+
+        assert sender_cache.get(tx.hash) == tx.sender
+    finally:
+        sender_cache.close()
+
+
+@pytest.mark.asyncio
+async def test_revalidates_pooled_transactions_against_head(event_bus,
+                                                            tx_validator,
+                                                            funded_address_private_key,
+                                                            chain_with_block_validation):
+    chain = chain_with_block_validation
+    tx_pool = TxPool(event_bus, None, tx_validator, chain=chain)
+    funded_tx = create_random_tx(chain, funded_address_private_key)
+    unfunded_tx = create_random_tx(chain, keys.PrivateKey(b'\x42' * 32))
+    for tx in (funded_tx, unfunded_tx):
+        tx_pool._pending.add(tx)
+
+    await tx_pool._revalidate(chain.get_canonical_head())
+
+    assert tx_pool._get_pooled_transactions([funded_tx.hash, unfunded_tx.hash]) == [funded_tx]
+
+
+def create_random_tx(chain, private_key, is_valid=True, nonce=0):
     return chain.create_unsigned_transaction(
-        nonce=0,
+        nonce=nonce,
         gas_price=1,
         gas=2100000000000 if is_valid else 0,
         # For simplicity, both peers create tx with the same private key.
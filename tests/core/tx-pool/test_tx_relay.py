@@ -0,0 +1,97 @@
+import math
+import uuid
+
+from eth._utils.address import force_bytes_to_address
+from eth.vm.forks.frontier.transactions import FrontierTransaction
+from eth_keys import keys
+import pytest
+
+from trinity.components.builtin.tx_pool.relay import (
+    KnownTransactions,
+    TransactionRelay,
+    get_known_transaction_key,
+)
+
+
+@pytest.fixture
+def txs():
+    private_key = keys.PrivateKey(b'\x01' * 32)
+    return tuple(
+        FrontierTransaction.create_unsigned_transaction(
+            nonce=nonce,
+            gas_price=1,
+            gas=21000,
+            to=force_bytes_to_address(b'\x10\x10'),
+            value=1,
+            data=b'',
+        ).as_signed_transaction(private_key)
+        for nonce in range(10)
+    )
+
+
+def make_sessions(count):
+    # the relay only uses sessions as keys
+    return tuple(uuid.uuid4() for _ in range(count))
+
+
+def test_known_transactions_is_bounded():
+    known = KnownTransactions(max_size=4)
+    for key in range(3):
+        known.add(key)
+    assert all(key in known for key in range(3))
+
+    for key in range(3, 10):
+        known.add(key)
+    assert len(known) <= 4
+    assert 9 in known
+    assert 0 not in known
+
+
+def test_relay_skips_known_transactions(txs):
+    relay = TransactionRelay()
+    sender, receiver = make_sessions(2)
+    relay.mark_known(sender, (tx.hash for tx in txs[:5]))
+
+    instructions = relay.plan((sender, receiver), txs)
+    by_session = {instruction.session: instruction for instruction in instructions}
+    assert by_session[sender].transactions == txs[5:]
+    assert by_session[receiver].transactions == txs
+    assert relay.is_known(receiver, txs[0].hash)
+
+    # everything was relayed to both peers already
+    assert relay.plan((sender, receiver), txs) == ()
+
+
+def test_relay_announces_to_most_announcing_peers(txs):
+    relay = TransactionRelay()
+    sessions = make_sessions(16)
+    for session in sessions[1:]:
+        relay.mark_announcing(session)
+
+    instructions = relay.plan(sessions, txs)
+    assert len(instructions) == len(sessions)
+
+    full_sessions = {
+        instruction.session for instruction in instructions if instruction.transactions
+    }
+    # the peer that can't take announcements gets full transactions, on top of sqrt(n) peers
+    assert sessions[0] in full_sessions
+    assert math.sqrt(len(sessions)) <= len(full_sessions) <= math.sqrt(len(sessions)) + 1
+
+    for instruction in instructions:
+        if instruction.session not in full_sessions:
+            assert instruction.announced_hashes == tuple(tx.hash for tx in txs)
+
+
+def test_relay_forgets_disconnected_peers(txs):
+    relay = TransactionRelay()
+    connected, disconnected = make_sessions(2)
+    relay.mark_known(disconnected, (tx.hash for tx in txs))
+    relay.mark_announcing(disconnected)
+
+    relay.retain_peers((connected,))
+    assert not relay.is_known(disconnected, txs[0].hash)
+
+
+def test_known_transaction_key_is_a_hash_prefix(txs):
+    assert get_known_transaction_key(txs[0].hash) == int.from_bytes(txs[0].hash[:8], 'big')
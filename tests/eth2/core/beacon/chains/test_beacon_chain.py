@@ -5,11 +5,18 @@ import pytest
 from eth2.beacon.chains.base import BeaconChain
 from eth2.beacon.db.exceptions import AttestationRootNotFound, StateNotFound
 from eth2.beacon.exceptions import BlockClassError
+from eth2.beacon.fork_choice.lmd_ghost import (
+    LatestMessage,
+    LMDGHOSTScore,
+    ProtoArrayStore,
+    score_block_by_root,
+)
+from eth2.beacon.state_machines.forks.serenity import SerenityStateMachine
 from eth2.beacon.state_machines.forks.serenity.blocks import SerenitySignedBeaconBlock
 from eth2.beacon.tools.builder.proposer import create_mock_block
 from eth2.beacon.tools.builder.validator import create_mock_signed_attestations_at_slot
 from eth2.beacon.types.blocks import SignedBeaconBlock
-from eth2.beacon.typing import FromBlockParams
+from eth2.beacon.typing import Epoch, FromBlockParams, ValidatorIndex
 
 
 @pytest.fixture
@@ -153,6 +160,34 @@ def test_from_genesis(base_db, genesis_block, genesis_state, fixture_sm_class, c
         klass.from_genesis(base_db, genesis_state, block, config)
 
 
+def test_chain_keeps_fork_choice_votes(
+    base_db, genesis_block, genesis_state, fixture_sm_class, config
+):
+    sm_class = fixture_sm_class.configure(
+        get_fork_choice_scoring=SerenityStateMachine.get_fork_choice_scoring,
+        fork_choice_store_class=ProtoArrayStore,
+    )
+    klass = BeaconChain.configure(
+        __name__="TestChain", sm_configuration=((0, sm_class),), chain_id=5566
+    )
+    chain = klass.from_genesis(base_db, genesis_state, genesis_block.message, config)
+
+    genesis_root = genesis_block.message.hash_tree_root
+    state_machine = chain.get_state_machine()
+    state_machine._fork_choice_store._update_latest_message(
+        ValidatorIndex(0), LatestMessage(epoch=Epoch(0), root=genesis_root)
+    )
+
+    assert chain.get_state_machine() is state_machine
+    scoring = chain.get_state_machine().get_fork_choice_scoring()
+    assert scoring.score(genesis_block) == LMDGHOSTScore(
+        (
+            genesis_state.validators[0].effective_balance,
+            score_block_by_root(genesis_root),
+        )
+    )
+
+
 @pytest.mark.long
 @pytest.mark.parametrize(
     (
@@ -1,6 +1,7 @@
 import random
 
 from eth.constants import GENESIS_PARENT_HASH
+from eth.db.atomic import AtomicDB
 from eth.exceptions import BlockNotFound, ParentNotFound
 from hypothesis import given
 from hypothesis import strategies as st
@@ -13,7 +14,9 @@ from eth2.beacon.db.exceptions import (
     FinalizedHeadNotFound,
     HeadStateSlotNotFound,
     JustifiedHeadNotFound,
+    StateNotFound,
 )
+from eth2.beacon.db.chain import BeaconChainDB, state_cache
 from eth2.beacon.db.schema import SchemaV1
 from eth2.beacon.fork_choice.higher_slot import HigherSlotScore
 from eth2.beacon.state_machines.forks.serenity.blocks import (
@@ -23,6 +26,7 @@ from eth2.beacon.state_machines.forks.serenity.blocks import (
 from eth2.beacon.types.attestations import Attestation
 from eth2.beacon.types.checkpoints import Checkpoint
 from eth2.beacon.types.states import BeaconState
+from eth2.beacon.types.validators import Validator
 from eth2.beacon.typing import FromBlockParams
 
 
@@ -197,6 +201,119 @@ def test_chaindb_state(chaindb, state):
     assert result_state.hash_tree_root == state.hash_tree_root
 
 
+def _mk_next_state(state, index):
+    """
+    Advance ``state`` by one slot, updating one balance and adding a validator
+    every other slot.
+    """
+    history_length = len(state.state_roots)
+    next_state = state.transform(
+        ("state_roots", state.slot % history_length), state.hash_tree_root
+    ).mset(
+        "slot",
+        state.slot + 1,
+        "balances",
+        state.balances.set(index % len(state.balances), state.slot),
+    )
+    if state.slot % 2:
+        next_state = next_state.mset(
+            "validators",
+            next_state.validators.append(Validator.create(pubkey=b"\x01" * 48)),
+            "balances",
+            next_state.balances.append(0),
+        )
+    return next_state
+
+
+def _mk_states(genesis_state, count):
+    states = [genesis_state]
+    for index in range(count):
+        states.append(_mk_next_state(states[-1], index))
+    return states
+
+
+def test_chaindb_state_diffs(chaindb, genesis_state, config):
+    chaindb.set_state_snapshot_interval(2)
+    states = _mk_states(genesis_state, 5 * config.SLOTS_PER_EPOCH)
+    for state in states:
+        chaindb.persist_state(state)
+
+    state_cache.clear()
+    for state in states:
+        is_snapshot = state.slot % (2 * config.SLOTS_PER_EPOCH) == 0
+        assert chaindb.exists(state.hash_tree_root) is is_snapshot
+        assert (
+            chaindb.exists(SchemaV1.make_state_diff_lookup_key(state.hash_tree_root))
+            is not is_snapshot
+        )
+        assert chaindb.get_state_by_root(state.hash_tree_root, type(state)) == state
+
+
+class MultiExistsDB(AtomicDB):
+    def __init__(self):
+        super().__init__()
+        self.requests = 0
+
+    def _exists(self, key):
+        self.requests += 1
+        return super()._exists(key)
+
+    def multi_exists(self, keys):
+        self.requests += 1
+        return tuple(key in self.wrapped_db for key in keys)
+
+
+def test_chaindb_checks_cached_state_with_single_request(genesis_state, config):
+    db = MultiExistsDB()
+    chaindb = BeaconChainDB(db, config)
+    chaindb.set_state_snapshot_interval(2)
+    states = _mk_states(genesis_state, 2)
+    for state in states:
+        chaindb.persist_state(state)
+
+    for state in states:
+        # cached by persisting it
+        db.requests = 0
+        assert chaindb.get_state_by_root(state.hash_tree_root, type(state)) == state
+        assert db.requests == 1
+
+
+def test_chaindb_state_snapshot_interval_persists(chaindb, config):
+    assert chaindb.get_state_snapshot_interval() == 0
+    chaindb.set_state_snapshot_interval(4)
+    assert BeaconChainDB(chaindb.db, config).get_state_snapshot_interval() == 4
+
+
+def test_chaindb_prune_states(
+    chaindb_at_genesis, genesis_block, genesis_state, fork_choice_scoring, config
+):
+    chaindb = chaindb_at_genesis
+    chaindb.set_state_snapshot_interval(2)
+    states = _mk_states(genesis_state, 5 * config.SLOTS_PER_EPOCH)
+    for state in states[1:]:
+        chaindb.persist_state(state)
+
+    finalized_slot = 3 * config.SLOTS_PER_EPOCH + 1
+    finalized_block = SignedBeaconBlock.from_parent(
+        genesis_block, FromBlockParams(slot=finalized_slot)
+    )
+    chaindb.persist_block(finalized_block, SignedBeaconBlock, fork_choice_scoring)
+    chaindb._update_finalized_head(finalized_block.message.hash_tree_root)
+
+    # the states from the snapshot at epoch 2 on are needed for later states
+    prune_slot = 2 * config.SLOTS_PER_EPOCH
+    assert chaindb.prune_states() == prune_slot - 1
+    assert chaindb.prune_states() == 0
+
+    state_cache.clear()
+    for state in states:
+        if state.slot == 0 or state.slot >= prune_slot:
+            assert chaindb.get_state_by_root(state.hash_tree_root, type(state)) == state
+        else:
+            with pytest.raises(StateNotFound):
+                chaindb.get_state_by_root(state.hash_tree_root, type(state))
+
+
 def test_chaindb_get_finalized_head_at_genesis(chaindb_at_genesis, genesis_block):
     assert (
         chaindb_at_genesis.get_finalized_head(genesis_block.__class__) == genesis_block
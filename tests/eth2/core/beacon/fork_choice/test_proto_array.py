@@ -0,0 +1,192 @@
+import random
+
+from eth_utils import ValidationError
+import pytest
+
+from eth2.beacon.fork_choice.lmd_ghost import (
+    Context,
+    LatestMessage,
+    ProtoArrayStore,
+    Store,
+)
+from eth2.beacon.fork_choice.proto_array import ProtoArray
+from eth2.beacon.types.blocks import BeaconBlock, SignedBeaconBlock
+from eth2.beacon.typing import Epoch
+
+
+def _root(value):
+    return value.to_bytes(32, byteorder="big")
+
+
+@pytest.fixture
+def proto_array():
+    """
+    1 - 2 - 4
+      \\
+        3 - 5
+          \\
+            6
+    """
+    proto_array = ProtoArray(prune_threshold=0)
+    proto_array.on_block(_root(1), None)
+    proto_array.on_block(_root(2), _root(1))
+    proto_array.on_block(_root(3), _root(1))
+    proto_array.on_block(_root(4), _root(2))
+    proto_array.on_block(_root(5), _root(3))
+    proto_array.on_block(_root(6), _root(3))
+    return proto_array
+
+
+def _deltas(proto_array, deltas_by_root):
+    deltas = [0] * len(proto_array)
+    for value, delta in deltas_by_root.items():
+        deltas[proto_array.get_index(_root(value))] = delta
+    return deltas
+
+
+def test_proto_array_weights(proto_array):
+    proto_array.apply_score_changes(_deltas(proto_array, {4: 10, 5: 3, 6: 4}))
+
+    assert proto_array.get_weight(_root(1)) == 17
+    assert proto_array.get_weight(_root(2)) == 10
+    assert proto_array.get_weight(_root(3)) == 7
+    assert proto_array.get_weight(_root(6)) == 4
+    assert proto_array.find_head(_root(1)) == _root(4)
+    assert proto_array.find_head(_root(3)) == _root(6)
+
+    # move votes from 4 to 5
+    proto_array.apply_score_changes(_deltas(proto_array, {4: -10, 5: 10}))
+
+    assert proto_array.get_weight(_root(1)) == 17
+    assert proto_array.get_weight(_root(2)) == 0
+    assert proto_array.get_weight(_root(3)) == 17
+    assert proto_array.find_head(_root(1)) == _root(5)
+
+
+def test_proto_array_breaks_ties_by_root(proto_array):
+    proto_array.apply_score_changes(_deltas(proto_array, {4: 5, 5: 2, 6: 3}))
+    assert proto_array.find_head(_root(1)) == _root(6)
+
+
+def test_proto_array_rejects_negative_weights(proto_array):
+    with pytest.raises(ValidationError):
+        proto_array.apply_score_changes(_deltas(proto_array, {4: -1}))
+
+
+def test_proto_array_prune(proto_array):
+    proto_array.apply_score_changes(_deltas(proto_array, {4: 10, 5: 3, 6: 4}))
+    proto_array.maybe_prune(_root(3))
+
+    assert tuple(proto_array.iter_roots()) == tuple(_root(i) for i in (3, 4, 5, 6))
+    assert _root(1) not in proto_array
+    assert proto_array.get_weight(_root(3)) == 7
+    assert proto_array.find_head(_root(3)) == _root(6)
+
+    proto_array.on_block(_root(7), _root(5))
+    proto_array.apply_score_changes(_deltas(proto_array, {7: 5}))
+    assert proto_array.get_weight(_root(3)) == 12
+    assert proto_array.find_head(_root(3)) == _root(7)
+
+
+def test_proto_array_prune_threshold():
+    proto_array = ProtoArray(prune_threshold=2)
+    proto_array.on_block(_root(1), None)
+    proto_array.on_block(_root(2), _root(1))
+    proto_array.on_block(_root(3), _root(2))
+
+    proto_array.maybe_prune(_root(2))
+    assert len(proto_array) == 3
+
+    proto_array.maybe_prune(_root(3))
+    assert tuple(proto_array.iter_roots()) == (_root(3),)
+
+
+def test_proto_array_head_agrees_with_checkpoints():
+    """
+    1 - 2
+      \\
+        3
+    """
+    proto_array = ProtoArray(prune_threshold=0)
+    proto_array.on_block(_root(1), None, Epoch(1), Epoch(0))
+    proto_array.on_block(_root(2), _root(1), Epoch(1), Epoch(0))
+    proto_array.on_block(_root(3), _root(1), Epoch(2), Epoch(1))
+
+    proto_array.apply_score_changes(
+        _deltas(proto_array, {2: 10, 3: 1}), Epoch(1), Epoch(0)
+    )
+    assert proto_array.find_head(_root(1)) == _root(2)
+
+    # the heavier block disagrees with the new justified and finalized epochs
+    proto_array.apply_score_changes([0] * len(proto_array), Epoch(2), Epoch(1))
+    assert proto_array.find_head(_root(1)) == _root(3)
+
+    proto_array.apply_score_changes([0] * len(proto_array), Epoch(3), Epoch(1))
+    with pytest.raises(ValidationError):
+        proto_array.find_head(_root(1))
+
+
+def _mk_block_tree(block_params, genesis_block, block_count):
+    blocks = [genesis_block]
+    for offset in range(block_count):
+        parent = random.choice(blocks)
+        block = BeaconBlock.create(**block_params).mset(
+            "slot",
+            parent.slot + 1,
+            "parent_root",
+            parent.message.hash_tree_root,
+            "state_root",
+            offset.to_bytes(32, byteorder="big"),
+        )
+        blocks.append(SignedBeaconBlock.create(message=block))
+    return blocks[1:]
+
+
+def _mk_store(store_class, chain_db, genesis_state, genesis_block, blocks, config):
+    context = Context.from_genesis(genesis_state, genesis_block)
+    for block in blocks:
+        context.blocks[block.message.hash_tree_root] = block.message
+    return store_class(chain_db, SignedBeaconBlock, config, context)
+
+
+@pytest.mark.parametrize(("validator_count",), [(64,)])
+def test_proto_array_store_matches_store(
+    sample_beacon_block_params,
+    chaindb_at_genesis,
+    fork_choice_scoring,
+    genesis_state,
+    genesis_block,
+    config,
+):
+    chain_db = chaindb_at_genesis
+    blocks = _mk_block_tree(sample_beacon_block_params, genesis_block, 12)
+    for block in blocks:
+        chain_db.persist_block(block, SignedBeaconBlock, fork_choice_scoring)
+
+    store = _mk_store(Store, chain_db, genesis_state, genesis_block, blocks, config)
+    proto_array_store = _mk_store(
+        ProtoArrayStore, chain_db, genesis_state, genesis_block, blocks, config
+    )
+
+    all_blocks = [genesis_block] + blocks
+    for epoch in range(3):
+        # each round, a random subset of validators moves its vote
+        for index in random.sample(range(len(genesis_state.validators)), 40):
+            root = random.choice(all_blocks).message.hash_tree_root
+            latest_message = LatestMessage(epoch=epoch, root=root)
+            store._update_latest_message(index, latest_message)
+            proto_array_store._update_latest_message(index, latest_message)
+
+        for block in all_blocks:
+            assert proto_array_store.scoring(block) == store.scoring(block)
+
+    head = proto_array_store.get_head()
+    children = {}
+    for block in blocks:
+        children.setdefault(block.parent_root, []).append(block)
+    expected_head = genesis_block
+    while expected_head.message.hash_tree_root in children:
+        expected_head = max(
+            children[expected_head.message.hash_tree_root], key=store.scoring
+        )
+    assert head == expected_head.message.hash_tree_root
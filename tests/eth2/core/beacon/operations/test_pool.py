@@ -2,9 +2,12 @@ import itertools
 
 from eth_utils.toolz import assoc, take
 
+from eth2._utils.bls import bls
 from eth2._utils.funcs import forever
 from eth2.beacon.operations.attestation_pool import AttestationPool
+from eth2.beacon.types.attestation_data import AttestationData
 from eth2.beacon.types.attestations import Attestation
+from eth2.beacon.types.checkpoints import Checkpoint
 
 
 def _mk_attestation(index, sample_attestation_params):
@@ -27,3 +30,82 @@ def test_iterating_operation_pool(sample_attestation_params):
 
     for _, a in pool:
         assert a in attestations
+
+
+def _mk_vote(
+    slot, committee_index, bit_index, privkey, committee_size=4, target_epoch=0
+):
+    data = AttestationData.create(
+        slot=slot, index=committee_index, target=Checkpoint.create(epoch=target_epoch),
+    )
+    aggregation_bits = tuple(index == bit_index for index in range(committee_size))
+    return Attestation.create(
+        aggregation_bits=aggregation_bits,
+        data=data,
+        signature=bls.sign(data.hash_tree_root, privkey, b"\x00" * 8),
+    )
+
+
+def test_attestation_pool_indexes(config):
+    pool = AttestationPool()
+    a1 = _mk_vote(slot=1, committee_index=0, bit_index=0, privkey=1)
+    a2 = _mk_vote(slot=1, committee_index=1, bit_index=0, privkey=2)
+    a3 = _mk_vote(slot=2, committee_index=0, bit_index=0, privkey=3, target_epoch=1)
+    pool.batch_add((a1, a2, a3))
+
+    assert pool.get_acceptable_attestations(1, 0, a1.data.beacon_block_root) == (a1,)
+    assert pool.get_acceptable_attestations(1, 1, a1.data.beacon_block_root) == (a2,)
+    assert pool.get_acceptable_attestations(3, 0, a1.data.beacon_block_root) == ()
+    assert set(pool.get_attestations_by_target_epoch(0)) == {a1, a2}
+    assert pool.get_attestations_by_target_epoch(1) == (a3,)
+
+    pool.remove(a1)
+    assert pool.get_acceptable_attestations(1, 0, a1.data.beacon_block_root) == ()
+    assert pool.get_attestations_by_target_epoch(0) == (a2,)
+
+
+def test_attestation_pool_expiry(config):
+    pool = AttestationPool()
+    old = _mk_vote(slot=1, committee_index=0, bit_index=0, privkey=1)
+    recent = _mk_vote(
+        slot=1 + config.SLOTS_PER_EPOCH, committee_index=0, bit_index=0, privkey=2
+    )
+    pool.batch_add((old, recent))
+
+    current_slot = 1 + config.SLOTS_PER_EPOCH + config.MIN_ATTESTATION_INCLUSION_DELAY
+    assert pool.get_valid_attestation_by_current_slot(current_slot, config) == (recent,)
+    assert len(pool) == 2
+
+    pool.prune(current_slot, config)
+    assert old not in pool
+    assert len(pool) == 1
+
+
+def test_attestation_pool_aggregates_on_insert(config):
+    pool = AttestationPool()
+    votes = tuple(
+        _mk_vote(slot=1, committee_index=0, bit_index=index, privkey=index + 1)
+        for index in range(3)
+    )
+    # overlaps with the first vote
+    duplicate = _mk_vote(slot=1, committee_index=0, bit_index=0, privkey=4)
+    other_committee = _mk_vote(slot=1, committee_index=1, bit_index=1, privkey=5)
+    pool.batch_add(votes + (duplicate, other_committee))
+
+    current_slot = 1 + config.MIN_ATTESTATION_INCLUSION_DELAY
+    aggregates = pool.get_aggregated_attestations_by_current_slot(current_slot, config)
+
+    assert len(aggregates) == 3
+    assert aggregates[0].aggregation_bits == (True, True, True, False)
+    assert aggregates[0].signature == bls.aggregate_signatures(
+        tuple(vote.signature for vote in votes)
+    )
+    assert set(aggregates[1:]) == {duplicate, other_committee}
+    # the raw attestations are still there
+    assert len(pool.get_valid_attestation_by_current_slot(current_slot, config)) == 5
+
+    # the rest of the first group is aggregated with the duplicate
+    pool.batch_remove(votes[:2])
+    aggregates = pool.get_aggregated_attestations_by_current_slot(current_slot, config)
+    assert len(aggregates) == 2
+    assert aggregates[0].aggregation_bits == (True, False, True, False)
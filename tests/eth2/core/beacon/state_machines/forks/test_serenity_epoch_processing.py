@@ -19,6 +19,7 @@ from eth2.beacon.state_machines.forks.serenity.epoch_processing import (
     _bft_threshold_met,
     _determine_new_finalized_epoch,
     _determine_slashing_penalty,
+    _get_attestation_deltas_reference,
     compute_activation_exit_epoch,
     get_attestation_deltas,
     process_justification_and_finalization,
@@ -290,6 +291,93 @@ def test_get_attestation_deltas(
     assert all(reward > 0 for reward in rewards_received)
 
 
+@pytest.mark.parametrize(
+    (
+        "validator_count",
+        "slots_per_epoch",
+        "min_epochs_to_inactivity_penalty",
+        "target_committee_size",
+    ),
+    [(100, 8, 4, 10)],
+)
+@pytest.mark.parametrize(
+    ("finalized_epoch", "current_slot"), [(4, (4 + 1 + 4) * 8), (4, (4 + 1 + 5) * 8)]
+)
+def test_get_attestation_deltas_matches_reference(
+    genesis_state,
+    config,
+    finalized_epoch,
+    current_slot,
+    sample_pending_attestation_record_params,
+    sample_attestation_data_params,
+):
+    state = genesis_state.mset(
+        "slot",
+        current_slot,
+        "finalized_checkpoint",
+        Checkpoint.create(epoch=finalized_epoch),
+    )
+    previous_epoch = state.previous_epoch(config.SLOTS_PER_EPOCH, config.GENESIS_EPOCH)
+    target_root = get_block_root(
+        state, previous_epoch, config.SLOTS_PER_EPOCH, config.SLOTS_PER_HISTORICAL_ROOT,
+    )
+
+    # slash a few validators so that they are excluded from the attesting balances
+    for index in range(0, len(state.validators), 7):
+        state = state.transform(("validators", index, "slashed"), True,)
+
+    prev_epoch_attestations = tuple()
+    for committee, committee_index, slot in iterate_committees_at_epoch(
+        state, previous_epoch, config
+    ):
+        # two partially overlapping aggregates per committee with different
+        # inclusion delays, proposers, targets and heads
+        for offset, inclusion_delay, proposer_index, has_correct_votes in (
+            (0, 3, 1, slot % 2 == 0),
+            (1, 2, 2, True),
+        ):
+            participants_bitfield = get_empty_bitfield(len(committee))
+            for i in range(offset, len(committee), 2 - offset):
+                participants_bitfield = set_voted(participants_bitfield, i)
+
+            if has_correct_votes:
+                block_root = get_block_root_at_slot(
+                    state, slot, config.SLOTS_PER_HISTORICAL_ROOT
+                )
+                checkpoint_root = target_root
+            else:
+                block_root = checkpoint_root = b"\x55" * 32
+
+            prev_epoch_attestations += (
+                PendingAttestation.create(
+                    **sample_pending_attestation_record_params
+                ).mset(
+                    "aggregation_bits",
+                    participants_bitfield,
+                    "inclusion_delay",
+                    inclusion_delay,
+                    "proposer_index",
+                    proposer_index,
+                    "data",
+                    AttestationData.create(**sample_attestation_data_params).mset(
+                        "slot",
+                        slot,
+                        "index",
+                        committee_index,
+                        "beacon_block_root",
+                        block_root,
+                        "target",
+                        Checkpoint.create(epoch=previous_epoch, root=checkpoint_root),
+                    ),
+                ),
+            )
+    state = state.set("previous_epoch_attestations", prev_epoch_attestations)
+
+    assert get_attestation_deltas(state, config) == _get_attestation_deltas_reference(
+        state, config
+    )
+
+
 @pytest.mark.parametrize(
     (
         "validator_count",
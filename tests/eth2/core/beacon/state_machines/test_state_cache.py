@@ -0,0 +1,73 @@
+import pytest
+
+from eth2.beacon.state_machines.forks.serenity.slot_processing import process_slots
+from eth2.beacon.state_machines.forks.serenity.state_transitions import (
+    SerenityStateTransition,
+)
+from eth2.beacon.state_machines.state_cache import AdvancedStateCache
+
+
+@pytest.mark.parametrize(("validator_count", "slots_per_epoch"), [(8, 4)])
+def test_cache_reuses_the_epoch_start_state(genesis_state, config):
+    cache = AdvancedStateCache()
+    epoch_start_slot = config.SLOTS_PER_EPOCH
+
+    epoch_start_state = cache.process_slots(
+        genesis_state, epoch_start_slot, config, process_slots
+    )
+    assert epoch_start_state == process_slots(genesis_state, epoch_start_slot, config)
+    assert cache.misses == 1
+    assert cache.hits == 0
+
+    # the blocks of the next epoch start from the precomputed epoch transition
+    target_slot = epoch_start_slot + 2
+    post_state = cache.process_slots(genesis_state, target_slot, config, process_slots)
+    assert post_state == process_slots(genesis_state, target_slot, config)
+    assert cache.hits == 1
+
+    assert (
+        cache.process_slots(genesis_state, target_slot, config, process_slots)
+        is post_state
+    )
+    assert cache.hits == 2
+    assert cache.get(genesis_state.hash_tree_root, target_slot) is post_state
+
+
+@pytest.mark.parametrize(("validator_count", "slots_per_epoch"), [(8, 4)])
+def test_cache_is_shared_by_the_skipped_slots(genesis_state, config):
+    cache = AdvancedStateCache()
+    epoch_start_slot = config.SLOTS_PER_EPOCH
+
+    skipped_state = cache.process_slots(
+        genesis_state, epoch_start_slot - 1, config, process_slots
+    )
+    epoch_start_state = cache.process_slots(
+        skipped_state, epoch_start_slot, config, process_slots
+    )
+    assert cache.misses == 2
+
+    # advancing the state before the skipped slots finds the same state
+    assert (
+        cache.process_slots(genesis_state, epoch_start_slot, config, process_slots)
+        is epoch_start_state
+    )
+    assert cache.hits == 1
+
+
+@pytest.mark.parametrize(("validator_count", "slots_per_epoch"), [(8, 4)])
+def test_state_transition_with_cache(genesis_state, config):
+    cache = AdvancedStateCache()
+    state_transition = SerenityStateTransition(config, cache)
+    target_slot = config.SLOTS_PER_EPOCH + 1
+
+    post_state = state_transition.apply_state_transition(
+        genesis_state, future_slot=target_slot
+    )
+    assert post_state == SerenityStateTransition(config).apply_state_transition(
+        genesis_state, future_slot=target_slot
+    )
+    assert len(cache) == 2
+    assert (
+        state_transition.apply_state_transition(genesis_state, future_slot=target_slot)
+        is post_state
+    )
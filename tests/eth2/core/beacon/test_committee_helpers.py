@@ -1,3 +1,4 @@
+from dataclasses import replace
 import random
 
 import pytest
@@ -5,10 +6,14 @@ import pytest
 from eth2._utils.hash import hash_eth2
 from eth2.beacon.committee_helpers import (
     MAX_RANDOM_BYTE,
+    committee_cache,
     compute_proposer_index,
+    compute_shuffled_index,
+    compute_shuffled_indices,
     get_beacon_committee,
     get_beacon_proposer_index,
     get_committee_count_at_slot,
+    iterate_committees_at_epoch,
 )
 from eth2.beacon.helpers import get_seed, signature_domain_to_domain_type
 from eth2.beacon.signature_domain import SignatureDomain
@@ -136,3 +141,51 @@ def test_get_beacon_committee(genesis_state, config):
 
     assert set(indices) == set(range(len(genesis_state.validators)))
     assert len(indices) == len(genesis_state.validators)
+
+
+@pytest.mark.parametrize(
+    ("index_count,"), [(0), (1), (2), (3), (255), (256), (257), (1000)]
+)
+def test_compute_shuffled_indices(index_count, config):
+    indices = tuple(range(100, 100 + index_count))
+    for seed in (SOME_SEED, hash_eth2(SOME_SEED)):
+        shuffled_indices = compute_shuffled_indices(
+            indices, seed, config.SHUFFLE_ROUND_COUNT
+        )
+        assert shuffled_indices == tuple(
+            indices[
+                compute_shuffled_index(
+                    index, index_count, seed, config.SHUFFLE_ROUND_COUNT
+                )
+            ]
+            for index in range(index_count)
+        )
+
+
+@pytest.mark.parametrize(("validator_count,"), [(1000)])
+def test_iterate_committees_at_epoch_shares_shuffling(genesis_state, config):
+    committee_cache.clear()
+    state = genesis_state
+    epoch = state.current_epoch(config.SLOTS_PER_EPOCH)
+
+    committees = tuple(iterate_committees_at_epoch(state, epoch, config))
+    assert len(committee_cache) == 1
+
+    for committee, committee_index, slot in committees:
+        assert get_beacon_committee(state, slot, committee_index, config) == committee
+    assert len(committee_cache) == 1
+
+    # the shuffling changes with the active validator set
+    validators = state.validators.set(0, state.validators[0].set("exit_epoch", epoch))
+    exited_state = state.set("validators", validators)
+    exited_committees = tuple(iterate_committees_at_epoch(exited_state, epoch, config))
+    assert len(committee_cache) == 2
+    assert sum(len(committee) for committee, _, _ in exited_committees) == (
+        len(state.validators) - 1
+    )
+
+    # and with the number of shuffling rounds of the config
+    other_config = replace(config, SHUFFLE_ROUND_COUNT=config.SHUFFLE_ROUND_COUNT + 1)
+    other_committees = tuple(iterate_committees_at_epoch(state, epoch, other_config))
+    assert len(committee_cache) == 3
+    assert other_committees != committees
@@ -15,7 +15,9 @@ from eth2.beacon.validator_status_helpers import (
     _compute_exit_queue_epoch,
     _set_validator_slashed,
     activate_validator,
+    compute_exit_queue_epochs,
     initiate_exit_for_validator,
+    initiate_validator_exit,
     slash_validator,
 )
 
@@ -125,6 +127,20 @@ def test_compute_exit_queue_epoch(
     )
 
 
+@pytest.mark.parametrize(("validator_count"), [(20)])
+def test_compute_exit_queue_epochs(genesis_state, config):
+    state = genesis_state
+    exit_count = 2 * get_validator_churn_limit(state, config) + 1
+    exit_queue_epochs = compute_exit_queue_epochs(state, exit_count, config)
+
+    # the same epochs as exiting the validators one after the other
+    for index, exit_queue_epoch in enumerate(exit_queue_epochs):
+        state = initiate_validator_exit(state, index, config)
+        assert state.validators[index].exit_epoch == exit_queue_epoch
+    assert len(set(exit_queue_epochs)) == 3
+    assert compute_exit_queue_epochs(state, 0, config) == ()
+
+
 @pytest.mark.parametrize(("is_already_exited,"), [(True), (False)])
 def test_initiate_validator_exit(genesis_state, is_already_exited, config):
     state = genesis_state
@@ -1,3 +1,4 @@
+import pytest
 import ssz
 
 from eth2.beacon.types.states import BeaconState
@@ -7,3 +8,36 @@ def test_defaults(sample_beacon_state_params):
     state = BeaconState.create(**sample_beacon_state_params)
     assert tuple(state.validators) == sample_beacon_state_params["validators"]
     assert ssz.encode(state)
+
+
+@pytest.mark.parametrize(("validator_count",), [(10,)])
+def test_transient_state(genesis_state):
+    state = genesis_state
+    evolver = state.transient()
+
+    evolver.increase_balance(0, 5)
+    evolver.decrease_balance(1, 3)
+    evolver.decrease_balance(2, state.balances[2] + 1)
+    evolver.validators[3] = state.validators[3].set("slashed", True)
+    assert evolver.balances[0] == state.balances[0] + 5
+    assert evolver.state is state
+
+    new_state = evolver.persistent()
+    expected_state = state.mset(
+        "balances",
+        state.balances.mset(0, state.balances[0] + 5, 1, state.balances[1] - 3, 2, 0),
+        "validators",
+        state.validators.set(3, state.validators[3].set("slashed", True)),
+    )
+    assert new_state == expected_state
+    assert new_state.hash_tree_root == expected_state.hash_tree_root
+    # the original state is untouched
+    assert state.balances[0] == genesis_state.balances[0]
+    assert not state.validators[3].slashed
+
+
+@pytest.mark.parametrize(("validator_count",), [(10,)])
+def test_transient_state_without_updates(genesis_state):
+    evolver = genesis_state.transient()
+    evolver.increase_balance(0, 0)
+    assert evolver.persistent() is genesis_state
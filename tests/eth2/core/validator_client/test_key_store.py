@@ -1,9 +1,11 @@
 import json
 
 import eth_keyfile
-from eth_utils import decode_hex
+from eth_utils import decode_hex, encode_hex
 import pytest
 
+from eth2._utils.bls import bls
+from eth2.validator_client.key_pair_cache import KeyPairCache
 from eth2.validator_client.key_store import KeyStore
 
 
@@ -47,3 +49,93 @@ def test_key_store_can_persist_key_files(tmp_path, sample_bls_key_pairs, has_key
         assert private_key_bytes == eth_keyfile.decode_keyfile_json(
             key_file_json, some_password
         )
+
+
+def _write_key_files(key_store_dir, private_keys, password):
+    for private_key in private_keys:
+        key_file_json = eth_keyfile.create_keyfile_json(
+            private_key.to_bytes(32, "little"), password, iterations=2
+        )
+        key_file_json["public_key"] = encode_hex(bls.privtopub(private_key))
+        with open(
+            key_store_dir / f"{key_file_json['id']}.json", "w"
+        ) as key_file_handle:
+            json.dump(key_file_json, key_file_handle)
+
+
+def test_key_store_loads_key_files_in_parallel(tmp_path):
+    some_password = b"password"
+    private_keys = tuple(range(1, 5))
+    _write_key_files(tmp_path, private_keys, some_password)
+
+    key_store = KeyStore(
+        key_store_dir=tmp_path, password_provider=lambda _public_key: some_password
+    )
+    with key_store.persistence():
+        assert len(key_store.public_keys) == len(private_keys)
+        for private_key in private_keys:
+            assert key_store.private_key_for(bls.privtopub(private_key)) == private_key
+
+
+def test_key_store_can_use_key_pair_cache(tmp_path):
+    some_password = b"password"
+    key_store_dir = tmp_path / "keys"
+    key_store_dir.mkdir()
+    private_keys = (1, 2)
+    _write_key_files(key_store_dir, private_keys, some_password)
+    cache_path = tmp_path / "key_pairs"
+
+    def _mk_key_store(password_provider, cache_password=b"master"):
+        return KeyStore(
+            key_store_dir=key_store_dir,
+            password_provider=password_provider,
+            key_pair_cache=KeyPairCache(cache_path, cache_password, scrypt_n=2 ** 4),
+        )
+
+    with _mk_key_store(lambda _public_key: some_password).persistence():
+        pass
+    assert cache_path.exists()
+
+    # a cache hit does not need the password of the key file
+    def _no_password_provider(public_key):
+        raise AssertionError("key file should not be decrypted")
+
+    key_store = _mk_key_store(_no_password_provider)
+    with key_store.persistence():
+        for private_key in private_keys:
+            assert key_store.private_key_for(bls.privtopub(private_key)) == private_key
+
+    # key files added since the cache was stored are decrypted
+    _write_key_files(key_store_dir, (3,), some_password)
+    key_store = _mk_key_store(lambda _public_key: some_password)
+    with key_store.persistence():
+        assert key_store.private_key_for(bls.privtopub(3)) == 3
+    assert len(KeyPairCache(cache_path, b"master").load()) == 3
+
+    with pytest.raises(ValueError):
+        with _mk_key_store(_no_password_provider, b"wrong").persistence():
+            pass
+
+
+def test_key_store_reports_every_incorrect_password(tmp_path, caplog):
+    some_password = b"password"
+    private_keys = tuple(range(1, 5))
+    _write_key_files(tmp_path, private_keys, some_password)
+    incorrect_public_keys = tuple(bls.privtopub(private_key) for private_key in (2, 3))
+
+    def _password_provider(public_key):
+        if public_key in incorrect_public_keys:
+            return b"wrong"
+        return some_password
+
+    key_store = KeyStore(key_store_dir=tmp_path, password_provider=_password_provider)
+    with pytest.raises(ValueError):
+        with key_store.persistence():
+            pass
+
+    logged_public_keys = tuple(
+        record.args[0]
+        for record in caplog.records
+        if record.msg.startswith("password was incorrect")
+    )
+    assert sorted(logged_public_keys) == sorted(map(encode_hex, incorrect_public_keys))
@@ -0,0 +1,127 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+
+from eth2._utils.bls import bls
+from eth2._utils.bls.backends import AVAILABLE_BACKENDS
+from eth2._utils.bls.backends.base import SignatureSet
+from eth2._utils.bls.backends.noop import NoOpBackend
+from eth2.beacon.exceptions import SignatureError
+
+BACKENDS = tuple(
+    backend for backend in AVAILABLE_BACKENDS if backend is not NoOpBackend
+)
+
+
+@pytest.fixture
+def domain():
+    return (123).to_bytes(8, "big")
+
+
+def _mk_signature_sets(domain, count):
+    signature_sets = []
+    for privkey in range(1, count + 1):
+        # every message is signed twice
+        message_hash = bytes([privkey // 2]) * 32
+        signature_sets.append(
+            SignatureSet(
+                bls.privtopub(privkey),
+                message_hash,
+                bls.sign(message_hash, privkey, domain),
+                domain,
+            )
+        )
+    return signature_sets
+
+
+def _swap_signatures(signature_sets, index, other_index):
+    signature_sets[index], signature_sets[other_index] = (
+        signature_sets[index]._replace(signature=signature_sets[other_index].signature),
+        signature_sets[other_index]._replace(signature=signature_sets[index].signature),
+    )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_verify_batch(backend, domain):
+    bls.use(backend)
+    signature_sets = _mk_signature_sets(domain, 4)
+    assert bls.verify_batch(signature_sets)
+    assert bls.verify_batch(())
+
+    # swapped signatures would cancel out in an aggregate without random factors
+    _swap_signatures(signature_sets, 0, 3)
+    assert not bls.verify_batch(signature_sets)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_batch_finds_invalid_signatures(backend, domain):
+    bls.use(backend)
+    signature_sets = _mk_signature_sets(domain, 5)
+    _swap_signatures(signature_sets, 1, 4)
+
+    with bls.collect_signatures() as batch:
+        for pubkey, message_hash, signature, domain in signature_sets:
+            bls.validate(message_hash, pubkey, signature, domain)
+
+    assert batch.signature_sets == tuple(signature_sets)
+    assert not batch.verify()
+    assert batch.find_invalid() == (1, 4)
+    with ThreadPoolExecutor(2) as executor:
+        assert batch.find_invalid(executor) == (1, 4)
+
+    with pytest.raises(SignatureError, match="2 of 5 signatures"):
+        batch.validate()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_batch_context(backend, domain):
+    bls.use(backend)
+    (valid_set, invalid_set) = _mk_signature_sets(domain, 2)
+    invalid_set = invalid_set._replace(signature=valid_set.signature)
+
+    with bls.batch() as batch:
+        bls.validate(
+            valid_set.message_hash, valid_set.pubkey, valid_set.signature, domain
+        )
+    assert len(batch) == 1
+
+    with pytest.raises(SignatureError):
+        with bls.batch():
+            bls.validate(
+                invalid_set.message_hash,
+                invalid_set.pubkey,
+                invalid_set.signature,
+                domain,
+            )
+
+    # outside of a batch, signatures are verified right away again
+    with pytest.raises(SignatureError):
+        bls.validate(
+            invalid_set.message_hash, invalid_set.pubkey, invalid_set.signature, domain
+        )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_batches_of_concurrent_threads_are_separate(backend, domain):
+    bls.use(backend)
+    signature_sets = _mk_signature_sets(domain, 2)
+    collecting = threading.Barrier(2)
+
+    def collect(signature_set):
+        with bls.collect_signatures() as batch:
+            # both threads collect at the same time
+            collecting.wait()
+            bls.validate(
+                signature_set.message_hash,
+                signature_set.pubkey,
+                signature_set.signature,
+                signature_set.domain,
+            )
+            collecting.wait()
+        return batch.signature_sets
+
+    with ThreadPoolExecutor(2) as executor:
+        collected = tuple(executor.map(collect, signature_sets))
+
+    assert collected == tuple((signature_set,) for signature_set in signature_sets)
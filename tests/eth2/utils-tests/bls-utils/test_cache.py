@@ -0,0 +1,117 @@
+from typing import NamedTuple
+
+from eth_typing import BLSPubkey
+import pytest
+
+from eth2._utils.bls import bls
+from eth2._utils.bls.backends import AVAILABLE_BACKENDS
+from eth2._utils.bls.backends.noop import NoOpBackend
+from eth2._utils.bls.backends.py_ecc import PyECCBackend
+from eth2._utils.bls.cache import ValidatorPubkeyCache
+
+
+class Validator(NamedTuple):
+    pubkey: BLSPubkey
+
+
+def _mk_validators(count, offset=0):
+    return tuple(
+        Validator(PyECCBackend.privtopub(privkey))
+        for privkey in range(offset + 1, offset + count + 1)
+    )
+
+
+@pytest.fixture(scope="module")
+def validators():
+    return _mk_validators(8)
+
+
+def test_cache_is_extended_with_new_validators(validators):
+    cache = ValidatorPubkeyCache()
+    cache.update(PyECCBackend, validators[:5])
+    assert len(cache) == 5
+
+    cache.update(PyECCBackend, validators)
+    assert len(cache) == len(validators)
+
+    # an older registry does not shrink the cache
+    cache.update(PyECCBackend, validators[:3])
+    assert len(cache) == len(validators)
+
+
+def test_pubkeys_are_decompressed_when_first_aggregated(validators):
+    cache = ValidatorPubkeyCache()
+    cache.update(PyECCBackend, validators)
+    assert cache.get_pubkey_stats().misses == 0
+
+    cache.aggregate(PyECCBackend, validators, (0, 1, 2), 0)
+    assert cache.get_pubkey_stats().misses == 3
+    assert cache.get_pubkey_stats().hits == 0
+
+    cache.aggregate(PyECCBackend, validators, (2, 3), 0)
+    assert cache.get_pubkey_stats().misses == 4
+    assert cache.get_pubkey_stats().hits == 1
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+def test_aggregate_matches_aggregate_pubkeys(backend, validators):
+    cache = ValidatorPubkeyCache()
+    indices = (1, 3, 4, 6)
+    expected = backend.aggregate_pubkeys(
+        tuple(validators[index].pubkey for index in indices)
+    )
+    assert cache.aggregate(backend, validators, indices, 0) == expected
+    assert cache.aggregate(backend, validators, (), 0) == backend.aggregate_pubkeys(())
+
+
+def test_aggregates_are_cached(validators):
+    cache = ValidatorPubkeyCache()
+    first = cache.aggregate(PyECCBackend, validators, (0, 1), 0)
+    assert cache.get_aggregate_stats().misses == 1
+    assert cache.get_aggregate_stats().hits == 0
+
+    assert cache.aggregate(PyECCBackend, validators, (0, 1), 0) == first
+    assert cache.get_aggregate_stats().misses == 1
+    assert cache.get_aggregate_stats().hits == 1
+    assert cache.get_aggregate_stats().hit_ratio == 0.5
+
+    cache.aggregate(PyECCBackend, validators, (0, 1), 1)
+    cache.aggregate(PyECCBackend, validators, (0, 2), 0)
+    assert cache.get_aggregate_stats().misses == 3
+    assert cache.get_pubkey_stats().misses == 3
+    assert cache.get_pubkey_stats().hits == 3
+
+
+def test_cache_is_reset(validators):
+    cache = ValidatorPubkeyCache()
+    cache.aggregate(PyECCBackend, validators, (0, 1), 0)
+
+    cache.update(NoOpBackend, validators[:2])
+    assert len(cache) == 2
+
+    other_validators = _mk_validators(4, offset=len(validators))
+    expected = PyECCBackend.aggregate_pubkeys(
+        (other_validators[0].pubkey, other_validators[1].pubkey)
+    )
+    assert cache.aggregate(PyECCBackend, other_validators, (0, 1), 0) == expected
+    assert len(cache) == len(other_validators)
+
+
+def test_cache_is_reset_by_registry_diverging_before_the_end(validators):
+    cache = ValidatorPubkeyCache()
+    cache.update(PyECCBackend, validators)
+
+    # the same last validator, but another chain
+    other_validators = _mk_validators(4, offset=len(validators)) + validators[4:]
+    expected = PyECCBackend.aggregate_pubkeys(
+        (other_validators[0].pubkey, other_validators[1].pubkey)
+    )
+    assert cache.aggregate(PyECCBackend, other_validators, (0, 1), 0) == expected
+
+
+def test_bls_aggregate_validator_pubkeys(validators):
+    bls.use(PyECCBackend)
+    pubkeys = tuple(validator.pubkey for validator in validators)
+    assert bls.aggregate_validator_pubkeys(
+        validators, range(len(validators)), 0
+    ) == bls.aggregate_pubkeys(pubkeys)
@@ -0,0 +1,53 @@
+from hypothesis import given
+from hypothesis import strategies as st
+import pytest
+from ssz.hashable_list import HashableList
+from ssz.hashable_vector import HashableVector
+from ssz.sedes import Bitvector, List, Vector, bytes32, uint64
+
+from eth2._utils.hash_tree import persist_hashable_structure
+
+
+@pytest.mark.parametrize(
+    "sedes, element_strategy",
+    [
+        (List(uint64, 2 ** 40), st.integers(min_value=0, max_value=2 ** 64 - 1)),
+        (Vector(uint64, 300), st.integers(min_value=0, max_value=2 ** 64 - 1)),
+        (List(bytes32, 2 ** 20), st.binary(min_size=32, max_size=32)),
+        (List(Bitvector(4), 2 ** 10), st.lists(st.booleans(), min_size=4, max_size=4)),
+    ],
+)
+@given(data=st.data())
+def test_persist_hashable_structure(sedes, element_strategy, data):
+    if isinstance(sedes, Vector):
+        length = sedes.length
+        structure_class = HashableVector
+    else:
+        length = data.draw(st.integers(min_value=1, max_value=300))
+        structure_class = HashableList
+
+    elements = data.draw(st.lists(element_strategy, min_size=length, max_size=length))
+    structure = structure_class.from_iterable(
+        tuple(
+            tuple(element) if isinstance(element, list) else element
+            for element in elements
+        ),
+        sedes,
+    )
+
+    updates = data.draw(
+        st.dictionaries(
+            st.integers(min_value=0, max_value=length - 1), element_strategy
+        )
+    )
+
+    evolver = structure.evolver()
+    for index, element in updates.items():
+        evolver[index] = tuple(element) if isinstance(element, list) else element
+
+    expected = evolver.persistent()
+    result = persist_hashable_structure(evolver)
+
+    assert tuple(result) == tuple(expected)
+    assert result.hash_tree_root == expected.hash_tree_root
+    assert result.hash_tree.raw_hash_tree == expected.hash_tree.raw_hash_tree
@@ -7,6 +7,7 @@ from libp2p.pubsub.pb import rpc_pb2
 import pytest
 import ssz
 
+from eth2._utils.bls import bls
 from eth2.beacon.chains.testnet import SkeletonLakeChain
 from eth2.beacon.fork_choice.higher_slot import HigherSlotScoring
 from eth2.beacon.state_machines.forks.serenity.blocks import SerenitySignedBeaconBlock
@@ -410,15 +411,26 @@ async def test_bcc_receive_server_get_ready_attestations(receive_server, monkeyp
 
     monkeypatch.setattr(receive_server.chain, "get_head_state", mock_get_head_state)
 
+    def mk_vote(slot, bit_index, privkey):
+        data = AttestationData.create(slot=slot)
+        return Attestation.create(
+            aggregation_bits=tuple(index == bit_index for index in range(2)),
+            data=data,
+            signature=bls.sign(data.hash_tree_root, privkey, b"\x00" * 8),
+        )
+
     attesting_slot = MINIMAL_SERENITY_CONFIG.GENESIS_SLOT
-    a1 = Attestation.create(data=AttestationData.create(slot=attesting_slot))
-    a2 = Attestation.create(
-        signature=b"\x56" * 96, data=AttestationData.create(slot=attesting_slot)
-    )
-    a3 = Attestation.create(
-        signature=b"\x78" * 96, data=AttestationData.create(slot=attesting_slot + 1)
-    )
+    a1 = mk_vote(attesting_slot, 0, 1)
+    a2 = mk_vote(attesting_slot, 1, 2)
+    a3 = mk_vote(attesting_slot + 1, 0, 3)
     receive_server.unaggregated_attestation_pool.batch_add([a1, a2, a3])
+    # the votes with the same data are included as one aggregate
+    a1_a2 = a1.mset(
+        "aggregation_bits",
+        (True, True),
+        "signature",
+        bls.aggregate_signatures((a1.signature, a2.signature)),
+    )
 
     # Workaround: add a fake head state slot
     # so `get_state_machine` won't trigger `HeadStateSlotNotFound` exception
@@ -440,7 +452,7 @@ async def test_bcc_receive_server_get_ready_attestations(receive_server, monkeyp
     ready_attestations = receive_server.get_ready_attestations(
         state.slot, is_aggregated=False
     )
-    assert set([a1, a2]) == set(ready_attestations)
+    assert ready_attestations == (a1_a2,)
 
     state.slot = (
         attesting_slot + MINIMAL_SERENITY_CONFIG.MIN_ATTESTATION_INCLUSION_DELAY + 1
@@ -448,10 +460,15 @@ async def test_bcc_receive_server_get_ready_attestations(receive_server, monkeyp
     ready_attestations = receive_server.get_ready_attestations(
         state.slot, is_aggregated=False
     )
-    assert set([a1, a2, a3]) == set(ready_attestations)
+    assert ready_attestations == (a1_a2, a3)
 
     state.slot = attesting_slot + MINIMAL_SERENITY_CONFIG.SLOTS_PER_EPOCH + 1
     ready_attestations = receive_server.get_ready_attestations(
         state.slot, is_aggregated=False
     )
-    assert set([a3]) == set(ready_attestations)
+    assert ready_attestations == (a3,)
+
+    # getting the attestations does not drop the expired ones, the slot tick does
+    assert len(receive_server.unaggregated_attestation_pool) == 3
+    receive_server.prune_attestation_pools(state.slot)
+    assert len(receive_server.unaggregated_attestation_pool) == 1
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from eth2._utils.bls import SignatureBatch, bls
+from eth2._utils.bls.backends.noop import NoOpBackend
+from trinity.protocol.bcc_libp2p.signature_verifier import GossipSignatureVerifier
+
+INVALID_SIGNATURE = b"\x01" * 96
+
+
+class MarkerBackend(NoOpBackend):
+    batch_sizes = []
+
+    @classmethod
+    def verify_batch(cls, signature_sets):
+        cls.batch_sizes.append(len(signature_sets))
+        return all(
+            signature_set.signature != INVALID_SIGNATURE
+            for signature_set in signature_sets
+        )
+
+
+@pytest.fixture
+def marker_backend():
+    MarkerBackend.batch_sizes = []
+    bls.use(MarkerBackend)
+    yield MarkerBackend
+    bls.use_noop_backend()
+
+
+def _mk_batch(*signatures):
+    batch = SignatureBatch(MarkerBackend)
+    for signature in signatures:
+        batch.add(b"\x00" * 48, b"\x00" * 32, signature, b"\x00" * 8)
+    return batch
+
+
+@pytest.mark.asyncio
+async def test_gossip_signature_verifier(marker_backend):
+    verifier = GossipSignatureVerifier(max_batch_size=16, max_batch_delay=0.01)
+    valid = b"\x00" * 96
+
+    results = await asyncio.gather(
+        verifier.verify(_mk_batch(valid)),
+        verifier.verify(_mk_batch(valid, INVALID_SIGNATURE)),
+        verifier.verify(_mk_batch(valid, valid)),
+        verifier.verify(_mk_batch()),
+    )
+
+    assert results == [True, False, True, True]
+    # one batch of all five signatures, then the bisection
+    assert marker_backend.batch_sizes[0] == 5
+
+
+@pytest.mark.asyncio
+async def test_gossip_signature_verifier_flushes_full_batches(marker_backend):
+    verifier = GossipSignatureVerifier(max_batch_size=2, max_batch_delay=10)
+    valid = b"\x00" * 96
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            verifier.verify(_mk_batch(valid)), verifier.verify(_mk_batch(valid))
+        ),
+        timeout=1,
+    )
+    assert results == [True, True]
+    assert marker_backend.batch_sizes == [2]
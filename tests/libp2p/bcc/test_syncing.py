@@ -3,6 +3,10 @@ import asyncio
 from async_generator import asynccontextmanager
 import pytest
 
+from eth2.beacon.tools.factories import BeaconChainFactory
+from trinity.protocol.bcc_libp2p.exceptions import RequestFailure
+from trinity.protocol.bcc_libp2p.node import PeerPool
+from trinity.sync.beacon.constants import MAX_BLOCKS_PER_REQUEST
 from trinity.tools.bcc_factories import (
     AsyncBeaconChainDBFactory,
     BeaconChainSyncerFactory,
@@ -161,3 +165,159 @@ async def test_sync_skipped_slots(request, event_loop, event_bus, genesis_state)
         request, event_loop, event_bus, genesis_state, alice_branch, bob_branch
     ) as (alice, bob):
         assert_synced(alice, bob, bob_branch)
+
+
+class FakePeer:
+    def __init__(
+        self,
+        peer_id,
+        branch,
+        is_failing=False,
+        serves_no_blocks=False,
+        leaves_out_blocks=False,
+    ):
+        self._id = peer_id
+        self.head_slot = branch[-1].slot
+        self.branch = branch
+        self.is_failing = is_failing
+        self.serves_no_blocks = serves_no_blocks
+        self.leaves_out_blocks = leaves_out_blocks
+        self.requested_slots = []
+
+    async def request_beacon_blocks_by_range(self, start_slot, count, step=1):
+        self.requested_slots.append(start_slot)
+        await asyncio.sleep(0)
+        if self.is_failing:
+            raise RequestFailure("fake failure")
+        elif self.serves_no_blocks:
+            return ()
+        elif self.leaves_out_blocks:
+            # only the first half of the range
+            count //= 2
+        return tuple(
+            block
+            for block in self.branch
+            if start_slot <= block.slot < start_slot + count
+        )
+
+
+@pytest.mark.asyncio
+async def test_sync_ranges_from_several_peers(genesis_state):
+    genesis_block = SignedBeaconBlockFactory(
+        message__state_root=genesis_state.hash_tree_root
+    )
+    branch = (genesis_block,) + SignedBeaconBlockFactory.create_branch(
+        length=199, root=genesis_block
+    )
+    alice_chain = BeaconChainFactory(genesis_state=genesis_state)
+    peer_pool = PeerPool()
+    peers = (
+        FakePeer("a", branch),
+        FakePeer("b", branch),
+        FakePeer("c", branch[:100]),
+        FakePeer("d", branch, is_failing=True),
+    )
+    for peer in peers:
+        peer_pool.add(peer)
+
+    syncer = BeaconChainSyncerFactory(
+        chain_db__db=alice_chain.chaindb.db, peer_pool=peer_pool
+    )
+    syncer.sync_peer = peer_pool.get_best_head_slot_peer()
+    await syncer.sync()
+
+    assert alice_chain.get_canonical_head() == branch[-1]
+    # the ranges were spread over the peers that have them
+    assert peers[0].requested_slots and peers[1].requested_slots
+    assert all(slot < 100 for slot in peers[2].requested_slots)
+    # the ranges the failing peer did not serve were served by the others
+    served_slots = sorted(slot for peer in peers[:3] for slot in peer.requested_slots)
+    assert set(served_slots) == set(range(1, 200, MAX_BLOCKS_PER_REQUEST))
+
+
+@pytest.mark.asyncio
+async def test_sync_requests_invalid_ranges_again(genesis_state):
+    genesis_block = SignedBeaconBlockFactory(
+        message__state_root=genesis_state.hash_tree_root
+    )
+    branch = (genesis_block,) + SignedBeaconBlockFactory.create_branch(
+        length=199, root=genesis_block
+    )
+    unrelated_branch = SignedBeaconBlockFactory.create_branch(
+        length=200, root=SignedBeaconBlockFactory()
+    )
+    alice_chain = BeaconChainFactory(genesis_state=genesis_state)
+    peer_pool = PeerPool()
+    peers = (
+        FakePeer("a", branch),
+        FakePeer("b", unrelated_branch),
+        FakePeer("c", branch, serves_no_blocks=True),
+    )
+    for peer in peers:
+        peer_pool.add(peer)
+
+    syncer = BeaconChainSyncerFactory(
+        chain_db__db=alice_chain.chaindb.db, peer_pool=peer_pool
+    )
+    syncer.sync_peer = peers[0]
+    await syncer.sync()
+
+    assert alice_chain.get_canonical_head() == branch[-1]
+    # the peers that served blocks not continuing the chain, or no blocks below
+    # their head, were penalized, and their ranges were served by the honest peer
+    assert syncer._penalized_peer_ids == {"b", "c"}
+    assert set(peers[0].requested_slots) == set(range(1, 200, MAX_BLOCKS_PER_REQUEST))
+
+
+@pytest.mark.asyncio
+async def test_sync_requests_left_out_blocks_again(genesis_state):
+    genesis_block = SignedBeaconBlockFactory(
+        message__state_root=genesis_state.hash_tree_root
+    )
+    branch = (genesis_block,) + SignedBeaconBlockFactory.create_branch(
+        length=199, root=genesis_block
+    )
+    alice_chain = BeaconChainFactory(genesis_state=genesis_state)
+    peer_pool = PeerPool()
+    peers = (
+        FakePeer("a", branch),
+        FakePeer("b", branch, leaves_out_blocks=True),
+    )
+    for peer in peers:
+        peer_pool.add(peer)
+
+    syncer = BeaconChainSyncerFactory(
+        chain_db__db=alice_chain.chaindb.db, peer_pool=peer_pool
+    )
+    syncer.sync_peer = peers[0]
+    await syncer.sync()
+
+    # the blocks the peer left out were requested from the honest peer, which
+    # was not blamed for the next ranges not continuing the imported chain
+    assert alice_chain.get_canonical_head() == branch[-1]
+    assert syncer._penalized_peer_ids == {"b"}
+
+
+@pytest.mark.asyncio
+async def test_sync_ranges_of_skipped_slots(genesis_state):
+    genesis_block = SignedBeaconBlockFactory(
+        message__state_root=genesis_state.hash_tree_root
+    )
+    # all the slots of the second range are skipped
+    branch = (genesis_block,) + SignedBeaconBlockFactory.create_branch_by_slots(
+        slots=tuple(range(1, 60)) + tuple(range(140, 200)), root=genesis_block
+    )
+    alice_chain = BeaconChainFactory(genesis_state=genesis_state)
+    peer_pool = PeerPool()
+    peers = (FakePeer("a", branch), FakePeer("b", branch))
+    for peer in peers:
+        peer_pool.add(peer)
+
+    syncer = BeaconChainSyncerFactory(
+        chain_db__db=alice_chain.chaindb.db, peer_pool=peer_pool
+    )
+    syncer.sync_peer = peers[0]
+    await syncer.sync()
+
+    assert alice_chain.get_canonical_head() == branch[-1]
+    assert not syncer._penalized_peer_ids
@@ -176,6 +176,27 @@ def test_iter_around(routing_table, center_node_id):
     assert tuple(routing_table.iter_nodes_around(node_ids[-1])) != node_ids
 
 
+def test_iter_around_matches_sorting_all_nodes(center_node_id):
+    routing_table = KademliaRoutingTable(center_node_id, 4)
+    for log_distance in itertools.chain(range(1, 12), range(240, 257)):
+        for _ in range(4):
+            routing_table.update(NodeIDFactory.at_log_distance(center_node_id, log_distance))
+    all_node_ids = tuple(itertools.chain(*routing_table.buckets))
+
+    reference_node_ids = (
+        (center_node_id,) +
+        all_node_ids[::7] +
+        tuple(NodeIDFactory() for _ in range(10)) +
+        tuple(NodeIDFactory.at_log_distance(center_node_id, distance) for distance in (5, 250))
+    )
+    for reference_node_id in reference_node_ids:
+        expected = tuple(sorted(
+            all_node_ids,
+            key=lambda node_id: compute_distance(reference_node_id, node_id),
+        ))
+        assert tuple(routing_table.iter_nodes_around(reference_node_id)) == expected
+
+
 def test_fill_bucket(routing_table, center_node_id, bucket_size):
     assert not routing_table.get_nodes_at_log_distance(200)
     for _ in range(2 * bucket_size):
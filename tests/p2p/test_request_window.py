@@ -0,0 +1,83 @@
+from p2p.exchange.window import RequestWindow
+from p2p.stats.ema import EMA
+
+
+class FakeTracker:
+    def __init__(self):
+        self.total_msgs = 0
+        self.total_timeouts = 0
+        self.items_per_second_ema = EMA(initial_value=0, smoothing_factor=0.5)
+
+    def record_response(self, items_per_second):
+        self.total_msgs += 1
+        self.items_per_second_ema = EMA(initial_value=items_per_second, smoothing_factor=0.5)
+
+    def record_timeout(self):
+        self.total_msgs += 1
+        self.total_timeouts += 1
+
+
+def test_window_grows_while_responses_are_not_slowed_down():
+    window = RequestWindow(max_size=4)
+    tracker = FakeTracker()
+    assert window.size == 1
+
+    for expected_size in (2, 3, 4, 4):
+        tracker.record_response(100)
+        window.update(tracker)
+        assert window.size == expected_size
+
+
+def test_window_shrinks_when_requests_wait_at_the_peer():
+    window = RequestWindow(max_size=8)
+    tracker = FakeTracker()
+    for _ in range(8):
+        tracker.record_response(100)
+        window.update(tracker)
+    assert window.size == 8
+
+    # the peer serves the same number of items per second in total, so every request
+    # takes eight times as long: most of them wait
+    tracker.record_response(100 / 8)
+    window.update(tracker)
+    assert window.size == 7
+
+    # a little slower still is within the bounds of the window
+    tracker.record_response(100 / 1.5)
+    window.update(tracker)
+    assert window.size == 7
+
+
+def test_window_halves_on_timeout():
+    window = RequestWindow(max_size=8)
+    tracker = FakeTracker()
+    for _ in range(8):
+        tracker.record_response(100)
+        window.update(tracker)
+
+    tracker.record_timeout()
+    window.update(tracker)
+    assert window.size == 4
+
+    for expected_size in (2, 1, 1):
+        tracker.record_timeout()
+        window.update(tracker)
+        assert window.size == expected_size
+
+
+def test_window_ignores_updates_without_new_responses():
+    window = RequestWindow(max_size=8)
+    tracker = FakeTracker()
+    tracker.record_response(100)
+    window.update(tracker)
+    window.update(tracker)
+    assert window.size == 2
+
+
+def test_window_stays_closed_without_items():
+    window = RequestWindow(max_size=8)
+    tracker = FakeTracker()
+    for _ in range(3):
+        tracker.record_response(0)
+        window.update(tracker)
+    assert window.size == 1
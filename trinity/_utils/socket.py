@@ -27,9 +27,17 @@ class BufferedSocket:
                 raise OSError("Connection closed")
 
             self._buffer.extend(data)
-        payload = self._buffer[:num_bytes]
-        self._buffer = self._buffer[num_bytes:]
-        return bytes(payload)
+        payload = bytes(self._buffer[:num_bytes])
+        del self._buffer[:num_bytes]
+        return payload
+
+    @property
+    def has_buffered_data(self) -> bool:
+        """
+        Return ``True`` if bytes have already been received from the socket but
+        not yet consumed by :meth:`read_exactly`.
+        """
+        return len(self._buffer) > 0
 
 
 class IPCSocketServer(ABC):
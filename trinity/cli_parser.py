@@ -168,6 +168,26 @@ trinity_parser.add_argument(
         "Port on which trinity should listen for incoming p2p/discovery connections. Default: 30303"
     ),
 )
+trinity_parser.add_argument(
+    '--db-read-cache-size',
+    type=int,
+    required=False,
+    default=0,
+    help=(
+        "Size in MiB of the memory mapped cache of database reads which is shared by all"
+        " processes.  Default: 0 (disabled)"
+    ),
+)
+trinity_parser.add_argument(
+    '--tx-sender-cache-size',
+    type=int,
+    required=False,
+    default=16,
+    help=(
+        "Size in MiB of the memory mapped cache of transaction senders which is shared by all"
+        " processes.  Default: 16, 0 disables the cache"
+    ),
+)
 trinity_parser.add_argument(
     '--trinity-tmp-root-dir',
     action="store_true",
@@ -3,7 +3,10 @@ from argparse import (
     Namespace,
     _SubParsersAction,
 )
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
 import logging
+import os
 import pathlib
 
 import rlp
@@ -26,7 +29,13 @@ from trinity.initialization import (
     ensure_eth1_dirs,
     initialize_database,
 )
-from .rlp_decode import decode_all
+from .streaming import (
+    BATCHES_IN_FLIGHT_PER_WORKER,
+    BlockThroughput,
+    decode_blocks_in_parallel,
+    open_export_file,
+    open_rlp_items,
+)
 
 
 def get_chain(trinity_config: TrinityConfig) -> ChainAPI:
@@ -69,25 +78,37 @@ class ImportBlockComponent(Application):
 
     @classmethod
     def run_import(cls, args: Namespace, trinity_config: TrinityConfig) -> None:
-        with open(args.file_path, 'rb') as import_file:
-            # This won't handle large files.
-            # TODO: Make this stream based: https://github.com/ethereum/trinity/issues/1282
-            file_bytes = import_file.read()
-
-        blocks = decode_all(file_bytes, sedes=FrontierBlock)
-
-        cls.logger.info("Importing %s blocks", len(blocks))
-
         chain = get_chain(trinity_config)
+        worker_count = os.cpu_count() or 1
 
-        for block in blocks:
-            try:
-                chain.import_block(block)
-            except (EVMMissingData, ValidationError) as exc:
-                cls.logger.error(exc)
-                cls.logger.error("Import failed")
+        with contextlib.ExitStack() as stack:
+            encoded_blocks = stack.enter_context(open_rlp_items(args.file_path))
+            # with a single CPU, handing blocks to another process only adds work
+            if worker_count > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(worker_count))
             else:
-                cls.logger.info("Successfully imported %s", block)
+                executor = None
+
+            # Blocks are decoded and their transaction senders recovered by the
+            # worker processes, while this process imports them one at a time.
+            blocks = decode_blocks_in_parallel(
+                encoded_blocks,
+                FrontierBlock,
+                executor,
+                max_batches_in_flight=worker_count * BATCHES_IN_FLIGHT_PER_WORKER,
+            )
+            throughput = BlockThroughput(cls.logger, 'Imported')
+            for block in blocks:
+                try:
+                    chain.import_block(block)
+                except (EVMMissingData, ValidationError) as exc:
+                    cls.logger.error(exc)
+                    cls.logger.error("Import failed")
+                else:
+                    cls.logger.info("Successfully imported %s", block)
+                    throughput.add(block)
+
+        throughput.report()
 
 
 class ExportBlockComponent(Application):
@@ -109,7 +130,7 @@ class ExportBlockComponent(Application):
         export_parser.add_argument(
             'file_path',
             type=pathlib.Path,
-            help='Specify the file to export to'
+            help='Specify the file to export to, gzip compressed if it ends with .gz'
         )
 
         export_parser.add_argument(
@@ -118,6 +139,12 @@ class ExportBlockComponent(Application):
             help='Specify the block number to be exported'
         )
 
+        export_parser.add_argument(
+            '--to-block',
+            type=int,
+            help='Export all blocks from `block_number` up to this block number',
+        )
+
         export_parser.add_argument(
             "--append",
             action="store_true",
@@ -135,15 +162,21 @@ class ExportBlockComponent(Application):
     @classmethod
     def run_export(cls, args: Namespace, trinity_config: TrinityConfig) -> None:
         chain = get_chain(trinity_config)
-        try:
-            block = chain.get_canonical_block_by_number(args.block_number)
-        except HeaderNotFound:
-            cls.logger.error("Block number %s does not exist in the database", args.block_number)
+        last_block_number = args.block_number if args.to_block is None else args.to_block
+        if last_block_number < args.block_number:
+            cls.logger.error(
+                "--to-block %s is lower than the block number %s",
+                last_block_number,
+                args.block_number,
+            )
             return
 
-        cls.logger.info("Exporting %s", block)
-
-        block_bytes = rlp.encode(block)
+        for block_number in sorted({args.block_number, last_block_number}):
+            try:
+                chain.get_canonical_block_header_by_number(block_number)
+            except HeaderNotFound:
+                cls.logger.error("Block number %s does not exist in the database", block_number)
+                return
 
         if args.file_path.exists() and not (args.append or args.overwrite):
             cls.logger.error(
@@ -156,11 +189,14 @@ class ExportBlockComponent(Application):
         if not parent_dir.exists():
             parent_dir.mkdir(parents=True)
 
-        write_mode = 'w+b' if not args.append else 'a+b'
-
-        cls.logger.info("Writing %s bytes to %s", len(block_bytes), args.file_path)
+        cls.logger.info("Writing blocks to %s", args.file_path)
 
-        with open(args.file_path, write_mode) as export_file:
-            export_file.write(block_bytes)
+        throughput = BlockThroughput(cls.logger, 'Exported')
+        with open_export_file(args.file_path, args.append) as export_file:
+            for block_number in range(args.block_number, last_block_number + 1):
+                block = chain.get_canonical_block_by_number(block_number)
+                export_file.write(rlp.encode(block))
+                cls.logger.info("Successfully exported %s", block)
+                throughput.add(block)
 
-        cls.logger.info("Successfully exported %s", block)
+        throughput.report()
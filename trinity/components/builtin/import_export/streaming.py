@@ -0,0 +1,252 @@
+import collections
+from concurrent.futures import (
+    Executor,
+    Future,
+)
+import contextlib
+import gzip
+import logging
+import mmap
+import pathlib
+import time
+from typing import (
+    IO,
+    Deque,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from eth_keys.exceptions import BadSignature
+from eth_utils import (
+    ValidationError,
+    to_tuple,
+)
+import rlp
+from rlp.codec import consume_length_prefix
+from rlp.exceptions import DecodingError
+
+from eth.abc import BlockAPI
+
+GZIP_MAGIC = b'\x1f\x8b'
+# the number of blocks a worker decodes at once
+DEFAULT_DECODE_BATCH_SIZE = 64
+# the batches being decoded ahead of the import, per worker
+BATCHES_IN_FLIGHT_PER_WORKER = 2
+STREAM_CHUNK_SIZE = 1024 * 1024
+REPORT_INTERVAL = 5  # seconds
+
+Buffer = Union[bytes, bytearray, mmap.mmap]
+
+
+def _get_item_end(buffer: Buffer, start: int) -> Optional[int]:
+    """
+    Return the end of the RLP item at ``start`` of ``buffer``, or ``None`` if the
+    buffer ends before the item does.
+    """
+    if start >= len(buffer):
+        return None
+    # long strings and lists have the length of their length in the first byte
+    first_byte = buffer[start]
+    if 0xb7 < first_byte < 0xc0:
+        length_of_length = first_byte - 0xb7
+    elif first_byte > 0xf7:
+        length_of_length = first_byte - 0xf7
+    else:
+        length_of_length = 0
+    if start + 1 + length_of_length > len(buffer):
+        return None
+
+    _, _, payload_length, payload_start = consume_length_prefix(buffer, start)
+    item_end = payload_start + payload_length
+    return item_end if item_end <= len(buffer) else None
+
+
+def split_rlp_items(buffer: Buffer) -> Iterator[bytes]:
+    """
+    Yield the encoding of every item of ``buffer``, a concatenation of RLP items,
+    without decoding them.
+    """
+    start = 0
+    while start < len(buffer):
+        item_end = _get_item_end(buffer, start)
+        if item_end is None:
+            raise DecodingError('RLP string too short', bytes(buffer[start:start + 9]))
+        yield bytes(buffer[start:item_end])
+        start = item_end
+
+
+def read_rlp_items(stream: Union[IO[bytes], gzip.GzipFile],
+                   chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Like ``split_rlp_items`` on the data of ``stream``, which is read in chunks.
+    """
+    buffer = bytearray()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+
+        start = 0
+        while start < len(buffer):
+            item_end = _get_item_end(buffer, start)
+            if item_end is None:
+                break
+            yield bytes(buffer[start:item_end])
+            start = item_end
+        del buffer[:start]
+
+    if buffer:
+        raise DecodingError('RLP string too short', bytes(buffer[:9]))
+
+
+def is_gzip_file(path: pathlib.Path) -> bool:
+    with open(path, 'rb') as file:
+        return file.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+
+
+@contextlib.contextmanager
+def open_rlp_items(path: pathlib.Path) -> Iterator[Iterator[bytes]]:
+    """
+    Open a file of RLP encoded items, optionally gzip compressed, and return an
+    iterator over the encoding of every item. Uncompressed files are mapped into
+    memory instead of being read.
+    """
+    if is_gzip_file(path):
+        with gzip.open(path, 'rb') as compressed_file:
+            yield read_rlp_items(compressed_file)
+    else:
+        with open(path, 'rb') as rlp_file:
+            if path.stat().st_size == 0:
+                # an empty file can not be mapped
+                yield iter(())
+            else:
+                with mmap.mmap(rlp_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    yield split_rlp_items(buffer)
+
+
+def open_export_file(path: pathlib.Path, append: bool) -> Union[IO[bytes], gzip.GzipFile]:
+    """
+    Open ``path`` for writing blocks, gzip compressed if it ends with ``.gz``.
+    Appending to a compressed file adds a gzip member, which reads as a
+    continuation of the file.
+    """
+    mode = 'ab' if append else 'wb'
+    if path.suffix == '.gz':
+        return gzip.GzipFile(path, mode)
+    else:
+        return open(path, mode)
+
+
+@to_tuple
+def decode_blocks(encoded_blocks: Sequence[bytes],
+                  block_class: Type[BlockAPI]) -> Iterable[BlockAPI]:
+    """
+    Decode ``encoded_blocks`` and recover the senders of their transactions.
+    The senders are cached on the transactions and survive pickling, so that
+    a worker process can do this work for the importing process.
+    """
+    for encoded_block in encoded_blocks:
+        block = rlp.decode(encoded_block, sedes=block_class)
+        for transaction in block.transactions:
+            try:
+                transaction.sender
+            except (BadSignature, ValidationError):
+                # leave it to the import to reject the block
+                pass
+        yield block
+
+
+def _batch(items: Iterable[bytes], batch_size: int) -> Iterator[Tuple[bytes, ...]]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield tuple(batch)
+            batch = []
+    if batch:
+        yield tuple(batch)
+
+
+def decode_blocks_in_parallel(encoded_blocks: Iterable[bytes],
+                              block_class: Type[BlockAPI],
+                              executor: Executor = None,
+                              max_batches_in_flight: int = BATCHES_IN_FLIGHT_PER_WORKER,
+                              batch_size: int = DEFAULT_DECODE_BATCH_SIZE) -> Iterator[BlockAPI]:
+    """
+    Yield the decoded ``encoded_blocks`` in order, while batches of the blocks that
+    follow are decoded by ``executor``. At most ``max_batches_in_flight`` batches
+    are decoded ahead, which bounds the memory used by blocks not yet consumed.
+    Without an executor the blocks are decoded as they are consumed.
+    """
+    if executor is None:
+        for batch in _batch(encoded_blocks, batch_size):
+            yield from decode_blocks(batch, block_class)
+        return
+
+    in_flight: Deque['Future[Tuple[BlockAPI, ...]]'] = collections.deque()
+    try:
+        for batch in _batch(encoded_blocks, batch_size):
+            in_flight.append(executor.submit(decode_blocks, batch, block_class))
+            if len(in_flight) >= max_batches_in_flight:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+class BlockThroughput:
+    """
+    Count the blocks and gas of an import or export and log its throughput
+    regularly, e.g. as "Imported 100 blocks in ...".
+    """
+
+    def __init__(self,
+                 logger: logging.Logger,
+                 verb: str,
+                 report_interval: float = REPORT_INTERVAL) -> None:
+        self.logger = logger
+        self.verb = verb
+        self.report_interval = report_interval
+        self.block_count = 0
+        self.gas_used = 0
+        self._start = time.perf_counter()
+        self._last_report = self._start
+
+    def add(self, block: BlockAPI) -> None:
+        self.block_count += 1
+        self.gas_used += block.header.gas_used
+
+        now = time.perf_counter()
+        if now - self._last_report >= self.report_interval:
+            self._last_report = now
+            self.report()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+    @property
+    def blocks_per_second(self) -> float:
+        return self.block_count / self.elapsed
+
+    @property
+    def mgas_per_second(self) -> float:
+        return self.gas_used / 1e6 / self.elapsed
+
+    def report(self) -> None:
+        self.logger.info(
+            '%s %d blocks in %.1fs (%.1f blocks/s, %.2f Mgas/s)',
+            self.verb,
+            self.block_count,
+            self.elapsed,
+            self.blocks_per_second,
+            self.mgas_per_second,
+        )
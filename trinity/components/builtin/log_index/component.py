@@ -0,0 +1,117 @@
+from argparse import (
+    ArgumentParser,
+    Namespace,
+    _SubParsersAction,
+)
+import logging
+import time
+
+from async_service import background_asyncio_service
+from eth.db.chain import ChainDB
+from lahja import EndpointAPI
+
+from trinity.boot_info import BootInfo
+from trinity.components.builtin.import_export.component import get_chain
+from trinity.config import TrinityConfig
+from trinity.constants import SYNC_LIGHT
+from trinity.db.eth1.log_index import LogIndex
+from trinity.db.manager import DBClient
+from trinity.extensibility import (
+    Application,
+    AsyncioIsolatedComponent,
+)
+
+from .indexer import LogIndexer
+
+
+class LogIndexComponent(AsyncioIsolatedComponent):
+    """
+    Keep the log index, which serves ``eth_getLogs`` and the log filters of the JSON-RPC API,
+    up to date with the canonical chain.
+    """
+    name = "LogIndex"
+
+    logger = logging.getLogger('trinity.components.log_index.LogIndex')
+
+    @classmethod
+    def configure_parser(cls, arg_parser: ArgumentParser, subparser: _SubParsersAction) -> None:
+        arg_parser.add_argument(
+            "--disable-log-index",
+            action="store_true",
+            help="Disables the index of the logs of the chain, which makes log queries slower",
+        )
+        arg_parser.add_argument(
+            "--log-index-postings",
+            action="store_true",
+            help=(
+                "Index the exact blocks with logs of every address and topic, on top of their "
+                "blooms, which takes more space and reads every receipt"
+            ),
+        )
+
+    @property
+    def is_enabled(self) -> bool:
+        light_mode = self._boot_info.args.sync_mode == SYNC_LIGHT
+        return not light_mode and not self._boot_info.args.disable_log_index
+
+    @classmethod
+    async def do_run(cls, boot_info: BootInfo, event_bus: EndpointAPI) -> None:
+        db = DBClient.connect(boot_info.trinity_config.database_ipc_path)
+        with db:
+            log_index = LogIndex(ChainDB(db), index_postings=boot_info.args.log_index_postings)
+            async with background_asyncio_service(LogIndexer(log_index)) as manager:
+                await manager.wait_finished()
+
+
+class IndexLogsComponent(Application):
+    """
+    Index the logs of a chain that was synced without the log index, while trinity isn't running.
+    """
+    logger = logging.getLogger('trinity.components.log_index.IndexLogs')
+
+    @classmethod
+    def configure_parser(cls,
+                         arg_parser: ArgumentParser,
+                         subparser: _SubParsersAction) -> None:
+
+        index_parser = subparser.add_parser(
+            'index-logs',
+            help='Index the logs of all confirmed blocks of the chain',
+        )
+
+        index_parser.add_argument(
+            '--postings',
+            action='store_true',
+            help='Index the exact blocks with logs of every address and topic as well',
+        )
+
+        index_parser.set_defaults(func=cls.run_index)
+
+    @classmethod
+    def run_index(cls, args: Namespace, trinity_config: TrinityConfig) -> None:
+        chain = get_chain(trinity_config)
+        log_index = LogIndex(chain.chaindb, index_postings=args.postings)
+
+        section_count = log_index.get_indexable_section_count()
+        cls.logger.info(
+            "Indexing the logs of %d sections of %d blocks, %d of which are indexed already",
+            section_count,
+            log_index.section_size,
+            log_index.get_section_count(),
+        )
+
+        start = time.perf_counter()
+        while log_index.index_next_section():
+            indexed_count = log_index.get_section_count()
+            cls.logger.info(
+                "Indexed section %d/%d, up to block #%d",
+                indexed_count,
+                section_count,
+                indexed_count * log_index.section_size - 1,
+            )
+
+        cls.logger.info(
+            "Indexed the logs of %d sections in %.1fs",
+            log_index.get_section_count(),
+            time.perf_counter() - start,
+        )
@@ -0,0 +1,31 @@
+import asyncio
+import logging
+
+from async_service import Service
+
+from trinity.db.eth1.log_index import LogIndex
+
+# How often we check whether more sections of the chain can be indexed
+INDEX_CHECK_INTERVAL = 5  # seconds
+
+
+class LogIndexer(Service):
+    """
+    Index the logs of every section of the canonical chain as soon as it is confirmed, including
+    the sections that were imported before the indexer started.
+    """
+    logger = logging.getLogger('trinity.components.log_index.LogIndexer')
+
+    def __init__(self, log_index: LogIndex) -> None:
+        self._log_index = log_index
+
+    async def run(self) -> None:
+        while self.manager.is_running:
+            # index one section at a time, to let the other tasks run in between
+            while self._log_index.index_next_section():
+                self.logger.debug(
+                    "Indexed the logs of section #%d",
+                    self._log_index.get_section_count() - 1,
+                )
+                await asyncio.sleep(0)
+            await asyncio.sleep(INDEX_CHECK_INTERVAL)
@@ -18,7 +18,13 @@ from trinity.components.builtin.metrics.service.trio import TrioMetricsService
 from trinity.components.builtin.metrics.blockchain_metrics_collector import (
     collect_blockchain_metrics,
 )
+from trinity.components.builtin.metrics.db_read_cache_metrics_collector import (
+    collect_db_read_cache_metrics,
+)
 from trinity.components.builtin.metrics.system_metrics_collector import collect_process_metrics
+from trinity.components.builtin.metrics.tx_sender_cache_metrics_collector import (
+    collect_tx_sender_cache_metrics,
+)
 
 from trinity.extensibility import (
     TrioIsolatedComponent,
@@ -158,10 +164,26 @@ class MetricsComponent(TrioIsolatedComponent):
             frequency_seconds=boot_info.args.metrics_blockchain_collector_frequency
         )
 
+        # types ignored due to https://github.com/ethereum/async-service/issues/5
+        db_read_cache_metrics_collector = collect_db_read_cache_metrics(  # type: ignore
+            boot_info,
+            metrics_service.registry,
+            frequency_seconds=boot_info.args.metrics_system_collector_frequency
+        )
+
+        # types ignored due to https://github.com/ethereum/async-service/issues/5
+        tx_sender_cache_metrics_collector = collect_tx_sender_cache_metrics(  # type: ignore
+            boot_info,
+            metrics_service.registry,
+            frequency_seconds=boot_info.args.metrics_system_collector_frequency
+        )
+
         services_to_exit = (
             metrics_service,
             system_metrics_collector,
             blockchain_metrics_collector,
+            db_read_cache_metrics_collector,
+            tx_sender_cache_metrics_collector,
         )
 
         async with AsyncExitStack() as stack:
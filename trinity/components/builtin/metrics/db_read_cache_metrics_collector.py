@@ -0,0 +1,47 @@
+from async_service import (
+    as_service,
+    ManagerAPI,
+)
+from p2p import trio_utils
+
+from trinity.boot_info import BootInfo
+from trinity.components.builtin.metrics.registry import HostMetricsRegistry
+from trinity.db.read_cache import (
+    ReadCacheStats,
+    attach_read_cache,
+)
+
+
+@as_service
+async def collect_db_read_cache_metrics(manager: ManagerAPI,
+                                        boot_info: BootInfo,
+                                        registry: HostMetricsRegistry,
+                                        frequency_seconds: int) -> None:
+    read_cache = attach_read_cache(boot_info.trinity_config.database_ipc_path)
+    if read_cache is None:
+        return
+
+    hits_meter = registry.meter('trinity.db/read_cache/hits.meter')
+    misses_meter = registry.meter('trinity.db/read_cache/misses.meter')
+    evictions_meter = registry.meter('trinity.db/read_cache/evictions.meter')
+    invalidations_meter = registry.meter('trinity.db/read_cache/invalidations.meter')
+    hit_ratio_gauge = registry.gauge('trinity.db/read_cache/hit_ratio.gauge')
+
+    previous = ReadCacheStats(0, 0, 0, 0)
+
+    try:
+        async for _ in trio_utils.every(frequency_seconds):
+            current = read_cache.get_stats()
+
+            hits = current.hits - previous.hits
+            misses = current.misses - previous.misses
+            hits_meter.mark(hits)
+            misses_meter.mark(misses)
+            evictions_meter.mark(current.evictions - previous.evictions)
+            invalidations_meter.mark(current.invalidations - previous.invalidations)
+            if hits + misses:
+                hit_ratio_gauge.set_value(hits / (hits + misses))
+
+            previous = current
+    finally:
+        read_cache.close()
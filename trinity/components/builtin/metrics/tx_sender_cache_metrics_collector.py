@@ -0,0 +1,43 @@
+from async_service import (
+    as_service,
+    ManagerAPI,
+)
+from p2p import trio_utils
+
+from trinity.boot_info import BootInfo
+from trinity.components.builtin.metrics.registry import HostMetricsRegistry
+from trinity.db.read_cache import ReadCacheStats
+from trinity.db.sender_cache import attach_sender_cache
+
+
+@as_service
+async def collect_tx_sender_cache_metrics(manager: ManagerAPI,
+                                          boot_info: BootInfo,
+                                          registry: HostMetricsRegistry,
+                                          frequency_seconds: int) -> None:
+    sender_cache = attach_sender_cache(boot_info.trinity_config.database_ipc_path)
+    if sender_cache is None:
+        return
+
+    hits_meter = registry.meter('trinity.tx/sender_cache/hits.meter')
+    misses_meter = registry.meter('trinity.tx/sender_cache/misses.meter')
+    evictions_meter = registry.meter('trinity.tx/sender_cache/evictions.meter')
+    hit_ratio_gauge = registry.gauge('trinity.tx/sender_cache/hit_ratio.gauge')
+
+    previous = ReadCacheStats(0, 0, 0, 0)
+
+    try:
+        async for _ in trio_utils.every(frequency_seconds):
+            current = sender_cache.get_stats()
+
+            hits = current.hits - previous.hits
+            misses = current.misses - previous.misses
+            hits_meter.mark(hits)
+            misses_meter.mark(misses)
+            evictions_meter.mark(current.evictions - previous.evictions)
+            if hits + misses:
+                hit_ratio_gauge.set_value(hits / (hits + misses))
+
+            previous = current
+    finally:
+        sender_cache.close()
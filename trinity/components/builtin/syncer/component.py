@@ -11,6 +11,7 @@ import logging
 from typing import (
     cast,
     Iterable,
+    Optional,
     Tuple,
     Type,
 )
@@ -41,6 +42,10 @@ from trinity.constants import (
 from trinity.chains.base import AsyncChainAPI
 from trinity.db.eth1.chain import AsyncChainDB
 from trinity.db.eth1.header import AsyncHeaderDB
+from trinity.db.sender_cache import (
+    TransactionSenderCache,
+    attach_sender_cache,
+)
 from trinity.extensibility.asyncio import (
     AsyncioIsolatedComponent
 )
@@ -100,7 +105,8 @@ class BaseSyncStrategy(ABC):
                    base_db: AtomicDatabaseAPI,
                    peer_pool: BasePeerPool,
                    event_bus: EndpointAPI,
-                   cancel_token: CancelToken) -> None:
+                   cancel_token: CancelToken,
+                   sender_cache: Optional[TransactionSenderCache]) -> None:
         ...
 
 
@@ -121,7 +127,8 @@ class NoopSyncStrategy(BaseSyncStrategy):
                    base_db: AtomicDatabaseAPI,
                    peer_pool: BasePeerPool,
                    event_bus: EndpointAPI,
-                   cancel_token: CancelToken) -> None:
+                   cancel_token: CancelToken,
+                   sender_cache: Optional[TransactionSenderCache]) -> None:
 
         logger.info("Node running without sync (--sync-mode=%s)", self.get_sync_mode())
 
@@ -139,7 +146,8 @@ class FullSyncStrategy(BaseSyncStrategy):
                    base_db: AtomicDatabaseAPI,
                    peer_pool: BasePeerPool,
                    event_bus: EndpointAPI,
-                   cancel_token: CancelToken) -> None:
+                   cancel_token: CancelToken,
+                   sender_cache: Optional[TransactionSenderCache]) -> None:
 
         syncer = FullChainSyncer(
             chain,
@@ -147,6 +155,7 @@ class FullSyncStrategy(BaseSyncStrategy):
             base_db,
             cast(ETHPeerPool, peer_pool),
             cancel_token,
+            sender_cache,
         )
 
         await syncer.run()
@@ -185,7 +194,8 @@ class BeamSyncStrategy(BaseSyncStrategy):
                    base_db: AtomicDatabaseAPI,
                    peer_pool: BasePeerPool,
                    event_bus: EndpointAPI,
-                   cancel_token: CancelToken) -> None:
+                   cancel_token: CancelToken,
+                   sender_cache: Optional[TransactionSenderCache]) -> None:
 
         syncer = BeamSyncService(
             chain,
@@ -196,6 +206,7 @@ class BeamSyncStrategy(BaseSyncStrategy):
             args.beam_from_checkpoint,
             args.force_beam_block_number,
             cancel_token,
+            sender_cache,
         )
 
         await syncer.run()
@@ -214,7 +225,8 @@ class LightSyncStrategy(BaseSyncStrategy):
                    base_db: AtomicDatabaseAPI,
                    peer_pool: BasePeerPool,
                    event_bus: EndpointAPI,
-                   cancel_token: CancelToken) -> None:
+                   cancel_token: CancelToken,
+                   sender_cache: Optional[TransactionSenderCache]) -> None:
 
         syncer = LightChainSyncer(
             chain,
@@ -329,15 +341,21 @@ class SyncerComponent(AsyncioIsolatedComponent):
                           boot_info: BootInfo,
                           event_bus: EndpointAPI) -> None:
         await node.get_manager().wait_started()
-        await strategy.sync(
-            boot_info.args,
-            cls.logger,
-            node.get_chain(),
-            node.base_db,
-            node.get_peer_pool(),
-            event_bus,
-            node.master_cancel_token
-        )
+        sender_cache = attach_sender_cache(boot_info.trinity_config.database_ipc_path)
+        try:
+            await strategy.sync(
+                boot_info.args,
+                cls.logger,
+                node.get_chain(),
+                node.base_db,
+                node.get_peer_pool(),
+                event_bus,
+                node.master_cancel_token,
+                sender_cache,
+            )
+        finally:
+            if sender_cache is not None:
+                sender_cache.close()
 
         if strategy.shutdown_node_on_halt:
             cls.logger.error("Sync ended unexpectedly. Shutting down trinity")
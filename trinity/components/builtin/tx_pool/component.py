@@ -23,6 +23,7 @@ from trinity.constants import (
     ROPSTEN_NETWORK_ID,
 )
 from trinity.db.manager import DBClient
+from trinity.db.sender_cache import attach_sender_cache
 from trinity.extensibility import (
     AsyncioIsolatedComponent,
 )
@@ -92,7 +93,12 @@ class TxComponent(AsyncioIsolatedComponent):
 
             proxy_peer_pool = ETHProxyPeerPool(event_bus, TO_NETWORKING_BROADCAST_CONFIG)
 
-            tx_pool = TxPool(event_bus, proxy_peer_pool, validator)
+            sender_cache = attach_sender_cache(trinity_config.database_ipc_path)
+            tx_pool = TxPool(event_bus, proxy_peer_pool, validator, sender_cache, chain)
 
-            async with background_asyncio_service(tx_pool) as manager:
-                await manager.wait_finished()
+            try:
+                async with background_asyncio_service(tx_pool) as manager:
+                    await manager.wait_finished()
+            finally:
+                if sender_cache is not None:
+                    sender_cache.close()
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import (
+    Optional,
+    Type,
+)
+
+from eth.abc import SignedTransactionAPI
+from eth_typing import Hash32
+from lahja import (
+    BaseEvent,
+    BaseRequestResponseEvent,
+)
+
+
+@dataclass
+class PendingTransactionResponse(BaseEvent):
+    transaction: Optional[SignedTransactionAPI]
+
+
+@dataclass
+class GetPendingTransactionRequest(BaseRequestResponseEvent[PendingTransactionResponse]):
+    """
+    Look up a transaction in the pool of the transaction pool process.
+    """
+    transaction_hash: Hash32
+
+    @staticmethod
+    def expected_response_type() -> Type[PendingTransactionResponse]:
+        return PendingTransactionResponse
@@ -0,0 +1,239 @@
+import heapq
+import itertools
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from eth_typing import (
+    Address,
+    Hash32,
+)
+from eth_utils import (
+    ValidationError,
+    encode_hex,
+)
+from eth.abc import SignedTransactionAPI
+
+
+# The maximum number of transactions in the pool, pending and queued, like geth's default
+# of 4096 pending and 1024 queued transactions.
+MAX_POOLED_TRANSACTIONS = 5120
+
+# The percentage by which the gas price of a transaction must exceed the one of the pooled
+# transaction with the same sender and nonce to replace it.
+PRICE_BUMP_PERCENT = 10
+
+
+class PooledTransaction(NamedTuple):
+    transaction: SignedTransactionAPI
+    transaction_hash: Hash32
+    sender: Address
+    # distinguishes entries of the price heap, as a transaction can be re-added after removal
+    sequence: int
+
+    @property
+    def nonce(self) -> int:
+        return self.transaction.nonce
+
+    @property
+    def gas_price(self) -> int:
+        return self.transaction.gas_price
+
+
+class RevalidationResult(NamedTuple):
+    dropped: Tuple[SignedTransactionAPI, ...]
+    pending_count: int
+    queued_count: int
+
+
+class PendingTransactions:
+    """
+    The transactions of a transaction pool, by hash, by sender and nonce, and by gas price.
+
+    A transaction is *pending* if it can be executed after the transactions of the same sender
+    with lower nonces, starting at the nonce of the sender's account, and *queued* if there is
+    a nonce gap. The pool holds at most ``max_size`` transactions; when it is full, the
+    transaction with the lowest gas price is evicted to make room for a better paying one.
+
+    Adding, replacing and evicting a transaction take ``O(log n)`` time. The price heap
+    is cleaned up lazily: entries of removed transactions are skipped when they reach the top,
+    and the heap is rebuilt when they make up most of it.
+    """
+
+    def __init__(self,
+                 max_size: int = MAX_POOLED_TRANSACTIONS,
+                 price_bump_percent: int = PRICE_BUMP_PERCENT) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be a positive integer: got {max_size}")
+        self._max_size = max_size
+        self._price_bump_percent = price_bump_percent
+
+        self._by_hash: Dict[Hash32, PooledTransaction] = {}
+        self._by_sender: Dict[Address, Dict[int, PooledTransaction]] = {}
+        self._price_heap: List[Tuple[int, int, Hash32]] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._by_hash)
+
+    def __contains__(self, transaction_hash: object) -> bool:
+        return transaction_hash in self._by_hash
+
+    def get(self, transaction_hash: Hash32) -> Optional[SignedTransactionAPI]:
+        try:
+            return self._by_hash[transaction_hash].transaction
+        except KeyError:
+            return None
+
+    @property
+    def senders(self) -> Tuple[Address, ...]:
+        return tuple(self._by_sender)
+
+    def get_sender_transactions(self, sender: Address) -> Tuple[SignedTransactionAPI, ...]:
+        """
+        Return the pooled transactions of ``sender``, ordered by nonce.
+        """
+        by_nonce = self._by_sender.get(sender, {})
+        return tuple(by_nonce[nonce].transaction for nonce in sorted(by_nonce))
+
+    def add(self,
+            transaction: SignedTransactionAPI,
+            transaction_hash: Hash32 = None) -> Tuple[SignedTransactionAPI, ...]:
+        """
+        Add ``transaction`` to the pool and return the transactions it replaced or evicted.
+        Raise a ``ValidationError`` if it is pooled already, if it doesn't pay enough to
+        replace the transaction with the same sender and nonce, or if the pool is full of
+        transactions that pay at least as much.
+        """
+        if transaction_hash is None:
+            transaction_hash = Hash32(transaction.hash)
+        if transaction_hash in self._by_hash:
+            raise ValidationError(f"Transaction {encode_hex(transaction_hash)} is pooled already")
+
+        sender = transaction.sender
+        by_nonce = self._by_sender.get(sender, {})
+        replaced = by_nonce.get(transaction.nonce)
+
+        if replaced is not None:
+            # like geth, require a strictly higher price even when the bump rounds down to zero
+            min_gas_price = max(
+                replaced.gas_price * (100 + self._price_bump_percent) // 100,
+                replaced.gas_price + 1,
+            )
+            if transaction.gas_price < min_gas_price:
+                raise ValidationError(
+                    f"Transaction {encode_hex(transaction_hash)} needs a gas price of at least "
+                    f"{min_gas_price} to replace {encode_hex(replaced.transaction_hash)}"
+                )
+        elif len(self._by_hash) >= self._max_size:
+            cheapest = self._get_cheapest()
+            if transaction.gas_price <= cheapest.gas_price:
+                raise ValidationError(
+                    f"Transaction {encode_hex(transaction_hash)} is underpriced for a full pool"
+                )
+
+        dropped = []
+        if replaced is not None:
+            self._remove(replaced)
+            dropped.append(replaced.transaction)
+
+        entry = PooledTransaction(transaction, transaction_hash, sender, next(self._sequence))
+        self._by_hash[transaction_hash] = entry
+        self._by_sender.setdefault(sender, {})[transaction.nonce] = entry
+        heapq.heappush(self._price_heap, (entry.gas_price, entry.sequence, transaction_hash))
+
+        while len(self._by_hash) > self._max_size:
+            evicted = self._get_cheapest()
+            self._remove(evicted)
+            dropped.append(evicted.transaction)
+
+        return tuple(dropped)
+
+    def remove(self, transaction_hash: Hash32) -> Optional[SignedTransactionAPI]:
+        try:
+            entry = self._by_hash[transaction_hash]
+        except KeyError:
+            return None
+        else:
+            self._remove(entry)
+            return entry.transaction
+
+    def revalidate(self,
+                   account_nonces: Mapping[Address, int],
+                   account_balances: Mapping[Address, int]) -> RevalidationResult:
+        """
+        Re-validate the pool against the state of a new chain head, given as the nonce and
+        balance of the account of every sender in the pool. Transactions with a nonce that
+        was used already, or that cost more than the balance of their sender, are dropped.
+        Senders without an account were pooled after the accounts were read, and are left
+        for the next re-validation.
+        """
+        dropped = []
+        pending_count = 0
+        for sender in self.senders:
+            if sender not in account_nonces:
+                continue
+            account_nonce = account_nonces[sender]
+            balance = account_balances[sender]
+            for entry in tuple(self._by_sender[sender].values()):
+                transaction = entry.transaction
+                cost = transaction.gas * transaction.gas_price + transaction.value
+                if transaction.nonce < account_nonce or cost > balance:
+                    self._remove(entry)
+                    dropped.append(transaction)
+            pending_count += sum(1 for _ in self._iter_pending_nonces(sender, account_nonce))
+
+        return RevalidationResult(
+            tuple(dropped),
+            pending_count,
+            len(self._by_hash) - pending_count,
+        )
+
+    def get_pending(self,
+                    sender: Address,
+                    account_nonce: int) -> Tuple[SignedTransactionAPI, ...]:
+        """
+        Return the transactions of ``sender`` that can be executed one after the other, starting
+        at ``account_nonce``.
+        """
+        by_nonce = self._by_sender.get(sender, {})
+        return tuple(
+            by_nonce[nonce].transaction
+            for nonce in self._iter_pending_nonces(sender, account_nonce)
+        )
+
+    def _iter_pending_nonces(self, sender: Address, account_nonce: int) -> Iterator[int]:
+        by_nonce = self._by_sender.get(sender, {})
+        nonce = account_nonce
+        while nonce in by_nonce:
+            yield nonce
+            nonce += 1
+
+    def _get_cheapest(self) -> PooledTransaction:
+        while True:
+            _, sequence, transaction_hash = self._price_heap[0]
+            entry = self._by_hash.get(transaction_hash)
+            if entry is not None and entry.sequence == sequence:
+                return entry
+            heapq.heappop(self._price_heap)
+
+    def _remove(self, entry: PooledTransaction) -> None:
+        del self._by_hash[entry.transaction_hash]
+        by_nonce = self._by_sender[entry.sender]
+        del by_nonce[entry.nonce]
+        if not by_nonce:
+            del self._by_sender[entry.sender]
+
+        # drop the entries of removed transactions from the heap once they are the majority
+        if len(self._price_heap) > 2 * len(self._by_hash) + 64:
+            self._price_heap = [
+                (pooled.gas_price, pooled.sequence, pooled.transaction_hash)
+                for pooled in self._by_hash.values()
+            ]
+            heapq.heapify(self._price_heap)
@@ -1,29 +1,49 @@
 import asyncio
 from typing import (
     Callable,
-    Iterable,
+    Dict,
     List,
     Sequence,
     Tuple,
 )
-import uuid
 
 from async_service import Service
 from lahja import EndpointAPI
+from trie.exceptions import MissingTrieNode
 
+from eth_typing import (
+    Address,
+    Hash32,
+)
+from eth_utils import ValidationError
 from eth_utils.toolz import partition_all
-from eth.abc import SignedTransactionAPI
+from eth.abc import (
+    BlockHeaderAPI,
+    ChainAPI,
+    SignedTransactionAPI,
+    TransactionFieldsAPI,
+)
+from eth.vm.forks.spurious_dragon.transactions import SpuriousDragonTransaction
 
 from p2p.abc import SessionAPI
 
-from trinity._utils.bloom import RollingBloom
 from trinity._utils.logging import get_logger
+from trinity.components.builtin.tx_pool.events import (
+    GetPendingTransactionRequest,
+    PendingTransactionResponse,
+)
+from trinity.components.builtin.tx_pool.pending import (
+    MAX_POOLED_TRANSACTIONS,
+    PendingTransactions,
+)
+from trinity.components.builtin.tx_pool.relay import TransactionRelay
+from trinity.db.sender_cache import TransactionSenderCache
 from trinity.protocol.eth.events import (
     TransactionsEvent,
     GetPooledTransactionsEvent,
+    NewPooledTransactionHashesEvent,
 )
 from trinity.protocol.eth.peer import (
-    ETHProxyPeer,
     ETHProxyPeerPool,
 )
 
@@ -40,6 +60,31 @@ BATCH_LOW_WATER = 100
 # at once.
 BATCH_HIGH_WATER = 200
 
+# How often we check whether the chain head changed, to re-validate the pooled transactions.
+HEAD_CHECK_INTERVAL = 1  # seconds
+
+
+def as_signed_transaction(transaction: TransactionFieldsAPI) -> SignedTransactionAPI:
+    """
+    Return ``transaction``, which may only hold the fields it was decoded from, as a transaction
+    that can recover its sender. The sender is recovered the same way in all forks since
+    Spurious Dragon, which accepts both EIP-155 and earlier signatures.
+    """
+    if isinstance(transaction, SignedTransactionAPI):
+        return transaction
+    else:
+        return SpuriousDragonTransaction(
+            nonce=transaction.nonce,
+            gas_price=transaction.gas_price,
+            gas=transaction.gas,
+            to=transaction.to,
+            value=transaction.value,
+            data=transaction.data,
+            v=transaction.v,
+            r=transaction.r,
+            s=transaction.s,
+        )
+
 
 class TxPool(Service):
     """
@@ -47,10 +92,10 @@ class TxPool(Service):
     of transactions, represented as :class:`~eth.abc.SignedTransactionAPI` among the
     connected peers.
 
-      .. note::
-
-        This is a minimal viable implementation that only relays transactions but doesn't actually
-        hold on to them yet. It's still missing many features of a grown up transaction pool.
+    The valid transactions are held in a bounded
+    :class:`~trinity.components.builtin.tx_pool.pending.PendingTransactions` pool, from which
+    ``GetPooledTransactions`` requests are served. If a ``chain`` is given, the pooled
+    transactions are re-validated against the state of every new chain head.
     """
     logger = get_logger('trinity.components.txpool.TxPool')
 
@@ -58,37 +103,22 @@ class TxPool(Service):
                  event_bus: EndpointAPI,
                  peer_pool: ETHProxyPeerPool,
                  tx_validation_fn: Callable[[SignedTransactionAPI], bool],
+                 sender_cache: TransactionSenderCache = None,
+                 chain: ChainAPI = None,
+                 max_pooled_transactions: int = MAX_POOLED_TRANSACTIONS,
                  ) -> None:
         self._event_bus = event_bus
         self._peer_pool = peer_pool
+        self._sender_cache = sender_cache
+        self._chain = chain
 
         if tx_validation_fn is None:
             raise ValueError('Must pass a tx validation function')
 
         self.tx_validation_fn = tx_validation_fn
 
-        # The effectiveness of the filter is based on the number of peers int the peer pool.
-        #
-        # Assuming 25 peers:
-        # - each transaction will get sent to at most 24 peers resulting in 24 entries in the BF
-        # - rough estimate of 100 transactions per block
-        # - 2400 BF entries per block-of-transactions
-        # - we'll target rotating the bloom filter every 10 minutes -> 40 blocks
-        #
-        # This gives a target generation size of 24 * 100 * 40 -> 96000 (round up to 100,000)
-        #
-        # We want our BF to remain effective for at least 24 hours -> 1440 min -> 144 generations
-        #
-        # Memory size can be computed as:
-
-        #
-        # bits_per_bloom = (-1 * generation_size * log(0.1)) / (log(2) ** 2) -> 479252
-        # kbytes_per_bloom = bits_per_bloom / 8 / 1024 -> 58
-        # kbytes_total = max_generations * kbytes_per_bloom -> 8424
-        #
-        # We can expect the maximum memory footprint to be about 8.5mb for the bloom filters.
-        self._bloom = RollingBloom(generation_size=100000, max_generations=144)
-        self._bloom_salt = uuid.uuid4()
+        self._relay = TransactionRelay()
+        self._pending = PendingTransactions(max_pooled_transactions)
         self._internal_queue: 'asyncio.Queue[Sequence[SignedTransactionAPI]]' = asyncio.Queue(2000)
 
     # This is a rather arbitrary value, but when the sync is operating normally we never see
@@ -106,21 +136,130 @@ class TxPool(Service):
         # Process GetPooledTransactions requests
         self.manager.run_daemon_task(self._process_get_pooled_transactions_requests)
 
+        # Track the transactions that peers announce to us
+        self.manager.run_daemon_task(self._process_transaction_announcements)
+
+        # Answer lookups of pooled transactions from other processes, e.g. JSON-RPC
+        self.manager.run_daemon_task(self._process_pending_transaction_requests)
+
+        if self._chain is not None:
+            self.manager.run_daemon_task(self._revalidate_on_new_head)
+
         async for event in self._event_bus.stream(TransactionsEvent):
             self.manager.run_task(self._handle_tx, event.session, event.command.payload)
 
     async def _process_get_pooled_transactions_requests(self) -> None:
 
         async for event in self._event_bus.stream(GetPooledTransactionsEvent):
+            # Only peers that speak a protocol with transaction announcements ask for them
+            self._relay.mark_announcing(event.session)
+
+            pooled_txs = self._get_pooled_transactions(event.command.payload)
+            self._relay.mark_known(event.session, event.command.payload)
             asking_peer = await self._peer_pool.ensure_proxy_peer(event.session)
-            asking_peer.eth_api.send_pooled_transactions([])
+            asking_peer.eth_api.send_pooled_transactions(pooled_txs)
 
-    async def _handle_tx(self, sender: SessionAPI, txs: Sequence[SignedTransactionAPI]) -> None:
+    async def _process_transaction_announcements(self) -> None:
 
-        self.logger.debug2('Received %d transactions from %s', len(txs), sender)
+        async for event in self._event_bus.stream(NewPooledTransactionHashesEvent):
+            self._relay.mark_announcing(event.session)
+            self._relay.mark_known(event.session, event.command.payload)
 
-        self._add_txs_to_bloom(sender, txs)
-        await self._internal_queue.put(txs)
+    async def _process_pending_transaction_requests(self) -> None:
+
+        async for request in self._event_bus.stream(GetPendingTransactionRequest):
+            await self._event_bus.broadcast(
+                PendingTransactionResponse(self._pending.get(request.transaction_hash)),
+                request.broadcast_config(),
+            )
+
+    def _get_pooled_transactions(
+            self,
+            tx_hashes: Sequence[Hash32]) -> List[SignedTransactionAPI]:
+        return [self._pending.get(tx_hash) for tx_hash in tx_hashes if tx_hash in self._pending]
+
+    async def _revalidate_on_new_head(self) -> None:
+        loop = asyncio.get_event_loop()
+        head_hash = None
+        while self.manager.is_running:
+            # The chain reads go over the database IPC, so they run in a thread
+            head = await loop.run_in_executor(None, self._chain.get_canonical_head)
+            if head.hash != head_hash:
+                head_hash = head.hash
+                await self._revalidate(head)
+            await asyncio.sleep(HEAD_CHECK_INTERVAL)
+
+    async def _revalidate(self, head: BlockHeaderAPI) -> None:
+        loop = asyncio.get_event_loop()
+        try:
+            nonces, balances = await loop.run_in_executor(
+                None,
+                self._get_accounts,
+                head,
+                self._pending.senders,
+            )
+        except MissingTrieNode as exc:
+            # e.g. during beam sync, when the state of the new head isn't available yet
+            self.logger.debug('Cannot re-validate pooled transactions at %s: %s', head, exc)
+            return
+
+        # The pool itself is only ever changed in the event loop
+        result = self._pending.revalidate(nonces, balances)
+        self.logger.debug(
+            'Re-validated pooled transactions at %s: %d pending, %d queued, %d dropped',
+            head,
+            result.pending_count,
+            result.queued_count,
+            len(result.dropped),
+        )
+
+    def _get_accounts(
+            self,
+            head: BlockHeaderAPI,
+            senders: Sequence[Address]) -> Tuple[Dict[Address, int], Dict[Address, int]]:
+        """
+        Return the nonces and balances of ``senders`` in the state of ``head``.
+        """
+        state = self._chain.get_vm(head).state
+        nonces = {sender: state.get_nonce(sender) for sender in senders}
+        balances = {sender: state.get_balance(sender) for sender in senders}
+        return nonces, balances
+
+    async def _handle_tx(self,
+                         sender: SessionAPI,
+                         received_txs: Sequence[TransactionFieldsAPI]) -> None:
+
+        self.logger.debug2('Received %d transactions from %s', len(received_txs), sender)
+
+        txs = tuple(as_signed_transaction(tx) for tx in received_txs)
+        tx_hashes = tuple(Hash32(tx.hash) for tx in txs)
+        self._relay.mark_known(sender, tx_hashes)
+
+        # Transactions that we pooled already were validated already
+        new_txs = tuple(
+            (tx_hash, tx) for tx_hash, tx in zip(tx_hashes, txs) if tx_hash not in self._pending
+        )
+        if self._sender_cache is not None:
+            # Most of these transactions end up in a block soon, which the syncer
+            # can then import without recovering their senders.
+            self._sender_cache.recover(tuple(tx for _, tx in new_txs))
+
+        # Validate every transaction once, instead of once for every peer it is relayed to,
+        # and relay only the transactions that made it into the pool.
+        pooled_txs = []
+        for tx_hash, tx in new_txs:
+            if not self.tx_validation_fn(tx):
+                self.logger.debug2('Dropping invalid transaction %s from %s', tx, sender)
+                continue
+            try:
+                self._pending.add(tx, tx_hash)
+            except ValidationError as exc:
+                self.logger.debug2('Not pooling transaction from %s: %s', sender, exc)
+            else:
+                pooled_txs.append(tx)
+
+        if pooled_txs:
+            await self._internal_queue.put(pooled_txs)
 
     async def _process_transactions(self) -> None:
         while self.manager.is_running:
@@ -141,49 +280,27 @@ class TxPool(Service):
             # Now that the queue is either empty or we have an adequate number
             # to send to our peers, broadcast them to the appropriate peers.
             for batch in partition_all(BATCH_HIGH_WATER, buffer):
-                peers = await self._peer_pool.get_peers()
-                for receiving_peer in peers:
-                    filtered_tx = self._filter_tx_for_peer(receiving_peer, batch)
-                    if len(filtered_tx) == 0:
+                batch_hashes = tuple(tx.hash for tx in batch)
+                peers = {peer.session: peer for peer in await self._peer_pool.get_peers()}
+                self._relay.retain_peers(peers)
+                for instruction in self._relay.plan(tuple(peers), batch, batch_hashes):
+                    receiving_peer = peers[instruction.session]
+                    if instruction.transactions:
+                        self.logger.debug2(
+                            'Relaying %d transactions to %s',
+                            len(instruction.transactions),
+                            receiving_peer,
+                        )
+                        receiving_peer.eth_api.send_transactions(instruction.transactions)
+                    else:
                         self.logger.debug2(
-                            '%d TXNS filtered down to ZERO for peer: %s',
-                            len(batch),
+                            'Announcing %d transactions to %s',
+                            len(instruction.announced_hashes),
                             receiving_peer,
                         )
-                        continue
-
-                    self.logger.debug2(
-                        'Relaying %d transactions to %s',
-                        len(filtered_tx),
-                        receiving_peer,
-                    )
-                    receiving_peer.eth_api.send_transactions(filtered_tx)
-                    self._add_txs_to_bloom(receiving_peer.session, filtered_tx)
+                        receiving_peer.eth_api.send_new_pooled_transaction_hashes(
+                            instruction.announced_hashes
+                        )
                     # release to the event loop since this loop processes a
                     # lot of data queue up a lot of outbound messages.
                     await asyncio.sleep(0)
-
-    def _filter_tx_for_peer(
-            self,
-            peer: ETHProxyPeer,
-            txs: Sequence[SignedTransactionAPI]) -> Tuple[SignedTransactionAPI, ...]:
-
-        return tuple(
-            val for val in txs
-            if self._construct_bloom_entry(peer.session, val) not in self._bloom
-            if self.tx_validation_fn(val)
-        )
-
-    def _construct_bloom_entry(self, session: SessionAPI, tx: SignedTransactionAPI) -> bytes:
-        return b':'.join((
-            session.id.bytes,
-            tx.hash,
-            self._bloom_salt.bytes,
-        ))
-
-    def _add_txs_to_bloom(self,
-                          session: SessionAPI,
-                          txs: Iterable[SignedTransactionAPI]) -> None:
-        for val in txs:
-            key = self._construct_bloom_entry(session, val)
-            self._bloom.add(key)
@@ -0,0 +1,170 @@
+import math
+import random
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from eth_typing import Hash32
+from eth.abc import SignedTransactionAPI
+
+from p2p.abc import SessionAPI
+
+
+# The number of transactions we remember to be known by a peer, either because it sent them to
+# us or because we sent or announced them to it. Roughly the same as what geth remembers.
+MAX_KNOWN_TRANSACTIONS_PER_PEER = 32768
+
+# The bytes of the transaction hash that identify a transaction in the per peer sets. A collision
+# means we don't relay a transaction to a peer that could have used it, which is harmless.
+KNOWN_TRANSACTION_KEY_SIZE = 8
+
+
+def get_known_transaction_key(transaction_hash: Hash32) -> int:
+    return int.from_bytes(transaction_hash[:KNOWN_TRANSACTION_KEY_SIZE], 'big')
+
+
+class KnownTransactions:
+    """
+    A bounded set of the transactions known to a single peer, by hash prefix. It is made of two
+    generations, the oldest of which is dropped at once when the current one is full, so that
+    adding and looking up a transaction never costs more than two set operations.
+    """
+
+    def __init__(self, max_size: int = MAX_KNOWN_TRANSACTIONS_PER_PEER) -> None:
+        if max_size < 2:
+            raise ValueError(f"max_size must be 2 or more: got {max_size}")
+        self._generation_size = max_size // 2
+        self._current: Set[int] = set()
+        self._previous: Set[int] = set()
+
+    def add(self, key: int) -> None:
+        if len(self._current) >= self._generation_size:
+            self._previous = self._current
+            self._current = set()
+        self._current.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._current or key in self._previous
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
+
+
+class RelayInstruction(NamedTuple):
+    """
+    What to send to a single peer: the full ``transactions`` or only the ``announced_hashes``
+    of transactions the peer can then request.
+    """
+    session: SessionAPI
+    transactions: Tuple[SignedTransactionAPI, ...]
+    announced_hashes: Tuple[Hash32, ...]
+
+
+class TransactionRelay:
+    """
+    Decide which transactions to relay to which peers, without sending any transaction to a peer
+    that is known to have it already.
+
+    Sending every transaction to every peer is wasteful, since most peers will get it from
+    somebody else as well. Like geth, we send the full transactions only to a random subset of
+    ``sqrt(n)`` of the ``n`` peers, and announce their hashes to the other peers, which request
+    the transactions they don't have yet. Only peers that are known to speak a protocol version
+    with transaction announcements, because they sent us an announcement or requested pooled
+    transactions, get announcements; any other peer gets the full transactions.
+    """
+
+    def __init__(self, max_known_per_peer: int = MAX_KNOWN_TRANSACTIONS_PER_PEER) -> None:
+        self._max_known_per_peer = max_known_per_peer
+        self._known: Dict[SessionAPI, KnownTransactions] = {}
+        self._announcing_sessions: Set[SessionAPI] = set()
+
+    def _get_known(self, session: SessionAPI) -> KnownTransactions:
+        try:
+            return self._known[session]
+        except KeyError:
+            known = self._known[session] = KnownTransactions(self._max_known_per_peer)
+            return known
+
+    def mark_known(self, session: SessionAPI, transaction_hashes: Iterable[Hash32]) -> None:
+        known = self._get_known(session)
+        for transaction_hash in transaction_hashes:
+            known.add(get_known_transaction_key(transaction_hash))
+
+    def is_known(self, session: SessionAPI, transaction_hash: Hash32) -> bool:
+        return get_known_transaction_key(transaction_hash) in self._get_known(session)
+
+    def mark_announcing(self, session: SessionAPI) -> None:
+        self._announcing_sessions.add(session)
+
+    def retain_peers(self, sessions: Iterable[SessionAPI]) -> None:
+        """
+        Forget about all peers other than ``sessions``, e.g. because they disconnected.
+        """
+        connected = set(sessions)
+        for session in tuple(self._known):
+            if session not in connected:
+                del self._known[session]
+        self._announcing_sessions &= connected
+
+    def select_full_transaction_peers(
+            self,
+            sessions: Sequence[SessionAPI]) -> Set[SessionAPI]:
+        full_transaction_count = math.ceil(math.sqrt(len(sessions)))
+        return set(random.sample(sessions, full_transaction_count))
+
+    def plan(self,
+             sessions: Sequence[SessionAPI],
+             transactions: Sequence[SignedTransactionAPI],
+             transaction_hashes: Sequence[Hash32] = None,
+             ) -> Tuple[RelayInstruction, ...]:
+        """
+        Return what to send to each of ``sessions`` to relay ``transactions``, which must have been
+        validated already, and remember the relayed transactions to be known to those peers.
+        Peers that know all the transactions already are left out.
+
+        The hashes of the transactions are computed once here unless ``transaction_hashes``
+        are given, since computing them is not free.
+        """
+        if transaction_hashes is None:
+            hashes = tuple(Hash32(transaction.hash) for transaction in transactions)
+        else:
+            hashes = tuple(transaction_hashes)
+        keys = tuple(get_known_transaction_key(transaction_hash) for transaction_hash in hashes)
+        full_transaction_sessions = self.select_full_transaction_peers(sessions)
+
+        instructions = []
+        for session in sessions:
+            known = self._get_known(session)
+            unknown_indices: List[int] = []
+            for index, key in enumerate(keys):
+                if key not in known:
+                    known.add(key)
+                    unknown_indices.append(index)
+
+            if not unknown_indices:
+                continue
+
+            should_announce = (
+                session in self._announcing_sessions and
+                session not in full_transaction_sessions
+            )
+            if should_announce:
+                instructions.append(RelayInstruction(
+                    session,
+                    (),
+                    tuple(hashes[index] for index in unknown_indices),
+                ))
+            else:
+                instructions.append(RelayInstruction(
+                    session,
+                    tuple(transactions[index] for index in unknown_indices),
+                    (),
+                ))
+
+        return tuple(instructions)
@@ -1,3 +1,4 @@
+import functools
 from typing import Callable, Tuple
 
 from cancel_token import CancelToken
@@ -19,6 +20,7 @@ GetAggregatableAttestationsFn = Callable[
     [Slot, CommitteeIndex], Tuple[Attestation, ...]
 ]
 ImportAttestationFn = Callable[[Attestation, bool], None]
+PruneAttestationsFn = Callable[[Slot], None]
 
 
 class ChainMaintainer(BaseService):
@@ -30,12 +32,17 @@ class ChainMaintainer(BaseService):
     starting_eth1_block_hash: Hash32
 
     def __init__(
-        self, chain: BaseBeaconChain, event_bus: EndpointAPI, token: CancelToken = None
+        self,
+        chain: BaseBeaconChain,
+        event_bus: EndpointAPI,
+        prune_attestations_fn: PruneAttestationsFn,
+        token: CancelToken = None,
     ) -> None:
         super().__init__(token)
         self.genesis_time = chain.get_head_state().genesis_time
         self.chain = chain
         self.event_bus = event_bus
+        self.prune_attestations = prune_attestations_fn
         config = self.chain.get_state_machine().config
         self.slots_per_epoch = config.SLOTS_PER_EPOCH
 
@@ -64,11 +71,11 @@ class ChainMaintainer(BaseService):
             try:
                 self._check_and_update_data_per_slot(event.slot)
                 if event.tick_type.is_start:
-                    pass
+                    self.prune_attestations(event.slot)
                 elif event.tick_type.is_one_third:
                     await self.handle_second_tick(event.slot)
                 elif event.tick_type.is_two_third:
-                    pass
+                    await self.handle_third_tick(event.slot)
             except ValidationError as e:
                 self.logger.warn("%s", e)
                 self.logger.warn(
@@ -82,6 +89,33 @@ class ChainMaintainer(BaseService):
         if state.slot < slot:
             self.skip_block(slot=slot, state=state, state_machine=state_machine)
 
+    async def handle_third_tick(self, slot: Slot) -> None:
+        # The epoch transition is the most expensive part of importing the first
+        # block of an epoch; run it ahead in the last slot of the epoch, so that the
+        # block and its gossip validation start from the cached epoch start state.
+        if (slot + 1) % self.slots_per_epoch == 0:
+            await self.precompute_epoch_transition(Slot(slot + 1))
+
+    async def precompute_epoch_transition(self, epoch_start_slot: Slot) -> None:
+        state = self.chain.get_head_state()
+        if state.slot >= epoch_start_slot:
+            return
+        state_machine = self.chain.get_state_machine(at_slot=epoch_start_slot)
+        # only the state transition runs in a thread; the database stays in the loop
+        await self._run_in_executor(
+            None,
+            functools.partial(
+                state_machine.state_transition.apply_state_transition,
+                state,
+                future_slot=epoch_start_slot,
+            ),
+        )
+        self.logger.debug(
+            "Precomputed the epoch transition to slot=%s from state of slot=%s",
+            epoch_start_slot,
+            state.slot,
+        )
+
     def skip_block(
         self, slot: Slot, state: BeaconState, state_machine: BaseBeaconStateMachine
     ) -> BeaconState:
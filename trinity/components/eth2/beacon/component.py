@@ -62,6 +62,14 @@ class BeaconNodeComponent(AsyncioIsolatedComponent):
         arg_parser.add_argument(
             "--bn-only", action="store_true", help="Run with BeaconNode only mode"
         )
+        arg_parser.add_argument(
+            "--state-snapshot-interval",
+            type=int,
+            help=(
+                "Store beacon states in full every this many epochs and all other "
+                "states as a diff to the latest full state (0 stores all states in full)"
+            ),
+        )
 
     @property
     def is_enabled(self) -> bool:
@@ -109,7 +117,10 @@ class BeaconNodeComponent(AsyncioIsolatedComponent):
             )
 
             chain_maintainer = ChainMaintainer(
-                chain=chain, event_bus=event_bus, token=libp2p_node.cancel_token
+                chain=chain,
+                event_bus=event_bus,
+                prune_attestations_fn=receive_server.prune_attestation_pools,
+                token=libp2p_node.cancel_token,
             )
 
             validator_handler = ValidatorHandler(
@@ -2,11 +2,13 @@ from abc import ABC, abstractmethod
 from typing import List, Optional, Sequence, Tuple
 
 from eth.abc import AtomicDatabaseAPI, DatabaseAPI
-from eth_typing import BlockNumber
+from eth_typing import BlockNumber, Hash32
 import ssz
 
+from eth2._utils.merkle.sparse import TreeDepth
 from eth2.beacon.types.deposit_data import DepositData
 
+from .deposit_tree import DepositTree
 from .exceptions import DepositDataDBValidationError
 
 
@@ -26,6 +28,16 @@ class BaseSchema(ABC):
     def make_highest_processed_block_number_lookup_key() -> bytes:
         ...
 
+    @staticmethod
+    @abstractmethod
+    def make_deposit_tree_node_lookup_key(level: int, index: int) -> bytes:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    def make_deposit_root_lookup_key(deposit_count: int) -> bytes:
+        ...
+
 
 class SchemaV1(BaseSchema):
     @staticmethod
@@ -40,6 +52,18 @@ class SchemaV1(BaseSchema):
     def make_highest_processed_block_number_lookup_key() -> bytes:
         return b"v1:deposit_data:highest_processed_block_number"
 
+    @staticmethod
+    def make_deposit_tree_node_lookup_key(level: int, index: int) -> bytes:
+        return (
+            b"v1:deposit_tree:node:"
+            + level.to_bytes(1, "big")
+            + index.to_bytes(8, "big")
+        )
+
+    @staticmethod
+    def make_deposit_root_lookup_key(deposit_count: int) -> bytes:
+        return b"v1:deposit_tree:root:" + deposit_count.to_bytes(8, "big")
+
 
 class BaseDepositDataDB(ABC):
     @property
@@ -68,6 +92,23 @@ class BaseDepositDataDB(ABC):
     ) -> Tuple[DepositData, ...]:
         ...
 
+    @abstractmethod
+    def get_deposit_root(self, deposit_count: int) -> Hash32:
+        """
+        Return the root of the deposit tree of the first ``deposit_count`` deposits.
+        """
+        ...
+
+    @abstractmethod
+    def get_deposit_proof(
+        self, deposit_count: int, deposit_index: int
+    ) -> Tuple[Hash32, ...]:
+        """
+        Return the proof of the deposit at ``deposit_index`` against
+        ``get_deposit_root(deposit_count)``.
+        """
+        ...
+
 
 def _validate_deposit_data_index(index: int, deposit_count: int) -> None:
     if index >= deposit_count:
@@ -103,6 +144,7 @@ class DepositDataDB(BaseDepositDataDB):
 
     _deposit_count: int
     _highest_processed_block_number: BlockNumber
+    _deposit_tree: DepositTree
 
     def __init__(
         self,
@@ -125,6 +167,7 @@ class DepositDataDB(BaseDepositDataDB):
         self._highest_processed_block_number = (
             self._get_highest_processed_block_number()
         )
+        self._deposit_tree = self._load_deposit_tree()
 
     @property
     def deposit_count(self) -> int:
@@ -148,6 +191,7 @@ class DepositDataDB(BaseDepositDataDB):
         with self.db.atomic_batch() as db:
             for index, data in enumerate(seq_deposit_data):
                 self._set_deposit_data(db, count + index, data)
+                self._add_to_deposit_tree(db, self._deposit_tree, data)
             self._set_deposit_count(db, new_count)
             self._set_highest_processed_block_number(db, block_number)
         self._deposit_count = new_count
@@ -174,6 +218,56 @@ class DepositDataDB(BaseDepositDataDB):
             self.get_deposit_data(index) for index in range(from_index, to_index)
         )
 
+    def get_deposit_root(self, deposit_count: int) -> Hash32:
+        return self._deposit_tree.get_root(deposit_count)
+
+    def get_deposit_proof(
+        self, deposit_count: int, deposit_index: int
+    ) -> Tuple[Hash32, ...]:
+        return self._deposit_tree.get_proof(deposit_count, deposit_index)
+
+    def _load_deposit_tree(self) -> DepositTree:
+        try:
+            layers = tuple(
+                tuple(
+                    Hash32(
+                        self.db[
+                            SchemaV1.make_deposit_tree_node_lookup_key(level, index)
+                        ]
+                    )
+                    for index in range(self.deposit_count >> level)
+                )
+                for level in range(TreeDepth + 1)
+            )
+            roots = tuple(
+                Hash32(self.db[SchemaV1.make_deposit_root_lookup_key(deposit_count)])
+                for deposit_count in range(1, self.deposit_count + 1)
+            )
+        except KeyError:
+            # Deposit data stored before the tree was persisted
+            return self._rebuild_deposit_tree()
+        return DepositTree(layers, roots)
+
+    def _rebuild_deposit_tree(self) -> DepositTree:
+        deposit_tree = DepositTree()
+        with self.db.atomic_batch() as db:
+            for index in range(self.deposit_count):
+                self._add_to_deposit_tree(
+                    db, deposit_tree, self.get_deposit_data(index)
+                )
+        return deposit_tree
+
+    @staticmethod
+    def _add_to_deposit_tree(
+        db: DatabaseAPI, deposit_tree: DepositTree, deposit_data: DepositData
+    ) -> None:
+        for level, index, node_hash in deposit_tree.add(deposit_data.hash_tree_root):
+            db[SchemaV1.make_deposit_tree_node_lookup_key(level, index)] = node_hash
+        deposit_count = deposit_tree.deposit_count
+        db[
+            SchemaV1.make_deposit_root_lookup_key(deposit_count)
+        ] = deposit_tree.get_root(deposit_count)
+
     def _get_deposit_count(self) -> int:
         key = SchemaV1.make_deposit_count_lookup_key()
         try:
@@ -259,6 +353,14 @@ class ListCachedDepositDataDB(BaseDepositDataDB):
             self.get_deposit_data(index) for index in range(from_index, to_index)
         )
 
+    def get_deposit_root(self, deposit_count: int) -> Hash32:
+        return self._db.get_deposit_root(deposit_count)
+
+    def get_deposit_proof(
+        self, deposit_count: int, deposit_index: int
+    ) -> Tuple[Hash32, ...]:
+        return self._db.get_deposit_proof(deposit_count, deposit_index)
+
     def _update_cache(self) -> None:
         if self.deposit_count != 0:
             self._cache_deposit_data = list(
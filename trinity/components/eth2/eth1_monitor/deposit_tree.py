@@ -0,0 +1,138 @@
+from typing import List, Sequence, Tuple
+
+from eth_typing import Hash32
+
+from eth2._utils.hash import hash_eth2
+from eth2._utils.merkle.sparse import EmptyNodeHashes, TreeDepth
+
+from .exceptions import DepositDataDBValidationError
+
+# The roots of empty subtrees by level, up to the root of the whole tree
+ZERO_HASHES = EmptyNodeHashes + (hash_eth2(EmptyNodeHashes[-1] + EmptyNodeHashes[-1]),)
+
+# A node of the tree, as `(level, index, node_hash)`. Leaves are at level 0.
+TreeNode = Tuple[int, int, Hash32]
+
+
+def _mix_in_length(root: Hash32, length: int) -> Hash32:
+    return hash_eth2(root + length.to_bytes(32, byteorder="little"))
+
+
+class DepositTree:
+    """
+    Incremental version of the sparse Merkle tree of the deposit contract.
+
+    Deposits are only ever appended, so a node whose subtree only holds leaves
+    before `deposit_count` never changes again. Only those complete nodes are
+    kept: `layers[level][index]` for every `index < deposit_count >> level`.
+    The tree as it was at any earlier `deposit_count` is made of complete nodes,
+    empty subtrees and the one path of incomplete nodes towards leaf
+    `deposit_count`, so its proofs take `TreeDepth` hashes. The root at every
+    `deposit_count` is kept as well.
+    """
+
+    def __init__(
+        self, layers: Sequence[Sequence[Hash32]] = (), roots: Sequence[Hash32] = ()
+    ) -> None:
+        self._layers: List[List[Hash32]] = [list(layer) for layer in layers]
+        self._layers.extend([] for _ in range(TreeDepth + 1 - len(self._layers)))
+        # the roots after every deposit, after the root of the empty tree
+        self._roots = [self._compute_root(0)] + list(roots)
+        if len(roots) != self.deposit_count:
+            raise DepositDataDBValidationError(
+                f"Got {len(roots)} deposit roots for {self.deposit_count} deposits"
+            )
+
+    @property
+    def deposit_count(self) -> int:
+        return len(self._layers[0])
+
+    def add(self, leaf: Hash32) -> Tuple[TreeNode, ...]:
+        """
+        Append ``leaf`` and return the nodes it completed, starting with itself.
+        """
+        index = self.deposit_count
+        node_hash = leaf
+        nodes = []
+        for level in range(TreeDepth + 1):
+            self._layers[level].append(node_hash)
+            nodes.append((level, index, node_hash))
+            if index % 2 == 0:
+                break
+            node_hash = hash_eth2(self._layers[level][index - 1] + node_hash)
+            index //= 2
+        self._roots.append(self._compute_root(self.deposit_count))
+        return tuple(nodes)
+
+    def get_root(self, deposit_count: int) -> Hash32:
+        """
+        Return the root of the tree of the first ``deposit_count`` leaves, with
+        the count mixed in like the deposit contract does.
+        """
+        self._validate_deposit_count(deposit_count)
+        return self._roots[deposit_count]
+
+    def _compute_root(self, deposit_count: int) -> Hash32:
+        incomplete_nodes = self._get_incomplete_nodes(deposit_count)
+        return _mix_in_length(
+            self._get_node(TreeDepth, 0, deposit_count, incomplete_nodes),
+            deposit_count,
+        )
+
+    def get_proof(self, deposit_count: int, index: int) -> Tuple[Hash32, ...]:
+        """
+        Return the proof of leaf ``index`` against ``get_root(deposit_count)``.
+        """
+        self._validate_deposit_count(deposit_count)
+        if index < 0 or index >= deposit_count:
+            raise DepositDataDBValidationError(
+                "`index` should be smaller than `deposit_count`: "
+                f"index={index}, deposit_count={deposit_count}"
+            )
+        incomplete_nodes = self._get_incomplete_nodes(deposit_count)
+        proof = tuple(
+            self._get_node(level, (index >> level) ^ 1, deposit_count, incomplete_nodes)
+            for level in range(TreeDepth)
+        )
+        return proof + (Hash32(deposit_count.to_bytes(32, byteorder="little")),)
+
+    def _validate_deposit_count(self, deposit_count: int) -> None:
+        if deposit_count < 0 or deposit_count > self.deposit_count:
+            raise DepositDataDBValidationError(
+                "`deposit_count` should not be larger than the number of deposits: "
+                f"deposit_count={deposit_count}, number of deposits={self.deposit_count}"
+            )
+
+    def _get_incomplete_nodes(self, deposit_count: int) -> Tuple[Hash32, ...]:
+        """
+        Return the node at every level whose subtree holds some, but not all of
+        the first ``deposit_count`` leaves, where there is one.
+        """
+        nodes = [ZERO_HASHES[0]]
+        for level in range(1, TreeDepth + 1):
+            if deposit_count % (1 << level):
+                index = deposit_count >> level
+                nodes.append(
+                    hash_eth2(
+                        self._get_node(level - 1, index * 2, deposit_count, nodes)
+                        + self._get_node(level - 1, index * 2 + 1, deposit_count, nodes)
+                    )
+                )
+            else:
+                nodes.append(ZERO_HASHES[level])
+        return tuple(nodes)
+
+    def _get_node(
+        self,
+        level: int,
+        index: int,
+        deposit_count: int,
+        incomplete_nodes: Sequence[Hash32],
+    ) -> Hash32:
+        complete_count = deposit_count >> level
+        if index < complete_count:
+            return self._layers[level][index]
+        elif index == complete_count and deposit_count % (1 << level):
+            return incomplete_nodes[level]
+        else:
+            return ZERO_HASHES[level]
@@ -12,10 +12,6 @@ from lahja import EndpointAPI
 import trio
 from web3 import Web3
 
-from eth2.beacon.tools.builder.validator import (
-    make_deposit_proof,
-    make_deposit_tree_and_root,
-)
 from eth2.beacon.types.deposit_data import DepositData
 from eth2.beacon.types.deposits import Deposit
 from eth2.beacon.types.eth1_data import Eth1Data
@@ -219,10 +215,7 @@ class Eth1Monitor(Service):
         # If we have processed the target block number, validate deposit root.
         if largest_block_number >= target_block_number:
             # Verify that the deposit data in db and the deposit data in contract match
-            deposit_data_in_range = self._db.get_deposit_data_range(
-                0, contract_deposit_count
-            )
-            _, deposit_root = make_deposit_tree_and_root(deposit_data_in_range)
+            deposit_root = self._db.get_deposit_root(contract_deposit_count)
             if contract_deposit_root != deposit_root:
                 raise DepositDataCorrupted(
                     "deposit root built locally mismatches the one in the contract on chain: "
@@ -251,10 +244,8 @@ class Eth1Monitor(Service):
             raise Eth1MonitorValidationError(
                 f"invalid `deposit_index`: deposit_index={deposit_index}"
             )
-        deposit_data_in_range = self._db.get_deposit_data_range(0, deposit_count)
-        tree, root = make_deposit_tree_and_root(deposit_data_in_range)
         return Deposit.create(
-            proof=make_deposit_proof(deposit_data_in_range, tree, root, deposit_index),
+            proof=self._db.get_deposit_proof(deposit_count, deposit_index),
             data=self._db.get_deposit_data(deposit_index),
         )
 
@@ -333,7 +324,7 @@ class Eth1Monitor(Service):
     ) -> None:
         """
         Store deposit data from the log in database, and increase the corresponding block's
-        `deposit_count`.
+        `deposit_count`. The deposit tree is extended with the deposit data as well.
         """
         seq_deposit_data = tuple(
             DepositData.create(
@@ -0,0 +1,39 @@
+from argparse import ArgumentParser, Namespace, _SubParsersAction
+import logging
+
+from eth.db.backends.level import LevelDB
+
+from eth2.beacon.db.chain import BeaconChainDB
+from trinity.config import BeaconAppConfig, TrinityConfig
+from trinity.extensibility import Application
+
+
+class PruneStatesComponent(Application):
+    """
+    Delete the beacon states from before the latest finalized block which are not
+    needed to rebuild any later state.
+    """
+
+    logger = logging.getLogger("trinity.components.eth2.prune_states")
+
+    @classmethod
+    def configure_parser(
+        cls, arg_parser: ArgumentParser, subparser: _SubParsersAction
+    ) -> None:
+        prune_parser = subparser.add_parser(
+            "prune-beacon-states",
+            help="Delete the beacon states from before the latest finalized block",
+        )
+        prune_parser.set_defaults(func=cls.prune_states)
+
+    @classmethod
+    def prune_states(cls, args: Namespace, trinity_config: TrinityConfig) -> None:
+        app_config = trinity_config.get_app_config(BeaconAppConfig)
+        chain_config = app_config.get_chain_config()
+
+        base_db = LevelDB(db_path=app_config.database_dir)
+        chaindb = BeaconChainDB(base_db, chain_config.genesis_config)
+
+        cls.logger.info("Pruning beacon states before the finalized block...")
+        pruned_count = chaindb.prune_states()
+        cls.logger.info("Pruned %d beacon states", pruned_count)
@@ -34,6 +34,10 @@ from trinity.components.builtin.import_export.component import (
 from trinity.components.builtin.json_rpc.component import (
     JsonRpcServerComponent,
 )
+from trinity.components.builtin.log_index.component import (
+    IndexLogsComponent,
+    LogIndexComponent,
+)
 from trinity.components.builtin.network_db.component import (
     NetworkDBComponent,
 )
@@ -55,6 +59,7 @@ from trinity.components.eth2.beacon_trio.component import (
 )
 from trinity.components.eth2.discv5.component import DiscV5Component
 from trinity.components.eth2.network_generator.component import NetworkGeneratorComponent
+from trinity.components.eth2.prune_states.component import PruneStatesComponent
 from trinity.components.builtin.tx_pool.component import (
     TxComponent,
 )
@@ -75,6 +80,7 @@ BEACON_NODE_COMPONENTS: Tuple[Type[BaseComponentAPI], ...] = (
     NetworkGeneratorComponent,
     DiscV5Component,
     FixUncleanShutdownComponent,
+    PruneStatesComponent,
 )
 
 
@@ -87,6 +93,8 @@ ETH1_NODE_COMPONENTS: Tuple[Type[BaseComponentAPI], ...] = (
     EthstatsComponent,
     ExportBlockComponent,
     ImportBlockComponent,
+    IndexLogsComponent,
+    LogIndexComponent,
     MetricsComponent,
     RequestServerComponent,
     SyncerComponent,
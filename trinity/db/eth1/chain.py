@@ -2,6 +2,8 @@ from abc import abstractmethod
 from typing import (
     Dict,
     Iterable,
+    List,
+    Optional,
     Sequence,
     Tuple,
     Type,
@@ -17,7 +19,17 @@ from eth.abc import (
 )
 from eth.db.chain import ChainDB
 
+from p2p.commands import EncodedRLP
+
 from trinity._utils.async_dispatch import async_method
+from trinity.db.eth1.encoded import (
+    HEADER_RECEIPT_ROOT_INDEX,
+    HEADER_TRANSACTION_ROOT_INDEX,
+    HEADER_UNCLES_HASH_INDEX,
+    get_encoded_uncles,
+    get_header_fields,
+    get_trie_list_values,
+)
 from trinity.db.eth1.header import BaseAsyncHeaderDB
 
 
@@ -26,6 +38,68 @@ class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
     Abstract base class for the async counterpart to ``ChainDatabaseAPI``.
     """
 
+    def get_encoded_block_bodies(
+            self,
+            block_hashes: Sequence[Hash32]) -> Tuple[Optional[EncodedRLP], ...]:
+        """
+        Return the RLP encoded body of each block in ``block_hashes``, as sent in a
+        ``BlockBodies`` message, or ``None`` for the blocks we don't have entirely.
+
+        The transactions and uncles are read as they are stored, with a few batched lookups
+        for all the blocks, and never decoded.
+        """
+        all_header_fields = get_header_fields(self.db, block_hashes)
+        present_fields = tuple(fields for fields in all_header_fields if fields is not None)
+        all_transactions = iter(get_trie_list_values(
+            self.db,
+            tuple(Hash32(fields[HEADER_TRANSACTION_ROOT_INDEX]) for fields in present_fields),
+        ))
+        all_uncles = iter(get_encoded_uncles(
+            self.db,
+            tuple(Hash32(fields[HEADER_UNCLES_HASH_INDEX]) for fields in present_fields),
+        ))
+
+        bodies: List[Optional[EncodedRLP]] = []
+        for header_fields in all_header_fields:
+            if header_fields is None:
+                bodies.append(None)
+                continue
+            transactions = next(all_transactions)
+            uncles = next(all_uncles)
+            if transactions is None or uncles is None:
+                bodies.append(None)
+            else:
+                bodies.append(EncodedRLP.from_encoded_items((
+                    EncodedRLP.from_encoded_items(transactions),
+                    uncles,
+                )))
+        return tuple(bodies)
+
+    def get_encoded_receipts(
+            self,
+            block_hashes: Sequence[Hash32]) -> Tuple[Optional[EncodedRLP], ...]:
+        """
+        Return the RLP encoded receipts of each block in ``block_hashes``, as sent in a
+        ``Receipts`` message, or ``None`` for the blocks we don't have entirely.
+        """
+        all_header_fields = get_header_fields(self.db, block_hashes)
+        all_receipts = iter(get_trie_list_values(
+            self.db,
+            tuple(
+                Hash32(fields[HEADER_RECEIPT_ROOT_INDEX])
+                for fields in all_header_fields
+                if fields is not None
+            ),
+        ))
+        encoded_receipts: List[Optional[EncodedRLP]] = []
+        for header_fields in all_header_fields:
+            receipts = None if header_fields is None else next(all_receipts)
+            if receipts is None:
+                encoded_receipts.append(None)
+            else:
+                encoded_receipts.append(EncodedRLP.from_encoded_items(receipts))
+        return tuple(encoded_receipts)
+
     @abstractmethod
     async def coro_exists(self, key: bytes) -> bool:
         ...
@@ -68,6 +142,18 @@ class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
     ) -> Tuple[ReceiptAPI, ...]:
         ...
 
+    @abstractmethod
+    async def coro_get_encoded_block_bodies(
+            self,
+            block_hashes: Sequence[Hash32]) -> Tuple[Optional[EncodedRLP], ...]:
+        ...
+
+    @abstractmethod
+    async def coro_get_encoded_receipts(
+            self,
+            block_hashes: Sequence[Hash32]) -> Tuple[Optional[EncodedRLP], ...]:
+        ...
+
 
 class AsyncChainDB(BaseAsyncChainDB):
     coro_exists = async_method(BaseAsyncChainDB.exists)
@@ -88,3 +174,5 @@ class AsyncChainDB(BaseAsyncChainDB):
     coro_get_block_transactions = async_method(BaseAsyncChainDB.get_block_transactions)
     coro_get_block_uncles = async_method(BaseAsyncChainDB.get_block_uncles)
     coro_get_receipts = async_method(BaseAsyncChainDB.get_receipts)
+    coro_get_encoded_block_bodies = async_method(BaseAsyncChainDB.get_encoded_block_bodies)
+    coro_get_encoded_receipts = async_method(BaseAsyncChainDB.get_encoded_receipts)
@@ -0,0 +1,160 @@
+"""
+Read the RLP encoded block data as it is stored in the database, without decoding it, to be
+served to peers as it is.
+"""
+import itertools
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from eth_typing import Hash32
+from eth.abc import DatabaseAPI
+from eth.constants import (
+    BLANK_ROOT_HASH,
+    EMPTY_UNCLE_HASH,
+)
+import rlp
+from rlp.sedes import big_endian_int
+from trie.constants import (
+    BLANK_NODE,
+    NODE_TYPE_BLANK,
+    NODE_TYPE_BRANCH,
+    NODE_TYPE_EXTENSION,
+    NODE_TYPE_LEAF,
+)
+from trie.utils.nibbles import nibbles_to_bytes
+from trie.utils.nodes import (
+    extract_key,
+    get_node_type,
+)
+
+# The encoding of an empty list, e.g. of the uncles of a block without uncles
+EMPTY_RLP_LIST = b'\xc0'
+
+# The position of the roots in a header, see eth.rlp.headers.BlockHeader
+HEADER_UNCLES_HASH_INDEX = 1
+HEADER_TRANSACTION_ROOT_INDEX = 4
+HEADER_RECEIPT_ROOT_INDEX = 5
+
+
+def multi_get(db: DatabaseAPI, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+    """
+    Look up all of ``keys`` with a single request if ``db`` supports it, e.g. a
+    :class:`~trinity.db.manager.DBClient`, returning ``None`` in place of each missing value.
+    """
+    try:
+        db_multi_get = getattr(db, 'multi_get')
+    except AttributeError:
+        return tuple(db.get(key) for key in keys)
+    else:
+        return db_multi_get(keys)
+
+
+def get_header_fields(db: DatabaseAPI,
+                      block_hashes: Sequence[Hash32]) -> Tuple[Optional[List[bytes]], ...]:
+    """
+    Return the still encoded fields of the headers of ``block_hashes``, or ``None`` for the
+    headers that are missing.
+    """
+    return tuple(
+        None if encoded_header is None else rlp.decode(encoded_header)
+        for encoded_header in multi_get(db, block_hashes)
+    )
+
+
+def get_encoded_uncles(db: DatabaseAPI,
+                       uncles_hashes: Sequence[Hash32]) -> Tuple[Optional[bytes], ...]:
+    """
+    Return the encoded list of uncles for each of ``uncles_hashes``, or ``None`` for the ones
+    that are missing.
+    """
+    stored_hashes = tuple(set(
+        uncles_hash for uncles_hash in uncles_hashes if uncles_hash != EMPTY_UNCLE_HASH
+    ))
+    stored_uncles = dict(zip(stored_hashes, multi_get(db, stored_hashes)))
+    return tuple(
+        EMPTY_RLP_LIST if uncles_hash == EMPTY_UNCLE_HASH else stored_uncles[uncles_hash]
+        for uncles_hash in uncles_hashes
+    )
+
+
+def get_trie_list_values(db: DatabaseAPI,
+                         root_hashes: Sequence[Hash32]) -> Tuple[Optional[Tuple[bytes, ...]], ...]:
+    """
+    Return the values of every trie in ``root_hashes`` that is keyed by the RLP encoded index of
+    the values, like the transaction and receipt tries, ordered by index. The value is ``None``
+    for tries with missing nodes.
+
+    Rather than looking up the values one by one from the root, the tries are walked
+    breadth first together, with a single database lookup for each level of all the tries.
+    """
+    values_by_trie: List[Optional[Dict[int, bytes]]] = [{} for _ in root_hashes]
+    # the nodes to visit: the index of their trie, the nibbles of their path and the node, or
+    # its hash if it still needs to be looked up
+    to_visit: List[Tuple[int, Tuple[int, ...], Any]] = [
+        (trie_index, (), root_hash)
+        for trie_index, root_hash in enumerate(root_hashes)
+        if root_hash != BLANK_ROOT_HASH
+    ]
+
+    while to_visit:
+        node_hashes = tuple(set(
+            node_or_hash for _, _, node_or_hash in to_visit if isinstance(node_or_hash, bytes)
+        ))
+        encoded_nodes = dict(zip(node_hashes, multi_get(db, node_hashes)))
+
+        next_to_visit = []
+        for trie_index, path, node_or_hash in to_visit:
+            values = values_by_trie[trie_index]
+            if values is None:
+                # a node of this trie was missing already
+                continue
+
+            if isinstance(node_or_hash, bytes):
+                encoded_node = encoded_nodes[node_or_hash]
+                if encoded_node is None:
+                    values_by_trie[trie_index] = None
+                    continue
+                node = rlp.decode(encoded_node)
+            else:
+                # small nodes are embedded in their parent
+                node = node_or_hash
+
+            node_type = get_node_type(node)
+            if node_type == NODE_TYPE_BLANK:
+                continue
+            elif node_type == NODE_TYPE_LEAF:
+                _set_list_value(values, path + tuple(extract_key(node)), node[1])
+            elif node_type == NODE_TYPE_EXTENSION:
+                next_to_visit.append((trie_index, path + tuple(extract_key(node)), node[1]))
+            elif node_type == NODE_TYPE_BRANCH:
+                for nibble, child in enumerate(node[:16]):
+                    if child != BLANK_NODE:
+                        next_to_visit.append((trie_index, path + (nibble,), child))
+                if node[16]:
+                    _set_list_value(values, path, node[16])
+            else:
+                raise Exception(f"Invariant: unknown trie node type {node_type}")
+
+        to_visit = next_to_visit
+
+    return tuple(
+        None if values is None else _get_ordered_values(values)
+        for values in values_by_trie
+    )
+
+
+def _set_list_value(values: Dict[int, bytes], path: Tuple[int, ...], value: bytes) -> None:
+    index = rlp.decode(nibbles_to_bytes(path), sedes=big_endian_int)
+    values[index] = value
+
+
+def _get_ordered_values(values: Dict[int, bytes]) -> Tuple[bytes, ...]:
+    # like py-evm, stop at the first missing index
+    indices = itertools.takewhile(values.__contains__, itertools.count())
+    return tuple(values[index] for index in indices)
@@ -0,0 +1,530 @@
+"""
+An index of the logs of the canonical chain, to find the blocks with logs of some addresses and
+topics without reading the receipts of every block in the queried range.
+
+The chain is split in sections of ``SECTION_SIZE`` blocks. Once all blocks of a section are
+``CONFIRMATIONS`` deep, the section is indexed by rotating the 2048 bit blooms of its headers
+into 2048 bit-vectors of ``SECTION_SIZE`` bits, one for every bit of the bloom, like geth's
+bloombits. The blocks whose bloom may contain a value are then found with a few bitwise ANDs of
+the three vectors of the bloom bits of the value, and a whole section is checked at once.
+
+Blooms have false positives, so optionally the exact list of the blocks with logs of every
+address, and of every topic at every position, is stored as well, at the cost of reading all
+receipts when indexing.
+
+The blocks after the last indexed section are checked against their header blooms directly.
+"""
+import functools
+import itertools
+import operator
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
+
+from eth.abc import ChainDatabaseAPI
+from eth.db.schema import SchemaV1
+from eth.exceptions import (
+    BlockNotFound,
+    HeaderNotFound,
+)
+from eth_typing import (
+    Address,
+    BlockNumber,
+    Hash32,
+)
+from eth_utils import (
+    big_endian_to_int,
+    encode_hex,
+    keccak,
+)
+from eth_utils.toolz import partition_all
+import rlp
+
+from trinity.db.eth1.encoded import (
+    HEADER_RECEIPT_ROOT_INDEX,
+    HEADER_TRANSACTION_ROOT_INDEX,
+    get_header_fields,
+    get_trie_list_values,
+    multi_get,
+)
+
+# The number of blocks in an indexed section, as in geth
+SECTION_SIZE = 4096
+
+# The number of blocks a section must be behind the head of the chain to be indexed, so that
+# indexed sections are never reorganized away
+CONFIRMATIONS = 256
+
+BLOOM_BITS = 2048
+
+# The position of the bloom in a header, see eth.rlp.headers.BlockHeader
+HEADER_BLOOM_INDEX = 6
+
+# The number of blocks whose headers or receipts are read with a single lookup
+READ_BATCH_SIZE = 512
+
+TOPIC_SIZE = 32
+
+# The prefix of an address in the postings, which are otherwise prefixed with a topic's position
+ADDRESS_POSTING_PREFIX = b'\xff'
+
+
+class LogIndexSchema:
+    @staticmethod
+    def make_section_count_key() -> bytes:
+        return b'log-index:section-count'
+
+    @staticmethod
+    def make_section_head_key(section: int) -> bytes:
+        return b'log-index:section-head:%d' % section
+
+    # The keys of the data of a section include the hash of its last block, so that the data of
+    # a section that was reorganized away is never read again
+    @staticmethod
+    def make_bloom_bits_key(bit: int, section_head_hash: Hash32) -> bytes:
+        return b'log-index:bloom-bits:%d:%s' % (bit, section_head_hash)
+
+    @staticmethod
+    def make_postings_key(value: bytes, section_head_hash: Hash32) -> bytes:
+        return b'log-index:postings:%s:%s' % (value, section_head_hash)
+
+
+class IndexedLog(NamedTuple):
+    address: Address
+    topics: Tuple[Hash32, ...]
+    data: bytes
+    block_number: BlockNumber
+    block_hash: Hash32
+    transaction_hash: Hash32
+    transaction_index: int
+    log_index: int
+
+
+class LogCriteria(NamedTuple):
+    """
+    The logs of any of ``addresses`` (or of any address if it is empty), whose topic at every
+    position is one of the topics at that position in ``topics`` (or any topic if it is empty).
+    """
+    addresses: Tuple[Address, ...] = ()
+    topics: Tuple[Tuple[Hash32, ...], ...] = ()
+
+    def get_groups(self) -> Tuple[Tuple[bytes, ...], ...]:
+        """
+        The groups of values of which a block must contain at least one each to have a match.
+        """
+        return tuple(group for group in (self.addresses,) + self.topics if group)
+
+    def get_posting_groups(self) -> Tuple[Tuple[bytes, ...], ...]:
+        """
+        Like :meth:`get_groups`, with the values as they are in the postings, which tell the
+        topics at different positions apart.
+        """
+        address_group = tuple(map(get_address_posting, self.addresses))
+        topic_groups = tuple(
+            tuple(get_topic_posting(position, topic) for topic in group)
+            for position, group in enumerate(self.topics)
+        )
+        return tuple(group for group in (address_group,) + topic_groups if group)
+
+    def matches(self, address: Address, topics: Sequence[Hash32]) -> bool:
+        if self.addresses and address not in self.addresses:
+            return False
+        if len(self.topics) > len(topics):
+            return False
+        return all(
+            not expected or topic in expected
+            for expected, topic in zip(self.topics, topics)
+        )
+
+
+def get_address_posting(address: Address) -> bytes:
+    return ADDRESS_POSTING_PREFIX + address
+
+
+def get_topic_posting(position: int, topic: Hash32) -> bytes:
+    return bytes([position]) + topic
+
+
+def get_bloom_bits(value: bytes) -> Tuple[int, int, int]:
+    """
+    Return the indices of the three bits that ``value`` sets in a bloom.
+    """
+    value_hash = keccak(value)
+    first, second, third = (
+        ((value_hash[index] << 8) | value_hash[index + 1]) % BLOOM_BITS
+        for index in (0, 2, 4)
+    )
+    return first, second, third
+
+
+def get_bloom_mask(value: bytes) -> int:
+    return sum(1 << bit for bit in set(get_bloom_bits(value)))
+
+
+def bloom_matches(bloom: int, criteria: LogCriteria) -> bool:
+    return all(
+        any(bloom & mask == mask for mask in map(get_bloom_mask, group))
+        for group in criteria.get_groups()
+    )
+
+
+def iter_vector_offsets(vector: int, section_size: int) -> Iterator[int]:
+    """
+    Return the offsets of the blocks that are set in ``vector``, of which the highest bit
+    is the first block of a section.
+    """
+    bits = format(vector, f'0{section_size}b')
+    offset = bits.find('1')
+    while offset != -1:
+        yield offset
+        offset = bits.find('1', offset + 1)
+
+
+def _encode_vector(vector: int) -> bytes:
+    return vector.to_bytes((vector.bit_length() + 7) // 8, 'big')
+
+
+# The postings of a value are encoded as the offsets of its blocks if they are few, or as the
+# bit-vector of the blocks otherwise, after a byte that tells which
+OFFSETS_ENCODING = b'\x00'
+VECTOR_ENCODING = b'\x01'
+
+
+def _encode_postings(offsets: Set[int], section_size: int) -> bytes:
+    if len(offsets) * 2 < section_size // 8:
+        return OFFSETS_ENCODING + b''.join(offset.to_bytes(2, 'big') for offset in sorted(offsets))
+    else:
+        vector = sum(1 << (section_size - 1 - offset) for offset in offsets)
+        return VECTOR_ENCODING + _encode_vector(vector)
+
+
+def _decode_postings(encoded: bytes, section_size: int) -> int:
+    if encoded[:1] == VECTOR_ENCODING:
+        return big_endian_to_int(encoded[1:])
+
+    vector = 0
+    for index in range(1, len(encoded), 2):
+        offset = int.from_bytes(encoded[index:index + 2], 'big')
+        vector |= 1 << (section_size - 1 - offset)
+    return vector
+
+
+def _decode_section_head(section_head: bytes) -> Tuple[Hash32, bool]:
+    return Hash32(section_head[:32]), section_head[32:] == b'\x01'
+
+
+def _get_log_values(
+        encoded_receipt: bytes) -> Iterator[Tuple[Address, Tuple[Hash32, ...], bytes]]:
+    _, _, _, logs = rlp.decode(encoded_receipt)
+    for address, topics, data in logs:
+        # topics are encoded as integers, without their leading zeros
+        padded_topics = tuple(Hash32(topic.rjust(TOPIC_SIZE, b'\0')) for topic in topics)
+        yield Address(address), padded_topics, data
+
+
+class LogIndex:
+    """
+    Index the logs of the canonical chain of ``chaindb`` and find them again.
+    See the module docstring.
+    """
+
+    def __init__(self,
+                 chaindb: ChainDatabaseAPI,
+                 section_size: int = SECTION_SIZE,
+                 confirmations: int = CONFIRMATIONS,
+                 index_postings: bool = False) -> None:
+        if section_size < 1 or section_size > 2 ** 16 or section_size % 8:
+            raise ValueError(
+                f"section_size must be a multiple of 8 up to 2**16: got {section_size}"
+            )
+        self._chaindb = chaindb
+        self._db = chaindb.db
+        self.section_size = section_size
+        self.confirmations = confirmations
+        self.index_postings = index_postings
+
+    #
+    # Indexing
+    #
+    def get_section_count(self) -> int:
+        """
+        Return the number of indexed sections, all of which are from the start of the chain.
+        """
+        try:
+            return big_endian_to_int(self._db[LogIndexSchema.make_section_count_key()])
+        except KeyError:
+            return 0
+
+    def get_indexable_section_count(self) -> int:
+        head_number = self._chaindb.get_canonical_head().block_number
+        return max(0, head_number + 1 - self.confirmations) // self.section_size
+
+    def index_next_section(self) -> bool:
+        """
+        Index the first section that is not indexed yet, if all its blocks are confirmed, and
+        return whether it did. Sections that were reorganized away are dropped first.
+        """
+        section = self._drop_reorganized_sections()
+        if section >= self.get_indexable_section_count():
+            return False
+
+        first_block = section * self.section_size
+        block_numbers = range(first_block, first_block + self.section_size)
+        block_hashes = self._get_canonical_hashes(block_numbers)
+        header_fields = self._get_header_fields(block_hashes)
+
+        # Rotate the blooms: the k-th character of every bloom string is bit 2047 - k
+        bloom_strings = (
+            format(big_endian_to_int(fields[HEADER_BLOOM_INDEX]), f'0{BLOOM_BITS}b')
+            for fields in header_fields
+        )
+        vectors = tuple(
+            int(''.join(column), 2)
+            for column in zip(*bloom_strings)
+        )
+
+        section_head_hash = block_hashes[-1]
+        with self._db.atomic_batch() as batch:
+            for position, vector in enumerate(vectors):
+                if vector:
+                    bit = BLOOM_BITS - 1 - position
+                    key = LogIndexSchema.make_bloom_bits_key(bit, section_head_hash)
+                    batch[key] = _encode_vector(vector)
+
+            if self.index_postings:
+                postings = self._get_postings(header_fields)
+                for value, offsets in postings.items():
+                    key = LogIndexSchema.make_postings_key(value, section_head_hash)
+                    batch[key] = _encode_postings(offsets, self.section_size)
+
+            # a flag after the hash of the last block tells whether the section has postings
+            section_head = section_head_hash + (b'\x01' if self.index_postings else b'\x00')
+            batch[LogIndexSchema.make_section_head_key(section)] = section_head
+            batch[LogIndexSchema.make_section_count_key()] = (section + 1).to_bytes(8, 'big')
+
+        return True
+
+    def _drop_reorganized_sections(self) -> int:
+        section_count = self.get_section_count()
+        canonical_head_number = self._chaindb.get_canonical_head().block_number
+        while section_count:
+            last_section = section_count - 1
+            head_number = BlockNumber((last_section + 1) * self.section_size - 1)
+            section_head = self._db[LogIndexSchema.make_section_head_key(last_section)]
+            # the canonical hashes of the block numbers after the head of a shorter chain that
+            # replaced a longer one are not deleted, so they can't be trusted
+            if head_number <= canonical_head_number:
+                try:
+                    canonical_hash = self._chaindb.get_canonical_block_hash(head_number)
+                except HeaderNotFound:
+                    canonical_hash = None
+                if canonical_hash == section_head[:32]:
+                    break
+            section_count = last_section
+
+        if section_count != self.get_section_count():
+            self._db[LogIndexSchema.make_section_count_key()] = section_count.to_bytes(8, 'big')
+        return section_count
+
+    def _get_postings(self, header_fields: Sequence[List[bytes]]) -> Dict[bytes, Set[int]]:
+        postings: Dict[bytes, Set[int]] = {}
+        receipt_roots = tuple(Hash32(fields[HEADER_RECEIPT_ROOT_INDEX]) for fields in header_fields)
+        all_receipts = self._get_trie_values(receipt_roots, "receipts")
+        for offset, receipts in enumerate(all_receipts):
+            for receipt in receipts:
+                for address, topics, _ in _get_log_values(receipt):
+                    postings.setdefault(get_address_posting(address), set()).add(offset)
+                    for position, topic in enumerate(topics):
+                        posting = get_topic_posting(position, topic)
+                        postings.setdefault(posting, set()).add(offset)
+        return postings
+
+    #
+    # Queries
+    #
+    def find_candidate_blocks(self,
+                              from_block: BlockNumber,
+                              to_block: BlockNumber,
+                              criteria: LogCriteria) -> Iterator[BlockNumber]:
+        """
+        Return the canonical blocks from ``from_block`` to ``to_block`` that may contain logs
+        that match ``criteria``, in order. With postings, the blocks of indexed sections are
+        only returned if they have logs of all the addresses and topics of ``criteria``.
+        """
+        if from_block > to_block:
+            return
+
+        indexed_end = self.get_section_count() * self.section_size
+        if from_block < indexed_end:
+            yield from self._find_indexed_candidates(
+                from_block,
+                BlockNumber(min(to_block, indexed_end - 1)),
+                criteria,
+            )
+
+        if to_block >= indexed_end:
+            yield from self._find_unindexed_candidates(
+                BlockNumber(max(from_block, indexed_end)),
+                to_block,
+                criteria,
+            )
+
+    def _find_indexed_candidates(self,
+                                 from_block: BlockNumber,
+                                 to_block: BlockNumber,
+                                 criteria: LogCriteria) -> Iterator[BlockNumber]:
+        sections = range(from_block // self.section_size, to_block // self.section_size + 1)
+        groups = criteria.get_groups()
+        posting_groups = criteria.get_posting_groups()
+        section_heads = multi_get(
+            self._db,
+            tuple(map(LogIndexSchema.make_section_head_key, sections)),
+        )
+
+        # read all the vectors of all the sections at once
+        keys: List[bytes] = []
+        for section_head in section_heads:
+            section_head_hash, has_postings = _decode_section_head(section_head)
+            if has_postings:
+                keys.extend(
+                    LogIndexSchema.make_postings_key(value, section_head_hash)
+                    for value in itertools.chain.from_iterable(posting_groups)
+                )
+            else:
+                keys.extend(
+                    LogIndexSchema.make_bloom_bits_key(bit, section_head_hash)
+                    for value in itertools.chain.from_iterable(groups)
+                    for bit in set(get_bloom_bits(value))
+                )
+        values = dict(zip(keys, multi_get(self._db, keys)))
+
+        full_vector = (1 << self.section_size) - 1
+        for section, section_head in zip(sections, section_heads):
+            section_head_hash, has_postings = _decode_section_head(section_head)
+            section_vector = full_vector
+            for group in posting_groups if has_postings else groups:
+                group_vector = 0
+                for value in group:
+                    if has_postings:
+                        key = LogIndexSchema.make_postings_key(value, section_head_hash)
+                        if values[key] is not None:
+                            group_vector |= _decode_postings(values[key], self.section_size)
+                    else:
+                        group_vector |= self._get_value_vector(values, value, section_head_hash)
+                section_vector &= group_vector
+                if not section_vector:
+                    break
+
+            first_block = section * self.section_size
+            for offset in iter_vector_offsets(section_vector, self.section_size):
+                block_number = first_block + offset
+                if from_block <= block_number <= to_block:
+                    yield BlockNumber(block_number)
+
+    def _get_value_vector(self,
+                          values: Dict[bytes, Optional[bytes]],
+                          value: bytes,
+                          section_head_hash: Hash32) -> int:
+        keys = (
+            LogIndexSchema.make_bloom_bits_key(bit, section_head_hash)
+            for bit in set(get_bloom_bits(value))
+        )
+        encoded_vectors = tuple(values[key] for key in keys)
+        if any(encoded is None for encoded in encoded_vectors):
+            return 0
+        else:
+            return functools.reduce(operator.and_, map(big_endian_to_int, encoded_vectors))
+
+    def _find_unindexed_candidates(self,
+                                   from_block: BlockNumber,
+                                   to_block: BlockNumber,
+                                   criteria: LogCriteria) -> Iterator[BlockNumber]:
+        block_numbers = range(from_block, to_block + 1)
+        for batch in partition_all(READ_BATCH_SIZE, block_numbers):
+            block_hashes = self._get_canonical_hashes(batch)
+            for block_number, fields in zip(batch, self._get_header_fields(block_hashes)):
+                if bloom_matches(big_endian_to_int(fields[HEADER_BLOOM_INDEX]), criteria):
+                    yield BlockNumber(block_number)
+
+    def find_logs(self,
+                  from_block: BlockNumber,
+                  to_block: BlockNumber,
+                  criteria: LogCriteria) -> Iterator[IndexedLog]:
+        """
+        Return the logs of the canonical blocks from ``from_block`` to ``to_block`` that match
+        ``criteria``, in the order of the chain. Only the receipts of the blocks whose bloom
+        matches ``criteria`` are read, a batch of blocks at a time and without decoding the
+        transactions.
+        """
+        candidates = self.find_candidate_blocks(from_block, to_block, criteria)
+        for batch in partition_all(READ_BATCH_SIZE, candidates):
+            block_hashes = self._get_canonical_hashes(batch)
+            header_fields = self._get_header_fields(block_hashes)
+            all_receipts = self._get_trie_values(
+                tuple(Hash32(fields[HEADER_RECEIPT_ROOT_INDEX]) for fields in header_fields),
+                "receipts",
+            )
+            all_transactions = self._get_trie_values(
+                tuple(Hash32(fields[HEADER_TRANSACTION_ROOT_INDEX]) for fields in header_fields),
+                "transactions",
+            )
+            for block_number, block_hash, receipts, transactions in zip(
+                    batch, block_hashes, all_receipts, all_transactions):
+                log_index = itertools.count()
+                for transaction_index, receipt in enumerate(receipts):
+                    for address, topics, data in _get_log_values(receipt):
+                        index = next(log_index)
+                        if criteria.matches(address, topics):
+                            yield IndexedLog(
+                                address,
+                                topics,
+                                data,
+                                BlockNumber(block_number),
+                                block_hash,
+                                Hash32(keccak(transactions[transaction_index])),
+                                transaction_index,
+                                index,
+                            )
+
+    #
+    # Reads
+    #
+    def _get_canonical_hashes(self, block_numbers: Sequence[int]) -> Tuple[Hash32, ...]:
+        keys = tuple(
+            SchemaV1.make_block_number_to_hash_lookup_key(BlockNumber(block_number))
+            for block_number in block_numbers
+        )
+        encoded_hashes = multi_get(self._db, keys)
+        missing = tuple(
+            number for number, encoded in zip(block_numbers, encoded_hashes) if encoded is None
+        )
+        if missing:
+            raise HeaderNotFound(f"No canonical header for block number #{missing[0]}")
+        return tuple(
+            Hash32(rlp.decode(encoded_hash, sedes=rlp.sedes.binary))
+            for encoded_hash in encoded_hashes
+        )
+
+    def _get_header_fields(self, block_hashes: Sequence[Hash32]) -> Tuple[List[bytes], ...]:
+        header_fields = get_header_fields(self._db, block_hashes)
+        for block_hash, fields in zip(block_hashes, header_fields):
+            if fields is None:
+                raise HeaderNotFound(f"No header with hash {encode_hex(block_hash)} found")
+        return cast(Tuple[List[bytes], ...], header_fields)
+
+    def _get_trie_values(self,
+                         root_hashes: Sequence[Hash32],
+                         name: str) -> Tuple[Tuple[bytes, ...], ...]:
+        values = get_trie_list_values(self._db, root_hashes)
+        for root_hash, root_values in zip(root_hashes, values):
+            if root_values is None:
+                raise BlockNotFound(f"Missing {name} with trie root {encode_hex(root_hash)}")
+        return cast(Tuple[Tuple[bytes, ...], ...], values)
@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import enum
 import errno
@@ -9,7 +10,12 @@ import struct
 import threading
 from types import TracebackType
 from typing import (
+    Any,
+    Dict,
     Iterator,
+    Optional,
+    Sequence,
+    Tuple,
     Type,
 )
 
@@ -25,6 +31,7 @@ from eth.db.diff import DBDiffTracker, DBDiff, DiffMissingError
 
 from trinity._utils.ipc import wait_for_ipc
 from trinity._utils.socket import BufferedSocket, IPCSocketServer
+from trinity.db.read_cache import SharedReadCache, attach_read_cache
 
 
 @enum.unique
@@ -34,6 +41,9 @@ class Operation(enum.Enum):
     DELETE = b'\x02'
     EXISTS = b'\x03'
     ATOMIC_BATCH = b'\x04'
+    MULTI_GET = b'\x05'
+    MULTI_EXISTS = b'\x06'
+    PIPELINED = b'\x07'
 
 
 GET = Operation.GET
@@ -112,10 +122,62 @@ ATOMIC_BATCH Response:
 - Success Byte: 0x01
 """
 
+MULTI_GET = Operation.MULTI_GET
+"""
+MULTI_GET Request:
+
+- Operation Byte: 0x05
+- Key Count: 4-byte little endian
+- Key Sizes: Array of 4-byte little endian
+- Keys: Array of raw bytes
+
+MULTI_GET Response:
+
+- Success Byte: 0x01
+- Value Sizes: Array of 4-byte little endian, ``0xffffffff`` for missing keys
+- Values: Array of raw bytes (present keys only)
+"""
+
+MULTI_EXISTS = Operation.MULTI_EXISTS
+"""
+MULTI_EXISTS Request:
+
+- Operation Byte: 0x06
+- Key Count: 4-byte little endian
+- Key Sizes: Array of 4-byte little endian
+- Keys: Array of raw bytes
+
+MULTI_EXISTS Response:
+
+- Success Byte: 0x01
+- Results: Array of response bytes, True: 0x01 or False: 0x00
+"""
+
+PIPELINED = Operation.PIPELINED
+"""
+PIPELINED Request:
+
+- Operation Byte: 0x07
+- Request ID: 4-byte little endian
+- Request: any complete non-PIPELINED request
+
+PIPELINED Response:
+
+- Request ID: 4-byte little endian
+- Response: the response to the wrapped request
+
+A client may send any number of PIPELINED requests without waiting for their
+responses and match each response to its request by ID.  The server answers
+requests on a connection in the order they were received, coalescing the
+responses to requests that were already buffered into a single write.
+"""
+
 
 LEN_BYTES = 4
 DOUBLE_LEN_BYTES = 2 * LEN_BYTES
 
+MISSING_VALUE_SIZE = 2 ** (8 * LEN_BYTES) - 1
+
 
 SUCCESS_BYTE = b'\x01'
 FAIL_BYTE = b'\x00'
@@ -137,14 +199,26 @@ class DBManager(IPCSocketServer):
     """
     logger = logging.getLogger('trinity.db.manager.DBManager')
 
-    def __init__(self, db: AtomicDatabaseAPI):
+    def __init__(self, db: AtomicDatabaseAPI, read_cache: SharedReadCache = None):
         """
         The AtomicDatabaseAPI that this wraps must be threadsafe.
+
+        If a ``read_cache`` is given, every key that is written or deleted is
+        invalidated in it before the write is acknowledged.
         """
         super().__init__()
         self.db = db
+        self.read_cache = read_cache
+
+    def _invalidate(self, keys: Sequence[bytes]) -> None:
+        if self.read_cache is not None:
+            self.read_cache.invalidate(keys)
 
     def serve_conn(self, sock: BufferedSocket) -> None:
+        # Responses are held back while more requests are already waiting in
+        # the socket buffer, so a pipelining client gets them in one write.
+        pending_responses = []
+
         while self.is_running:
             try:
                 operation_byte = sock.read_exactly(1)
@@ -157,38 +231,58 @@ class DBManager(IPCSocketServer):
 
             try:
                 operation = Operation(operation_byte)
-            except TypeError:
+            except ValueError:
                 self.logger.error("Unrecognized database operation: %s", operation_byte.hex())
                 break
 
             try:
-                if operation is GET:
-                    self.handle_GET(sock)
-                elif operation is SET:
-                    self.handle_SET(sock)
-                elif operation is DELETE:
-                    self.handle_DELETE(sock)
-                elif operation is EXISTS:
-                    self.handle_EXISTS(sock)
-                elif operation is ATOMIC_BATCH:
-                    self.handle_ATOMIC_BATCH(sock)
+                if operation is PIPELINED:
+                    request_id = sock.read_exactly(LEN_BYTES)
+                    inner_operation = Operation(sock.read_exactly(1))
+                    if inner_operation is PIPELINED:
+                        self.logger.error("Nested PIPELINED requests are not supported")
+                        break
+                    response = request_id + self.handle_operation(inner_operation, sock)
                 else:
-                    self.logger.error("Got unhandled operation %s", operation)
+                    response = self.handle_operation(operation, sock)
             except Exception as err:
                 self.logger.exception("Unhandled error during operation %s: %s", operation, err)
                 raise
 
-    def handle_GET(self, sock: BufferedSocket) -> None:
+            pending_responses.append(response)
+            if not sock.has_buffered_data:
+                sock.sendall(b''.join(pending_responses))
+                pending_responses.clear()
+
+    def handle_operation(self, operation: Operation, sock: BufferedSocket) -> bytes:
+        if operation is GET:
+            return self.handle_GET(sock)
+        elif operation is SET:
+            return self.handle_SET(sock)
+        elif operation is DELETE:
+            return self.handle_DELETE(sock)
+        elif operation is EXISTS:
+            return self.handle_EXISTS(sock)
+        elif operation is ATOMIC_BATCH:
+            return self.handle_ATOMIC_BATCH(sock)
+        elif operation is MULTI_GET:
+            return self.handle_MULTI_GET(sock)
+        elif operation is MULTI_EXISTS:
+            return self.handle_MULTI_EXISTS(sock)
+        else:
+            raise Exception(f"Got unhandled operation {operation}")
+
+    def handle_GET(self, sock: BufferedSocket) -> bytes:
         key_size_data = sock.read_exactly(LEN_BYTES)
         key = sock.read_exactly(int.from_bytes(key_size_data, 'little'))
         try:
             value = self.db[key]
         except KeyError:
-            sock.sendall(FAIL_BYTE)
+            return FAIL_BYTE
         else:
-            sock.sendall(SUCCESS_BYTE + len(value).to_bytes(LEN_BYTES, 'little') + value)
+            return SUCCESS_BYTE + len(value).to_bytes(LEN_BYTES, 'little') + value
 
-    def handle_SET(self, sock: BufferedSocket) -> None:
+    def handle_SET(self, sock: BufferedSocket) -> bytes:
         key_and_value_size_data = sock.read_exactly(DOUBLE_LEN_BYTES)
         key_size, value_size = struct.unpack('<II', key_and_value_size_data)
         combined_size = key_size + value_size
@@ -196,27 +290,29 @@ class DBManager(IPCSocketServer):
         key = key_and_value_data[:key_size]
         value = key_and_value_data[key_size:]
         self.db[key] = value
-        sock.sendall(SUCCESS_BYTE)
+        self._invalidate((key,))
+        return SUCCESS_BYTE
 
-    def handle_DELETE(self, sock: BufferedSocket) -> None:
+    def handle_DELETE(self, sock: BufferedSocket) -> bytes:
         key_size_data = sock.read_exactly(LEN_BYTES)
         key = sock.read_exactly(int.from_bytes(key_size_data, 'little'))
         try:
             del self.db[key]
         except KeyError:
-            sock.sendall(FAIL_BYTE)
+            return FAIL_BYTE
         else:
-            sock.sendall(SUCCESS_BYTE)
+            self._invalidate((key,))
+            return SUCCESS_BYTE
 
-    def handle_EXISTS(self, sock: BufferedSocket) -> None:
+    def handle_EXISTS(self, sock: BufferedSocket) -> bytes:
         key_size_data = sock.read_exactly(LEN_BYTES)
         key = sock.read_exactly(int.from_bytes(key_size_data, 'little'))
         if key in self.db:
-            sock.sendall(SUCCESS_BYTE)
+            return SUCCESS_BYTE
         else:
-            sock.sendall(FAIL_BYTE)
+            return FAIL_BYTE
 
-    def handle_ATOMIC_BATCH(self, sock: BufferedSocket) -> None:
+    def handle_ATOMIC_BATCH(self, sock: BufferedSocket) -> bytes:
         kv_pair_and_delete_count_data = sock.read_exactly(DOUBLE_LEN_BYTES)
         kv_pair_count, delete_count = struct.unpack('<II', kv_pair_and_delete_count_data)
         total_kv_count = 2 * kv_pair_count
@@ -231,6 +327,7 @@ class DBManager(IPCSocketServer):
             kv_sizes = kv_and_delete_sizes[:total_kv_count]
             delete_sizes = kv_and_delete_sizes[total_kv_count:total_kv_count + delete_count]
 
+            written_keys = []
             with self.db.atomic_batch() as batch:
                 for key_size, value_size in partition(2, kv_sizes):
                     combined_size = key_size + value_size
@@ -238,19 +335,122 @@ class DBManager(IPCSocketServer):
                     key = key_and_value_data[:key_size]
                     value = key_and_value_data[key_size:]
                     batch[key] = value
+                    written_keys.append(key)
                 for key_size in delete_sizes:
                     key = sock.read_exactly(key_size)
                     del batch[key]
+                    written_keys.append(key)
+            self._invalidate(written_keys)
+
+        return SUCCESS_BYTE
+
+    def handle_MULTI_GET(self, sock: BufferedSocket) -> bytes:
+        keys = _read_keys(sock)
+        values = []
+        for key in keys:
+            try:
+                values.append(self.db[key])
+            except KeyError:
+                values.append(None)
+
+        value_sizes = tuple(
+            MISSING_VALUE_SIZE if value is None else len(value)
+            for value in values
+        )
+        return b''.join((
+            SUCCESS_BYTE,
+            struct.pack('<' + 'I' * len(value_sizes), *value_sizes),
+            *(value for value in values if value is not None),
+        ))
+
+    def handle_MULTI_EXISTS(self, sock: BufferedSocket) -> bytes:
+        keys = _read_keys(sock)
+        return SUCCESS_BYTE + b''.join(
+            SUCCESS_BYTE if key in self.db else FAIL_BYTE
+            for key in keys
+        )
+
+
+def _read_keys(sock: BufferedSocket) -> Tuple[bytes, ...]:
+    key_count = int.from_bytes(sock.read_exactly(LEN_BYTES), 'little')
+    if key_count == 0:
+        return ()
+    key_sizes = struct.unpack('<' + 'I' * key_count, sock.read_exactly(LEN_BYTES * key_count))
+    keys_data = sock.read_exactly(sum(key_sizes))
+    return tuple(_split_by_sizes(keys_data, key_sizes))
+
+
+def _split_by_sizes(data: bytes, sizes: Sequence[int]) -> Iterator[bytes]:
+    offset = 0
+    for size in sizes:
+        yield data[offset:offset + size]
+        offset += size
 
-        sock.sendall(SUCCESS_BYTE)
+
+def encode_multi_key_request(operation: Operation, keys: Sequence[bytes]) -> bytes:
+    """
+    Encode a MULTI_GET or MULTI_EXISTS request for ``keys``.
+    """
+    key_sizes = tuple(len(key) for key in keys)
+    return b''.join((
+        operation.value,
+        struct.pack('<I' + 'I' * len(key_sizes), len(key_sizes), *key_sizes),
+        *keys,
+    ))
+
+
+def encode_atomic_batch_request(diff: DBDiff) -> bytes:
+    """
+    Encode an ATOMIC_BATCH request that applies ``diff``.
+    """
+    pending_deletes = diff.deleted_keys()
+    pending_kv_pairs = diff.pending_items()
+
+    kv_pair_count = len(pending_kv_pairs)
+    delete_count = len(pending_deletes)
+
+    kv_sizes = tuple(len(item) for item in itertools.chain(*pending_kv_pairs))
+    delete_sizes = tuple(len(key) for key in pending_deletes)
+
+    # We encode all of the *sizes* in one shot using `struct.pack` and this
+    # dynamically constructed format string.
+    fmt_str = '<II' + 'I' * (len(kv_sizes) + len(pending_deletes))
+    kv_pair_count_and_size_data = struct.pack(
+        fmt_str,
+        kv_pair_count,
+        delete_count,
+        *kv_sizes,
+        *delete_sizes,
+    )
+    kv_and_delete_data = b''.join(itertools.chain(*pending_kv_pairs, pending_deletes))
+    return ATOMIC_BATCH.value + kv_pair_count_and_size_data + kv_and_delete_data
+
+
+def decode_multi_get_values(value_sizes_data: bytes,
+                            values_data: bytes) -> Tuple[Optional[bytes], ...]:
+    value_sizes = struct.unpack('<' + 'I' * (len(value_sizes_data) // LEN_BYTES), value_sizes_data)
+    values = iter(_split_by_sizes(
+        values_data,
+        tuple(size for size in value_sizes if size != MISSING_VALUE_SIZE),
+    ))
+    return tuple(
+        None if size == MISSING_VALUE_SIZE else next(values)
+        for size in value_sizes
+    )
+
+
+def _total_value_size(value_sizes_data: bytes) -> int:
+    value_sizes = struct.unpack('<' + 'I' * (len(value_sizes_data) // LEN_BYTES), value_sizes_data)
+    return sum(size for size in value_sizes if size != MISSING_VALUE_SIZE)
 
 
 class DBClient(BaseAtomicDB):
     logger = logging.getLogger('trinity.db.client.DBClient')
 
-    def __init__(self, sock: socket.socket):
+    def __init__(self, sock: socket.socket, read_cache: SharedReadCache = None):
         self._socket = BufferedSocket(sock)
         self._lock = threading.Lock()
+        self._read_cache = read_cache
 
     def __enter__(self) -> None:
         self._socket.__enter__()
@@ -262,6 +462,12 @@ class DBClient(BaseAtomicDB):
         self._socket.__exit__(exc_type, exc_value, exc_tb)
 
     def __getitem__(self, key: bytes) -> bytes:
+        if self._read_cache is not None:
+            cached_value = self._read_cache.get(key)
+            if cached_value is not None:
+                return cached_value
+            cache_version = self._read_cache.get_version(key)
+
         with self._lock:
             self._socket.sendall(GET.value + len(key).to_bytes(LEN_BYTES, 'little') + key)
             result_byte = self._socket.read_exactly(1)
@@ -269,12 +475,15 @@ class DBClient(BaseAtomicDB):
             if result_byte == SUCCESS_BYTE:
                 value_size_data = self._socket.read_exactly(LEN_BYTES)
                 value = self._socket.read_exactly(int.from_bytes(value_size_data, 'little'))
-                return value
             elif result_byte == FAIL_BYTE:
                 raise KeyError(key)
             else:
                 raise Exception(f"Unknown result byte: {result_byte.hex}")
 
+        if self._read_cache is not None:
+            self._read_cache.insert(key, value, cache_version)
+        return value
+
     def __setitem__(self, key: bytes, value: bytes) -> None:
         with self._lock:
             self._socket.sendall(
@@ -295,6 +504,9 @@ class DBClient(BaseAtomicDB):
             raise Exception(f"Unknown result byte: {result_byte.hex}")
 
     def _exists(self, key: bytes) -> bool:
+        if self._read_cache is not None and self._read_cache.get(key) is not None:
+            return True
+
         with self._lock:
             self._socket.sendall(EXISTS.value + len(key).to_bytes(4, 'little') + key)
             result_byte = self._socket.read_exactly(1)
@@ -306,35 +518,59 @@ class DBClient(BaseAtomicDB):
         else:
             raise Exception(f"Unknown result byte: {result_byte.hex}")
 
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        """
+        Look up all of ``keys`` in a single round trip, returning ``None`` in
+        place of each missing value.
+        """
+        if self._read_cache is None:
+            return self._multi_get_uncached(keys)
+
+        values = [self._read_cache.get(key) for key in keys]
+        missing_indices = tuple(index for index, value in enumerate(values) if value is None)
+        if missing_indices:
+            missing_keys = tuple(keys[index] for index in missing_indices)
+            cache_versions = tuple(self._read_cache.get_version(key) for key in missing_keys)
+            fetched_values = self._multi_get_uncached(missing_keys)
+            for index, key, version, value in zip(
+                    missing_indices,
+                    missing_keys,
+                    cache_versions,
+                    fetched_values):
+                values[index] = value
+                if value is not None:
+                    self._read_cache.insert(key, value, version)
+
+        return tuple(values)
+
+    def _multi_get_uncached(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        with self._lock:
+            self._socket.sendall(encode_multi_key_request(MULTI_GET, keys))
+            Result(self._socket.read_exactly(1))
+            value_sizes_data = self._socket.read_exactly(LEN_BYTES * len(keys))
+            values_data = self._socket.read_exactly(_total_value_size(value_sizes_data))
+
+        return decode_multi_get_values(value_sizes_data, values_data)
+
+    def multi_exists(self, keys: Sequence[bytes]) -> Tuple[bool, ...]:
+        """
+        Check for the presence of all of ``keys`` in a single round trip.
+        """
+        with self._lock:
+            self._socket.sendall(encode_multi_key_request(MULTI_EXISTS, keys))
+            Result(self._socket.read_exactly(1))
+            results = self._socket.read_exactly(len(keys))
+
+        return tuple(result == SUCCESS_BYTE[0] for result in results)
+
     @contextlib.contextmanager
     def atomic_batch(self) -> Iterator['AtomicBatch']:
         batch = AtomicBatch(self)
         yield batch
         diff = batch.finalize()
-        pending_deletes = diff.deleted_keys()
-        pending_kv_pairs = diff.pending_items()
-
-        kv_pair_count = len(pending_kv_pairs)
-        delete_count = len(pending_deletes)
-
-        kv_sizes = tuple(len(item) for item in itertools.chain(*pending_kv_pairs))
-        delete_sizes = tuple(len(key) for key in pending_deletes)
-
-        # We encode all of the *sizes* in one shot using `struct.pack` and this
-        # dynamically constructed format string.
-        fmt_str = '<II' + 'I' * (len(kv_sizes) + len(pending_deletes))
-        kv_pair_count_and_size_data = struct.pack(
-            fmt_str,
-            kv_pair_count,
-            delete_count,
-            *kv_sizes,
-            *delete_sizes,
-        )
-        kv_and_delete_data = b''.join(itertools.chain(*pending_kv_pairs, pending_deletes))
+        request = encode_atomic_batch_request(diff)
         with self._lock:
-            self._socket.sendall(
-                ATOMIC_BATCH.value + kv_pair_count_and_size_data + kv_and_delete_data
-            )
+            self._socket.sendall(request)
             Result(self._socket.read_exactly(1))
 
     def close(self) -> None:
@@ -346,14 +582,20 @@ class DBClient(BaseAtomicDB):
             if e.errno != errno.ENOTCONN:
                 raise
         self._socket.close()
+        if self._read_cache is not None:
+            self._read_cache.close()
 
     @classmethod
     def connect(cls, path: pathlib.Path, timeout: int = 5) -> "DBClient":
+        """
+        Connect to the :class:`DBManager` serving ``path``, reading through its
+        shared read cache if it runs with one.
+        """
         wait_for_ipc(path, timeout)
         s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         cls.logger.debug("Opened connection to %s: %s", path, s)
         s.connect(str(path))
-        return cls(s)
+        return cls(s, attach_read_cache(path))
 
 
 class AtomicBatch(BaseDB):
@@ -410,6 +652,145 @@ class AtomicBatch(BaseDB):
         return diff
 
 
+class AsyncDBClient:
+    """
+    An asyncio client for :class:`DBManager` which wraps every request in a
+    PIPELINED request, so that any number of requests can be in flight over a
+    single connection.  Responses are routed back to their callers by request ID.
+    """
+    logger = logging.getLogger('trinity.db.client.AsyncDBClient')
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._request_ids = itertools.count()
+        self._pending: Dict[bytes, Tuple[Operation, int, 'asyncio.Future[Any]']] = {}
+        self._response_reader = asyncio.ensure_future(self._read_responses())
+
+    async def coro_get(self, key: bytes) -> bytes:
+        value = await self._request(GET, GET.value + len(key).to_bytes(LEN_BYTES, 'little') + key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    async def coro_set(self, key: bytes, value: bytes) -> None:
+        await self._request(
+            SET,
+            SET.value + struct.pack('<II', len(key), len(value)) + key + value,
+        )
+
+    async def coro_delete(self, key: bytes) -> None:
+        was_deleted = await self._request(
+            DELETE,
+            DELETE.value + len(key).to_bytes(LEN_BYTES, 'little') + key,
+        )
+        if not was_deleted:
+            raise KeyError(key)
+
+    async def coro_exists(self, key: bytes) -> bool:
+        return await self._request(
+            EXISTS,
+            EXISTS.value + len(key).to_bytes(LEN_BYTES, 'little') + key,
+        )
+
+    async def coro_multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        return await self._request(
+            MULTI_GET,
+            encode_multi_key_request(MULTI_GET, keys),
+            len(keys),
+        )
+
+    async def coro_multi_exists(self, keys: Sequence[bytes]) -> Tuple[bool, ...]:
+        return await self._request(
+            MULTI_EXISTS,
+            encode_multi_key_request(MULTI_EXISTS, keys),
+            len(keys),
+        )
+
+    async def coro_apply_diff(self, diff: DBDiff) -> None:
+        """
+        Atomically apply all changes in ``diff`` to the database.
+        """
+        await self._request(ATOMIC_BATCH, encode_atomic_batch_request(diff))
+
+    async def _request(self, operation: Operation, request: bytes, key_count: int = 0) -> Any:
+        if self._response_reader.done():
+            raise ConnectionError("Connection to the database manager is closed")
+
+        request_id = (next(self._request_ids) % MISSING_VALUE_SIZE).to_bytes(LEN_BYTES, 'little')
+        future: 'asyncio.Future[Any]' = asyncio.get_event_loop().create_future()
+        self._pending[request_id] = (operation, key_count, future)
+        self._writer.write(PIPELINED.value + request_id + request)
+        await self._writer.drain()
+        return await future
+
+    async def _read_responses(self) -> None:
+        try:
+            while True:
+                request_id = await self._reader.readexactly(LEN_BYTES)
+                pending = self._pending.pop(request_id, None)
+                if pending is None:
+                    # the size of a response depends on its request, so the rest of
+                    # the stream can't be read
+                    self.logger.error(
+                        "%s: got a response to unknown request %s, closing the connection",
+                        self,
+                        request_id.hex(),
+                    )
+                    break
+                operation, key_count, future = pending
+                result = await self._read_result(operation, key_count)
+                if not future.done():
+                    future.set_result(result)
+        except (asyncio.IncompleteReadError, ConnectionError) as err:
+            self.logger.debug("%s: connection closed: %s", self, err)
+        finally:
+            self._writer.close()
+            for _, _, future in self._pending.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError("Connection to the database manager was closed")
+                    )
+            self._pending.clear()
+
+    async def _read_result(self, operation: Operation, key_count: int) -> Any:
+        result_byte = await self._reader.readexactly(1)
+
+        if operation is GET:
+            if result_byte == FAIL_BYTE:
+                return None
+            value_size_data = await self._reader.readexactly(LEN_BYTES)
+            return await self._reader.readexactly(int.from_bytes(value_size_data, 'little'))
+        elif operation in (SET, ATOMIC_BATCH):
+            Result(result_byte)
+            return None
+        elif operation in (DELETE, EXISTS):
+            return Result(result_byte) is SUCCESS
+        elif operation is MULTI_GET:
+            Result(result_byte)
+            value_sizes_data = await self._reader.readexactly(LEN_BYTES * key_count)
+            values_data = await self._reader.readexactly(_total_value_size(value_sizes_data))
+            return decode_multi_get_values(value_sizes_data, values_data)
+        elif operation is MULTI_EXISTS:
+            Result(result_byte)
+            results = await self._reader.readexactly(key_count)
+            return tuple(result == SUCCESS_BYTE[0] for result in results)
+        else:
+            raise Exception(f"Got unhandled operation {operation}")
+
+    def close(self) -> None:
+        self._response_reader.cancel()
+        self._writer.close()
+
+    @classmethod
+    async def connect(cls, path: pathlib.Path, timeout: int = 5) -> "AsyncDBClient":
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, wait_for_ipc, path, timeout)
+        reader, writer = await asyncio.open_unix_connection(str(path))
+        cls.logger.debug("Opened connection to %s", path)
+        return cls(reader, writer)
+
+
 def _run() -> None:
     from eth.db.backends.level import LevelDB
     from eth.db.chain import ChainDB
@@ -0,0 +1,404 @@
+import contextlib
+import fcntl
+import logging
+import mmap
+import os
+import pathlib
+import struct
+import threading
+from typing import (
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+import zlib
+
+
+READ_CACHE_MAGIC = b'TRNRDC01'
+
+# magic, bucket count, ways per bucket, max key size, max value size,
+# hits, misses, evictions, invalidations
+HEADER_FORMAT = '<8sIIIIQQQQ'
+HEADER_SIZE = 64
+STATS_OFFSET = struct.calcsize('<8sIIII')
+
+# seqlock counter, invalidation version, CLOCK hand
+BUCKET_HEADER_FORMAT = '<QQI'
+BUCKET_HEADER_SIZE = struct.calcsize(BUCKET_HEADER_FORMAT)
+VERSION_OFFSET = 8
+HAND_OFFSET = 16
+
+# flags, key length, value length
+ENTRY_HEADER_FORMAT = '<BBI'
+ENTRY_HEADER_SIZE = struct.calcsize(ENTRY_HEADER_FORMAT)
+
+FLAG_USED = 0b01
+FLAG_REFERENCED = 0b10
+
+DEFAULT_WAYS = 8
+DEFAULT_MAX_KEY_SIZE = 64
+DEFAULT_MAX_VALUE_SIZE = 1024
+
+READ_RETRIES = 3
+
+
+class ReadCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+def get_read_cache_path(database_ipc_path: pathlib.Path) -> pathlib.Path:
+    """
+    Return the path of the shared read cache that belongs to the database
+    served at ``database_ipc_path``.
+    """
+    return database_ipc_path.with_name(database_ipc_path.name + '.cache')
+
+
+class SharedReadCache:
+    """
+    A bounded, cross-process cache of database reads, backed by a memory
+    mapped file.
+
+    The cache is a set-associative hash table of fixed size entries.  Readers
+    never wait for a lock: every bucket carries a sequence counter which writers
+    make odd while they modify the bucket, so a reader that observes a change
+    retries or treats the read as a miss.  Writers serialize on a file lock.
+
+    Every bucket also carries a version that is bumped whenever one of its keys
+    is invalidated.  A client records the version before it fetches a value
+    over the socket and :meth:`insert` drops the value if the version has
+    changed since, so a write that races with a read can never leave a stale
+    value behind.
+
+    Entries are evicted with the CLOCK algorithm.  Keys and values larger than
+    the configured maximums are never cached.  The hit and miss counters are
+    shared by all processes and are updated without locking, so they are
+    approximate.
+    """
+    logger = logging.getLogger('trinity.db.read_cache.SharedReadCache')
+
+    def __init__(self, path: pathlib.Path, mapped: mmap.mmap, fd: int) -> None:
+        self.path = path
+        self._mmap = mapped
+        self._fd = fd
+        self._thread_lock = threading.Lock()
+
+        (
+            magic,
+            self._bucket_count,
+            self._ways,
+            self._max_key_size,
+            self._max_value_size,
+            *_,
+        ) = struct.unpack_from(HEADER_FORMAT, mapped, 0)
+        if magic != READ_CACHE_MAGIC:
+            raise ValueError(f"{path} is not a read cache file")
+
+        self._entry_size = ENTRY_HEADER_SIZE + self._max_key_size + self._max_value_size
+        self._bucket_size = BUCKET_HEADER_SIZE + self._ways * self._entry_size
+
+    @classmethod
+    def create(cls,
+               path: pathlib.Path,
+               size: int,
+               ways: int = DEFAULT_WAYS,
+               max_key_size: int = DEFAULT_MAX_KEY_SIZE,
+               max_value_size: int = DEFAULT_MAX_VALUE_SIZE) -> 'SharedReadCache':
+        """
+        Create a new, empty cache of at most ``size`` bytes at ``path``,
+        replacing any cache that was left there before.
+        """
+        if max_key_size > 255:
+            raise ValueError(f"Maximum key size must fit in a byte, got {max_key_size}")
+
+        entry_size = ENTRY_HEADER_SIZE + max_key_size + max_value_size
+        bucket_size = BUCKET_HEADER_SIZE + ways * entry_size
+        bucket_count = (size - HEADER_SIZE) // bucket_size
+        if bucket_count < 1:
+            raise ValueError(f"A read cache of {size} bytes is too small to hold a single bucket")
+
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+
+        with open(path, 'w+b') as cache_file:
+            cache_file.truncate(HEADER_SIZE + bucket_count * bucket_size)
+            cache_file.write(struct.pack(
+                HEADER_FORMAT,
+                READ_CACHE_MAGIC,
+                bucket_count,
+                ways,
+                max_key_size,
+                max_value_size,
+                0, 0, 0, 0,
+            ))
+
+        cls.logger.info(
+            "Created read cache at %s with %d buckets of %d entries",
+            path,
+            bucket_count,
+            ways,
+        )
+        return cls.attach(path)
+
+    @classmethod
+    def attach(cls, path: pathlib.Path) -> 'SharedReadCache':
+        """
+        Open the existing cache at ``path``.
+        """
+        fd = os.open(str(path), os.O_RDWR)
+        try:
+            mapped = mmap.mmap(fd, 0)
+        except Exception:
+            os.close(fd)
+            raise
+        return cls(path, mapped, fd)
+
+    #
+    # Reads (never blocked by writers)
+    #
+    def get(self, key: bytes) -> Optional[bytes]:
+        """
+        Return the cached value for ``key``, or ``None`` if it isn't cached.
+        """
+        if len(key) > self._max_key_size:
+            return None
+
+        bucket_offset = self._get_bucket_offset(key)
+        for _ in range(READ_RETRIES):
+            seq = self._read_u64(bucket_offset)
+            if seq & 1:
+                continue
+
+            entry_offset, value = self._find(bucket_offset, key)
+
+            if self._read_u64(bucket_offset) != seq:
+                continue
+            elif value is None:
+                break
+            else:
+                if not self._mmap[entry_offset] & FLAG_REFERENCED:
+                    self._mark_referenced(bucket_offset, key)
+                self._increment_stat(0)
+                return value
+
+        self._increment_stat(1)
+        return None
+
+    def get_version(self, key: bytes) -> int:
+        """
+        Return the invalidation version of the bucket that ``key`` belongs to.
+        Must be read before the value that is later handed to :meth:`insert`
+        is fetched from the database.
+        """
+        return self._read_u64(self._get_bucket_offset(key) + VERSION_OFFSET)
+
+    def get_stats(self) -> ReadCacheStats:
+        return ReadCacheStats(*struct.unpack_from('<QQQQ', self._mmap, STATS_OFFSET))
+
+    #
+    # Writes
+    #
+    def insert(self, key: bytes, value: bytes, version: int) -> None:
+        """
+        Cache ``value`` for ``key``, unless the key was invalidated after
+        ``version`` was read with :meth:`get_version`.
+        """
+        if len(key) > self._max_key_size or len(value) > self._max_value_size:
+            return
+
+        bucket_offset = self._get_bucket_offset(key)
+        with self._write_lock():
+            if self._read_u64(bucket_offset + VERSION_OFFSET) != version:
+                return
+
+            with self._modifying(bucket_offset):
+                entry_offset, _ = self._find(bucket_offset, key)
+                if entry_offset is None:
+                    entry_offset = self._claim_entry(bucket_offset)
+
+                struct.pack_into(
+                    ENTRY_HEADER_FORMAT,
+                    self._mmap,
+                    entry_offset,
+                    FLAG_USED,
+                    len(key),
+                    len(value),
+                )
+                key_offset = entry_offset + ENTRY_HEADER_SIZE
+                self._mmap[key_offset:key_offset + len(key)] = key
+                value_offset = key_offset + self._max_key_size
+                self._mmap[value_offset:value_offset + len(value)] = value
+
+    def invalidate(self, keys: Iterable[bytes]) -> None:
+        """
+        Drop ``keys`` from the cache, and make any concurrent :meth:`insert`
+        of them that started before this call a no-op.
+        """
+        invalidation_count = 0
+        with self._write_lock():
+            for key in keys:
+                bucket_offset = self._get_bucket_offset(key)
+                with self._modifying(bucket_offset):
+                    version_offset = bucket_offset + VERSION_OFFSET
+                    struct.pack_into(
+                        '<Q',
+                        self._mmap,
+                        version_offset,
+                        self._read_u64(version_offset) + 1,
+                    )
+                    if len(key) <= self._max_key_size:
+                        entry_offset, _ = self._find(bucket_offset, key)
+                        if entry_offset is not None:
+                            self._mmap[entry_offset] = 0
+                invalidation_count += 1
+
+        if invalidation_count:
+            self._increment_stat(3, invalidation_count)
+
+    def close(self) -> None:
+        self._mmap.close()
+        os.close(self._fd)
+
+    #
+    # Internals
+    #
+    def _get_bucket_offset(self, key: bytes) -> int:
+        return HEADER_SIZE + (zlib.crc32(key) % self._bucket_count) * self._bucket_size
+
+    def _read_u64(self, offset: int) -> int:
+        return struct.unpack_from('<Q', self._mmap, offset)[0]
+
+    def _find(self, bucket_offset: int, key: bytes) -> Tuple[Optional[int], Optional[bytes]]:
+        key_size = len(key)
+        entry_offset = bucket_offset + BUCKET_HEADER_SIZE
+        for _ in range(self._ways):
+            flags, entry_key_size, value_size = struct.unpack_from(
+                ENTRY_HEADER_FORMAT,
+                self._mmap,
+                entry_offset,
+            )
+            key_offset = entry_offset + ENTRY_HEADER_SIZE
+            if (
+                flags & FLAG_USED and
+                entry_key_size == key_size and
+                self._mmap[key_offset:key_offset + key_size] == key
+            ):
+                value_offset = key_offset + self._max_key_size
+                return entry_offset, self._mmap[value_offset:value_offset + value_size]
+            entry_offset += self._entry_size
+
+        return None, None
+
+    def _mark_referenced(self, bucket_offset: int, key: bytes) -> None:
+        # The flags of an entry are only ever written under the write lock, or
+        # an invalidation racing with this could be undone.  The reference bit
+        # is just a hint for eviction, so it is skipped rather than waited for
+        # when a writer holds the lock.
+        with self._try_write_lock() as is_locked:
+            if is_locked:
+                entry_offset, _ = self._find(bucket_offset, key)
+                if entry_offset is not None:
+                    self._mmap[entry_offset] |= FLAG_REFERENCED
+
+    def _claim_entry(self, bucket_offset: int) -> int:
+        first_entry_offset = bucket_offset + BUCKET_HEADER_SIZE
+
+        for way in range(self._ways):
+            entry_offset = first_entry_offset + way * self._entry_size
+            if not self._mmap[entry_offset] & FLAG_USED:
+                return entry_offset
+
+        # Every entry is in use: sweep the CLOCK hand, clearing reference bits
+        # until an entry that was not referenced since the last sweep is found.
+        hand = struct.unpack_from('<I', self._mmap, bucket_offset + HAND_OFFSET)[0]
+        while True:
+            entry_offset = first_entry_offset + hand * self._entry_size
+            hand = (hand + 1) % self._ways
+            flags = self._mmap[entry_offset]
+            if flags & FLAG_REFERENCED:
+                self._mmap[entry_offset] = flags & ~FLAG_REFERENCED
+            else:
+                struct.pack_into('<I', self._mmap, bucket_offset + HAND_OFFSET, hand)
+                self._increment_stat(2)
+                return entry_offset
+
+    @contextlib.contextmanager
+    def _modifying(self, bucket_offset: int) -> Iterator[None]:
+        seq = self._read_u64(bucket_offset)
+        struct.pack_into('<Q', self._mmap, bucket_offset, seq + 1)
+        try:
+            yield
+        finally:
+            struct.pack_into('<Q', self._mmap, bucket_offset, seq + 2)
+
+    @contextlib.contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        # flock() only excludes other processes, so threads within this process
+        # need a lock of their own.
+        with self._thread_lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @contextlib.contextmanager
+    def _try_write_lock(self) -> Iterator[bool]:
+        if not self._thread_lock.acquire(blocking=False):
+            yield False
+            return
+        try:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+            else:
+                try:
+                    yield True
+                finally:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            self._thread_lock.release()
+
+    def _increment_stat(self, index: int, amount: int = 1) -> None:
+        offset = STATS_OFFSET + 8 * index
+        struct.pack_into('<Q', self._mmap, offset, self._read_u64(offset) + amount)
+
+
+def prepare_read_cache(database_ipc_path: pathlib.Path, size: int) -> Optional[SharedReadCache]:
+    """
+    Set up the read cache for a database manager that is about to serve
+    ``database_ipc_path``.  A cache left behind by a previous run is always
+    discarded, since it may be out of date.  Returns ``None`` when ``size`` is
+    zero, which disables the cache.
+    """
+    if size:
+        return SharedReadCache.create(get_read_cache_path(database_ipc_path), size)
+    else:
+        remove_read_cache(database_ipc_path)
+        return None
+
+
+def remove_read_cache(database_ipc_path: pathlib.Path) -> None:
+    """
+    Remove the read cache of the database served at ``database_ipc_path``, if
+    there is one.  Processes that attached it before can still use their mapping.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        get_read_cache_path(database_ipc_path).unlink()
+
+
+def attach_read_cache(database_ipc_path: pathlib.Path) -> Optional[SharedReadCache]:
+    """
+    Open the read cache of the database served at ``database_ipc_path``, or
+    return ``None`` if the database manager runs without one.
+    """
+    try:
+        return SharedReadCache.attach(get_read_cache_path(database_ipc_path))
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,174 @@
+import contextlib
+import pathlib
+from typing import (
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from eth_keys.exceptions import BadSignature
+from eth_typing import (
+    Address,
+    Hash32,
+)
+from eth_utils import (
+    ValidationError,
+    to_tuple,
+)
+
+from eth.abc import SignedTransactionAPI
+
+from trinity.db.read_cache import (
+    ReadCacheStats,
+    SharedReadCache,
+)
+
+# A transaction hash and the address it was sent from
+SENDER_KEY_SIZE = 32
+SENDER_VALUE_SIZE = 20
+
+
+def get_sender_cache_path(database_ipc_path: pathlib.Path) -> pathlib.Path:
+    """
+    Return the path of the shared transaction sender cache that belongs to the
+    database served at ``database_ipc_path``.
+    """
+    return database_ipc_path.with_name(database_ipc_path.name + '.senders')
+
+
+def get_cached_sender(transaction: SignedTransactionAPI) -> Optional[Address]:
+    """
+    Return the sender of ``transaction`` if it was recovered already, without
+    recovering it.
+    """
+    # ``sender`` is a cached property, which keeps its value in the instance dict
+    return vars(transaction).get('sender')
+
+
+def set_cached_sender(transaction: SignedTransactionAPI, sender: Address) -> None:
+    """
+    Make ``sender`` the sender of ``transaction``, as if it had been recovered
+    from the signature.
+    """
+    transaction.__dict__['sender'] = sender
+
+
+@to_tuple
+def recover_senders(transactions: Sequence[SignedTransactionAPI]) -> Iterable[Optional[Address]]:
+    """
+    Recover the sender of every transaction, or ``None`` if its signature is invalid.
+    """
+    for transaction in transactions:
+        try:
+            yield transaction.get_sender()
+        except (BadSignature, ValidationError):
+            yield None
+
+
+class TransactionSenderCache:
+    """
+    A bounded, cross-process cache of the senders of transactions, by transaction
+    hash, so that a sender the transaction pool or the syncer recovered from a
+    signature is never recovered again by another process.
+
+    The sender is a function of the signed transaction, and so of its hash, so
+    entries never need to be invalidated. Stored in a :class:`SharedReadCache`.
+    """
+
+    def __init__(self, cache: SharedReadCache) -> None:
+        self._cache = cache
+
+    @classmethod
+    def create(cls, path: pathlib.Path, size: int) -> 'TransactionSenderCache':
+        return cls(SharedReadCache.create(
+            path,
+            size,
+            max_key_size=SENDER_KEY_SIZE,
+            max_value_size=SENDER_VALUE_SIZE,
+        ))
+
+    @classmethod
+    def attach(cls, path: pathlib.Path) -> 'TransactionSenderCache':
+        return cls(SharedReadCache.attach(path))
+
+    def get(self, transaction_hash: Hash32) -> Optional[Address]:
+        sender = self._cache.get(transaction_hash)
+        if sender is None:
+            return None
+        else:
+            return Address(sender)
+
+    def insert(self, transaction_hash: Hash32, sender: Address) -> None:
+        self._cache.insert(transaction_hash, sender, self._cache.get_version(transaction_hash))
+
+    def fill(
+            self,
+            transactions: Iterable[SignedTransactionAPI]) -> Tuple[SignedTransactionAPI, ...]:
+        """
+        Set the cached senders on ``transactions``, and return the transactions
+        whose sender is still unknown.
+        """
+        missing = []
+        for transaction in transactions:
+            if get_cached_sender(transaction) is not None:
+                continue
+            sender = self.get(Hash32(transaction.hash))
+            if sender is None:
+                missing.append(transaction)
+            else:
+                set_cached_sender(transaction, sender)
+        return tuple(missing)
+
+    def add(self, transactions: Iterable[SignedTransactionAPI]) -> None:
+        """
+        Cache the senders of ``transactions`` that were recovered already.
+        """
+        for transaction in transactions:
+            sender = get_cached_sender(transaction)
+            if sender is not None:
+                self.insert(Hash32(transaction.hash), sender)
+
+    def recover(self, transactions: Sequence[SignedTransactionAPI]) -> None:
+        """
+        Set the senders of ``transactions``, from the cache or else recovered from
+        their signatures, and cache the recovered ones.
+        """
+        missing = self.fill(transactions)
+        for transaction, sender in zip(missing, recover_senders(missing)):
+            if sender is not None:
+                set_cached_sender(transaction, sender)
+        self.add(missing)
+
+    def get_stats(self) -> ReadCacheStats:
+        return self._cache.get_stats()
+
+    def close(self) -> None:
+        self._cache.close()
+
+
+def prepare_sender_cache(database_ipc_path: pathlib.Path,
+                         size: int) -> Optional[TransactionSenderCache]:
+    """
+    Set up the sender cache next to the database that is about to be served at
+    ``database_ipc_path``, discarding any cache of a previous run.  Returns
+    ``None`` when ``size`` is zero, which disables the cache.
+    """
+    path = get_sender_cache_path(database_ipc_path)
+    if size:
+        return TransactionSenderCache.create(path, size)
+    else:
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+        return None
+
+
+def attach_sender_cache(database_ipc_path: pathlib.Path) -> Optional[TransactionSenderCache]:
+    """
+    Open the sender cache of the database served at ``database_ipc_path``, or
+    return ``None`` if it runs without one.
+    """
+    try:
+        return TransactionSenderCache.attach(get_sender_cache_path(database_ipc_path))
+    except FileNotFoundError:
+        return None
@@ -6,6 +6,7 @@ from eth_typing import Hash32
 from lahja.base import EndpointAPI
 from prometheus_client import generate_latest
 
+from eth2._utils.bls import bls
 from eth2.beacon.chains.base import (
     BaseBeaconChain,
 )
@@ -52,6 +53,13 @@ async def process_metrics(chain: BaseBeaconChain, event_bus: EndpointAPI) -> Non
     metrics.beacon_finalized_epoch.set(epoch_info.finalized_checkpoint.epoch)
     metrics.beacon_finalized_root.set(root_to_int(epoch_info.finalized_checkpoint.root))
 
+    # BLS
+    pubkey_stats = bls.pubkey_cache.get_pubkey_stats()
+    aggregate_stats = bls.pubkey_cache.get_aggregate_stats()
+    metrics.bls_pubkey_cache_hit_ratio.set(pubkey_stats.hit_ratio)
+    metrics.bls_aggregate_pubkey_cache_hit_ratio.set(aggregate_stats.hit_ratio)
+    metrics.bls_pubkey_cache_time_saved.set(pubkey_stats.time_saved + aggregate_stats.time_saved)
+
 
 class MetricsHandler(BaseHTTPHandler):
 
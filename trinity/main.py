@@ -20,6 +20,11 @@ from trinity.constants import (
     APP_IDENTIFIER_ETH1,
 )
 from trinity.db.manager import DBManager
+from trinity.db.read_cache import (
+    prepare_read_cache,
+    remove_read_cache,
+)
+from trinity.db.sender_cache import prepare_sender_cache
 from trinity.initialization import (
     is_database_initialized,
     initialize_database,
@@ -95,9 +100,24 @@ def run_database_process(boot_info: BootInfo, db_class: Type[LevelDB]) -> None:
                 chain_config = app_config.get_chain_config()
                 initialize_database(chain_config, chaindb, base_db)
 
-            manager = DBManager(base_db)
-            with manager.run(trinity_config.database_ipc_path):
-                try:
-                    manager.wait_stopped()
-                except KeyboardInterrupt:
-                    pass
+            read_cache = prepare_read_cache(
+                trinity_config.database_ipc_path,
+                boot_info.args.db_read_cache_size * 1024 * 1024,
+            )
+            sender_cache = prepare_sender_cache(
+                trinity_config.database_ipc_path,
+                boot_info.args.tx_sender_cache_size * 1024 * 1024,
+            )
+            manager = DBManager(base_db, read_cache)
+            try:
+                with manager.run(trinity_config.database_ipc_path):
+                    try:
+                        manager.wait_stopped()
+                    except KeyboardInterrupt:
+                        pass
+            finally:
+                if read_cache is not None:
+                    read_cache.close()
+                    remove_read_cache(trinity_config.database_ipc_path)
+                if sender_cache is not None:
+                    sender_cache.close()
@@ -25,6 +25,10 @@ from trinity.constants import (
     APP_IDENTIFIER_BEACON,
 )
 from trinity.db.manager import DBManager
+from trinity.db.read_cache import (
+    prepare_read_cache,
+    remove_read_cache,
+)
 from trinity.initialization import (
     ensure_beacon_dirs,
     initialize_beacon_database,
@@ -98,9 +102,21 @@ def run_database_process(boot_info: BootInfo, db_class: Type[LevelDB]) -> None:
             if not is_beacon_database_initialized(chaindb):
                 initialize_beacon_database(chain_config, chaindb, base_db)
 
-            manager = DBManager(base_db)
-            with manager.run(trinity_config.database_ipc_path):
-                try:
-                    manager.wait_stopped()
-                except KeyboardInterrupt:
-                    pass
+            if boot_info.args.state_snapshot_interval is not None:
+                chaindb.set_state_snapshot_interval(boot_info.args.state_snapshot_interval)
+
+            read_cache = prepare_read_cache(
+                trinity_config.database_ipc_path,
+                boot_info.args.db_read_cache_size * 1024 * 1024,
+            )
+            manager = DBManager(base_db, read_cache)
+            try:
+                with manager.run(trinity_config.database_ipc_path):
+                    try:
+                        manager.wait_stopped()
+                    except KeyboardInterrupt:
+                        pass
+            finally:
+                if read_cache is not None:
+                    read_cache.close()
+                    remove_read_cache(trinity_config.database_ipc_path)
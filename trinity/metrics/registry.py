@@ -55,6 +55,23 @@ class AllMetrics:
             "beacon_finalized_root", "Current finalized root", registry=registry
         )  # noqa: E501
 
+        # BLS
+        self.bls_pubkey_cache_hit_ratio = Gauge(
+            "bls_pubkey_cache_hit_ratio",
+            "Ratio of validator pubkeys found decompressed in the cache",
+            registry=registry,
+        )  # noqa: E501
+        self.bls_aggregate_pubkey_cache_hit_ratio = Gauge(
+            "bls_aggregate_pubkey_cache_hit_ratio",
+            "Ratio of aggregate pubkeys found in the cache",
+            registry=registry,
+        )  # noqa: E501
+        self.bls_pubkey_cache_time_saved = Gauge(
+            "bls_pubkey_cache_time_saved",
+            "Estimated seconds saved by the pubkey and aggregate pubkey caches",
+            registry=registry,
+        )  # noqa: E501
+
         #
         # Other
         #
@@ -136,6 +136,7 @@ from .messages import (
     BeaconBlocksByRangeRequest,
     BeaconBlocksByRootRequest,
 )
+from .signature_verifier import GossipSignatureVerifier
 from .topic_validators import (
     get_beacon_aggregate_and_proof_validator,
     get_beacon_attestation_validator,
@@ -384,29 +385,34 @@ class Node(BaseService):
         self._is_started = True
 
     def _setup_topic_validators(self) -> None:
+        # The signatures of concurrently validated messages are verified in batches
+        signature_verifier = GossipSignatureVerifier()
+
         # Global channel
         self.pubsub.set_topic_validator(
             PUBSUB_TOPIC_BEACON_BLOCK,
-            get_beacon_block_validator(self.chain),
-            False,
+            get_beacon_block_validator(self.chain, signature_verifier),
+            True,
         )
         self.pubsub.set_topic_validator(
             PUBSUB_TOPIC_BEACON_ATTESTATION,
-            get_beacon_attestation_validator(self.chain),
-            False,
+            get_beacon_attestation_validator(self.chain, signature_verifier),
+            True,
         )
         # Attestation subnets
         for subnet_id in self.subnets:
             self.pubsub.set_topic_validator(
                 PUBSUB_TOPIC_COMMITTEE_BEACON_ATTESTATION.substitute(subnet_id=str(subnet_id)),
-                get_committee_index_beacon_attestation_validator(self.chain, subnet_id),
-                False,
+                get_committee_index_beacon_attestation_validator(
+                    self.chain, subnet_id, signature_verifier
+                ),
+                True,
             )
 
         self.pubsub.set_topic_validator(
             PUBSUB_TOPIC_BEACON_AGGREGATE_AND_PROOF,
-            get_beacon_aggregate_and_proof_validator(self.chain),
-            False,
+            get_beacon_aggregate_and_proof_validator(self.chain, signature_verifier),
+            True,
         )
 
     async def dial_peer_maddr(self, maddr: Multiaddr, peer_id: ID) -> None:
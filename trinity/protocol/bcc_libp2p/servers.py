@@ -371,18 +371,26 @@ class BCCReceiveServer(BaseService):
     ) -> Iterable[Attestation]:
         """
         Get the attestations that are ready to be included in ``current_slot`` block.
+
+        The attestations of the pool with the same data are aggregated, the ones
+        covering the most validators first.
         """
         config = self.chain.get_state_machine().config
 
         if is_aggregated:
-            attestation_pool = self.aggregated_attestation_pool
+            pool = self.aggregated_attestation_pool
         else:
-            attestation_pool = self.unaggregated_attestation_pool
+            pool = self.unaggregated_attestation_pool
+        return pool.get_aggregated_attestations_by_current_slot(current_slot, config)
 
-        return attestation_pool.get_valid_attestation_by_current_slot(
-            current_slot,
-            config,
-        )
+    def prune_attestation_pools(self, current_slot: Slot) -> None:
+        """
+        Drop the attestations that are too old to be included in a block at
+        ``current_slot`` or later.
+        """
+        config = self.chain.get_state_machine().config
+        self.unaggregated_attestation_pool.prune(current_slot, config)
+        self.aggregated_attestation_pool.prune(current_slot, config)
 
     def get_aggregatable_attestations(
         self,
@@ -0,0 +1,103 @@
+import asyncio
+from concurrent.futures import Executor
+import logging
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+from eth2._utils.bls import SignatureBatch, bls
+from eth2._utils.bls.batch import find_invalid_signature_sets
+
+
+# Gossip messages validated within this many seconds of each other are verified together
+DEFAULT_MAX_BATCH_DELAY = 0.05
+DEFAULT_MAX_BATCH_SIZE = 128
+
+
+class GossipSignatureVerifier:
+    """
+    Verify the signatures of the gossip messages that are validated concurrently
+    in one batch.
+
+    Every message hands over the batch of its signatures, collected with
+    ``bls.collect_signatures``, and waits for the combined batch to be verified.
+    A batch is verified once it reaches ``max_batch_size`` signatures or
+    ``max_batch_delay`` seconds after its first message arrived, in ``executor``
+    if one is given, so a process pool can take the verification off the event
+    loop. If the combined batch is invalid, only the messages whose signatures
+    are invalid are rejected.
+    """
+    logger = logging.getLogger('trinity.protocol.bcc_libp2p.GossipSignatureVerifier')
+
+    def __init__(self,
+                 executor: Optional[Executor] = None,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_batch_delay: float = DEFAULT_MAX_BATCH_DELAY) -> None:
+        self._executor = executor
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max_batch_delay
+        self._pending: List[Tuple[SignatureBatch, 'asyncio.Future[bool]']] = []
+        self._pending_size = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    async def verify(self, batch: SignatureBatch) -> bool:
+        if not len(batch):
+            return True
+
+        loop = asyncio.get_event_loop()
+        future: 'asyncio.Future[bool]' = loop.create_future()
+        self._pending.append((batch, future))
+        self._pending_size += len(batch)
+
+        if self._pending_size >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._max_batch_delay, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        self._pending_size = 0
+        if pending:
+            asyncio.ensure_future(self._verify_pending(pending))
+
+    async def _verify_pending(
+            self,
+            pending: List[Tuple[SignatureBatch, 'asyncio.Future[bool]']]) -> None:
+        combined = SignatureBatch(bls.backend)
+        owners = []
+        for message_index, (batch, _) in enumerate(pending):
+            combined.extend(batch.signature_sets)
+            owners.extend([message_index] * len(batch))
+
+        loop = asyncio.get_event_loop()
+        try:
+            invalid_indices = await loop.run_in_executor(
+                self._executor,
+                find_invalid_signature_sets,
+                combined.backend,
+                combined.signature_sets,
+            )
+        except Exception as error:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        invalid_messages = {owners[index] for index in invalid_indices}
+        if invalid_messages:
+            self.logger.debug(
+                "%d of %d gossip messages have invalid signatures",
+                len(invalid_messages),
+                len(pending),
+            )
+        for message_index, (_, future) in enumerate(pending):
+            if not future.done():
+                future.set_result(message_index not in invalid_messages)
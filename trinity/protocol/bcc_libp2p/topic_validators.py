@@ -1,5 +1,6 @@
 import logging
 from typing import (
+    Awaitable,
     Callable,
 )
 
@@ -12,6 +13,7 @@ from eth_utils import (
 
 from eth.exceptions import BlockNotFound
 
+from eth2._utils.bls import SignatureBatch, bls
 from eth2.beacon.types.aggregate_and_proof import AggregateAndProof
 from eth2.beacon.types.attestations import Attestation
 from eth2.beacon.chains.base import BaseBeaconChain
@@ -38,13 +40,16 @@ from trinity.protocol.bcc_libp2p.configs import (
     ATTESTATION_SUBNET_COUNT,
 )
 from trinity.protocol.bcc_libp2p.exceptions import InvalidGossipMessage
+from trinity.protocol.bcc_libp2p.signature_verifier import GossipSignatureVerifier
 
 
 logger = logging.getLogger('trinity.components.eth2.beacon.TopicValidator')
 
 
-def get_beacon_block_validator(chain: BaseBeaconChain) -> Callable[..., bool]:
-    def beacon_block_validator(msg_forwarder: ID, msg: rpc_pb2.Message) -> bool:
+def get_beacon_block_validator(
+        chain: BaseBeaconChain,
+        signature_verifier: GossipSignatureVerifier) -> Callable[..., Awaitable[bool]]:
+    async def beacon_block_validator(msg_forwarder: ID, msg: rpc_pb2.Message) -> bool:
         try:
             block = ssz.decode(msg.data, SignedBeaconBlock)
         except (TypeError, ssz.DeserializationError) as error:
@@ -59,19 +64,22 @@ def get_beacon_block_validator(chain: BaseBeaconChain) -> Callable[..., bool]:
         state = chain.get_head_state()
 
         try:
-            run_validate_block_proposer_signature(state, state_machine, block)
+            with bls.collect_signatures() as signature_batch:
+                run_validate_block_proposer_signature(state, state_machine, block)
         except InvalidGossipMessage as error:
             logger.debug("%s", str(error))
             return False
         else:
-            return True
+            return await _verify_signatures(signature_verifier, signature_batch, block)
 
     return beacon_block_validator
 
 
-def get_beacon_attestation_validator(chain: BaseBeaconChain) -> Callable[..., bool]:
+def get_beacon_attestation_validator(
+        chain: BaseBeaconChain,
+        signature_verifier: GossipSignatureVerifier) -> Callable[..., Awaitable[bool]]:
     # TODO:  The beacon_attestation topic is only for interop and will be removed prior to mainnet.
-    def beacon_attestation_validator(msg_forwarder: ID, msg: rpc_pb2.Message) -> bool:
+    async def beacon_attestation_validator(msg_forwarder: ID, msg: rpc_pb2.Message) -> bool:
         try:
             attestation = ssz.decode(msg.data, sedes=Attestation)
         except (TypeError, ssz.DeserializationError) as error:
@@ -88,24 +96,25 @@ def get_beacon_attestation_validator(chain: BaseBeaconChain) -> Callable[..., bo
 
         try:
             validate_voting_beacon_block(chain, attestation)
-            validate_attestation_signature(
-                state,
-                attestation,
-                state_machine.config,
-            )
+            with bls.collect_signatures() as signature_batch:
+                validate_attestation_signature(
+                    state,
+                    attestation,
+                    state_machine.config,
+                )
         except InvalidGossipMessage as error:
             logger.debug("%s", str(error))
             return False
         else:
-            return True
+            return await _verify_signatures(signature_verifier, signature_batch, attestation)
 
     return beacon_attestation_validator
 
 
 def get_committee_index_beacon_attestation_validator(
-    chain: BaseBeaconChain, subnet_id: SubnetId
-) -> Callable[..., bool]:
-    def committee_index_beacon_attestation_validator(
+    chain: BaseBeaconChain, subnet_id: SubnetId, signature_verifier: GossipSignatureVerifier
+) -> Callable[..., Awaitable[bool]]:
+    async def committee_index_beacon_attestation_validator(
         msg_forwarder: ID, msg: rpc_pb2.Message
     ) -> bool:
         try:
@@ -131,22 +140,27 @@ def get_committee_index_beacon_attestation_validator(
                 attestation,
                 ATTESTATION_PROPAGATION_SLOT_RANGE,
             )
-            validate_attestation_signature(
-                state,
-                attestation,
-                state_machine.config,
-            )
+            with bls.collect_signatures() as signature_batch:
+                validate_attestation_signature(
+                    state,
+                    attestation,
+                    state_machine.config,
+                )
         except InvalidGossipMessage as error:
             logger.debug("%s", str(error))
             return False
         else:
-            return True
+            return await _verify_signatures(signature_verifier, signature_batch, attestation)
 
     return committee_index_beacon_attestation_validator
 
 
-def get_beacon_aggregate_and_proof_validator(chain: BaseBeaconChain) -> Callable[..., bool]:
-    def beacon_aggregate_and_proof_validator(msg_forwarder: ID, msg: rpc_pb2.Message) -> bool:
+def get_beacon_aggregate_and_proof_validator(
+        chain: BaseBeaconChain,
+        signature_verifier: GossipSignatureVerifier) -> Callable[..., Awaitable[bool]]:
+    async def beacon_aggregate_and_proof_validator(
+            msg_forwarder: ID,
+            msg: rpc_pb2.Message) -> bool:
         try:
             aggregate_and_proof = ssz.decode(msg.data, sedes=AggregateAndProof)
         except (TypeError, ssz.DeserializationError) as error:
@@ -164,19 +178,31 @@ def get_beacon_aggregate_and_proof_validator(chain: BaseBeaconChain) -> Callable
 
         try:
             validate_voting_beacon_block(chain, attestation)
-            run_validate_aggregate_and_proof(
-                state,
-                aggregate_and_proof,
-                state_machine.config,
-            )
+            with bls.collect_signatures() as signature_batch:
+                run_validate_aggregate_and_proof(
+                    state,
+                    aggregate_and_proof,
+                    state_machine.config,
+                )
         except InvalidGossipMessage as error:
             logger.debug("%s", str(error))
             return False
 
-        return True
+        return await _verify_signatures(signature_verifier, signature_batch, aggregate_and_proof)
     return beacon_aggregate_and_proof_validator
 
 
+async def _verify_signatures(
+        signature_verifier: GossipSignatureVerifier,
+        signature_batch: SignatureBatch,
+        message: object) -> bool:
+    if await signature_verifier.verify(signature_batch):
+        return True
+    else:
+        logger.debug("Invalid signature on gossip message %s", message)
+        return False
+
+
 #
 # Validation
 #
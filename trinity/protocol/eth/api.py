@@ -28,6 +28,7 @@ from trinity.protocol.eth.commands import (
     GetReceiptsV65,
     NewBlock,
     NewBlockHashes,
+    NewPooledTransactionHashes,
     NodeDataV65,
     ReceiptsV65,
     StatusV63,
@@ -272,5 +273,8 @@ class ETHV65API(ETHV64API):
     def send_get_pooled_transactions(self, transaction_hashes: Sequence[Hash32]) -> None:
         self.protocol.send(GetPooledTransactionsV65(tuple(transaction_hashes)))
 
+    def send_new_pooled_transaction_hashes(self, transaction_hashes: Sequence[Hash32]) -> None:
+        self.protocol.send(NewPooledTransactionHashes(tuple(transaction_hashes)))
+
 
 AnyETHAPI = Union[ETHV63API, ETHV64API, ETHV65API]
@@ -194,6 +194,16 @@ class SendPooledTransactionsEvent(PeerPoolMessageEvent):
     session: SessionAPI
     command: PooledTransactionsV65
 
+
+@dataclass
+class SendNewPooledTransactionHashesEvent(PeerPoolMessageEvent):
+    """
+    Event to proxy a ``ETHPeer.sub_proto.send_new_pooled_transaction_hashes`` call from a proxy
+    peer to the actual peer that sits in the peer pool.
+    """
+    session: SessionAPI
+    command: NewPooledTransactionHashes
+
 # EXCHANGE HANDLER REQUEST / RESPONSE PAIRS
 
 
@@ -69,6 +69,7 @@ from .events import (
     NewPooledTransactionHashesEvent,
     GetPooledTransactionsEvent,
     GetPooledTransactionsRequest,
+    SendNewPooledTransactionHashesEvent,
     SendPooledTransactionsEvent,
     SendTransactionsEvent,
 )
@@ -207,6 +208,7 @@ class ETHPeerPoolEventServer(PeerPoolEventServer[ETHPeer]):
         SendBlockBodiesEvent,
         SendNodeDataEvent,
         SendReceiptsEvent,
+        SendNewPooledTransactionHashesEvent,
         SendPooledTransactionsEvent,
         SendTransactionsEvent,
     })
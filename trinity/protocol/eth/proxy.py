@@ -1,6 +1,7 @@
 from typing import (
     Sequence,
     Tuple,
+    cast,
 )
 
 from eth.abc import (
@@ -19,6 +20,7 @@ from lahja import (
 )
 
 from p2p.abc import SessionAPI
+from p2p.commands import EncodedRLP
 
 from trinity._utils.errors import SupportsError
 from trinity._utils.logging import get_logger
@@ -32,6 +34,7 @@ from trinity.rlp.block_body import BlockBody
 from .commands import (
     BlockBodiesV65,
     BlockHeadersV65,
+    NewPooledTransactionHashes,
     NodeDataV65,
     ReceiptsV65,
     Transactions,
@@ -48,6 +51,7 @@ from .events import (
     SendReceiptsEvent,
     SendTransactionsEvent,
     GetPooledTransactionsRequest,
+    SendNewPooledTransactionHashesEvent,
     SendPooledTransactionsEvent,
 )
 
@@ -211,6 +215,14 @@ class ProxyETHAPI:
             self._broadcast_config,
         )
 
+    def send_new_pooled_transaction_hashes(self,
+                                           transaction_hashes: Sequence[Hash32]) -> None:
+        command = NewPooledTransactionHashes(tuple(transaction_hashes))
+        self._event_bus.broadcast_nowait(
+            SendNewPooledTransactionHashesEvent(self.session, command),
+            self._broadcast_config,
+        )
+
     def send_block_headers(self, headers: Sequence[BlockHeaderAPI]) -> None:
         command = BlockHeadersV65(tuple(headers))
         self._event_bus.broadcast_nowait(
@@ -229,6 +241,18 @@ class ProxyETHAPI:
             self._broadcast_config,
         )
 
+    def send_encoded_block_bodies(self, encoded_bodies: Sequence[bytes]) -> None:
+        """
+        Send the already RLP encoded ``encoded_bodies`` as they are, as returned by
+        :meth:`~trinity.db.eth1.chain.BaseAsyncChainDB.get_encoded_block_bodies`.
+        """
+        payload = EncodedRLP.from_encoded_items(encoded_bodies)
+        command = BlockBodiesV65(cast(Tuple[BlockBody, ...], payload))
+        self._event_bus.broadcast_nowait(
+            SendBlockBodiesEvent(self.session, command),
+            self._broadcast_config,
+        )
+
     def send_receipts(self, receipts: Sequence[Sequence[ReceiptAPI]]) -> None:
         command = ReceiptsV65(tuple(map(tuple, receipts)))
         self._event_bus.broadcast_nowait(
@@ -236,6 +260,18 @@ class ProxyETHAPI:
             self._broadcast_config,
         )
 
+    def send_encoded_receipts(self, encoded_receipts: Sequence[bytes]) -> None:
+        """
+        Send the already RLP encoded ``encoded_receipts`` of blocks as they are, as returned
+        by :meth:`~trinity.db.eth1.chain.BaseAsyncChainDB.get_encoded_receipts`.
+        """
+        payload = EncodedRLP.from_encoded_items(encoded_receipts)
+        command = ReceiptsV65(cast(Tuple[Tuple[ReceiptAPI, ...], ...], payload))
+        self._event_bus.broadcast_nowait(
+            SendReceiptsEvent(self.session, command),
+            self._broadcast_config,
+        )
+
     def send_node_data(self, nodes: Sequence[bytes]) -> None:
         command = NodeDataV65(tuple(nodes))
         self._event_bus.broadcast_nowait(
@@ -2,9 +2,6 @@ from typing import (
     Any,
 )
 
-from eth.exceptions import (
-    HeaderNotFound,
-)
 from eth_utils import (
     to_hex,
 )
@@ -12,9 +9,6 @@ from lahja import (
     BroadcastConfig,
     EndpointAPI,
 )
-from trie.exceptions import (
-    MissingTrieNode,
-)
 
 from p2p.abc import CommandAPI, SessionAPI
 
@@ -33,16 +27,11 @@ from trinity.protocol.eth.events import (
 from trinity.protocol.eth.peer import (
     ETHProxyPeer,
 )
-
-from eth.rlp.receipts import Receipt
-from eth.rlp.transactions import BaseTransactionFields
-
 from trinity.protocol.eth.constants import (
     MAX_BODIES_FETCH,
     MAX_RECEIPTS_FETCH,
     MAX_STATE_FETCH,
 )
-from trinity.rlp.block_body import BlockBody
 
 from .commands import (
     GetBlockHeadersV65,
@@ -72,69 +61,38 @@ class ETHPeerRequestHandler(BasePeerRequestHandler):
         block_hashes = command.payload
 
         self.logger.debug2("%s requested bodies for %d blocks", peer, len(block_hashes))
-        bodies = []
         # Only serve up to MAX_BODIES_FETCH items in every request.
-        for block_hash in block_hashes[:MAX_BODIES_FETCH]:
-            try:
-                header = await self.db.coro_get_block_header_by_hash(block_hash)
-            except HeaderNotFound:
-                self.logger.debug(
-                    "%s asked for a block with a header we don't have: %s", peer, to_hex(block_hash)
-                )
-                continue
-            try:
-                transactions = await self.db.coro_get_block_transactions(
-                    header,
-                    BaseTransactionFields,
-                )
-            except MissingTrieNode as exc:
-                self.logger.debug(
-                    "%s asked for block transactions we don't have: %s, "
-                    "due to %r",
-                    peer,
-                    to_hex(block_hash),
-                    exc,
-                )
-                continue
-            try:
-                uncles = await self.db.coro_get_block_uncles(header.uncles_hash)
-            except HeaderNotFound as exc:
+        requested_hashes = block_hashes[:MAX_BODIES_FETCH]
+        # The bodies are sent as they are stored, without decoding and re-encoding them
+        encoded_bodies = await self.db.coro_get_encoded_block_bodies(requested_hashes)
+        bodies = []
+        for block_hash, encoded_body in zip(requested_hashes, encoded_bodies):
+            if encoded_body is None:
                 self.logger.debug(
-                    "%s asked for a block with uncles we don't have: %s", peer, exc
+                    "%s asked for a block body we don't have: %s", peer, to_hex(block_hash)
                 )
-                continue
-            bodies.append(BlockBody(transactions, uncles))
+            else:
+                bodies.append(encoded_body)
         self.logger.debug2("Replying to %s with %d block bodies", peer, len(bodies))
-        peer.eth_api.send_block_bodies(bodies)
+        peer.eth_api.send_encoded_block_bodies(bodies)
 
     async def handle_get_receipts(self, peer: ETHProxyPeer, command: GetReceiptsV65) -> None:
         block_hashes = command.payload
 
         self.logger.debug2("%s requested receipts for %d blocks", peer, len(block_hashes))
-        receipts = []
         # Only serve up to MAX_RECEIPTS_FETCH items in every request.
-        for block_hash in block_hashes[:MAX_RECEIPTS_FETCH]:
-            try:
-                header = await self.db.coro_get_block_header_by_hash(block_hash)
-            except HeaderNotFound:
+        requested_hashes = block_hashes[:MAX_RECEIPTS_FETCH]
+        encoded_receipts = await self.db.coro_get_encoded_receipts(requested_hashes)
+        receipts = []
+        for block_hash, block_receipts in zip(requested_hashes, encoded_receipts):
+            if block_receipts is None:
                 self.logger.debug(
                     "%s asked receipts for a block we don't have: %s", peer, to_hex(block_hash)
                 )
-                continue
-            try:
-                block_receipts = await self.db.coro_get_receipts(header, Receipt)
-            except MissingTrieNode as exc:
-                self.logger.debug(
-                    "%s asked for block receipts we don't have: %s, "
-                    "due to %r",
-                    peer,
-                    to_hex(block_hash),
-                    exc,
-                )
-                continue
-            receipts.append(block_receipts)
+            else:
+                receipts.append(block_receipts)
         self.logger.debug2("Replying to %s with receipts for %d blocks", peer, len(receipts))
-        peer.eth_api.send_receipts(receipts)
+        peer.eth_api.send_encoded_receipts(receipts)
 
     async def handle_get_node_data(self, peer: ETHProxyPeer, command: GetNodeDataV65) -> None:
         node_hashes = command.payload
@@ -9,6 +9,7 @@ from eth.abc import BlockHeaderAPI
 from p2p.exchange import (
     BaseExchange,
 )
+from p2p.exchange.candidate_stream import RequestIDCandidateStream
 from p2p.exchange.normalizers import DefaultNormalizer
 from trinity._utils.les import (
     gen_request_id,
@@ -48,6 +49,7 @@ class GetBlockHeadersExchange(BaseGetBlockHeadersExchange):
         normalize_fn=lambda res: res.payload.headers
     )
     tracker_class = GetBlockHeadersTracker
+    response_stream_class = RequestIDCandidateStream
 
     _request_command_type = GetBlockHeaders
     _response_command_type = BlockHeaders
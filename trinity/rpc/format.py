@@ -35,10 +35,12 @@ from eth.constants import (
 )
 
 from trinity.chains.base import AsyncChainAPI
+from trinity.db.eth1.log_index import IndexedLog
 from trinity.rpc.typing import (
     RpcBlockResponse,
     RpcBlockTransactionResponse,
     RpcHeaderResponse,
+    RpcLogResponse,
     RpcReceiptResponse,
     RpcTransactionResponse,
 )
@@ -102,6 +104,21 @@ def to_receipt_response(receipt: ReceiptAPI,
     }
 
 
+def log_to_dict(log: IndexedLog) -> RpcLogResponse:
+    return {
+        "address": encode_hex(log.address),
+        "data": encode_hex(log.data),
+        "blockHash": encode_hex(log.block_hash),
+        "blockNumber": hex(log.block_number),
+        "logIndex": hex(log.log_index),
+        # Logs are only looked up in the canonical chain
+        "removed": False,
+        "topics": [encode_hex(topic) for topic in log.topics],
+        "transactionHash": encode_hex(log.transaction_hash),
+        "transactionIndex": hex(log.transaction_index),
+    }
+
+
 def transaction_to_dict(transaction: SignedTransactionAPI) -> RpcTransactionResponse:
     return {
         'hash': encode_hex(transaction.hash),
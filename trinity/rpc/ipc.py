@@ -2,10 +2,15 @@ import asyncio
 import json
 import logging
 import pathlib
+import re
 from typing import (
     Any,
     Callable,
+    List,
+    Optional,
+    Set,
     Tuple,
+    Union,
 )
 
 from async_service import Service
@@ -15,13 +20,142 @@ from trinity.rpc.main import (
     RPCServer,
 )
 
-MAXIMUM_REQUEST_BYTES = 10000
+# A single request or batch of requests may not be larger than this
+MAXIMUM_REQUEST_BYTES = 5 * 1024 * 1024
+# Requests of a connection that may be executed at the same time
+MAXIMUM_CONCURRENT_REQUESTS = 64
+READ_CHUNK_SIZE = 64 * 1024
 NEW_LINE = "\n"
 
+WHITESPACE = b' \t\n\r'
+STRUCTURAL_CHARACTER = re.compile(rb'[{}\[\]"]')
+STRING_CHARACTER = re.compile(rb'["\\]')
+MESSAGE_START = re.compile(rb'[{\[]')
+
 
 logger = logging.getLogger('trinity.rpc.IPCServer')
 
 
+class FramingError(Exception):
+    pass
+
+
+class JSONFramer:
+    """
+    Split a stream of bytes into the JSON objects and arrays it consists of.
+
+    Only the brackets and strings are tracked, so every byte is looked at once
+    no matter how many chunks a message arrives in. Whether the message is
+    valid JSON is left to the decoder.
+    """
+
+    def __init__(self, max_message_size: int = MAXIMUM_REQUEST_BYTES) -> None:
+        self._max_message_size = max_message_size
+        self._buffer = bytearray()
+        # where to continue scanning the buffer
+        self._position = 0
+        # start of the current message in the buffer, if one was started
+        self._start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._prefix = bytearray()
+        # set while skipping the rest of a message that is too large
+        self._discarding = False
+
+    def feed(self, data: bytes) -> Tuple[Union[bytes, FramingError], ...]:
+        """
+        Add ``data`` to the stream and return the messages it completed, along
+        with errors about data that is not a message.
+        """
+        self._buffer.extend(data)
+        frames: List[Union[bytes, FramingError]] = []
+
+        while self._position < len(self._buffer):
+            if self._start is None:
+                if not self._find_message_start(frames):
+                    break
+            elif self._in_string:
+                match = STRING_CHARACTER.search(self._buffer, self._position)
+                if match is None:
+                    self._position = len(self._buffer)
+                elif match.group() == b'"':
+                    self._in_string = False
+                    self._position = match.end()
+                else:
+                    # skip the escaped character, which may not have arrived yet
+                    self._position = match.end() + 1
+            else:
+                match = STRUCTURAL_CHARACTER.search(self._buffer, self._position)
+                if match is None:
+                    self._position = len(self._buffer)
+                    continue
+
+                self._position = match.end()
+                character = match.group()
+                if character == b'"':
+                    self._in_string = True
+                elif character in b'{[':
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        self._finish_message(frames)
+
+        self._compact(frames)
+        return tuple(frames)
+
+    def _find_message_start(self, frames: List[Union[bytes, FramingError]]) -> bool:
+        match = MESSAGE_START.search(self._buffer, self._position)
+        if match is None:
+            self._add_prefix(self._buffer[self._position:])
+            self._position = len(self._buffer)
+            return False
+
+        self._add_prefix(self._buffer[self._position:match.start()])
+        prefix = self._prefix.strip(WHITESPACE)
+        if prefix:
+            frames.append(FramingError(f"Cannot parse json: {prefix.decode(errors='replace')}"))
+        self._prefix.clear()
+
+        self._start = match.start()
+        self._position = match.end()
+        self._depth = 1
+        return True
+
+    def _add_prefix(self, data: bytes) -> None:
+        if len(self._prefix) < self._max_message_size:
+            self._prefix.extend(data)
+
+    def _finish_message(self, frames: List[Union[bytes, FramingError]]) -> None:
+        if not self._discarding:
+            frames.append(bytes(self._buffer[self._start:self._position]))
+        self._start = None
+        self._discarding = False
+
+    def _compact(self, frames: List[Union[bytes, FramingError]]) -> None:
+        if self._start is None:
+            consumed = self._position
+        elif self._discarding:
+            consumed = self._start = self._position
+        elif self._position - self._start > self._max_message_size:
+            frames.append(FramingError(
+                f"reached limit: {self._max_message_size} bytes, "
+                f"starting with '{bytes(self._buffer[self._start:self._start + 20])!r}'"
+            ))
+            self._discarding = True
+            consumed = self._start = self._position
+        else:
+            consumed = self._start
+
+        # the position is past the buffer if an escaped character is still missing
+        consumed = min(consumed, len(self._buffer))
+        if consumed:
+            del self._buffer[:consumed]
+            self._position -= consumed
+            if self._start is not None:
+                self._start -= consumed
+
+
 @curry
 async def connection_handler(execute_rpc: Callable[[Any], Any],
                              reader: asyncio.StreamReader,
@@ -43,70 +177,104 @@ async def connection_handler(execute_rpc: Callable[[Any], Any],
 async def connection_loop(execute_rpc: Callable[[Any], Any],
                           reader: asyncio.StreamReader,
                           writer: asyncio.StreamWriter) -> None:
-    # TODO: we should look into using an io.StrinIO here for more efficient
-    # writing to the end of the string.
-    raw_request = ''
-    while True:
-        request_bytes = b''
-        try:
-            request_bytes = await reader.readuntil(b'}')
-        except asyncio.LimitOverrunError as e:
-            logger.info("Client request was too long. Erasing buffer and restarting...")
-            request_bytes = await reader.read(e.consumed)
-            await write_error(
-                writer,
-                f"reached limit: {e.consumed} bytes, starting with '{request_bytes[:20]!r}'",
-            )
-            continue
-
-        raw_request += request_bytes.decode()
-
-        bad_prefix, raw_request = strip_non_json_prefix(raw_request)
-        if bad_prefix:
-            logger.info("Client started request with non json data: %r", bad_prefix)
-            await write_error(writer, 'Cannot parse json: ' + bad_prefix)
+    """
+    Execute the requests of a connection concurrently, and write each response
+    as soon as it is ready. Clients match the responses to their requests by id.
+    """
+    framer = JSONFramer()
+    write_lock = asyncio.Lock()
+    in_flight = asyncio.Semaphore(MAXIMUM_CONCURRENT_REQUESTS)
+    pending: Set['asyncio.Future[None]'] = set()
 
-        try:
-            request = json.loads(raw_request)
-        except json.JSONDecodeError:
-            # invalid json request, keep reading data until a valid json is formed
-            logger.debug("Invalid JSON, waiting for rest of message: %r", raw_request)
-            continue
+    def on_done(task: 'asyncio.Future[None]') -> None:
+        pending.discard(task)
+        in_flight.release()
 
-        # reset the buffer for the next message
-        raw_request = ''
+    try:
+        while True:
+            data = await reader.read(READ_CHUNK_SIZE)
+            if not data:
+                break
 
-        if not request:
-            logger.debug("Client sent empty request")
-            await write_error(writer, 'Invalid Request: empty')
-            continue
+            for frame in framer.feed(data):
+                if isinstance(frame, FramingError):
+                    logger.info("Client sent unparseable data: %s", frame)
+                    await write_response(writer, write_lock, json_error(str(frame)))
+                    continue
 
-        try:
-            result = await execute_rpc(request)
-        except Exception as e:
-            logger.exception("Unrecognized exception while executing RPC")
-            await write_error(writer, "unknown failure: " + str(e))
+                # stop reading from the client while too many requests are executing
+                await in_flight.acquire()
+                task = asyncio.ensure_future(
+                    respond(execute_rpc, writer, write_lock, frame)
+                )
+                pending.add(task)
+                task.add_done_callback(on_done)
+
+        # the client may half-close the connection and still wait for responses
+        if pending:
+            await asyncio.gather(*pending)
+    finally:
+        for pending_task in pending:
+            pending_task.cancel()
+
+
+async def respond(execute_rpc: Callable[[Any], Any],
+                  writer: asyncio.StreamWriter,
+                  write_lock: asyncio.Lock,
+                  raw_request: bytes) -> None:
+    try:
+        request = json.loads(raw_request)
+    except ValueError as e:
+        logger.info("Client sent invalid JSON: %r", raw_request[:100])
+        response = json_error(f'Cannot parse json: {e}')
+    else:
+        if isinstance(request, list):
+            response = await execute_batch(execute_rpc, request)
         else:
-            if not result.endswith(NEW_LINE):
-                result += NEW_LINE
+            response = await execute_request(execute_rpc, request)
 
-            writer.write(result.encode())
+    await write_response(writer, write_lock, response)
 
-        await writer.drain()
 
+async def execute_batch(execute_rpc: Callable[[Any], Any], requests: List[Any]) -> str:
+    if not requests:
+        logger.debug("Client sent empty batch")
+        return json_error('Invalid Request: empty batch')
 
-def strip_non_json_prefix(raw_request: str) -> Tuple[str, str]:
-    if raw_request and raw_request[0] != '{':
-        prefix, bracket, rest = raw_request.partition('{')
-        return prefix.strip(), bracket + rest
-    else:
-        return '', raw_request
+    responses = await asyncio.gather(*(
+        execute_request(execute_rpc, request) for request in requests
+    ))
+    return '[' + ','.join(response.rstrip(NEW_LINE) for response in responses) + ']'
+
+
+async def execute_request(execute_rpc: Callable[[Any], Any], request: Any) -> str:
+    if not request:
+        logger.debug("Client sent empty request")
+        return json_error('Invalid Request: empty')
+    elif not isinstance(request, dict):
+        return json_error(f'Invalid Request: {request!r}')
+
+    try:
+        return await execute_rpc(request)
+    except Exception as e:
+        logger.exception("Unrecognized exception while executing RPC")
+        return json_error("unknown failure: " + str(e))
+
+
+def json_error(message: str) -> str:
+    return json.dumps({'error': message})
 
 
-async def write_error(writer: asyncio.StreamWriter, message: str) -> None:
-    json_error = json.dumps({'error': message})
-    writer.write(json_error.encode())
-    await writer.drain()
+async def write_response(writer: asyncio.StreamWriter,
+                         write_lock: asyncio.Lock,
+                         response: str) -> None:
+    if not response.endswith(NEW_LINE):
+        response += NEW_LINE
+
+    writer.write(response.encode())
+    # concurrent drains of the same writer are not allowed
+    async with write_lock:
+        await writer.drain()
 
 
 class IPCServer(Service):
@@ -127,7 +295,6 @@ class IPCServer(Service):
         server = await asyncio.start_unix_server(
             connection_handler(self.rpc.execute),
             str(self.ipc_path),
-            limit=MAXIMUM_REQUEST_BYTES,
         )
         self.logger.info('IPC started at: %s', self.ipc_path.resolve())
         try:
@@ -1,4 +1,7 @@
+import asyncio
+import itertools
 import os
+import time
 
 from eth_utils.toolz import (
     identity,
@@ -8,9 +11,14 @@ from typing import (
     cast,
     Dict,
     List,
+    NamedTuple,
     NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
     Union,
 )
+from lahja import EndpointAPI
 from mypy_extensions import (
     TypedDict,
 )
@@ -32,10 +40,12 @@ from eth.abc import (
     SignedTransactionAPI,
     StateAPI,
 )
+
 from eth.constants import (
     ZERO_ADDRESS,
 )
 from eth.exceptions import (
+    BlockNotFound,
     HeaderNotFound,
     TransactionNotFound,
 )
@@ -53,14 +63,20 @@ from eth._utils.padding import (
 )
 
 from trinity.chains.base import AsyncChainAPI
+from trinity.components.builtin.tx_pool.events import GetPendingTransactionRequest
 from trinity.constants import (
     TO_NETWORKING_BROADCAST_CONFIG,
 )
+from trinity.db.eth1.log_index import (
+    LogCriteria,
+    LogIndex,
+)
 from trinity.exceptions import RpcError
 from trinity.rpc.format import (
     block_to_dict,
     header_to_dict,
     format_params,
+    log_to_dict,
     normalize_transaction_dict,
     to_int_if_hex,
     to_receipt_response,
@@ -73,6 +89,7 @@ from trinity.rpc.retry import retryable
 from trinity.rpc.typing import (
     RpcBlockResponse,
     RpcHeaderResponse,
+    RpcLogResponse,
     RpcReceiptResponse,
     RpcTransactionResponse,
 )
@@ -86,6 +103,12 @@ from trinity._utils.validation import (
 
 from ._util import get_header
 
+# How long to wait for the transaction pool to look up a pending transaction
+PENDING_TRANSACTION_REQUEST_TIMEOUT = 1  # seconds
+
+# Filters that are not polled for this long are uninstalled, like in geth
+FILTER_TIMEOUT = 5 * 60  # seconds
+
 
 async def state_at_block(
         chain: AsyncChainAPI,
@@ -137,6 +160,48 @@ def dict_to_spoof_transaction(
     return cast(SignedTransactionAPI, SpoofTransaction(unsigned, from_=sender))
 
 
+def _decode_hash(value: str) -> Hash32:
+    hash_bytes = decode_hex(value)
+    if len(hash_bytes) != 32:
+        raise RpcError(f"Invalid hash, expected 32 bytes: {value}")
+    return Hash32(hash_bytes)
+
+
+def _decode_filter_values(value: Union[None, str, Sequence[str]]) -> Tuple[str, ...]:
+    # A filter value is a single value, a list of alternatives or null for any value
+    if value is None:
+        return ()
+    elif isinstance(value, str):
+        return (value,)
+    elif None in value:
+        return ()
+    else:
+        return tuple(value)
+
+
+def dict_to_log_criteria(filter_params: Dict[str, Any]) -> LogCriteria:
+    """
+    Convert the address and topics of the filter dicts of log queries into :class:`LogCriteria`
+    """
+    addresses = tuple(
+        Address(decode_hex(address))
+        for address in _decode_filter_values(filter_params.get('address'))
+    )
+    topics = tuple(
+        tuple(map(_decode_hash, _decode_filter_values(position)))
+        for position in filter_params.get('topics') or ()
+    )
+    return LogCriteria(addresses, topics)
+
+
+class LogFilter(NamedTuple):
+    criteria: LogCriteria
+    # resolved when the filter is installed
+    from_block: BlockNumber
+    # ``None`` if the filter follows the head
+    to_block: Optional[BlockNumber]
+
+
 class SyncProgressDict(TypedDict):
     startingBlock: BlockNumber
     currentBlock: BlockNumber
@@ -149,6 +214,15 @@ class Eth(Eth1ChainRPCModule):
 
     Any attribute without an underscore is publicly accessible.
     """
+    def __init__(self, chain: AsyncChainAPI, event_bus: EndpointAPI) -> None:
+        super().__init__(chain, event_bus)
+        self._filter_ids = itertools.count(1)
+        self._log_filters: Dict[int, LogFilter] = {}
+        # The last block of every filter that `getFilterChanges` has seen
+        self._filter_last_blocks: Dict[int, BlockNumber] = {}
+        # When every filter was last used, to uninstall the abandoned ones
+        self._filter_last_polls: Dict[int, float] = {}
+
     async def accounts(self) -> List[str]:
         # trinity does not manage accounts for the user
         return []
@@ -245,7 +319,22 @@ class Eth(Eth1ChainRPCModule):
     @format_params(decode_hex)
     async def getTransactionByHash(self,
                                    transaction_hash: Hash32) -> RpcTransactionResponse:
-        transaction = await self.chain.coro_get_canonical_transaction(transaction_hash)
+        try:
+            transaction = await self.chain.coro_get_canonical_transaction(transaction_hash)
+        except TransactionNotFound as not_found:
+            # It may still be waiting in the transaction pool, if one is running
+            if not self.event_bus.is_any_endpoint_subscribed_to(GetPendingTransactionRequest):
+                raise
+            try:
+                response = await asyncio.wait_for(
+                    self.event_bus.request(GetPendingTransactionRequest(transaction_hash)),
+                    timeout=PENDING_TRANSACTION_REQUEST_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                raise not_found
+            if response.transaction is None:
+                raise
+            transaction = response.transaction
         return transaction_to_dict(transaction)
 
     @format_params(decode_hex, to_int_if_hex)
@@ -321,6 +410,160 @@ class Eth(Eth1ChainRPCModule):
 
         return to_receipt_response(receipt, transaction, tx_index, block_header, tx_gas_used)
 
+    @format_params(identity)
+    async def getLogs(self, filter_params: Dict[str, Any]) -> List[RpcLogResponse]:
+        criteria = dict_to_log_criteria(filter_params)
+        if filter_params.get('blockHash') is not None:
+            if 'fromBlock' in filter_params or 'toBlock' in filter_params:
+                raise RpcError("Cannot query logs with both blockHash and fromBlock/toBlock")
+            block_hash = _decode_hash(filter_params['blockHash'])
+            header = await self.chain.coro_get_block_header_by_hash(block_hash)
+            canonical_header = await self.chain.coro_get_canonical_block_header_by_number(
+                header.block_number,
+            )
+            if canonical_header.hash != block_hash:
+                raise RpcError(f"Block {encode_hex(block_hash)} is not in the canonical chain")
+            from_block = to_block = header.block_number
+        else:
+            from_block, to_block = self._get_filter_range(
+                filter_params.get('fromBlock', 'latest'),
+                filter_params.get('toBlock', 'latest'),
+            )
+        return await self._find_logs(from_block, to_block, criteria)
+
+    @format_params(identity)
+    async def newFilter(self, filter_params: Dict[str, Any]) -> str:
+        self._expire_filters()
+        head_number = self.chain.get_canonical_head().block_number
+        from_block = self._get_filter_block_number(
+            to_int_if_hex(filter_params.get('fromBlock', 'latest')),
+            head_number,
+        )
+        to_block = to_int_if_hex(filter_params.get('toBlock', 'latest'))
+        resolved_to_block: Optional[BlockNumber]
+        if to_block in ('latest', 'pending'):
+            resolved_to_block = None
+        else:
+            # blocks after the current head may have logs by the time the filter is polled
+            resolved_to_block = self._get_filter_block_number(to_block, head_number)
+        log_filter = LogFilter(dict_to_log_criteria(filter_params), from_block, resolved_to_block)
+        filter_id = next(self._filter_ids)
+        self._log_filters[filter_id] = log_filter
+        # The changes of a new filter are the logs of the blocks after the current head
+        self._filter_last_blocks[filter_id] = head_number
+        self._filter_last_polls[filter_id] = time.monotonic()
+        return hex(filter_id)
+
+    @format_params(to_int_if_hex)
+    async def getFilterChanges(self, filter_id: int) -> List[RpcLogResponse]:
+        log_filter = self._get_log_filter(filter_id)
+        # Every block since the last poll, no matter how many were imported in between
+        last_block = self._filter_last_blocks[filter_id]
+        from_block = BlockNumber(max(log_filter.from_block, last_block + 1))
+        to_block = self._get_filter_to_block(log_filter)
+        if to_block > last_block:
+            self._filter_last_blocks[filter_id] = to_block
+        return await self._find_logs(from_block, to_block, log_filter.criteria)
+
+    @format_params(to_int_if_hex)
+    async def getFilterLogs(self, filter_id: int) -> List[RpcLogResponse]:
+        log_filter = self._get_log_filter(filter_id)
+        return await self._find_logs(
+            log_filter.from_block,
+            self._get_filter_to_block(log_filter),
+            log_filter.criteria,
+        )
+
+    @format_params(to_int_if_hex)
+    async def uninstallFilter(self, filter_id: int) -> bool:
+        return self._remove_filter(filter_id)
+
+    def _get_log_filter(self, filter_id: int) -> LogFilter:
+        self._expire_filters()
+        try:
+            log_filter = self._log_filters[filter_id]
+        except KeyError:
+            raise RpcError(f"Filter {filter_id} not found")
+        self._filter_last_polls[filter_id] = time.monotonic()
+        return log_filter
+
+    def _get_filter_to_block(self, log_filter: LogFilter) -> BlockNumber:
+        head_number = self.chain.get_canonical_head().block_number
+        if log_filter.to_block is None:
+            return head_number
+        else:
+            # blocks after the head have no logs yet
+            return BlockNumber(min(log_filter.to_block, head_number))
+
+    def _remove_filter(self, filter_id: int) -> bool:
+        self._filter_last_blocks.pop(filter_id, None)
+        self._filter_last_polls.pop(filter_id, None)
+        return self._log_filters.pop(filter_id, None) is not None
+
+    def _expire_filters(self) -> None:
+        expired_before = time.monotonic() - FILTER_TIMEOUT
+        expired_filter_ids = tuple(
+            filter_id
+            for filter_id, last_poll in self._filter_last_polls.items()
+            if last_poll < expired_before
+        )
+        for filter_id in expired_filter_ids:
+            self._remove_filter(filter_id)
+
+    def _get_filter_range(self,
+                          from_block: Union[str, int],
+                          to_block: Union[str, int]) -> Tuple[BlockNumber, BlockNumber]:
+        head_number = self.chain.get_canonical_head().block_number
+        return (
+            self._get_filter_block_number(to_int_if_hex(from_block), head_number),
+            # blocks after the head have no logs yet
+            BlockNumber(min(
+                self._get_filter_block_number(to_int_if_hex(to_block), head_number),
+                head_number,
+            )),
+        )
+
+    def _get_filter_block_number(self,
+                                 at_block: Union[str, int],
+                                 head_number: BlockNumber) -> BlockNumber:
+        if at_block in ('latest', 'pending'):
+            return head_number
+        elif at_block == 'earliest':
+            return BlockNumber(0)
+        # mypy doesn't have user defined type guards yet
+        # https://github.com/python/mypy/issues/5206
+        elif is_integer(at_block) and at_block >= 0:  # type: ignore
+            return BlockNumber(int(at_block))
+        else:
+            raise TypeError("Unrecognized block reference: %r" % at_block)
+
+    async def _find_logs(self,
+                         from_block: BlockNumber,
+                         to_block: BlockNumber,
+                         criteria: LogCriteria) -> List[RpcLogResponse]:
+        if from_block > to_block:
+            # e.g. from a block after the head
+            return []
+        # The search reads blooms and receipts over the database IPC, so it runs in a thread
+        loop = asyncio.get_event_loop()
+        try:
+            return await loop.run_in_executor(
+                None,
+                self._read_logs,
+                from_block,
+                to_block,
+                criteria,
+            )
+        except (HeaderNotFound, BlockNotFound) as exc:
+            raise RpcError(f"Logs of blocks {from_block} to {to_block} are not available") from exc
+
+    def _read_logs(self,
+                   from_block: BlockNumber,
+                   to_block: BlockNumber,
+                   criteria: LogCriteria) -> List[RpcLogResponse]:
+        log_index = LogIndex(self.chain.chaindb)
+        return [log_to_dict(log) for log in log_index.find_logs(from_block, to_block, criteria)]
+
     @format_params(decode_hex)
     async def getUncleCountByBlockHash(self, block_hash: Hash32) -> str:
         block = await self.chain.coro_get_block_by_hash(block_hash)
@@ -1,8 +1,24 @@
+import asyncio
+from collections import (
+    Counter,
+    deque,
+)
+import time
+import typing
 from typing import (
+    Collection,
+    Deque,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
     Tuple,
-    AsyncGenerator,
 )
 
+from eth.exceptions import (
+    BlockNotFound,
+)
 from eth_utils import (
     ValidationError,
 )
@@ -13,6 +29,7 @@ from lahja import (
 from cancel_token import (
     CancelToken,
 )
+from libp2p.peer.id import ID
 
 from p2p.service import (
     BaseService,
@@ -35,13 +52,28 @@ from trinity.protocol.bcc_libp2p.exceptions import RequestFailure
 from trinity.protocol.bcc_libp2p.node import PeerPool, Peer
 from trinity.sync.beacon.constants import (
     MAX_BLOCKS_PER_REQUEST,
+    MAX_IMPORT_QUEUE_SIZE,
+    MAX_RANGES_IN_FLIGHT,
 )
 from trinity.sync.common.chain import (
     SyncBlockImporter,
 )
 from trinity.sync.beacon.events import SyncRequest
 
-from .exceptions import LeadingPeerNotFonud
+from .exceptions import (
+    LeadingPeerNotFonud,
+    RangeRequestFailure,
+)
+
+
+class BlockRange(NamedTuple):
+    """
+    The blocks of ``slot_count`` slots from ``start_slot`` on, as served by a peer.
+    """
+    start_slot: Slot
+    slot_count: int
+    peer_id: ID
+    blocks: Tuple[BaseSignedBeaconBlock, ...]
 
 
 class BeaconChainSyncer(BaseService):
@@ -60,7 +92,8 @@ class BeaconChainSyncer(BaseService):
                  block_importer: SyncBlockImporter,
                  genesis_config: Eth2Config,
                  event_bus: EndpointAPI,
-                 token: CancelToken = None) -> None:
+                 token: CancelToken = None,
+                 max_ranges_in_flight: int = MAX_RANGES_IN_FLIGHT) -> None:
         super().__init__(token)
 
         self.chain_db = chain_db
@@ -68,8 +101,12 @@ class BeaconChainSyncer(BaseService):
         self.block_importer = block_importer
         self.genesis_config = genesis_config
         self._event_bus = event_bus
+        self.max_ranges_in_flight = max_ranges_in_flight
 
         self.sync_peer = None
+        self._requests_in_flight: typing.Counter[ID] = Counter()
+        # peers that served invalid blocks are not asked again during a sync
+        self._penalized_peer_ids: Set[ID] = set()
 
     async def _run(self) -> None:
         async for event in self.wait_iter(self._event_bus.stream(SyncRequest)):
@@ -112,27 +149,175 @@ class BeaconChainSyncer(BaseService):
             finalized_slot = self.genesis_config.GENESIS_SLOT
 
         self.logger.info(
-            "Syncing with %s (their head slot: %d, our finalized slot: %d)",
+            "Syncing with %s and %d other peer(s) (their head slot: %d, our finalized slot: %d)",
             self.sync_peer,
+            len(self.peer_pool) - 1,
             self.sync_peer.head_slot,
             finalized_slot,
         )
-        start_slot = finalized_slot + 1
-        batches = self.request_batches(start_slot)
+        start_slot = Slot(finalized_slot + 1)
+        self._penalized_peer_ids.clear()
+
+        # downloaded ranges, in order, waiting to be imported
+        batches: 'asyncio.Queue[Optional[BlockRange]]' = asyncio.Queue(MAX_IMPORT_QUEUE_SIZE)
+        download = asyncio.ensure_future(
+            self.download_batches(start_slot, self.sync_peer.head_slot, batches)
+        )
+        start_time = time.perf_counter()
+        try:
+            imported_count = await self.import_batches(batches)
+        finally:
+            download.cancel()
+            await asyncio.wait((download,))
+
+        elapsed = time.perf_counter() - start_time
+        self.logger.info(
+            "Imported %d blocks in %.2f seconds (%.1f blocks/s)",
+            imported_count,
+            elapsed,
+            imported_count / elapsed if elapsed else 0.0,
+        )
+
+    async def download_batches(
+            self,
+            start_slot: Slot,
+            target_slot: Slot,
+            batches: 'asyncio.Queue[Optional[BlockRange]]') -> None:
+        """
+        Download the blocks from ``start_slot`` to ``target_slot`` in ranges of
+        ``MAX_BLOCKS_PER_REQUEST`` slots, from all peers that have them, with up to
+        ``max_ranges_in_flight`` requests ahead of the import. Put the ranges into
+        ``batches`` in order, followed by ``None``.
+        """
+        range_starts = iter(range(start_slot, target_slot + 1, MAX_BLOCKS_PER_REQUEST))
+        in_flight: Deque['asyncio.Future[BlockRange]'] = deque()
+        try:
+            while True:
+                while len(in_flight) < self.max_ranges_in_flight:
+                    range_start = next(range_starts, None)
+                    if range_start is None:
+                        break
+                    count = min(MAX_BLOCKS_PER_REQUEST, target_slot - range_start + 1)
+                    in_flight.append(
+                        asyncio.ensure_future(self.request_range(Slot(range_start), count))
+                    )
+                if not in_flight:
+                    break
 
-        last_block = None
-        async for batch in batches:
-            if last_block is None:
                 try:
-                    await self.validate_first_batch(batch)
-                except ValidationError as error:
-                    self.logger.debug("Invalid first batch: %s", error)
-                    return
+                    batch = await self.wait(in_flight.popleft())
+                except RangeRequestFailure as error:
+                    self.logger.info("Stop syncing: %s", error)
+                    break
+                await self.wait(batches.put(batch))
+        finally:
+            for request in in_flight:
+                request.cancel()
+
+        await self.wait(batches.put(None))
+
+    async def request_range(self,
+                            start_slot: Slot,
+                            count: int,
+                            avoided_peer_ids: Collection[ID] = ()) -> BlockRange:
+        """
+        Request the blocks of ``count`` slots from ``start_slot`` on from the least
+        busy peer with its head at or after the last of them, asking the peers in
+        ``avoided_peer_ids`` last. If the request fails, or the peer responds with
+        anything but a chain of blocks in that range, the range goes to another peer.
+        """
+        end_slot = start_slot + count - 1
+        tried_peer_ids: Set[ID] = set()
+        while True:
+            candidates = tuple(
+                (peer_id, peer) for peer_id, peer in self.peer_pool.peers.items()
+                if peer_id not in tried_peer_ids and
+                peer_id not in self._penalized_peer_ids and
+                peer.head_slot >= end_slot
+            )
+            if not candidates:
+                raise RangeRequestFailure(
+                    f"None of {len(tried_peer_ids)} peer(s) served the blocks of "
+                    f"slots #{start_slot} to #{end_slot}"
+                )
+            peer_id, peer = min(
+                candidates,
+                key=lambda candidate: (
+                    candidate[0] in avoided_peer_ids,
+                    self._requests_in_flight[candidate[0]],
+                ),
+            )
+            tried_peer_ids.add(peer_id)
+
+            self.logger.debug(
+                "Requesting %d slots from %s starting at #%d", count, peer, start_slot
+            )
+            self._requests_in_flight[peer_id] += 1
+            try:
+                batch = await peer.request_beacon_blocks_by_range(start_slot, count)
+                validate_range(batch, start_slot, count, peer.head_slot)
+            except RequestFailure as error:
+                self.logger.debug(
+                    "Request of slots from #%d to %s failed, reason: %s", start_slot, peer, error
+                )
+                continue
+            except ValidationError as error:
+                self.penalize(peer_id, error)
+                continue
+            finally:
+                self._requests_in_flight[peer_id] -= 1
+                if not self._requests_in_flight[peer_id]:
+                    del self._requests_in_flight[peer_id]
+            return BlockRange(start_slot, count, peer_id, batch)
+
+    def penalize(self, peer_id: ID, reason: Exception) -> None:
+        """
+        Stop requesting blocks from the peer for the rest of the sync.
+        """
+        self.logger.info("Peer %s served invalid blocks, not syncing from it: %s", peer_id, reason)
+        self._penalized_peer_ids.add(peer_id)
+
+    async def import_batches(self, batches: 'asyncio.Queue[Optional[BlockRange]]') -> int:
+        """
+        Import the batches as they are downloaded, until ``None``. Return the number of
+        imported blocks. A batch that does not continue the imported chain is requested
+        again, after the slots since the last imported block, see ``request_again``.
+        """
+        imported_count = 0
+        last_block = None
+        # the imported ranges since the one of the last imported block, which may
+        # have left out blocks after it
+        unlinked_ranges: List[BlockRange] = []
+        # ranges requested again, imported before the next downloaded one
+        retried_ranges: Deque[BlockRange] = deque()
+        while True:
+            if retried_ranges:
+                block_range = retried_ranges.popleft()
             else:
-                if batch[0].parent_root != last_block.message.hash_tree_root:
-                    self.logger.info("Received batch is not linked to previous one")
+                block_range = await self.wait(batches.get())
+                if block_range is None:
                     break
+
+            try:
+                await self.validate_link(block_range.blocks, last_block)
+            except ValidationError as error:
+                self.logger.debug("Requesting the unlinked blocks again: %s", error)
+                try:
+                    retried_ranges.extendleft(reversed(await self.wait(
+                        self.request_again(block_range, last_block, unlinked_ranges)
+                    )))
+                except RangeRequestFailure as error:
+                    self.logger.info("Stop syncing: %s", error)
+                    return imported_count
+                continue
+
+            batch = block_range.blocks
+            if not batch:
+                # only skipped slots
+                unlinked_ranges.append(block_range)
+                continue
             last_block = batch[-1]
+            unlinked_ranges = [block_range]
 
             for block in batch:
                 # Copied from `RegularChainBodySyncer._import_blocks`
@@ -156,33 +341,91 @@ class BeaconChainSyncer(BaseService):
                     else:
                         raise Exception("Invariant: unreachable code path")
                 except ValidationError as error:
-                    self.logger.info(f"Received invalid block from {self.sync_peer}: {error}")
-                    break
+                    self.logger.info(f"Received invalid block {block}: {error}")
+                    return imported_count
+                imported_count += 1
+                # the import is synchronous, let the downloads make progress in between
+                await asyncio.sleep(0)
+        return imported_count
 
-    async def request_batches(self,
-                              start_slot: Slot,
-                              ) -> AsyncGenerator[Tuple[BaseSignedBeaconBlock, ...], None]:
-        slot = start_slot
-        while True:
-            self.logger.debug(
-                "Requesting blocks from %s starting at #%d", self.sync_peer, slot
-            )
-            try:
-                batch = await self.sync_peer.request_beacon_blocks_by_range(
-                    slot, MAX_BLOCKS_PER_REQUEST
+    async def request_again(
+            self,
+            block_range: BlockRange,
+            last_block: Optional[BaseSignedBeaconBlock],
+            unlinked_ranges: Sequence[BlockRange]) -> Tuple[BlockRange, ...]:
+        """
+        Request the blocks again, when ``block_range`` does not continue the chain
+        imported up to ``last_block``. Either the peers of ``unlinked_ranges`` left out
+        blocks since ``last_block``, or the peer of ``block_range`` served other blocks.
+        So first request the slots since ``last_block``, from other peers if possible,
+        and penalize the peers that left out any of their blocks. Then request
+        ``block_range`` from another peer, if it does not continue those blocks either.
+        Return the ranges to import, in order.
+        """
+        if last_block is not None:
+            start_slot = last_block.slot + 1
+        elif unlinked_ranges:
+            start_slot = unlinked_ranges[0].start_slot
+        else:
+            start_slot = block_range.start_slot
+        suspect_peer_ids = {unlinked_range.peer_id for unlinked_range in unlinked_ranges}
+
+        ranges = []
+        linked_block = last_block
+        for range_start in range(start_slot, block_range.start_slot, MAX_BLOCKS_PER_REQUEST):
+            count = min(MAX_BLOCKS_PER_REQUEST, block_range.start_slot - range_start)
+            while True:
+                missing_range = await self.request_range(
+                    Slot(range_start),
+                    count,
+                    suspect_peer_ids,
                 )
-            except RequestFailure as error:
-                self.logger.debug("Request batch failed  reason: %s", error)
-                break
+                try:
+                    await self.validate_link(missing_range.blocks, linked_block)
+                except ValidationError as error:
+                    self.penalize(missing_range.peer_id, error)
+                else:
+                    break
+            ranges.append(missing_range)
+            if missing_range.blocks:
+                linked_block = missing_range.blocks[-1]
 
-            if len(batch) == 0:
-                break
+        missing_slots = {block.slot for missing_range in ranges for block in missing_range.blocks}
+        for unlinked_range in unlinked_ranges:
+            left_out_slots = missing_slots.intersection(range(
+                unlinked_range.start_slot,
+                unlinked_range.start_slot + unlinked_range.slot_count,
+            ))
+            if left_out_slots:
+                self.penalize(unlinked_range.peer_id, ValidationError(
+                    f"Left out the block at slot #{min(left_out_slots)}"
+                ))
 
-            yield batch
+        while True:
+            try:
+                await self.validate_link(block_range.blocks, linked_block)
+            except ValidationError as error:
+                self.penalize(block_range.peer_id, error)
+            else:
+                return tuple(ranges) + (block_range,)
+            block_range = await self.request_range(block_range.start_slot, block_range.slot_count)
 
-            slot = Slot(batch[-1].slot + 1)
-            if slot > self.sync_peer.head_slot:
-                break
+    async def validate_link(self,
+                            batch: Tuple[BaseSignedBeaconBlock, ...],
+                            last_block: Optional[BaseSignedBeaconBlock]) -> None:
+        """
+        Validate that ``batch`` continues the chain imported up to ``last_block``,
+        or starts from our finalized head if nothing was imported yet.
+        """
+        if not batch:
+            return
+        elif last_block is None:
+            await self.validate_first_batch(batch)
+        elif batch[0].parent_root != last_block.message.hash_tree_root:
+            raise ValidationError(
+                f"Block at slot #{batch[0].slot} is not linked to the block at slot "
+                f"#{last_block.slot} of the previous batch"
+            )
 
     async def validate_first_batch(self, batch: Tuple[BaseSignedBeaconBlock, ...]) -> None:
         try:
@@ -196,10 +439,15 @@ class BeaconChainSyncer(BaseService):
                 "genesis block"
             )
 
-        parent = await self.chain_db.coro_get_block_by_root(
-            first_block.parent_root,
-            SignedBeaconBlock,
-        )
+        try:
+            parent = await self.chain_db.coro_get_block_by_root(
+                first_block.parent_root,
+                SignedBeaconBlock,
+            )
+        except BlockNotFound:
+            raise ValidationError(
+                f"Parent of the block at slot #{first_block.slot} is unknown"
+            )
         finalized_head = await self.chain_db.coro_get_finalized_head(SignedBeaconBlock)
 
         if parent.message.hash_tree_root != finalized_head.message.hash_tree_root:
@@ -211,3 +459,31 @@ class BeaconChainSyncer(BaseService):
                 finalized_head,
             )
             raise ValidationError(message)
+
+
+def validate_range(batch: Tuple[BaseSignedBeaconBlock, ...],
+                   start_slot: Slot,
+                   count: int,
+                   head_slot: Slot) -> None:
+    """
+    Validate that ``batch`` is a chain of blocks within the ``count`` slots from
+    ``start_slot`` on, served by a peer with its head at ``head_slot``. Any of the
+    slots may be skipped, but not the one of the head of the peer.
+    """
+    end_slot = start_slot + count
+    if start_slot <= head_slot < end_slot and (not batch or batch[-1].slot != head_slot):
+        raise ValidationError(
+            f"No block at the head slot #{head_slot} of the peer, in slots "
+            f"#{start_slot} to #{end_slot - 1}"
+        )
+    for block in batch:
+        if block.slot < start_slot or block.slot >= end_slot:
+            raise ValidationError(
+                f"Block at slot #{block.slot} is outside of the requested slots "
+                f"#{start_slot} to #{end_slot - 1}"
+            )
+    for parent, child in zip(batch, batch[1:]):
+        if child.parent_root != parent.message.hash_tree_root:
+            raise ValidationError(
+                f"Block at slot #{child.slot} is not a child of the block at slot #{parent.slot}"
+            )
@@ -1 +1,5 @@
 MAX_BLOCKS_PER_REQUEST = 64
+# Number of block ranges requested ahead of the import
+MAX_RANGES_IN_FLIGHT = 8
+# Number of downloaded ranges waiting for the import
+MAX_IMPORT_QUEUE_SIZE = 2
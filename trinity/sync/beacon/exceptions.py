@@ -6,3 +6,10 @@ class LeadingPeerNotFonud(BaseTrinityError):
     Raised when unable to find a peer to sync
     """
     ...
+
+
+class RangeRequestFailure(BaseTrinityError):
+    """
+    Raised when no peer served a range of blocks
+    """
+    ...
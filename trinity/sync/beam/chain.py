@@ -35,6 +35,7 @@ from trinity.chains.base import AsyncChainAPI
 from trinity.constants import FIRE_AND_FORGET_BROADCASTING
 from trinity.db.eth1.chain import BaseAsyncChainDB
 from trinity.db.eth1.header import BaseAsyncHeaderDB
+from trinity.db.sender_cache import TransactionSenderCache
 from trinity.protocol.eth.peer import ETHPeerPool
 from trinity.protocol.eth.sync import ETHHeaderChainSyncer
 from trinity.sync.beam.constants import (
@@ -112,7 +113,8 @@ class BeamSyncer(BaseService):
             event_bus: EndpointAPI,
             checkpoint: Checkpoint = None,
             force_beam_block_number: BlockNumber = None,
-            token: CancelToken = None) -> None:
+            token: CancelToken = None,
+            sender_cache: TransactionSenderCache = None) -> None:
         super().__init__(token=token)
 
         if checkpoint is None:
@@ -174,6 +176,7 @@ class BeamSyncer(BaseService):
             self._checkpoint_header_syncer,
             self._block_importer,
             self.cancel_token,
+            sender_cache,
         )
 
         self._manual_header_syncer = ManualHeaderSyncer()
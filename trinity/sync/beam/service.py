@@ -9,6 +9,7 @@ from p2p.service import BaseService
 
 from trinity.chains.base import AsyncChainAPI
 from trinity.db.eth1.chain import BaseAsyncChainDB
+from trinity.db.sender_cache import TransactionSenderCache
 from trinity.protocol.eth.peer import ETHPeerPool
 from trinity.sync.beam.constants import (
     ESTIMATED_BEAMABLE_BLOCKS,
@@ -30,7 +31,8 @@ class BeamSyncService(BaseService):
             event_bus: EndpointAPI,
             checkpoint: Checkpoint = None,
             force_beam_block_number: BlockNumber = None,
-            token: CancelToken = None) -> None:
+            token: CancelToken = None,
+            sender_cache: TransactionSenderCache = None) -> None:
         super().__init__(token)
         self.chain = chain
         self.chaindb = chaindb
@@ -39,6 +41,7 @@ class BeamSyncService(BaseService):
         self.event_bus = event_bus
         self.checkpoint = checkpoint
         self.force_beam_block_number = force_beam_block_number
+        self.sender_cache = sender_cache
 
     async def _run(self) -> None:
         head = await self.wait(self.chaindb.coro_get_canonical_head())
@@ -65,6 +68,7 @@ class BeamSyncService(BaseService):
                 self.checkpoint,
                 self.force_beam_block_number,
                 token=self.cancel_token,
+                sender_cache=self.sender_cache,
             )
             self.run_child_service(beam_syncer)
             do_pivot = await self._monitor_for_pivot(beam_syncer)
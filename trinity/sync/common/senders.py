@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+)
+import os
+from typing import (
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from eth_typing import Address
+
+from eth.abc import SignedTransactionAPI
+
+from trinity.db.sender_cache import (
+    TransactionSenderCache,
+    get_cached_sender,
+    recover_senders,
+    set_cached_sender,
+)
+
+# Fewer missing senders than this are recovered in the syncer's own process, since
+# sending them to a worker would cost about as much as recovering them.
+MIN_PARALLEL_RECOVERY = 16
+
+
+class SenderRecovery:
+    """
+    Make sure the senders of the transactions of a block are known before the
+    block is imported: from the shared sender cache, or else recovered from the
+    signatures in a pool of worker processes.
+    """
+
+    def __init__(self,
+                 sender_cache: TransactionSenderCache = None,
+                 max_workers: int = None) -> None:
+        self._sender_cache = sender_cache
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self._max_workers = max_workers
+        self._executor: Executor = None
+
+    async def recover(self, transactions: Sequence[SignedTransactionAPI]) -> None:
+        if self._sender_cache is None:
+            missing = tuple(tx for tx in transactions if get_cached_sender(tx) is None)
+        else:
+            missing = self._sender_cache.fill(transactions)
+
+        if len(missing) >= MIN_PARALLEL_RECOVERY and self._max_workers > 1:
+            senders = await self._recover_in_workers(missing)
+        else:
+            senders = recover_senders(missing)
+        for transaction, sender in zip(missing, senders):
+            # an invalid signature is left for the import to reject
+            if sender is not None:
+                set_cached_sender(transaction, sender)
+
+        if self._sender_cache is not None:
+            self._sender_cache.add(missing)
+
+    async def _recover_in_workers(
+            self,
+            transactions: Sequence[SignedTransactionAPI]) -> Tuple[Optional[Address], ...]:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self._max_workers)
+
+        chunk_size = -(-len(transactions) // self._max_workers)
+        loop = asyncio.get_event_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._executor,
+                recover_senders,
+                transactions[start:start + chunk_size],
+            )
+            for start in range(0, len(transactions), chunk_size)
+        ))
+        return tuple(sender for chunk in chunks for sender in chunk)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -59,6 +59,7 @@ from p2p.token_bucket import TokenBucket
 
 from trinity.chains.base import AsyncChainAPI
 from trinity.db.eth1.chain import BaseAsyncChainDB
+from trinity.db.sender_cache import TransactionSenderCache
 from trinity.protocol.eth.monitors import ETHChainTipMonitor
 from trinity.protocol.eth import commands
 from trinity.protocol.eth.constants import (
@@ -77,6 +78,7 @@ from trinity.sync.common.constants import (
 )
 from trinity.sync.common.headers import HeaderSyncerAPI
 from trinity.sync.common.peers import WaitingPeers
+from trinity.sync.common.senders import SenderRecovery
 from trinity.sync.full.constants import (
     HEADER_QUEUE_SIZE_TARGET,
     BLOCK_QUEUE_SIZE_TARGET,
@@ -967,7 +969,8 @@ class RegularChainSyncer(BaseService):
                  chain: AsyncChainAPI,
                  db: BaseAsyncChainDB,
                  peer_pool: ETHPeerPool,
-                 token: CancelToken = None) -> None:
+                 token: CancelToken = None,
+                 sender_cache: TransactionSenderCache = None) -> None:
         super().__init__(token=token)
         self._header_syncer = ETHHeaderChainSyncer(chain, db, peer_pool, token=self.cancel_token)
         self._body_syncer = RegularChainBodySyncer(
@@ -977,6 +980,7 @@ class RegularChainSyncer(BaseService):
             self._header_syncer,
             SimpleBlockImporter(chain),
             self.cancel_token,
+            sender_cache,
         )
 
     async def _run(self) -> None:
@@ -1004,7 +1008,8 @@ class RegularChainBodySyncer(BaseBodyChainSyncer):
                  peer_pool: ETHPeerPool,
                  header_syncer: HeaderSyncerAPI,
                  block_importer: BaseBlockImporter,
-                 token: CancelToken = None) -> None:
+                 token: CancelToken = None,
+                 sender_cache: TransactionSenderCache = None) -> None:
         super().__init__(chain, db, peer_pool, header_syncer, token)
 
         # track when block bodies are downloaded, so that blocks can be imported
@@ -1032,6 +1037,8 @@ class RegularChainBodySyncer(BaseBodyChainSyncer):
 
         self._import_active = asyncio.Lock()
 
+        self._sender_recovery = SenderRecovery(sender_cache)
+
     async def _run(self) -> None:
         head = await self.wait(self.db.coro_get_canonical_head())
         self._block_import_tracker.set_finished_dependency(head)
@@ -1042,6 +1049,10 @@ class RegularChainBodySyncer(BaseBodyChainSyncer):
         self.run_daemon_task(self._display_stats())
         await super()._run()
 
+    async def _cleanup(self) -> None:
+        self._sender_recovery.shutdown()
+        await super()._cleanup()
+
     def register_peer(self, peer: BasePeer) -> None:
         # when a new peer is added to the pool, add it to the idle peer list
         super().register_peer(peer)
@@ -1107,6 +1118,10 @@ class RegularChainBodySyncer(BaseBodyChainSyncer):
             header = completed_headers[0]
             block = self._header_to_block(header)
 
+            # Know every sender before the import starts, so that neither the
+            # preview nor the import has to recover them one at a time
+            await self.wait(self._sender_recovery.recover(block.transactions))
+
             # Put block in short queue for import, wait here if queue is full
             await self.wait(self._import_queue.put(block))
 
@@ -7,6 +7,7 @@ from p2p.service import BaseService
 
 from trinity.chains.base import AsyncChainAPI
 from trinity.db.eth1.chain import BaseAsyncChainDB
+from trinity.db.sender_cache import TransactionSenderCache
 from trinity.protocol.eth.peer import ETHPeerPool
 
 from .chain import RegularChainSyncer
@@ -19,12 +20,14 @@ class FullChainSyncer(BaseService):
                  chaindb: BaseAsyncChainDB,
                  base_db: AtomicDatabaseAPI,
                  peer_pool: ETHPeerPool,
-                 token: CancelToken = None) -> None:
+                 token: CancelToken = None,
+                 sender_cache: TransactionSenderCache = None) -> None:
         super().__init__(token)
         self.chain = chain
         self.chaindb = chaindb
         self.base_db = base_db
         self.peer_pool = peer_pool
+        self.sender_cache = sender_cache
 
     async def _run(self) -> None:
         head = await self.wait(self.chaindb.coro_get_canonical_head())
@@ -41,5 +44,5 @@ class FullChainSyncer(BaseService):
         # Now, loop forever, fetching missing blocks and applying them.
         self.logger.info("Starting regular sync; current head: %s", head)
         regular_syncer = RegularChainSyncer(
-            self.chain, self.chaindb, self.peer_pool, self.cancel_token)
+            self.chain, self.chaindb, self.peer_pool, self.cancel_token, self.sender_cache)
         await regular_syncer.run()
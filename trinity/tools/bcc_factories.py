@@ -160,7 +160,6 @@ class SignedBeaconBlockFactory(factory.Factory):
     def _create(
         cls, model_class: Type[BaseSignedBeaconBlock], *args: Any, **kwargs: Any
     ) -> BaseSignedBeaconBlock:
-        print(kwargs)
         parent = kwargs.pop("parent", None)
         if parent is not None:
             return (